@@ -5,6 +5,8 @@ the root of the project.
 """
 import pytest
 
+pytest_plugins = ["opentrons_shared_data.pytest_benchmarks"]
+
 # Options must be added at the root level for pytest to properly
 # pick them up. Technically, the main conftest that we use in
 # tests/opentrons is not the root level.
@@ -1,31 +1,25 @@
+from __future__ import annotations
+
+import importlib
 import os
 
 from pathlib import Path
 import logging
 import re
-from typing import Any, List, Tuple
-
-from opentrons.drivers.serial_communication import get_ports_by_name
-from opentrons.hardware_control import (
-    API as HardwareAPI,
-    ThreadManager,
-    ThreadManagedHardware,
-    types as hw_types,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from opentrons.config import (
     feature_flags as ff,
     name,
-    robot_configs,
     IS_ROBOT,
     ROBOT_FIRMWARE_DIR,
 )
-from opentrons.util import logging_config
-from opentrons.protocols.types import ApiDeprecationError
-from opentrons.protocols.api_support.types import APIVersion
 
 from ._version import version
 
+if TYPE_CHECKING:
+    from opentrons.hardware_control import ThreadManagedHardware
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 __version__ = version
 
@@ -36,13 +30,44 @@ LEGACY_MODULES = ["robot", "reset", "instruments", "containers", "labware", "mod
 __all__ = ["version", "__version__", "HERE", "config"]
 
 
-def __getattr__(attrname: str) -> None:
+# Names this module has always provided, but whose modules are slow to import
+# (the hardware controller alone takes most of a second). They're imported the
+# first time they're used, so `import opentrons` itself stays cheap for
+# callers that only need part of the package.
+# Name -> (module, attribute of that module, or None for the module itself).
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, Optional[str]]] = {
+    "get_ports_by_name": (
+        "opentrons.drivers.serial_communication",
+        "get_ports_by_name",
+    ),
+    "HardwareAPI": ("opentrons.hardware_control", "API"),
+    "ThreadManager": ("opentrons.hardware_control", "ThreadManager"),
+    "ThreadManagedHardware": ("opentrons.hardware_control", "ThreadManagedHardware"),
+    "hw_types": ("opentrons.hardware_control.types", None),
+    "robot_configs": ("opentrons.config.robot_configs", None),
+    "logging_config": ("opentrons.util.logging_config", None),
+    "ApiDeprecationError": ("opentrons.protocols.types", "ApiDeprecationError"),
+    "APIVersion": ("opentrons.protocols.api_support.types", "APIVersion"),
+}
+
+
+def __getattr__(attrname: str) -> Any:
     """
-    Prevent import of legacy modules from global to officially
-    deprecate Python API Version 1.0.
+    Import the slow-to-import names above on first use, and prevent import
+    of legacy modules from global to officially deprecate Python API Version 1.0.
     """
     if attrname in LEGACY_MODULES:
+        from opentrons.protocols.types import ApiDeprecationError
+        from opentrons.protocols.api_support.types import APIVersion
+
         raise ApiDeprecationError(APIVersion(1, 0))
+    if attrname in _LAZY_ATTRIBUTES:
+        module_name, module_attrname = _LAZY_ATTRIBUTES[attrname]
+        value = importlib.import_module(module_name)
+        if module_attrname is not None:
+            value = getattr(value, module_attrname)
+        globals()[attrname] = value
+        return value
     raise AttributeError(attrname)
 
 
@@ -76,6 +101,8 @@ def _find_smoothie_file() -> Tuple[Path, str]:
 
 
 def _get_motor_control_serial_port() -> Any:
+    from opentrons.drivers.serial_communication import get_ports_by_name
+
     port = os.environ.get("OT_SMOOTHIE_EMULATOR_URI")
 
     if port is None:
@@ -106,6 +133,12 @@ async def _create_thread_manager() -> ThreadManagedHardware:
     .. deprecated:: 4.6
         ThreadManager is on its way out.
     """
+    from opentrons.hardware_control import (
+        API as HardwareAPI,
+        ThreadManager,
+        types as hw_types,
+    )
+
     if os.environ.get("ENABLE_VIRTUAL_SMOOTHIE"):
         log.info("Initialized robot using virtual Smoothie")
         thread_manager: ThreadManagedHardware = ThreadManager(
@@ -141,6 +174,9 @@ async def initialize() -> ThreadManagedHardware:
     """
     Initialize the Opentrons hardware returning a hardware instance.
     """
+    from opentrons.config import robot_configs
+    from opentrons.util import logging_config
+
     robot_conf = robot_configs.load()
     logging_config.log_init(robot_conf.log_level)
 
@@ -26,6 +26,7 @@ EncoderType = typing.Type[json.JSONEncoder]
 # TODO(mc, 2022-06-07): replace with Path.unlink(missing_ok=True)
 # when we are on Python >= 3.8
 def delete_file(path: Path) -> None:
+    _cal_file_cache.pop(path, None)
     try:
         path.unlink()
     except FileNotFoundError:
@@ -81,6 +82,63 @@ def read_cal_file(
     return calibration_data
 
 
+_ParsedT = typing.TypeVar("_ParsedT")
+
+
+class _CachedCalFile(typing.NamedTuple):
+    file_version: typing.Tuple[int, int, int]
+    parse: typing.Callable[[typing.Dict[str, typing.Any]], typing.Any]
+    parsed: typing.Any
+
+
+_cal_file_cache: typing.Dict[Path, _CachedCalFile] = {}
+
+
+def _file_version(file_path: Path) -> typing.Tuple[int, int, int]:
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def read_cal_file_cached(
+    file_path: Path,
+    parse: typing.Callable[[typing.Dict[str, typing.Any]], _ParsedT],
+) -> _ParsedT:
+    """
+    Function used to read and parse data from a file, reusing the last result
+    if the file hasn't changed since.
+
+    Checking whether the file has changed costs a stat() instead of
+    a read, a JSON decode and a validation. Files changed by other processes
+    are picked up through their modification time and size; files saved or
+    deleted through this module are dropped from the cache immediately.
+
+    :param file_path: path to look for data at
+    :param parse: converts the data read by :py:func:`read_cal_file` into
+        whatever the caller wants. Its return value is shared between callers,
+        so they must copy it before changing it.
+    :return: The parsed data from the file
+    :raises: Whatever :py:func:`read_cal_file` or ``parse`` raises. Failures
+        are not cached.
+    """
+    try:
+        file_version = _file_version(file_path)
+    except FileNotFoundError:
+        _cal_file_cache.pop(file_path, None)
+        raise
+    cached = _cal_file_cache.get(file_path)
+    if (
+        cached is not None
+        and cached.file_version == file_version
+        and cached.parse == parse
+    ):
+        return typing.cast(_ParsedT, cached.parsed)
+    parsed = parse(read_cal_file(file_path))
+    _cal_file_cache[file_path] = _CachedCalFile(
+        file_version=file_version, parse=parse, parsed=parsed
+    )
+    return parsed
+
+
 def save_to_file(
     directory_path: Path,
     # todo(mm, 2023-11-15): This file_name argument does not include the file
@@ -107,6 +165,7 @@ def save_to_file(
         if isinstance(data, pydantic.BaseModel)
         else json.dumps(data, cls=encoder)
     )
+    _cal_file_cache.pop(file_path, None)
     file_path.write_text(json_data, encoding="utf-8")
 
 
@@ -73,7 +73,9 @@ def get_robot_deck_attitude() -> Optional[v1.DeckCalibrationModel]:
         config.get_opentrons_path("robot_calibration_dir") / "deck_calibration.json"
     )
     try:
-        return v1.DeckCalibrationModel(**io.read_cal_file(deck_calibration_path))
+        return io.read_cal_file_cached(
+            deck_calibration_path, v1.DeckCalibrationModel.parse_obj
+        ).copy(deep=True)
     except FileNotFoundError:
         log.warning("Deck calibration not found.")
         pass
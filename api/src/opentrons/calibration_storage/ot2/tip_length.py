@@ -34,21 +34,9 @@ def _convert_tip_length_model_to_dict(
     return dict_of_tip_lengths
 
 
-def tip_lengths_for_pipette(
-    pipette_id: str,
+def _parse_tip_lengths(
+    all_tip_lengths_for_pipette: typing.Dict[str, typing.Any]
 ) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
-    try:
-        tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
-        all_tip_lengths_for_pipette = io.read_cal_file(tip_length_filepath)
-    except FileNotFoundError:
-        log.debug(f"Tip length calibrations not found for {pipette_id}")
-        return {}
-    except json.JSONDecodeError:
-        log.warning(
-            f"Tip length calibration is malformed for {pipette_id}", exc_info=True
-        )
-        return {}
-
     tip_lengths: typing.Dict[LabwareUri, v1.TipLengthModel] = {}
 
     for tiprack_identifier, data in all_tip_lengths_for_pipette.items():
@@ -70,12 +58,39 @@ def tip_lengths_for_pipette(
             tip_lengths[LabwareUri(tiprack_identifier)] = v1.TipLengthModel(**data)
         except ValidationError:
             log.warning(
-                f"Tip length calibration is malformed for {tiprack_identifier} on {pipette_id}",
+                f"Tip length calibration is malformed for {tiprack_identifier}",
                 exc_info=True,
             )
     return tip_lengths
 
 
+def tip_lengths_for_pipette(
+    pipette_id: str,
+) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+    # The parsed file is cached, so hand out copies that callers may change.
+    return {
+        uri: tip_length.copy(deep=True)
+        for uri, tip_length in _cached_tip_lengths_for_pipette(pipette_id).items()
+    }
+
+
+def _cached_tip_lengths_for_pipette(
+    pipette_id: str,
+) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+    try:
+        tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
+        tip_lengths = io.read_cal_file_cached(tip_length_filepath, _parse_tip_lengths)
+    except FileNotFoundError:
+        log.debug(f"Tip length calibrations not found for {pipette_id}")
+        return {}
+    except json.JSONDecodeError:
+        log.warning(
+            f"Tip length calibration is malformed for {pipette_id}", exc_info=True
+        )
+        return {}
+    return tip_lengths
+
+
 def load_tip_length_calibration(
     pip_id: str, definition: "LabwareDefinition"
 ) -> v1.TipLengthModel:
@@ -89,13 +104,14 @@ def load_tip_length_calibration(
     labware_uri = helpers.uri_from_definition(definition)
     load_name = definition["parameters"]["loadName"]
     try:
-        return tip_lengths_for_pipette(pip_id)[labware_uri]
+        tip_length = _cached_tip_lengths_for_pipette(pip_id)[labware_uri]
     except KeyError as e:
         raise local_types.TipLengthCalNotFound(
             f"Tip length of {load_name} has not been "
             f"calibrated for this pipette: {pip_id} and cannot"
             "be loaded"
         ) from e
+    return tip_length.copy(deep=True)
 
 
 def get_all_tip_length_calibrations() -> typing.List[v1.TipLengthCalibration]:
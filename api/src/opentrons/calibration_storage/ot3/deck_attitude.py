@@ -71,7 +71,9 @@ def get_robot_belt_attitude() -> Optional[v1.BeltCalibrationModel]:
         config.get_opentrons_path("robot_calibration_dir") / "belt_calibration.json"
     )
     try:
-        return v1.BeltCalibrationModel(**io.read_cal_file(belt_calibration_path))
+        return io.read_cal_file_cached(
+            belt_calibration_path, v1.BeltCalibrationModel.parse_obj
+        ).copy(deep=True)
     except FileNotFoundError:
         log.warning("Belt calibration not found.")
         pass
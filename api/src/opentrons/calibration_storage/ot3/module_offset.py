@@ -100,7 +100,9 @@ def get_module_offset(
         module_calibration_filepath = (
             config.get_opentrons_path("module_calibration_dir") / f"{module_id}.json"
         )
-        return v1.ModuleOffsetModel(**io.read_cal_file(module_calibration_filepath))
+        return io.read_cal_file_cached(
+            module_calibration_filepath, v1.ModuleOffsetModel.parse_obj
+        ).copy(deep=True)
     except FileNotFoundError:
         log.warning(
             f"Calibrations for {module} {module_id} on slot {slot} does not exist."
@@ -123,11 +125,10 @@ def load_all_module_offsets() -> List[v1.ModuleOffsetModel]:
     for file in files:
         try:
             calibrations.append(
-                v1.ModuleOffsetModel(
-                    **io.read_cal_file(
-                        Path(config.get_opentrons_path("module_calibration_dir") / file)
-                    )
-                )
+                io.read_cal_file_cached(
+                    Path(config.get_opentrons_path("module_calibration_dir") / file),
+                    v1.ModuleOffsetModel.parse_obj,
+                ).copy(deep=True)
             )
         except (json.JSONDecodeError, ValidationError):
             log.warning(
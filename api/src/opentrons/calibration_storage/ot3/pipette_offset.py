@@ -81,9 +81,9 @@ def get_pipette_offset(
             / mount.name.lower()
             / f"{pipette_id}.json"
         )
-        return v1.InstrumentOffsetModel(
-            **io.read_cal_file(pipette_calibration_filepath)
-        )
+        return io.read_cal_file_cached(
+            pipette_calibration_filepath, v1.InstrumentOffsetModel.parse_obj
+        ).copy(deep=True)
     except FileNotFoundError:
         log.debug(f"Calibrations for {pipette_id} on {mount} does not exist.")
         return None
@@ -9,38 +9,118 @@ or axis)  to a deck-absolute point (not a Smoothie-coordinate point).
 This module is not for use outside the opentrons api module. Higher-level
 functions are available elsewhere.
 """
-from .adapters import SynchronousAdapter
-from .api import API
-from .pause_manager import PauseManager
-from .backends import Controller, Simulator
-from .types import CriticalPoint, ExecutionState, OT3Mount
-from .constants import DROP_TIP_RELEASE_DISTANCE
-from .thread_manager import ThreadManager
-from .execution_manager import ExecutionManager
-from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
-from .protocols import HardwareControlInterface, FlexHardwareControlInterface
-from .instruments import AbstractInstrument, Gripper
-from typing import Union
-from .ot3_calibration import OT3Transforms
-from .robot_calibration import RobotCalibration
-from opentrons.config.types import RobotConfig, OT3Config
-
-from opentrons.types import Mount
-
-# TODO (lc 12-05-2022) We should 1. figure out if we need
-# to globally export a class that is strictly used in the hardware controller
-# and 2. how to properly export an ot2 and ot3 pipette.
-from .instruments.ot2.pipette import Pipette
-
-OT2HardwareControlAPI = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
-OT3HardwareControlAPI = FlexHardwareControlInterface[
-    OT3Transforms, Union[Mount, OT3Mount], OT3Config
-]
-HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from .adapters import SynchronousAdapter
+    from .api import API
+    from .pause_manager import PauseManager
+    from .backends import Controller, Simulator
+    from .types import CriticalPoint, ExecutionState, OT3Mount
+    from .constants import DROP_TIP_RELEASE_DISTANCE
+    from .thread_manager import ThreadManager
+    from .execution_manager import ExecutionManager
+    from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
+    from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+    from .instruments import AbstractInstrument, Gripper
+    from .ot3_calibration import OT3Transforms
+    from .robot_calibration import RobotCalibration
+    from opentrons.config.types import RobotConfig, OT3Config
+
+    from opentrons.types import Mount
+
+    # TODO (lc 12-05-2022) We should 1. figure out if we need
+    # to globally export a class that is strictly used in the hardware controller
+    # and 2. how to properly export an ot2 and ot3 pipette.
+    from .instruments.ot2.pipette import Pipette
+
+    OT2HardwareControlAPI = HardwareControlInterface[
+        RobotCalibration, Mount, RobotConfig
+    ]
+    OT3HardwareControlAPI = FlexHardwareControlInterface[
+        OT3Transforms, Union[Mount, OT3Mount], OT3Config
+    ]
+    HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
+
+    # this type ignore is because of https://github.com/python/mypy/issues/13437
+    ThreadManagedHardware = ThreadManager[HardwareControlAPI]  # type: ignore[misc]
+    SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
+
+
+# Importing the hardware controller pulls in nearly all of this package, so the
+# names below are only imported the first time they're used. This keeps lighter
+# modules like `hardware_control.types` cheap to import on their own.
+# Name -> (submodule, attribute of that submodule).
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "SynchronousAdapter": (".adapters", "SynchronousAdapter"),
+    "API": (".api", "API"),
+    "PauseManager": (".pause_manager", "PauseManager"),
+    "Controller": (".backends", "Controller"),
+    "Simulator": (".backends", "Simulator"),
+    "CriticalPoint": (".types", "CriticalPoint"),
+    "ExecutionState": (".types", "ExecutionState"),
+    "OT3Mount": (".types", "OT3Mount"),
+    "DROP_TIP_RELEASE_DISTANCE": (".constants", "DROP_TIP_RELEASE_DISTANCE"),
+    "ThreadManager": (".thread_manager", "ThreadManager"),
+    "ExecutionManager": (".execution_manager", "ExecutionManager"),
+    "ThreadedAsyncLock": (".threaded_async_lock", "ThreadedAsyncLock"),
+    "ThreadedAsyncForbidden": (".threaded_async_lock", "ThreadedAsyncForbidden"),
+    "HardwareControlInterface": (".protocols", "HardwareControlInterface"),
+    "FlexHardwareControlInterface": (".protocols", "FlexHardwareControlInterface"),
+    "AbstractInstrument": (".instruments", "AbstractInstrument"),
+    "Gripper": (".instruments", "Gripper"),
+    "OT3Transforms": (".ot3_calibration", "OT3Transforms"),
+    "RobotCalibration": (".robot_calibration", "RobotCalibration"),
+    "Pipette": (".instruments.ot2.pipette", "Pipette"),
+}
+
+
+def _build_type_aliases() -> Dict[str, Any]:
+    from .adapters import SynchronousAdapter
+    from .types import OT3Mount
+    from .thread_manager import ThreadManager
+    from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+    from .ot3_calibration import OT3Transforms
+    from .robot_calibration import RobotCalibration
+    from opentrons.config.types import RobotConfig, OT3Config
+    from opentrons.types import Mount
+
+    ot2_api = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
+    ot3_api = FlexHardwareControlInterface[
+        OT3Transforms, Union[Mount, OT3Mount], OT3Config
+    ]
+    hardware_control_api = Union[ot2_api, ot3_api]
+    return {
+        "OT2HardwareControlAPI": ot2_api,
+        "OT3HardwareControlAPI": ot3_api,
+        "HardwareControlAPI": hardware_control_api,
+        "ThreadManagedHardware": ThreadManager[hardware_control_api],  # type: ignore[misc]
+        "SyncHardwareAPI": SynchronousAdapter[hardware_control_api],
+    }
+
+
+_TYPE_ALIAS_NAMES = (
+    "OT2HardwareControlAPI",
+    "OT3HardwareControlAPI",
+    "HardwareControlAPI",
+    "ThreadManagedHardware",
+    "SyncHardwareAPI",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attrname = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attrname)
+        globals()[name] = value
+        return value
+    if name in _TYPE_ALIAS_NAMES:
+        aliases = _build_type_aliases()
+        globals().update(aliases)
+        return aliases[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# this type ignore is because of https://github.com/python/mypy/issues/13437
-ThreadManagedHardware = ThreadManager[HardwareControlAPI]  # type: ignore[misc]
-SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
 
 __all__ = [
     "API",
@@ -385,6 +385,11 @@ class FlexBackend(Protocol):
     def subsystems(self) -> Dict[SubSystem, SubSystemState]:
         ...
 
+    @property
+    def tools_generation(self) -> int:
+        """A count that changes whenever the attached tools might have changed."""
+        ...
+
     async def get_tip_status(
         self, mount: OT3Mount, ht_operation_sensor: Optional[InstrumentProbeType] = None
     ) -> TipStateType:
@@ -27,6 +27,7 @@ from typing import (
 )
 from opentrons.config.types import OT3Config, GantryLoad, OutputOptions
 from opentrons.config import gripper_config
+from opentrons.util.performance_helpers import trace_span
 from .ot3utils import (
     axis_convert,
     create_move_group,
@@ -413,6 +414,10 @@ class OT3Controller(FlexBackend):
     def subsystems(self) -> Dict[SubSystem, SubSystemState]:
         return self._subsystem_manager.subsystems
 
+    @property
+    def tools_generation(self) -> int:
+        return self._subsystem_manager.tools_generation
+
     @property
     def fw_version(self) -> Dict[SubSystem, int]:
         """Get the firmware version."""
@@ -637,40 +642,42 @@ class OT3Controller(FlexBackend):
         Returns:
             None
         """
-        move_target = MoveTarget.build(position=target, max_speed=speed)
-        try:
-            _, movelist = self._move_manager.plan_motion(
-                origin=origin, target_list=[move_target]
-            )
-        except ZeroLengthMoveError as zme:
-            log.debug(f"Not moving because move was zero length {str(zme)}")
-            return
-        moves = movelist[0]
-        log.info(f"move: machine {target} from {origin} requires {moves}")
-
-        ordered_nodes = self._motor_nodes()
-        if nodes_in_moves_only:
-            moving_axes = {
-                axis_to_node(ax) for move in moves for ax in move.unit_vector.keys()
-            }
-            ordered_nodes = ordered_nodes.intersection(moving_axes)
+        with trace_span("OT3Controller.move"):
+            move_target = MoveTarget.build(position=target, max_speed=speed)
+            try:
+                with trace_span("OT3Controller.plan_motion"):
+                    _, movelist = self._move_manager.plan_motion(
+                        origin=origin, target_list=[move_target]
+                    )
+            except ZeroLengthMoveError as zme:
+                log.debug(f"Not moving because move was zero length {str(zme)}")
+                return
+            moves = movelist[0]
+            log.info(f"move: machine {target} from {origin} requires {moves}")
+
+            ordered_nodes = self._motor_nodes()
+            if nodes_in_moves_only:
+                moving_axes = {
+                    axis_to_node(ax) for move in moves for ax in move.unit_vector.keys()
+                }
+                ordered_nodes = ordered_nodes.intersection(moving_axes)
 
-        group = create_move_group(
-            origin, moves, ordered_nodes, MoveStopCondition[stop_condition.name]
-        )
-        move_group, _ = group
-        runner = MoveGroupRunner(
-            move_groups=[move_group],
-            ignore_stalls=True
-            if not self._feature_flags.stall_detection_enabled
-            else False,
-        )
+            group = create_move_group(
+                origin, moves, ordered_nodes, MoveStopCondition[stop_condition.name]
+            )
+            move_group, _ = group
+            runner = MoveGroupRunner(
+                move_groups=[move_group],
+                ignore_stalls=True
+                if not self._feature_flags.stall_detection_enabled
+                else False,
+            )
 
-        pipettes_moving = moving_pipettes_in_move_group(move_group)
+            pipettes_moving = moving_pipettes_in_move_group(move_group)
 
-        async with self._monitor_overpressure(pipettes_moving):
-            positions = await runner.run(can_messenger=self._messenger)
-        self._handle_motor_status_response(positions)
+            async with self._monitor_overpressure(pipettes_moving):
+                positions = await runner.run(can_messenger=self._messenger)
+            self._handle_motor_status_response(positions)
 
     def _get_axis_home_distance(self, axis: Axis) -> float:
         if self.check_motor_status([axis]):
@@ -767,6 +767,11 @@ class OT3Simulator(FlexBackend):
         self._position[moving] += distance_mm
         return []
 
+    @property
+    def tools_generation(self) -> int:
+        # Simulated tools only change when cache_instruments() requires them to.
+        return 0
+
     @property
     def subsystems(self) -> Dict[SubSystem, SubSystemState]:
         return {
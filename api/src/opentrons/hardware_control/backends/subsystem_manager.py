@@ -56,6 +56,7 @@ class SubsystemManager:
     _tool_detection_task: "Optional[asyncio.Task[None]]"
     _expected_core_targets: Set[FirmwareTarget]
     _present_tools: tools.types.ToolSummary
+    _tools_generation: int
     _tool_task_condition: asyncio.Condition
     _tool_task_state: Union[bool, Exception]
     _updates_required: Dict[FirmwareTarget, FirmwareUpdateRequirements]
@@ -90,6 +91,7 @@ class SubsystemManager:
         self._present_tools = tools.types.ToolSummary(
             left=None, right=None, gripper=None
         )
+        self._tools_generation = 0
 
     @property
     def ok(self) -> bool:
@@ -113,6 +115,14 @@ class SubsystemManager:
     def tools(self) -> tools.types.ToolSummary:
         return self._present_tools
 
+    @property
+    def tools_generation(self) -> int:
+        """A count that goes up every time the present tools are re-resolved.
+
+        If this hasn't changed, neither have the tools.
+        """
+        return self._tools_generation
+
     @property
     def subsystems(self) -> Dict[SubSystem, SubSystemState]:
         def _state_or(maybe_status: Optional[UpdateStatus]) -> Optional[UpdateState]:
@@ -411,6 +421,7 @@ class SubsystemManager:
                 gripper=self._tool_if_ok(update.gripper, NodeId.gripper),
             )
             self._present_tools = await self._tool_detector.resolve(to_resolve, 10.0)
+            self._tools_generation += 1
             log.info(f"Present tools are now {self._present_tools}")
             async with self._tool_task_condition:
                 self._tool_task_state = True
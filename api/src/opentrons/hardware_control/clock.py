@@ -0,0 +1,164 @@
+"""Clocks to wait on and measure time with.
+
+Everything that waits for time to pass in emulation - module pollers, protocol
+delays, the module emulators themselves - asks the current clock instead of
+calling ``asyncio.sleep`` or ``time.sleep`` directly. Normally that's a
+:py:class:`RealClock`. Replacing it with a :py:class:`VirtualClock` lets
+emulated runs with long holds and delays finish in seconds.
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+class Clock(ABC):
+    """A source of time."""
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Get the current time, in seconds, like `time.monotonic`."""
+
+    @abstractmethod
+    async def sleep(self, seconds: float) -> None:
+        """Wait for some seconds to pass, like `asyncio.sleep`."""
+
+    @abstractmethod
+    def sleep_sync(self, seconds: float) -> None:
+        """Block for some seconds to pass, like `time.sleep`."""
+
+
+class RealClock(Clock):
+    """The wall clock."""
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    def sleep_sync(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """A clock that runs faster than the wall clock.
+
+    By default, virtual time passes ``speed`` times faster than real time.
+
+    With ``jump=True``, virtual time only passes when every sleeper is
+    waiting: once nothing has gone to sleep or woken up for ``settle_seconds``
+    of real time, the clock jumps straight to the earliest deadline and wakes
+    whoever was waiting for it. Sleepers always wake in deadline order, and
+    sleepers with the same deadline wake in the order they went to sleep.
+
+    A virtual clock can be shared between threads and event loops.
+
+    Args:
+        speed: How many virtual seconds pass per real second. Ignored when
+            ``jump`` is set.
+        jump: Jump to the next deadline instead of waiting for it.
+        settle_seconds: In jump mode, how long the sleepers must have been
+            quiet, in real seconds, before the clock jumps.
+    """
+
+    def __init__(
+        self, speed: float = 1.0, jump: bool = False, settle_seconds: float = 0.005
+    ) -> None:
+        assert speed > 0, "Clock speed must be positive"
+        self._speed = speed
+        self._jump = jump
+        self._settle_seconds = settle_seconds
+        self._real_start = time.monotonic()
+        self._lock = threading.Lock()
+        # Jump mode state: the current virtual time, the time we last saw
+        # a sleeper come or go, and the pending (deadline, ticket) pairs.
+        self._now = 0.0
+        self._last_activity = self._real_start
+        self._deadlines: List[Tuple[float, int]] = []
+        self._tickets = itertools.count()
+
+    @property
+    def speed(self) -> float:
+        """How many virtual seconds pass per real second."""
+        return self._speed
+
+    @property
+    def jump(self) -> bool:
+        """Whether this clock jumps to the next deadline."""
+        return self._jump
+
+    def monotonic(self) -> float:
+        if self._jump:
+            return self._now
+        return (time.monotonic() - self._real_start) * self._speed
+
+    async def sleep(self, seconds: float) -> None:
+        if not self._jump:
+            await asyncio.sleep(seconds / self._speed)
+            return
+
+        deadline = self._add_deadline(seconds)
+        try:
+            while not self._try_wake(deadline):
+                await asyncio.sleep(self._settle_seconds)
+        except BaseException:
+            self._remove_deadline(deadline)
+            raise
+
+    def sleep_sync(self, seconds: float) -> None:
+        if not self._jump:
+            time.sleep(seconds / self._speed)
+            return
+
+        deadline = self._add_deadline(seconds)
+        try:
+            while not self._try_wake(deadline):
+                time.sleep(self._settle_seconds)
+        except BaseException:
+            self._remove_deadline(deadline)
+            raise
+
+    def _add_deadline(self, seconds: float) -> Tuple[float, int]:
+        with self._lock:
+            deadline = (self._now + max(seconds, 0.0), next(self._tickets))
+            heapq.heappush(self._deadlines, deadline)
+            self._last_activity = time.monotonic()
+            return deadline
+
+    def _remove_deadline(self, deadline: Tuple[float, int]) -> None:
+        with self._lock:
+            if deadline in self._deadlines:
+                self._deadlines.remove(deadline)
+                heapq.heapify(self._deadlines)
+
+    def _try_wake(self, deadline: Tuple[float, int]) -> bool:
+        """Wake the given sleeper if the clock can jump to its deadline."""
+        with self._lock:
+            now_real = time.monotonic()
+            if (
+                self._deadlines[0] != deadline
+                or now_real - self._last_activity < self._settle_seconds
+            ):
+                return False
+            heapq.heappop(self._deadlines)
+            self._now = max(self._now, deadline[0])
+            self._last_activity = now_real
+            return True
+
+
+_clock: Clock = RealClock()
+
+
+def get_clock() -> Clock:
+    """Get the clock that waits should be made against."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """Replace the clock that waits are made against."""
+    global _clock
+    _clock = clock
@@ -3,13 +3,10 @@ from __future__ import annotations
 # this file defines types that require dev dependencies
 # and are only relevant for static typechecking. this file should only
 # be imported if typing.TYPE_CHECKING is True
-from typing import Optional, Dict, List, Union
+from typing import TYPE_CHECKING, Optional, Dict, List, Union
 
 from typing_extensions import TypedDict, Literal
 
-from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
-    GripperCalibrationOffset,
-)
 from opentrons_shared_data.pipette.types import (
     PipetteModel,
     PipetteName,
@@ -31,6 +28,12 @@ from opentrons.types import Mount
 from opentrons.hardware_control.types import GripperJawState
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 
+if TYPE_CHECKING:
+    # The gripper module imports this one, so this can't be a runtime import.
+    from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
+        GripperCalibrationOffset,
+    )
+
 
 class InstrumentSpec(TypedDict):
     id: Optional[str]
@@ -3,7 +3,6 @@
 The purpose is to provide a fake backend that responds to GCODE commands.
 """
 import logging
-from time import sleep
 from typing import (
     Optional,
 )
@@ -12,6 +11,7 @@ from opentrons.drivers.heater_shaker.driver import (
     GCODE,
     HS_ACK,
 )
+from opentrons.hardware_control.clock import get_clock
 from opentrons.hardware_control.emulation.parser import Parser, Command
 from opentrons.hardware_control.emulation.settings import HeaterShakerSettings
 from . import util
@@ -111,7 +111,7 @@ class HeaterShakerEmulator(AbstractEmulator):
         return res
 
     def _home(self, command: Command) -> str:
-        sleep(self._settings.home_delay_time)
+        get_clock().sleep_sync(self._settings.home_delay_time)
         self._rpm.deactivate(0.0)
         self._rpm.set_target(0.0)
         return "G28"
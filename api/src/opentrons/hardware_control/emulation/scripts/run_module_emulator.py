@@ -5,6 +5,7 @@ from argparse import ArgumentParser
 from typing import Dict, Callable
 from typing_extensions import Final
 
+from opentrons.hardware_control.clock import set_clock
 from opentrons.hardware_control.emulation.abstract_emulator import AbstractEmulator
 from opentrons.hardware_control.emulation.heater_shaker import HeaterShakerEmulator
 from opentrons.hardware_control.emulation.types import ModuleType
@@ -47,6 +48,7 @@ async def run(settings: Settings, emulator_name: str, host: str) -> None:
     Returns:
         None
     """
+    set_clock(settings.clock.build_clock())
     e = emulator_builder[emulator_name](settings)
     proxy_settings = emulator_port[emulator_name](settings)
     await run_emulator_client(host, proxy_settings.emulator_port, e)
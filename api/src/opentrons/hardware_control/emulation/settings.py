@@ -1,4 +1,5 @@
 from typing import List
+from opentrons.hardware_control.clock import Clock, RealClock, VirtualClock
 from opentrons.hardware_control.emulation.types import ModuleType
 from opentrons.hardware_control.emulation.util import TEMPERATURE_ROOM
 from pydantic import BaseSettings, BaseModel
@@ -64,6 +65,22 @@ class ProxySettings(BaseModel):
     use_local_host: bool = True
 
 
+class ClockSettings(BaseModel):
+    """Settings for the clock emulated time passes on.
+
+    See opentrons.hardware_control.clock.VirtualClock.
+    """
+
+    speed: float = 1.0
+    jump: bool = False
+
+    def build_clock(self) -> Clock:
+        """Build the clock these settings describe."""
+        if self.speed == 1.0 and not self.jump:
+            return RealClock()
+        return VirtualClock(speed=self.speed, jump=self.jump)
+
+
 class ModuleServerSettings(BaseModel):
     """Settings for the module server"""
 
@@ -118,3 +135,4 @@ class Settings(BaseSettings):
         env_prefix = "OT_EMULATOR_"
 
     module_server: ModuleServerSettings = ModuleServerSettings()
+    clock: ClockSettings = ClockSettings()
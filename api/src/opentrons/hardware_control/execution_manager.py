@@ -11,6 +11,7 @@ from typing import (
     ParamSpec,
     Concatenate,
 )
+from .clock import get_clock
 from .types import ExecutionState
 from opentrons_shared_data.errors.exceptions import ExecutionCancelledError
 
@@ -157,7 +158,7 @@ class ExecutionManagerProvider:
         if not self._em_simulate:
 
             async def sleep_for_seconds(seconds: float) -> None:
-                await asyncio.sleep(seconds)
+                await get_clock().sleep(seconds)
 
             delay_task = asyncio.create_task(sleep_for_seconds(duration_s))
             self._execution_manager.register_cancellable_task(delay_task)
@@ -1,28 +1,73 @@
-from .mod_abc import AbstractModule
-from .tempdeck import TempDeck
-from .magdeck import MagDeck
-from .thermocycler import Thermocycler
-from .heater_shaker import HeaterShaker
-from .absorbance_reader import AbsorbanceReader
-from .update import update_firmware
-from .utils import MODULE_TYPE_BY_NAME, build
-from .types import (
-    ThermocyclerStep,
-    UploadFunction,
-    BundledFirmware,
-    UpdateError,
-    ModuleAtPort,
-    SimulatingModuleAtPort,
-    SimulatingModule,
-    ModuleType,
-    ModuleModel,
-    TemperatureStatus,
-    MagneticStatus,
-    HeaterShakerStatus,
-    AbsorbanceReaderStatus,
-    SpeedStatus,
-    LiveData,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .mod_abc import AbstractModule
+    from .tempdeck import TempDeck
+    from .magdeck import MagDeck
+    from .thermocycler import Thermocycler
+    from .heater_shaker import HeaterShaker
+    from .absorbance_reader import AbsorbanceReader
+    from .update import update_firmware
+    from .utils import MODULE_TYPE_BY_NAME, build
+    from .types import (
+        ThermocyclerStep,
+        UploadFunction,
+        BundledFirmware,
+        UpdateError,
+        ModuleAtPort,
+        SimulatingModuleAtPort,
+        SimulatingModule,
+        ModuleType,
+        ModuleModel,
+        TemperatureStatus,
+        MagneticStatus,
+        HeaterShakerStatus,
+        AbsorbanceReaderStatus,
+        SpeedStatus,
+        LiveData,
+    )
+
+
+# Each module class pulls in its driver, and the drivers import `modules.types`,
+# so these are only imported the first time they're used. That keeps
+# `modules.types` cheap to import on its own.
+# Name -> the submodule it's defined in.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "AbstractModule": ".mod_abc",
+    "TempDeck": ".tempdeck",
+    "MagDeck": ".magdeck",
+    "Thermocycler": ".thermocycler",
+    "HeaterShaker": ".heater_shaker",
+    "AbsorbanceReader": ".absorbance_reader",
+    "update_firmware": ".update",
+    "MODULE_TYPE_BY_NAME": ".utils",
+    "build": ".utils",
+    "ThermocyclerStep": ".types",
+    "UploadFunction": ".types",
+    "BundledFirmware": ".types",
+    "UpdateError": ".types",
+    "ModuleAtPort": ".types",
+    "SimulatingModuleAtPort": ".types",
+    "SimulatingModule": ".types",
+    "ModuleType": ".types",
+    "ModuleModel": ".types",
+    "TemperatureStatus": ".types",
+    "MagneticStatus": ".types",
+    "HeaterShakerStatus": ".types",
+    "AbsorbanceReaderStatus": ".types",
+    "SpeedStatus": ".types",
+    "LiveData": ".types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "MODULE_TYPE_BY_NAME",
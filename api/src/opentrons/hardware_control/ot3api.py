@@ -36,6 +36,7 @@ from opentrons_shared_data.robot.types import RobotType
 
 from opentrons import types as top_types
 from opentrons.config import robot_configs
+from opentrons.util.performance_helpers import trace_span
 from opentrons.config.types import (
     RobotConfig,
     OT3Config,
@@ -245,6 +246,8 @@ class OT3API(
         self._gripper_handler = GripperHandler(gripper=None)
         self._gantry_load = GantryLoad.LOW_THROUGHPUT
         self._configured_since_update = True
+        self._instruments_cached_for_tools_generation: Optional[int] = None
+        self._skipped_instrument_scans = 0
         OT3RobotCalibrationProvider.__init__(self, self._config)
         ExecutionManagerProvider.__init__(self, isinstance(backend, OT3Simulator))
 
@@ -664,10 +667,38 @@ class OT3API(
         if skip_if_would_block and self._motion_lock.locked():
             return
         async with self._motion_lock:
+            tools_generation = self._backend.tools_generation
             skip_configure = await self._cache_instruments(require)
             if not skip_configure or not self._configured_since_update:
                 self._log.info("Reconfiguring instrument cache")
                 await self._configure_instruments()
+            # What's cached for a specific request may not match a plain scan.
+            self._instruments_cached_for_tools_generation = (
+                None if require else tools_generation
+            )
+
+    async def cache_instruments_if_changed(self) -> None:
+        """Scan the attached instruments only if they might have changed.
+
+        The backend keeps track of the attached tools from tool detection
+        notifications. If none have arrived since the last scan, and no firmware
+        update has happened since either, the instrument cache is still good and
+        this returns without touching the hardware. Otherwise, it behaves like
+        `cache_instruments(skip_if_would_block=True)`.
+        """
+        if (
+            self._configured_since_update
+            and self._instruments_cached_for_tools_generation
+            == self._backend.tools_generation
+        ):
+            self._skipped_instrument_scans += 1
+            return
+        await self.cache_instruments(skip_if_would_block=True)
+
+    @property
+    def skipped_instrument_scans(self) -> int:
+        """How many times `cache_instruments_if_changed()` didn't need to scan."""
+        return self._skipped_instrument_scans
 
     async def _cache_instruments(  # noqa: C901
         self, require: Optional[Dict[top_types.Mount, PipetteName]] = None
@@ -1430,24 +1461,30 @@ class OT3API(
         }
         check_motion_bounds(to_check, target_position, bounds, check_bounds)
         self._log.info(f"Move: deck {target_position} becomes machine {machine_pos}")
-        origin = await self._backend.update_position()
-        async with contextlib.AsyncExitStack() as stack:
-            if acquire_lock:
-                await stack.enter_async_context(self._motion_lock)
-            try:
-                await self._backend.move(
-                    origin,
-                    machine_pos,
-                    speed or 400.0,
-                    HWStopCondition.stall if expect_stalls else HWStopCondition.none,
-                )
-            except Exception:
-                self._log.exception("Move failed")
-                self._current_position.clear()
-                raise
-            else:
-                await self._cache_current_position()
-                await self._cache_encoder_position()
+        with trace_span("OT3API._move"):
+            with trace_span("OT3API.update_position"):
+                origin = await self._backend.update_position()
+            async with contextlib.AsyncExitStack() as stack:
+                if acquire_lock:
+                    with trace_span("OT3API.acquire_motion_lock"):
+                        await stack.enter_async_context(self._motion_lock)
+                try:
+                    await self._backend.move(
+                        origin,
+                        machine_pos,
+                        speed or 400.0,
+                        HWStopCondition.stall
+                        if expect_stalls
+                        else HWStopCondition.none,
+                    )
+                except Exception:
+                    self._log.exception("Move failed")
+                    self._current_position.clear()
+                    raise
+                else:
+                    with trace_span("OT3API.cache_position"):
+                        await self._cache_current_position()
+                        await self._cache_encoder_position()
 
     async def _set_plunger_current_and_home(
         self,
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from typing import AsyncGenerator, List, Optional
 from opentrons_shared_data.errors.exceptions import ModuleCommunicationError
 
+from .clock import Clock, get_clock
+
 
 log = logging.getLogger(__name__)
 
@@ -24,13 +26,18 @@ class Poller:
     Args:
         reader: An interface to read data.
         interval: The poll interval, in seconds.
+        clock: The clock to wait out the interval on. Defaults to
+            whatever `clock.get_clock()` returns at the time.
     """
 
     interval: float
 
-    def __init__(self, reader: Reader, interval: float) -> None:
+    def __init__(
+        self, reader: Reader, interval: float, clock: Optional[Clock] = None
+    ) -> None:
         self.interval = interval
         self._reader = reader
+        self._clock = clock
         self._read_lock: Optional["asyncio.Lock"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
@@ -77,7 +84,7 @@ class Poller:
         """Polling loop."""
         while True:
             await self._poll_once()
-            await asyncio.sleep(self.interval)
+            await (self._clock or get_clock()).sleep(self.interval)
 
     @staticmethod
     def _set_waiter_complete(
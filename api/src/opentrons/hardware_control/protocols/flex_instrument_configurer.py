@@ -20,6 +20,10 @@ from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
 class FlexInstrumentConfigurer(Protocol[MountArgType]):
     """A protocol specifying Flex-specific extensions to instrument configuration."""
 
+    async def cache_instruments_if_changed(self) -> None:
+        """Scan the attached instruments only if they might have changed since the last scan."""
+        ...
+
     async def get_instrument_state(
         self,
         mount: MountArgType,
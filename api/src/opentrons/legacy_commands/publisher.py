@@ -1,5 +1,6 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
 from typing import Any, Callable, Iterator, Optional, TypeVar, cast
 from uuid import uuid4
@@ -43,6 +44,10 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     """Publish messages before and after the decorated function has run."""
 
     def _decorator(func: FuncT) -> FuncT:
+        # Inspect both signatures once, up front, rather than on every call.
+        func_sig = _inspect_signature(func)
+        message_creator_arg_names = frozenset(_inspect_signature(command).parameters)
+
         @functools.wraps(func)
         def _decorated(*args: Any, **kwargs: Any) -> Any:
             """Use the args passed to wrapped `func` to build the message payload.
@@ -63,13 +68,10 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, LegacyBroker
             ), "Only methods of CommandPublisher classes should be decorated."
 
-            func_sig = _inspect_signature(func)
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
             func_args = bound_func_args.arguments
 
-            message_creator_sig = _inspect_signature(command)
-            message_creator_arg_names = set(message_creator_sig.parameters.keys())
             message_creator_args = {
                 n: func_args[n] for n in message_creator_arg_names if n in func_args
             }
@@ -148,7 +150,8 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    # Formatting every payload value can be slow, so only do it if it will be logged.
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
@@ -291,21 +291,12 @@ def _slot_has_potential_colliding_object(
 ) -> bool:
     """Return the slot, if any, that has an item that the pipette might collide into."""
     # Check if slot overlaps with pipette position
-    slot_pos = engine_state.addressable_areas.get_addressable_area_position(
-        addressable_area_name=surrounding_slot.id,
-        do_compatibility_check=False,
-    )
-    slot_bounds = engine_state.addressable_areas.get_addressable_area_bounding_box(
-        addressable_area_name=surrounding_slot.id,
-        do_compatibility_check=False,
-    )
-    slot_back_left_coords = Point(slot_pos.x, slot_pos.y + slot_bounds.y, slot_pos.z)
-    slot_front_right_coords = Point(slot_pos.x + slot_bounds.x, slot_pos.y, slot_pos.z)
+    slot_rectangle = engine_state.geometry.get_slot_bounding_rectangle(surrounding_slot)
 
     # If slot overlaps with pipette bounds
     if point_calculations.are_overlapping_rectangles(
         rectangle1=(pipette_bounds[0], pipette_bounds[1]),
-        rectangle2=(slot_back_left_coords, slot_front_right_coords),
+        rectangle2=slot_rectangle,
     ):
         # Check z-height of items in overlapping slot
         if isinstance(surrounding_slot, DeckSlotName):
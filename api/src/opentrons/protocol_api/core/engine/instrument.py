@@ -1,7 +1,7 @@
 """ProtocolEngine-based InstrumentContext core implementation."""
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, cast, Union
+from typing import ContextManager, Optional, TYPE_CHECKING, cast, Union
 from opentrons.protocols.api_support.types import APIVersion
 
 from opentrons.types import Location, Mount
@@ -689,6 +689,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
         return self._engine_client.state.pipettes.get_working_volume(self._pipette_id)
 
     def get_current_volume(self) -> float:
+        self._engine_client.flush_commands()
         try:
             current_volume = self._engine_client.state.pipettes.get_aspirated_volume(
                 self._pipette_id
@@ -699,6 +700,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
         return current_volume or 0
 
     def get_available_volume(self) -> float:
+        self._engine_client.flush_commands()
         try:
             available_volume = self._engine_client.state.pipettes.get_available_volume(
                 self._pipette_id
@@ -710,6 +712,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
 
     def get_hardware_state(self) -> PipetteDict:
         """Get the current state of the pipette hardware as a dictionary."""
+        self._engine_client.flush_commands()
         return self._sync_hardware_api.get_attached_instrument(self.get_mount())  # type: ignore[no-any-return]
 
     def get_channels(self) -> int:
@@ -832,6 +835,13 @@ class InstrumentCore(AbstractInstrument[WellCore]):
             )
         )
 
+    def batch_commands(self) -> ContextManager[None]:
+        """Execute the commands issued in this context as a single batch.
+
+        See `SyncClient.batch_commands()`.
+        """
+        return self._engine_client.batch_commands()
+
     def retract(self) -> None:
         """Retract this instrument to the top of the gantry."""
         z_axis = self._engine_client.state.pipettes.get_z_axis(self._pipette_id)
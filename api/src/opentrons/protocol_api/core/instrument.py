@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from typing import Any, Generic, Optional, TypeVar, Union
+from typing import Any, ContextManager, Generic, Optional, TypeVar, Union
 
 from opentrons import types
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -300,6 +300,14 @@ class AbstractInstrument(ABC, Generic[WellCoreType]):
     def is_tip_tracking_available(self) -> bool:
         """Return whether auto tip tracking is available for the pipette's current nozzle configuration."""
 
+    @abstractmethod
+    def batch_commands(self) -> ContextManager[None]:
+        """Execute the liquid handling commands issued in this context together.
+
+        Cores that can't batch commands execute each one as it's issued.
+        """
+        ...
+
     @abstractmethod
     def retract(self) -> None:
         """Retract this instrument to the top of the gantry."""
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional, Union
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Optional, Union
 
 from opentrons import types
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -480,6 +481,10 @@ class LegacyInstrumentCoreSimulator(AbstractInstrument[LegacyWellCore]):
         # Tip tracking is always available in legacy context
         return True
 
+    def batch_commands(self) -> ContextManager[None]:
+        """This core has no engine to batch commands for."""
+        return nullcontext()
+
     def retract(self) -> None:
         """Retract this instrument to the top of the gantry."""
         self._protocol_interface.get_hardware.retract(self._mount)  # type: ignore [attr-defined]
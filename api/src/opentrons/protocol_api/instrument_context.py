@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
-from contextlib import ExitStack
+from contextlib import ExitStack, nullcontext
+from itertools import groupby
 from typing import Any, List, Optional, Sequence, Union, cast, Dict
 from opentrons.protocol_engine.errors.exceptions import TipNotAttachedError
 from opentrons_shared_data.errors.exceptions import (
@@ -61,6 +62,11 @@ _DISPOSAL_LOCATION_OFFSET_ADDED_IN = APIVersion(2, 18)
 _PARTIAL_NOZZLE_CONFIGURATION_SINGLE_ROW_PARTIAL_COLUMN_ADDED_IN = APIVersion(2, 20)
 """The version after which partial nozzle configurations of single, row, and partial column layouts became available."""
 
+_BATCHED_TRANSFER_METHODS = frozenset(
+    ["aspirate", "dispense", "mix", "air_gap", "touch_tip", "blow_out"]
+)
+"""The transfer plan steps whose commands can be executed in batches."""
+
 
 class InstrumentContext(publisher.CommandPublisher):
     """
@@ -1488,8 +1494,16 @@ class InstrumentContext(publisher.CommandPublisher):
         return self
 
     def _execute_transfer(self, plan: transfers.TransferPlan) -> None:
-        for cmd in plan:
-            getattr(self, cmd["method"])(*cmd["args"], **cmd["kwargs"])
+        # Runs of liquid handling steps between tip changes are submitted to the
+        # engine as one batch of commands, instead of one command at a time.
+        # Tip pick-ups and drops stay outside the batches, because choosing
+        # the next tip depends on the tip tracking state of the steps before.
+        for batched, steps in groupby(
+            plan, key=lambda step: step["method"] in _BATCHED_TRANSFER_METHODS
+        ):
+            with self._core.batch_commands() if batched else nullcontext():
+                for cmd in steps:
+                    getattr(self, cmd["method"])(*cmd["args"], **cmd["kwargs"])
 
     @requires_version(2, 0)
     def delay(self, *args: Any, **kwargs: Any) -> None:
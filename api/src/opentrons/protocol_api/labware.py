@@ -347,13 +347,19 @@ class Labware:
 
         well_columns = core.get_well_columns()
         self._well_grid = well_grid.create(columns=well_columns)
-        self._wells_by_name = {
-            well_name: Well(
-                parent=self, core=core.get_well_core(well_name), api_version=api_version
-            )
-            for column in well_columns
-            for well_name in column
-        }
+        # Wells are created the first time they're accessed, since protocols
+        # often only touch a few wells of a large plate (or, for tip racks,
+        # only the wells that next_tip() hands out).
+        self._well_names: Tuple[str, ...] = tuple(
+            well_name for column in well_columns for well_name in column
+        )
+        self._well_name_set = frozenset(self._well_names)
+        self._wells_by_name: Dict[str, Well] = {}
+        # Immutable views over all wells, built on first use. The public
+        # accessors return copies of these so callers can't mutate them.
+        self._all_wells: Optional[Tuple[Well, ...]] = None
+        self._rows: Optional[Tuple[Tuple[Well, ...], ...]] = None
+        self._columns: Optional[Tuple[Tuple[Well, ...], ...]] = None
 
     @property
     def separate_calibration(self) -> bool:
@@ -377,7 +383,47 @@ class Labware:
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._get_well(key)
+
+    def _get_well(self, well_name: str) -> Well:
+        """Get a well by name, creating it if this is its first access.
+
+        Raises:
+            KeyError: The labware has no well with this name.
+        """
+        well = self._wells_by_name.get(well_name)
+        if well is None:
+            if well_name not in self._well_name_set:
+                raise KeyError(well_name)
+            well = Well(
+                parent=self,
+                core=self._core.get_well_core(well_name),
+                api_version=self._api_version,
+            )
+            self._wells_by_name[well_name] = well
+        return well
+
+    def _get_all_wells(self) -> Tuple[Well, ...]:
+        """Get every well, ordered A1, B1, C1…A2, B2, C2…."""
+        if self._all_wells is None:
+            self._all_wells = tuple(self._get_well(name) for name in self._well_names)
+        return self._all_wells
+
+    def _get_rows(self) -> Tuple[Tuple[Well, ...], ...]:
+        if self._rows is None:
+            self._rows = tuple(
+                tuple(self._get_well(well_name) for well_name in row)
+                for row in self._well_grid.rows_by_name.values()
+            )
+        return self._rows
+
+    def _get_columns(self) -> Tuple[Tuple[Well, ...], ...]:
+        if self._columns is None:
+            self._columns = tuple(
+                tuple(self._get_well(well_name) for well_name in column)
+                for column in self._well_grid.columns_by_name.values()
+            )
+        return self._columns
 
     @property
     @requires_version(2, 0)
@@ -651,9 +697,9 @@ class Labware:
     def well(self, idx: Union[int, str]) -> Well:
         """Deprecated. Use result of :py:meth:`wells` or :py:meth:`wells_by_name`."""
         if isinstance(idx, int):
-            return self.wells()[idx]
+            return self._get_all_wells()[idx]
         elif isinstance(idx, str):
-            return self.wells_by_name()[idx]
+            return self._get_well(idx)
         else:
             raise TypeError(
                 f"`Labware.well` must be called with an `int` or `str`, but got {idx}"
@@ -679,15 +725,14 @@ class Labware:
         :return: Ordered list of all wells in a labware.
         """
         if not args:
-            return list(self._wells_by_name.values())
+            return list(self._get_all_wells())
 
         elif validation.is_all_integers(args):
-            wells = self.wells()
+            wells = self._get_all_wells()
             return [wells[idx] for idx in args]
 
         elif validation.is_all_strings(args):
-            wells_by_name = self.wells_by_name()
-            return [wells_by_name[idx] for idx in args]
+            return [self._get_well(idx) for idx in args]
 
         else:
             raise TypeError(
@@ -705,7 +750,7 @@ class Labware:
 
         :return: Dictionary of :py:class:`.Well` objects keyed by well name.
         """
-        return dict(self._wells_by_name)
+        return dict(zip(self._well_names, self._get_all_wells()))
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -737,14 +782,11 @@ class Labware:
         :return: A list of row lists.
         """
         if not args:
-            return [
-                [self._wells_by_name[well_name] for well_name in row]
-                for row in self._well_grid.rows_by_name.values()
-            ]
+            return [list(row) for row in self._get_rows()]
 
         elif validation.is_all_integers(args):
-            rows = self.rows()
-            return [rows[idx] for idx in args]
+            rows = self._get_rows()
+            return [list(rows[idx]) for idx in args]
 
         elif validation.is_all_strings(args):
             rows_by_name = self.rows_by_name()
@@ -769,8 +811,8 @@ class Labware:
         :return: Dictionary of :py:class:`.Well` lists keyed by row name.
         """
         return {
-            row_name: [self._wells_by_name[well_name] for well_name in row]
-            for row_name, row in self._well_grid.rows_by_name.items()
+            row_name: list(row)
+            for row_name, row in zip(self._well_grid.rows_by_name, self._get_rows())
         }
 
     @requires_version(2, 0)
@@ -802,14 +844,11 @@ class Labware:
         :return: A list of column lists.
         """
         if not args:
-            return [
-                [self._wells_by_name[well_name] for well_name in column]
-                for column in self._well_grid.columns_by_name.values()
-            ]
+            return [list(column) for column in self._get_columns()]
 
         elif validation.is_all_integers(args):
-            columns = self.columns()
-            return [columns[idx] for idx in args]
+            columns = self._get_columns()
+            return [list(columns[idx]) for idx in args]
 
         elif validation.is_all_strings(args):
             columns_by_name = self.columns_by_name()
@@ -834,8 +873,10 @@ class Labware:
         :return: Dictionary of :py:class:`.Well` lists keyed by column name.
         """
         return {
-            column_name: [self._wells_by_name[well_name] for well_name in column]
-            for column_name, column in self._well_grid.columns_by_name.items()
+            column_name: list(column)
+            for column_name, column in zip(
+                self._well_grid.columns_by_name, self._get_columns()
+            )
         }
 
     @requires_version(2, 0)
@@ -944,7 +985,7 @@ class Labware:
             nozzle_map=nozzle_map,
         )
 
-        return self._wells_by_name[well_name] if well_name is not None else None
+        return self._get_well(well_name) if well_name is not None else None
 
     def use_tips(self, start_well: Well, num_channels: int = 1) -> None:
         """
@@ -1032,7 +1073,7 @@ class Labware:
             .get_tip_tracker()
             .previous_tip(num_tips=num_tips)
         )
-        return self._wells_by_name[well_core.get_name()] if well_core else None
+        return self._get_well(well_core.get_name()) if well_core else None
 
     # TODO(mc, 2022-11-09): implementation detail; deprecate public method
     def return_tips(self, start_well: Well, num_channels: int = 1) -> None:
@@ -1,6 +1,7 @@
 """Control a `ProtocolEngine` without async/await."""
 
-from typing import cast, Any, Optional, overload
+from contextlib import contextmanager
+from typing import cast, Any, Iterator, List, Optional, overload
 
 from opentrons_shared_data.labware.types import LabwareUri
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
@@ -48,16 +49,65 @@ class SyncClient:
                 communicate with the `ProtocolEngine`.
         """
         self._transport = transport
+        self._batched_requests: Optional[List[commands.CommandCreate]] = None
 
     def execute_command(self, params: commands.CommandParams) -> None:
         """Execute a ProtocolEngine command, including error recovery.
 
         See `ChildThreadTransport.execute_command_wait_for_recovery()` for exact
         behavior.
+
+        Inside `batch_commands()`, the command is only queued up,
+        and executes when the batch is flushed.
         """
         CreateType = CREATE_TYPES_BY_PARAMS_TYPE[type(params)]
         create_request = CreateType(params=cast(Any, params))
-        self._transport.execute_command_wait_for_recovery(create_request)
+        if self._batched_requests is not None:
+            self._batched_requests.append(create_request)
+        else:
+            self._transport.execute_command_wait_for_recovery(create_request)
+
+    @contextmanager
+    def batch_commands(self) -> Iterator[None]:
+        """Collect the commands from `execute_command()` and execute them together.
+
+        Executing a batch of commands takes a single round trip to the engine's
+        thread, instead of one per command. The commands still execute one at
+        a time, in the order they were requested, and the batch is flushed
+        before any other call that goes to the engine. If one of them fails,
+        the ones after it are never added to the engine, and the error is
+        raised when the batch is flushed.
+
+        While a batch is pending, `state` doesn't reflect its commands yet.
+        Callers that read state that the batched commands change, like
+        a pipette's aspirated volume, must call `flush_commands()` first.
+
+        The batch is flushed when the context exits, even if it exits with
+        an exception. Nested calls join the outermost batch.
+        """
+        if self._batched_requests is not None:
+            yield
+            return
+
+        self._batched_requests = []
+        try:
+            yield
+        finally:
+            try:
+                self.flush_commands()
+            finally:
+                self._batched_requests = None
+
+    def flush_commands(self) -> None:
+        """Execute the commands that `batch_commands()` has collected so far.
+
+        See `ChildThreadTransport.execute_commands_wait_for_recovery()` for exact
+        behavior. Does nothing outside of a batch.
+        """
+        if self._batched_requests:
+            requests = self._batched_requests
+            self._batched_requests = []
+            self._transport.execute_commands_wait_for_recovery(requests)
 
     @overload
     def execute_command_without_recovery(
@@ -97,6 +147,7 @@ class SyncClient:
         See `ChildThreadTransport.execute_command()` for exact
         behavior.
         """
+        self.flush_commands()
         CreateType = CREATE_TYPES_BY_PARAMS_TYPE[type(params)]
         create_request = CreateType(params=cast(Any, params))
         return self._transport.execute_command(create_request)
@@ -108,6 +159,7 @@ class SyncClient:
 
     def add_labware_definition(self, definition: LabwareDefinition) -> LabwareUri:
         """Add a labware definition to the engine."""
+        self.flush_commands()
         return self._transport.call_method(
             "add_labware_definition",
             definition=definition,
@@ -115,6 +167,7 @@ class SyncClient:
 
     def add_addressable_area(self, addressable_area_name: str) -> None:
         """Add an addressable area to the engine's state."""
+        self.flush_commands()
         self._transport.call_method(
             "add_addressable_area", addressable_area_name=addressable_area_name
         )
@@ -123,10 +176,12 @@ class SyncClient:
         self, name: str, color: Optional[str], description: Optional[str]
     ) -> Liquid:
         """Add a liquid to the engine."""
+        self.flush_commands()
         return self._transport.call_method("add_liquid", name=name, color=color, description=description)  # type: ignore[no-any-return]
 
     def reset_tips(self, labware_id: str) -> None:
         """Reset a labware's tip tracking state.."""
+        self.flush_commands()
         self._transport.call_method(
             "reset_tips",
             labware_id=labware_id,
@@ -134,6 +189,7 @@ class SyncClient:
 
     def add_labware_offset(self, request: LabwareOffsetCreate) -> None:
         """Add a labware offset."""
+        self.flush_commands()
         self._transport.call_method("add_labware_offset", request=request)
 
     def set_pipette_movement_speed(
@@ -143,6 +199,7 @@ class SyncClient:
 
         None will use the hardware API's default.
         """
+        self.flush_commands()
         self._transport.call_method(
             "set_pipette_movement_speed",
             pipette_id=pipette_id,
@@ -1,6 +1,6 @@
 """A helper for controlling a `ProtocolEngine` without async/await."""
 from asyncio import AbstractEventLoop, run_coroutine_threadsafe
-from typing import Any, Final, overload
+from typing import Any, Final, List, Sequence, overload
 from typing_extensions import Literal
 
 from opentrons_shared_data.labware.types import LabwareUri
@@ -158,6 +158,58 @@ class ChildThreadTransport:
 
         return command
 
+    def execute_commands_wait_for_recovery(
+        self, requests: Sequence[CommandCreate]
+    ) -> List[Command]:
+        """Execute several ProtocolEngine commands, in order, including error recovery.
+
+        The commands are sent in a single trip to the engine's thread, and then
+        behave like `execute_command_wait_for_recovery()` called once for each
+        of them. See `ProtocolEngine.add_and_execute_commands_wait_for_recovery()`.
+
+        Args:
+            requests: The ProtocolEngine command requests, in order.
+
+        Returns:
+            The commands.
+
+        Raises:
+            ProtocolEngineError: If a command failed, *and* the failure was not
+                recovered from. Commands after it won't have been added.
+
+                If the run was stopped before all the commands could complete,
+                that's also signalled as this exception.
+        """
+
+        async def run_in_pe_thread() -> List[Command]:
+            commands = await self._engine.add_and_execute_commands_wait_for_recovery(
+                requests=requests
+            )
+
+            for command in commands:
+                if command.error is not None:
+                    error_recovery_type = (
+                        self._engine.state_view.commands.get_error_recovery_type(
+                            command.id
+                        )
+                    )
+                    if error_recovery_type == ErrorRecoveryType.FAIL_RUN:
+                        error = command.error
+                        raise ProtocolCommandFailedError(
+                            original_error=error,
+                            message=f"{error.errorType}: {error.detail}",
+                        )
+
+                elif command.status == CommandStatus.QUEUED:
+                    raise RunStoppedBeforeCommandError(command)
+
+            return commands
+
+        return run_coroutine_threadsafe(
+            run_in_pe_thread(),
+            loop=self._loop,
+        ).result()
+
     @overload
     def call_method(
         self,
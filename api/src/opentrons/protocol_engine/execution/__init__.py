@@ -1,6 +1,7 @@
 """Command execution module."""
 
 from .command_executor import CommandExecutor
+from .command_profiler import CommandProfiler, CommandTypeProfile
 from .create_queue_worker import create_queue_worker
 from .equipment import (
     EquipmentHandler,
@@ -13,7 +14,7 @@ from .equipment import (
 from .movement import MovementHandler
 from .gantry_mover import GantryMover
 from .labware_movement import LabwareMovementHandler
-from .pipetting import PipettingHandler
+from .pipetting import PipettingHandler, LiquidProbeStats
 from .tip_handler import TipHandler
 from .queue_worker import QueueWorker
 from .rail_lights import RailLightsHandler
@@ -27,6 +28,8 @@ from .status_bar import StatusBarHandler
 
 __all__ = [
     "CommandExecutor",
+    "CommandProfiler",
+    "CommandTypeProfile",
     "create_queue_worker",
     "EquipmentHandler",
     "LoadedLabwareData",
@@ -37,6 +40,7 @@ __all__ = [
     "MovementHandler",
     "GantryMover",
     "PipettingHandler",
+    "LiquidProbeStats",
     "TipHandler",
     "LabwareMovementHandler",
     "QueueWorker",
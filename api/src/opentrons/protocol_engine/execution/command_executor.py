@@ -1,5 +1,6 @@
 """Command side-effect execution logic container."""
 import asyncio
+import time
 from logging import getLogger
 from typing import Optional, List, Protocol
 
@@ -12,6 +13,7 @@ from opentrons_shared_data.errors.exceptions import (
 )
 
 from opentrons.protocol_engine.commands.command import SuccessData
+from opentrons.util.performance_helpers import trace_span
 
 from ..state import StateStore
 from ..resources import ModelUtils
@@ -34,6 +36,7 @@ from .tip_handler import TipHandler
 from .run_control import RunControlHandler
 from .rail_lights import RailLightsHandler
 from .status_bar import StatusBarHandler
+from .command_profiler import CommandProfiler
 
 
 log = getLogger(__name__)
@@ -85,6 +88,7 @@ class CommandExecutor:
         status_bar: StatusBarHandler,
         model_utils: Optional[ModelUtils] = None,
         command_note_tracker_provider: Optional[CommandNoteTrackerProvider] = None,
+        command_profiler: Optional[CommandProfiler] = None,
     ) -> None:
         """Initialize the CommandExecutor with access to its dependencies."""
         self._hardware_api = hardware_api
@@ -103,6 +107,7 @@ class CommandExecutor:
         self._command_note_tracker_provider = (
             command_note_tracker_provider or _NoteTracker
         )
+        self._command_profiler = command_profiler
 
     async def execute(self, command_id: str) -> None:
         """Run a given command's execution procedure.
@@ -111,6 +116,11 @@ class CommandExecutor:
             command_id: The identifier of the command to execute. The
                 command itself will be looked up from state.
         """
+        with trace_span("CommandExecutor.execute", command_id=command_id):
+            await self._execute(command_id)
+
+    async def _execute(self, command_id: str) -> None:
+        picked_up_at = time.perf_counter()
         queued_command = self._state_store.commands.get(command_id=command_id)
         note_tracker = self._command_note_tracker_provider()
         command_impl = queued_command._ImplementationCls(
@@ -131,9 +141,11 @@ class CommandExecutor:
 
         started_at = self._model_utils.get_timestamp()
 
+        run_dispatched_at = time.perf_counter()
         self._action_dispatcher.dispatch(
             RunCommandAction(command_id=queued_command.id, started_at=started_at)
         )
+        implementation_started_at = time.perf_counter()
         running_command = self._state_store.commands.get(queued_command.id)
         error_recovery_policy = self._state_store.commands.get_error_recovery_policy()
 
@@ -141,12 +153,14 @@ class CommandExecutor:
             f"Executing {running_command.id}, {running_command.commandType}, {running_command.params}"
         )
         try:
-            result = await command_impl.execute(
-                running_command.params  # type: ignore[arg-type]
-            )
+            with trace_span(f"{running_command.commandType}.execute"):
+                result = await command_impl.execute(
+                    running_command.params  # type: ignore[arg-type]
+                )
 
         except (Exception, asyncio.CancelledError) as error:
             # The command encountered an undefined error.
+            implementation_finished_at = time.perf_counter()
 
             log.warning(f"Execution of {running_command.id} failed", exc_info=error)
             # TODO(mc, 2022-11-14): mark command as stopped rather than failed
@@ -175,6 +189,7 @@ class CommandExecutor:
             )
 
         else:
+            implementation_finished_at = time.perf_counter()
             if isinstance(result, SuccessData):
                 update = {
                     "result": result.public,
@@ -205,3 +220,13 @@ class CommandExecutor:
                         ),
                     )
                 )
+
+        if self._command_profiler is not None:
+            finished_at = time.perf_counter()
+            self._command_profiler.add(
+                command_type=running_command.commandType,
+                wall_time=finished_at - picked_up_at,
+                hardware_time=implementation_finished_at - implementation_started_at,
+                state_update_time=(implementation_started_at - run_dispatched_at)
+                + (finished_at - implementation_finished_at),
+            )
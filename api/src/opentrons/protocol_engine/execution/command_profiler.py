@@ -0,0 +1,69 @@
+"""Execution time profiling of commands, by command type."""
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class CommandTypeProfile:
+    """How long every executed command of one type took, in seconds."""
+
+    command_type: str
+    count: int = 0
+    wall_time: float = 0.0
+    hardware_time: float = 0.0
+    state_update_time: float = 0.0
+    max_wall_time: float = 0.0
+
+    @property
+    def mean_wall_time(self) -> float:
+        """The average wall time of one command of this type."""
+        return self.wall_time / self.count if self.count else 0.0
+
+
+class CommandProfiler:
+    """Accumulate how long executed commands took, grouped by command type.
+
+    The CommandExecutor reports three times for every command it executes:
+
+    * Wall time: from when the executor picked the command up until its
+      result was in state.
+    * Hardware time: time spent in the command's implementation. For most
+      commands this is dominated by waiting on the hardware.
+    * State update time: time spent dispatching the command's actions to
+      the state store.
+
+    The difference between the wall time and the other two is the executor's
+    own overhead, like building the command implementation.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: Dict[str, CommandTypeProfile] = {}
+
+    def add(
+        self,
+        command_type: str,
+        wall_time: float,
+        hardware_time: float,
+        state_update_time: float,
+    ) -> None:
+        """Add the times of one executed command."""
+        profile = self._profiles.get(command_type)
+        if profile is None:
+            profile = self._profiles[command_type] = CommandTypeProfile(
+                command_type=command_type
+            )
+        profile.count += 1
+        profile.wall_time += wall_time
+        profile.hardware_time += hardware_time
+        profile.state_update_time += state_update_time
+        profile.max_wall_time = max(profile.max_wall_time, wall_time)
+
+    def get_profiles(self) -> List[CommandTypeProfile]:
+        """Get the profile of each command type, the most total wall time first."""
+        return sorted(
+            self._profiles.values(), key=lambda profile: profile.wall_time, reverse=True
+        )
+
+    def clear(self) -> None:
+        """Forget every recorded command."""
+        self._profiles.clear()
@@ -1,5 +1,5 @@
 """QueueWorker and dependency factory."""
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator, Callable, Optional
 
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_engine.execution.rail_lights import RailLightsHandler
@@ -10,10 +10,11 @@ from .equipment import EquipmentHandler
 from .movement import MovementHandler
 from .gantry_mover import create_gantry_mover
 from .labware_movement import LabwareMovementHandler
-from .pipetting import create_pipetting_handler
+from .pipetting import LiquidProbeStats, create_pipetting_handler
 from .tip_handler import create_tip_handler
 from .run_control import RunControlHandler
 from .command_executor import CommandExecutor
+from .command_profiler import CommandProfiler
 from .queue_worker import QueueWorker
 from .status_bar import StatusBarHandler
 
@@ -23,6 +24,8 @@ def create_queue_worker(
     state_store: StateStore,
     action_dispatcher: ActionDispatcher,
     command_generator: Callable[[], AsyncGenerator[str, None]],
+    command_profiler: Optional[CommandProfiler] = None,
+    liquid_probe_stats: Optional[LiquidProbeStats] = None,
 ) -> QueueWorker:
     """Create a ready-to-use QueueWorker instance.
 
@@ -32,6 +35,9 @@ def create_queue_worker(
         action_dispatcher: ActionDispatcher to pass down to dependencies.
         error_recovery_policy: ErrorRecoveryPolicy to pass down to dependencies.
         command_generator: Command generator to get the next command to execute.
+        command_profiler: Where to record how long each executed command took.
+        liquid_probe_stats: Where to record how remembered liquid heights
+            shortened liquid probes.
     """
     gantry_mover = create_gantry_mover(
         hardware_api=hardware_api,
@@ -59,6 +65,7 @@ def create_queue_worker(
     pipetting_handler = create_pipetting_handler(
         hardware_api=hardware_api,
         state_view=state_store,
+        liquid_probe_stats=liquid_probe_stats,
     )
 
     tip_handler = create_tip_handler(
@@ -89,6 +96,7 @@ def create_queue_worker(
         run_control=run_control_handler,
         rail_lights=rail_lights_handler,
         status_bar=status_bar_handler,
+        command_profiler=command_profiler,
     )
 
     return QueueWorker(
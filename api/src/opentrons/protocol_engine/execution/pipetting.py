@@ -1,9 +1,13 @@
 """Pipetting command handling."""
+import math
+from dataclasses import dataclass
 from typing import Optional, Iterator
 from typing_extensions import Protocol as TypingProtocol
 from contextlib import contextmanager
 
+from opentrons_shared_data.errors.exceptions import PipetteLiquidNotFoundError
 from opentrons.hardware_control import HardwareControlAPI
+from opentrons.types import Mount, Point
 
 from ..state import StateView, HardwarePipette
 from ..notes import CommandNoteAdder, CommandNote
@@ -25,6 +29,28 @@ from opentrons.protocol_engine.types import WellLocation
 #   well in general.
 _VOLUME_ROUNDING_ERROR_TOLERANCE = 1e-9
 
+# How far above and below a predicted liquid height to search for liquid, on top of
+# the height that the liquid is predicted to have moved since it was last measured.
+# This keeps the tip out of the liquid while the probe establishes its baseline.
+_PREDICTED_LIQUID_HEIGHT_MARGIN_MM = 2.0
+
+
+@dataclass
+class LiquidProbeStats:
+    """How much remembered liquid heights have shortened liquid probes."""
+
+    probes: int = 0
+    """Liquid probes run, by any means."""
+
+    predicted_probes: int = 0
+    """Liquid probes that started just above a predicted liquid height."""
+
+    missed_predictions: int = 0
+    """Predicted probes that missed, and fell back to a full search."""
+
+    z_distance_saved: float = 0.0
+    """How much Z travel, in mm, predicted probes that hit did not have to search."""
+
 
 class PipettingHandler(TypingProtocol):
     """Liquid handling commands."""
@@ -76,10 +102,16 @@ class PipettingHandler(TypingProtocol):
 class HardwarePipettingHandler(PipettingHandler):
     """Liquid handling, using the Hardware API.""" ""
 
-    def __init__(self, state_view: StateView, hardware_api: HardwareControlAPI) -> None:
+    def __init__(
+        self,
+        state_view: StateView,
+        hardware_api: HardwareControlAPI,
+        liquid_probe_stats: Optional[LiquidProbeStats] = None,
+    ) -> None:
         """Initialize a PipettingHandler instance."""
         self._state_view = state_view
         self._hardware_api = hardware_api
+        self._liquid_probe_stats = liquid_probe_stats or LiquidProbeStats()
 
     def get_is_empty(self, pipette_id: str) -> bool:
         """Get whether a pipette has an aspirated volume equal to 0."""
@@ -179,7 +211,12 @@ class HardwarePipettingHandler(PipettingHandler):
         well_name: str,
         well_location: WellLocation,
     ) -> float:
-        """Detect liquid level."""
+        """Detect liquid level.
+
+        If liquid was measured in this well before, and the pipette is using a
+        single channel, first search a short window around where that liquid
+        should be now, and only search the whole well if that misses.
+        """
         hw_pipette = self._state_view.pipettes.get_hardware_pipette(
             pipette_id=pipette_id,
             attached_pipettes=self._hardware_api.attached_instruments,
@@ -189,12 +226,84 @@ class HardwarePipettingHandler(PipettingHandler):
         lld_min_height = self._state_view.pipettes.get_current_tip_lld_settings(
             pipette_id=pipette_id
         )
-        z_pos = await self._hardware_api.liquid_probe(
-            mount=hw_pipette.mount,
-            max_z_dist=well_depth - lld_min_height + well_location.offset.z,
-        )
+        max_z_dist = well_depth - lld_min_height + well_location.offset.z
+        self._liquid_probe_stats.probes += 1
+
+        z_pos = None
+        # With more than one channel, the other tips could end up below the
+        # liquid in their own wells, which we know nothing about.
+        if self._state_view.tips.get_pipette_active_channels(pipette_id) == 1:
+            z_pos = await self._probe_predicted_liquid_height(
+                mount=hw_pipette.mount,
+                labware_id=labware_id,
+                well_name=well_name,
+                max_z_dist=max_z_dist,
+            )
+        if z_pos is None:
+            z_pos = await self._hardware_api.liquid_probe(
+                mount=hw_pipette.mount,
+                max_z_dist=max_z_dist,
+            )
         return float(z_pos)
 
+    async def _probe_predicted_liquid_height(
+        self,
+        mount: Mount,
+        labware_id: str,
+        well_name: str,
+        max_z_dist: float,
+    ) -> Optional[float]:
+        """Probe for liquid near its predicted height, from the current position.
+
+        Returns the liquid height, or None if there is no useful prediction or
+        the liquid was not where it was predicted to be. Either way, the pipette
+        ends up back where it started. If the probe raises any other error, like
+        a stall, the pipette is left where the error happened.
+        """
+        last_measured = self._state_view.wells.get_last_measured_liquid_height(
+            labware_id=labware_id, well_name=well_name
+        )
+        if last_measured is None:
+            return None
+
+        well_def = self._state_view.labware.get_well_definition(labware_id, well_name)
+        if well_def.shape == "circular" and well_def.diameter:
+            area = math.pi * (well_def.diameter / 2) ** 2
+        elif well_def.xDimension and well_def.yDimension:
+            area = well_def.xDimension * well_def.yDimension
+        else:
+            return None
+
+        # Well walls aren't all vertical, so the further the liquid has moved
+        # since it was measured, the less sure we are of where it is now.
+        height_change = last_measured.volume_change / area
+        predicted_height = last_measured.height + height_change
+        margin = _PREDICTED_LIQUID_HEIGHT_MARGIN_MM + abs(height_change)
+
+        start_position = await self._hardware_api.gantry_position(mount, refresh=True)
+        lowest_z = start_position.z - max_z_dist
+        probe_start_z = predicted_height + margin
+        if not lowest_z < probe_start_z < start_position.z - margin:
+            return None
+
+        self._liquid_probe_stats.predicted_probes += 1
+        await self._hardware_api.move_to(
+            mount, Point(start_position.x, start_position.y, probe_start_z)
+        )
+        try:
+            z_pos = await self._hardware_api.liquid_probe(
+                mount=mount,
+                max_z_dist=probe_start_z - max(predicted_height - margin, lowest_z),
+            )
+        except PipetteLiquidNotFoundError:
+            self._liquid_probe_stats.missed_predictions += 1
+            await self._hardware_api.move_to(mount, start_position)
+            return None
+
+        self._liquid_probe_stats.z_distance_saved += start_position.z - probe_start_z
+        await self._hardware_api.move_to(mount, start_position)
+        return z_pos
+
     @contextmanager
     def _set_flow_rate(
         self,
@@ -309,11 +418,17 @@ class VirtualPipettingHandler(PipettingHandler):
 
 
 def create_pipetting_handler(
-    state_view: StateView, hardware_api: HardwareControlAPI
+    state_view: StateView,
+    hardware_api: HardwareControlAPI,
+    liquid_probe_stats: Optional[LiquidProbeStats] = None,
 ) -> PipettingHandler:
     """Create a pipetting handler."""
     return (
-        HardwarePipettingHandler(state_view=state_view, hardware_api=hardware_api)
+        HardwarePipettingHandler(
+            state_view=state_view,
+            hardware_api=hardware_api,
+            liquid_probe_stats=liquid_probe_stats,
+        )
         if state_view.config.use_virtual_pipettes is False
         else VirtualPipettingHandler(state_view=state_view)
     )
@@ -1,5 +1,5 @@
 """Run control command side-effect logic."""
-import asyncio
+from opentrons.hardware_control.clock import get_clock
 
 from ..state import StateStore
 from ..actions import ActionDispatcher, PauseAction, PauseSource
@@ -30,4 +30,4 @@ class RunControlHandler:
     async def wait_for_duration(self, seconds: float) -> None:
         """Delay protocol execution for a duration."""
         if not self._state_store.config.ignore_pause:
-            await asyncio.sleep(seconds)
+            await get_clock().sleep(seconds)
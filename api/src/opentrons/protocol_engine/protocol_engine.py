@@ -1,12 +1,15 @@
 """ProtocolEngine class definition."""
 from contextlib import AsyncExitStack
 from logging import getLogger
-from typing import Dict, Optional, Union, AsyncGenerator, Callable
+from typing import Dict, List, Optional, Sequence, Union, AsyncGenerator, Callable
 from opentrons.protocol_engine.actions.actions import (
     ResumeFromRecoveryAction,
     SetErrorRecoveryPolicyAction,
 )
-from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryPolicy
+from opentrons.protocol_engine.error_recovery_policy import (
+    ErrorRecoveryPolicy,
+    ErrorRecoveryType,
+)
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control import HardwareControlAPI
@@ -33,6 +36,8 @@ from .types import (
     AddressableAreaLocation,
 )
 from .execution import (
+    CommandProfiler,
+    LiquidProbeStats,
     QueueWorker,
     create_queue_worker,
     DoorWatcher,
@@ -94,6 +99,8 @@ class ProtocolEngine:
         hardware_stopper: Optional[HardwareStopper] = None,
         door_watcher: Optional[DoorWatcher] = None,
         module_data_provider: Optional[ModuleDataProvider] = None,
+        command_profiler: Optional[CommandProfiler] = None,
+        liquid_probe_stats: Optional[LiquidProbeStats] = None,
     ) -> None:
         """Initialize a ProtocolEngine instance.
 
@@ -122,6 +129,8 @@ class ProtocolEngine:
             action_dispatcher=self._action_dispatcher,
         )
         self._module_data_provider = module_data_provider or ModuleDataProvider()
+        self._command_profiler = command_profiler or CommandProfiler()
+        self._liquid_probe_stats = liquid_probe_stats or LiquidProbeStats()
         self._queue_worker = queue_worker
         if self._queue_worker:
             self._queue_worker.start()
@@ -132,6 +141,16 @@ class ProtocolEngine:
         """Get an interface to retrieve calculated state values."""
         return self._state_store
 
+    @property
+    def command_profiler(self) -> CommandProfiler:
+        """Get how long the commands this engine executed took, by command type."""
+        return self._command_profiler
+
+    @property
+    def liquid_probe_stats(self) -> LiquidProbeStats:
+        """Get how much remembered liquid heights have shortened liquid probes."""
+        return self._liquid_probe_stats
+
     @property
     def _get_queue_worker(self) -> QueueWorker:
         """Get the queue worker instance."""
@@ -210,6 +229,62 @@ class ProtocolEngine:
             CommandNotAllowedError: the request specified a failed command id
                 with a non fixit command.
         """
+        action = self._create_queue_command_action(
+            request=request,
+            failed_command_id=failed_command_id,
+            last_hash=self._state_store.commands.get_latest_protocol_command_hash(),
+        )
+        validated_action = self.state_view.commands.validate_action_allowed(action)
+        self._action_dispatcher.dispatch(validated_action)
+        return self._state_store.commands.get(action.command_id)
+
+    def add_commands(
+        self,
+        requests: Sequence[commands.CommandCreate],
+        failed_command_id: Optional[str] = None,
+    ) -> List[commands.Command]:
+        """Add several commands to the `ProtocolEngine`'s queue, in order.
+
+        The commands are added all together or not at all: every command is
+        validated before any is queued, so if one is not allowed, none are.
+
+        Arguments:
+            requests: The command types and payload data used to construct
+                the commands in state.
+            failed_command_id: The failed command that fixit commands fix.
+
+        Returns:
+            The full, newly queued commands.
+
+        Raises:
+            The same errors as `add_command`.
+        """
+        last_hash = self._state_store.commands.get_latest_protocol_command_hash()
+        actions = []
+        for request in requests:
+            action = self._create_queue_command_action(
+                request=request,
+                failed_command_id=failed_command_id,
+                last_hash=last_hash,
+            )
+            last_hash = action.request_hash or last_hash
+            actions.append(action)
+
+        validated_actions = [
+            self.state_view.commands.validate_action_allowed(action)
+            for action in actions
+        ]
+        for validated_action in validated_actions:
+            self._action_dispatcher.dispatch(validated_action)
+        return [self._state_store.commands.get(action.command_id) for action in actions]
+
+    def _create_queue_command_action(
+        self,
+        request: commands.CommandCreate,
+        failed_command_id: Optional[str],
+        last_hash: Optional[str],
+    ) -> QueueCommandAction:
+        """Build the action that queues a command, before it's validated."""
         request = slot_standardization.standardize_command(
             request, self.state_view.config.robot_type
         )
@@ -228,20 +303,16 @@ class ProtocolEngine:
         else:
             request_hash = commands.hash_protocol_command_params(
                 create=request,
-                last_hash=self._state_store.commands.get_latest_protocol_command_hash(),
+                last_hash=last_hash,
             )
 
-        action = self.state_view.commands.validate_action_allowed(
-            QueueCommandAction(
-                request=request,
-                request_hash=request_hash,
-                command_id=command_id,
-                created_at=self._model_utils.get_timestamp(),
-                failed_command_id=failed_command_id,
-            )
+        return QueueCommandAction(
+            request=request,
+            request_hash=request_hash,
+            command_id=command_id,
+            created_at=self._model_utils.get_timestamp(),
+            failed_command_id=failed_command_id,
         )
-        self._action_dispatcher.dispatch(action)
-        return self._state_store.commands.get(command_id)
 
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed.
@@ -305,6 +376,40 @@ class ProtocolEngine:
         )
         return completed_command
 
+    async def add_and_execute_commands_wait_for_recovery(
+        self, requests: Sequence[commands.CommandCreate]
+    ) -> List[commands.Command]:
+        """Like `add_and_execute_command_wait_for_recovery()`, for several commands.
+
+        This lets a caller in another thread execute several commands in a single
+        trip to the engine's thread. Unlike `add_commands()`, it doesn't queue the
+        commands all at once. Each command is only added after the one before it
+        has completed, including any error recovery. So if a command fails the run,
+        the commands after it are never added, just as if the caller had executed
+        them one at a time.
+
+        Returns:
+            The commands, in order, up to and including the first one that
+            failed without being recovered from, or that was left queued
+            because the engine was stopped before it reached it.
+        """
+        completed_commands = []
+        for request in requests:
+            completed_command = await self.add_and_execute_command_wait_for_recovery(
+                request
+            )
+            completed_commands.append(completed_command)
+
+            if completed_command.status == commands.CommandStatus.QUEUED or (
+                completed_command.error is not None
+                and self._state_store.commands.get_error_recovery_type(
+                    completed_command.id
+                )
+                == ErrorRecoveryType.FAIL_RUN
+            ):
+                break
+        return completed_commands
+
     def estop(self) -> None:
         """Signal to the engine that an E-stop event occurred.
 
@@ -612,6 +717,8 @@ class ProtocolEngine:
             state_store=self._state_store,
             action_dispatcher=self._action_dispatcher,
             command_generator=command_generator,
+            command_profiler=self._command_profiler,
+            liquid_probe_stats=self._liquid_probe_stats,
         )
         self._queue_worker.start()
 
@@ -81,6 +81,12 @@ class AddressableAreaState:
     """Information about the current robot model."""
     robot_definition: RobotDefinition
 
+    deck_layout_version: int = 0
+    """Incremented whenever the loaded addressable areas or the deck configuration change.
+
+    This lets views cache geometry that is derived from this state.
+    """
+
 
 _OT2_ORDERED_SLOTS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"]
 _FLEX_ORDERED_SLOTS = [
@@ -210,6 +216,7 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                         deck_definition=current_state.deck_definition,
                     )
                 )
+                self._state.deck_layout_version += 1
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -290,6 +297,7 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             self._state.loaded_addressable_areas_by_name[
                 addressable_area.area_name
             ] = addressable_area
+            self._state.deck_layout_version += 1
 
     def _validate_addressable_area_for_simulation(
         self, addressable_area_name: str
@@ -336,6 +344,10 @@ class AddressableAreaView(HasState[AddressableAreaState]):
         """
         self._state = state
 
+    def get_deck_layout_version(self) -> int:
+        """Get a number that changes whenever the loaded addressable areas may have changed."""
+        return self._state.deck_layout_version
+
     @cached_property
     def deck_extents(self) -> Point:
         """The maximum space on the deck."""
@@ -103,6 +103,14 @@ class GeometryView:
         self._addressable_areas = addressable_area_view
         self._last_drop_tip_location_spot: Dict[str, _TipDropSection] = {}
 
+        # Per-slot geometry that is expensive to compute, but only changes when
+        # labware, modules, or addressable areas do. See `_get_deck_layout_cache`.
+        self._deck_layout_cache_key: Optional[Tuple[int, int, int]] = None
+        self._highest_z_by_slot: Dict[Union[DeckSlotName, StagingSlotName], float] = {}
+        self._slot_rectangle_by_slot: Dict[
+            Union[DeckSlotName, StagingSlotName], Tuple[Point, Point]
+        ] = {}
+
     @cached_property
     def absolute_deck_extents(self) -> _AbsoluteRobotExtents:
         """The absolute deck extents for a given robot deck."""
@@ -184,6 +192,17 @@ class GeometryView:
         This height includes the height of any module that occupies the given slot
         even if it wasn't loaded in that slot (e.g., thermocycler).
         """
+        self._check_deck_layout_cache()
+        try:
+            return self._highest_z_by_slot[slot.slotName]
+        except KeyError:
+            highest_z = self._get_highest_z_in_slot(slot)
+            self._highest_z_by_slot[slot.slotName] = highest_z
+            return highest_z
+
+    def _get_highest_z_in_slot(
+        self, slot: Union[DeckSlotLocation, StagingSlotLocation]
+    ) -> float:
         slot_item = self.get_slot_item(slot.slotName)
         if isinstance(slot_item, LoadedModule):
             # get height of module + all labware on it
@@ -207,6 +226,49 @@ class GeometryView:
         else:
             return 0
 
+    def get_slot_bounding_rectangle(
+        self, slot_name: Union[DeckSlotName, StagingSlotName]
+    ) -> Tuple[Point, Point]:
+        """Get the back-left and front-right corners of a deck or staging slot's footprint.
+
+        Both corners are at the height of the slot's surface.
+        """
+        self._check_deck_layout_cache()
+        try:
+            return self._slot_rectangle_by_slot[slot_name]
+        except KeyError:
+            slot_pos = self._addressable_areas.get_addressable_area_position(
+                addressable_area_name=slot_name.id,
+                do_compatibility_check=False,
+            )
+            slot_bounds = self._addressable_areas.get_addressable_area_bounding_box(
+                addressable_area_name=slot_name.id,
+                do_compatibility_check=False,
+            )
+            rectangle = (
+                Point(slot_pos.x, slot_pos.y + slot_bounds.y, slot_pos.z),
+                Point(slot_pos.x + slot_bounds.x, slot_pos.y, slot_pos.z),
+            )
+            self._slot_rectangle_by_slot[slot_name] = rectangle
+            return rectangle
+
+    def _check_deck_layout_cache(self) -> None:
+        """Forget cached per-slot geometry if anything it was derived from has changed.
+
+        Checking three counters is much cheaper than re-deriving slot contents and
+        heights, which partial-tip collision checks otherwise do for several
+        slots on every movement.
+        """
+        cache_key = (
+            self._labware.get_deck_layout_version(),
+            self._modules.get_deck_layout_version(),
+            self._addressable_areas.get_deck_layout_version(),
+        )
+        if cache_key != self._deck_layout_cache_key:
+            self._deck_layout_cache_key = cache_key
+            self._highest_z_by_slot.clear()
+            self._slot_rectangle_by_slot.clear()
+
     def get_highest_z_of_labware_stack(self, labware_id: str) -> float:
         """Get the highest Z-point of the topmost labware in the stack of labware on the given labware.
 
@@ -109,6 +109,10 @@ class LabwareState:
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV5
 
+    # Incremented whenever something that can change where labware sits, or how
+    # tall it is, changes. Lets views cache geometry derived from this state.
+    deck_layout_version: int = 0
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
@@ -165,6 +169,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 vector=action.request.vector,
             )
             self._add_labware_offset(labware_offset)
+            self._state.deck_layout_version += 1
 
         elif isinstance(action, AddLabwareDefinitionAction):
             uri = uri_from_details(
@@ -173,6 +178,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=action.definition.version,
             )
             self._state.definitions_by_uri[uri] = action.definition
+            self._state.deck_layout_version += 1
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -203,11 +209,13 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 offsetId=command.result.offsetId,
                 displayName=command.params.displayName,
             )
+            self._state.deck_layout_version += 1
 
         elif isinstance(command.result, ReloadLabwareResult):
             labware_id = command.params.labwareId
             new_offset_id = command.result.offsetId
             self._state.labware_by_id[labware_id].offsetId = new_offset_id
+            self._state.deck_layout_version += 1
 
         elif isinstance(command.result, MoveLabwareResult):
             labware_id = command.params.labwareId
@@ -223,6 +231,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 # If a labware has been moved into a waste chute it's been chuted away and is now technically off deck
                 new_location = OFF_DECK_LOCATION
             self._state.labware_by_id[labware_id].location = new_location
+            self._state.deck_layout_version += 1
 
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
@@ -249,6 +258,10 @@ class LabwareView(HasState[LabwareState]):
         """
         self._state = state
 
+    def get_deck_layout_version(self) -> int:
+        """Get a number that changes whenever labware placement or geometry may have changed."""
+        return self._state.deck_layout_version
+
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
         try:
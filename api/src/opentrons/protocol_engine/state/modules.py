@@ -174,6 +174,12 @@ class ModuleState:
     deck_type: DeckType
     """Type of deck that the modules are on."""
 
+    deck_layout_version: int = 0
+    """Incremented whenever a module's placement or calibration changes.
+
+    This lets views cache geometry that is derived from this state.
+    """
+
 
 class ModuleStore(HasState[ModuleState], HandlesActions):
     """Module state container."""
@@ -293,6 +299,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             serial_number=serial_number,
             definition=definition,
         )
+        self._state.deck_layout_version += 1
 
         if ModuleModel.is_magnetic_module_model(actual_model):
             self._state.substate_by_module_id[module_id] = MagneticModuleSubState(
@@ -376,6 +383,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 moduleOffsetVector=module_offset,
                 location=location,
             )
+            self._state.deck_layout_version += 1
 
     def _handle_heater_shaker_commands(
         self,
@@ -573,6 +581,10 @@ class ModuleView(HasState[ModuleState]):
         """Initialize the view with its backing state value."""
         self._state = state
 
+    def get_deck_layout_version(self) -> int:
+        """Get a number that changes whenever module placement or calibration may have changed."""
+        return self._state.deck_layout_version
+
     def get(self, module_id: str) -> LoadedModule:
         """Get module data by the module's unique identifier."""
         try:
@@ -26,6 +26,7 @@ from .pipettes import PipetteState, PipetteStore, PipetteView
 from .modules import ModuleState, ModuleStore, ModuleView
 from .liquids import LiquidState, LiquidView, LiquidStore
 from .tips import TipState, TipView, TipStore
+from .wells import WellState, WellView, WellStore
 from .geometry import GeometryView
 from .motion import MotionView
 from .config import Config
@@ -48,6 +49,7 @@ class State:
     modules: ModuleState
     liquids: LiquidState
     tips: TipState
+    wells: WellState
 
 
 class StateView(HasState[State]):
@@ -61,6 +63,7 @@ class StateView(HasState[State]):
     _modules: ModuleView
     _liquid: LiquidView
     _tips: TipView
+    _wells: WellView
     _geometry: GeometryView
     _motion: MotionView
     _config: Config
@@ -100,6 +103,11 @@ class StateView(HasState[State]):
         """Get state view selectors for tip state."""
         return self._tips
 
+    @property
+    def wells(self) -> WellView:
+        """Get state view selectors for well state."""
+        return self._wells
+
     @property
     def geometry(self) -> GeometryView:
         """Get state view selectors for derived geometry state."""
@@ -195,6 +203,7 @@ class StateStore(StateView, ActionHandler):
         )
         self._liquid_store = LiquidStore()
         self._tip_store = TipStore()
+        self._well_store = WellStore()
 
         self._substores: List[HandlesActions] = [
             self._command_store,
@@ -204,6 +213,7 @@ class StateStore(StateView, ActionHandler):
             self._module_store,
             self._liquid_store,
             self._tip_store,
+            self._well_store,
         ]
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
@@ -320,6 +330,7 @@ class StateStore(StateView, ActionHandler):
             modules=self._module_store.state,
             liquids=self._liquid_store.state,
             tips=self._tip_store.state,
+            wells=self._well_store.state,
         )
 
     def _initialize_state(self) -> None:
@@ -335,6 +346,7 @@ class StateStore(StateView, ActionHandler):
         self._modules = ModuleView(state.modules)
         self._liquid = LiquidView(state.liquids)
         self._tips = TipView(state.tips)
+        self._wells = WellView(state.wells)
 
         # Derived states
         self._geometry = GeometryView(
@@ -364,6 +376,7 @@ class StateStore(StateView, ActionHandler):
         self._modules._state = next_state.modules
         self._liquid._state = next_state.liquids
         self._tips._state = next_state.tips
+        self._wells._state = next_state.wells
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
@@ -0,0 +1,209 @@
+"""Measured liquid heights in wells."""
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+from .. import commands
+from ..actions import (
+    Action,
+    DoorChangeAction,
+    FailCommandAction,
+    PauseAction,
+    PlayAction,
+    ResumeFromRecoveryAction,
+    SucceedCommandAction,
+)
+from ..commands.configuring_common import (
+    PipetteConfigUpdateResultMixin,
+    PipetteNozzleLayoutResultMixin,
+)
+from .abstract_store import HasState, HandlesActions
+
+
+@dataclass(frozen=True)
+class LiquidHeightInfo:
+    """The last liquid height measured in a well."""
+
+    height: float
+    """The Z coordinate, in deck space, where liquid was found."""
+
+    volume_change: float
+    """How many µL have been dispensed into the well since, minus those aspirated.
+
+    Only single-channel aspirates and dispenses are counted. Anything with more
+    active channels might also have moved liquid in other wells, so it makes the
+    labware's measurements be forgotten instead.
+    """
+
+
+@dataclass
+class WellState:
+    """State of the liquid in wells."""
+
+    measured_liquid_heights: Dict[str, Dict[str, LiquidHeightInfo]]
+    """Last measured liquid heights, by labware ID, then well name."""
+
+    active_channels_by_pipette_id: Dict[str, int]
+    """How many channels each pipette's current nozzle layout uses."""
+
+
+class WellStore(HasState[WellState], HandlesActions):
+    """Well state container."""
+
+    _state: WellState
+
+    def __init__(self) -> None:
+        """Initialize a well store and its state."""
+        self._state = WellState(
+            measured_liquid_heights={}, active_channels_by_pipette_id={}
+        )
+
+    def handle_action(self, action: Action) -> None:
+        """Modify state in reaction to an action."""
+        if isinstance(action, SucceedCommandAction):
+            if isinstance(action.private_result, PipetteConfigUpdateResultMixin):
+                self._state.active_channels_by_pipette_id[
+                    action.private_result.pipette_id
+                ] = action.private_result.config.nozzle_map.tip_count
+            elif isinstance(action.private_result, PipetteNozzleLayoutResultMixin):
+                pipette_id = action.private_result.pipette_id
+                nozzle_map = action.private_result.nozzle_map
+                if nozzle_map:
+                    self._state.active_channels_by_pipette_id[
+                        pipette_id
+                    ] = nozzle_map.tip_count
+                else:
+                    self._state.active_channels_by_pipette_id.pop(pipette_id, None)
+            self._handle_succeeded_command(action.command)
+        elif isinstance(action, FailCommandAction):
+            self._handle_failed_command(action.running_command)
+        elif isinstance(
+            action,
+            (PauseAction, PlayAction, DoorChangeAction, ResumeFromRecoveryAction),
+        ):
+            # Someone may have reached in and changed the liquid by hand.
+            self._state.measured_liquid_heights = {}
+
+    def _handle_succeeded_command(self, command: commands.Command) -> None:
+        if isinstance(
+            command.result, (commands.LiquidProbeResult, commands.TryLiquidProbeResult)
+        ):
+            if command.result.z_position is None:
+                self._forget_well(command.params.labwareId, command.params.wellName)
+            else:
+                self._state.measured_liquid_heights.setdefault(
+                    command.params.labwareId, {}
+                )[command.params.wellName] = LiquidHeightInfo(
+                    height=command.result.z_position, volume_change=0
+                )
+
+        elif isinstance(command.result, commands.AspirateResult):
+            self._add_volume(
+                command.params.labwareId,
+                command.params.wellName,
+                command.params.pipetteId,
+                -command.result.volume,
+            )
+
+        elif isinstance(command.result, commands.DispenseResult):
+            self._add_volume(
+                command.params.labwareId,
+                command.params.wellName,
+                command.params.pipetteId,
+                command.result.volume,
+            )
+
+        elif isinstance(command.result, commands.BlowOutResult):
+            # We don't know how much liquid a blow-out leaves in the well.
+            self._forget_well(command.params.labwareId, command.params.wellName)
+
+        elif isinstance(
+            command.result,
+            (
+                commands.AspirateInPlaceResult,
+                commands.DispenseInPlaceResult,
+                commands.BlowOutInPlaceResult,
+                commands.unsafe.UnsafeBlowOutInPlaceResult,
+                # Moving a labware also moves any labware stacked on it,
+                # so any measured height might be somewhere else now.
+                commands.MoveLabwareResult,
+                commands.ReloadLabwareResult,
+                # The liquid may have been changed by hand during the pause.
+                commands.WaitForResumeResult,
+            ),
+        ):
+            self._state.measured_liquid_heights = {}
+
+    def _handle_failed_command(self, command: commands.Command) -> None:
+        # A failed command may have moved some, but not all, of its liquid.
+        if isinstance(command, (commands.Aspirate, commands.Dispense)):
+            if self._is_single_channel(command.params.pipetteId):
+                self._forget_well(command.params.labwareId, command.params.wellName)
+            else:
+                self._forget_labware(command.params.labwareId)
+        elif isinstance(
+            command,
+            (
+                commands.BlowOut,
+                commands.LiquidProbe,
+                commands.TryLiquidProbe,
+            ),
+        ):
+            self._forget_well(command.params.labwareId, command.params.wellName)
+        elif isinstance(
+            command,
+            (
+                commands.AspirateInPlace,
+                commands.DispenseInPlace,
+                commands.BlowOutInPlace,
+                commands.unsafe.UnsafeBlowOutInPlace,
+            ),
+        ):
+            self._state.measured_liquid_heights = {}
+
+    def _add_volume(
+        self, labware_id: str, well_name: str, pipette_id: str, volume: float
+    ) -> None:
+        if not self._is_single_channel(pipette_id):
+            # The other channels may have moved liquid in wells next to this one,
+            # and we don't know which.
+            self._forget_labware(labware_id)
+            return
+        heights = self._state.measured_liquid_heights.get(labware_id, {})
+        height_info = heights.get(well_name)
+        if height_info is not None:
+            heights[well_name] = replace(
+                height_info, volume_change=height_info.volume_change + volume
+            )
+
+    def _is_single_channel(self, pipette_id: str) -> bool:
+        return self._state.active_channels_by_pipette_id.get(pipette_id) == 1
+
+    def _forget_well(self, labware_id: str, well_name: str) -> None:
+        self._state.measured_liquid_heights.get(labware_id, {}).pop(well_name, None)
+
+    def _forget_labware(self, labware_id: str) -> None:
+        self._state.measured_liquid_heights.pop(labware_id, None)
+
+
+class WellView(HasState[WellState]):
+    """Read-only well state view."""
+
+    _state: WellState
+
+    def __init__(self, state: WellState) -> None:
+        """Initialize the computed view of well state.
+
+        Arguments:
+            state: Well state dataclass used for all calculations.
+        """
+        self._state = state
+
+    def get_last_measured_liquid_height(
+        self, labware_id: str, well_name: str
+    ) -> Optional[LiquidHeightInfo]:
+        """Get the last liquid height measured in a well, if it is still useful.
+
+        Returns None if the well was never probed, or if something has happened
+        to it since that makes the measurement meaningless.
+        """
+        return self._state.measured_liquid_heights.get(labware_id, {}).get(well_name)
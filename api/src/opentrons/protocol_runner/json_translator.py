@@ -1,6 +1,6 @@
 """Translation of JSON protocol commands into ProtocolEngine commands."""
-from typing import cast, List, Union
-from pydantic import parse_obj_as
+from typing import cast, get_args, Any, Dict, List, Type, Union
+from pydantic import BaseModel, parse_obj_as
 
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons_shared_data.protocol.models import (
@@ -30,6 +30,13 @@ class CommandTranslatorError(Exception):
     pass
 
 
+# Every ProtocolEngine command request model, by its commandType.
+_COMMAND_CREATE_TYPES: Dict[str, Type[BaseModel]] = {
+    create_type.__fields__["commandType"].default: create_type
+    for create_type in get_args(get_args(pe_commands.CommandCreate)[0])
+}
+
+
 def _translate_labware_command(
     protocol: ProtocolSchemaV6,
     command: protocol_schema_v6.Command,
@@ -165,6 +172,24 @@ def _translate_v7_pipette_command(
     return translated_obj
 
 
+def _exclude_none(value: Any) -> Any:
+    """Return plain data for a schema value, like `.dict(exclude_none=True)` would.
+
+    The schemas' `Params` models declare every parameter of every command type,
+    so a full `.dict()` spends most of its time on fields that are `None`.
+    """
+    if isinstance(value, BaseModel):
+        return {
+            name: _exclude_none(field_value)
+            for name, field_value in value
+            if field_value is not None
+        }
+    elif isinstance(value, list):
+        return [_exclude_none(item) for item in value]
+    else:
+        return value
+
+
 def _translate_simple_command(
     command: Union[
         protocol_schema_v6.Command,
@@ -172,24 +197,34 @@ def _translate_simple_command(
         protocol_schema_v8.Command,
     ]
 ) -> pe_commands.CommandCreate:
-    dict_command = command.dict(exclude_none=True)
+    command_type = command.commandType
+    params = _exclude_none(command.params)
 
     # map deprecated `delay` commands to `waitForResume` / `waitForDuration`
-    if dict_command["commandType"] == "delay":
-        if "waitForResume" in dict_command["params"]:
-            dict_command["commandType"] = "waitForResume"
+    if command_type == "delay":
+        if "waitForResume" in params:
+            command_type = "waitForResume"
         else:
-            dict_command["commandType"] = "waitForDuration"
-
-    translated_obj = cast(
-        pe_commands.CommandCreate,
-        parse_obj_as(
-            # https://github.com/samuelcolvin/pydantic/issues/1847
-            pe_commands.CommandCreate,  # type: ignore[arg-type]
-            dict_command,
-        ),
-    )
-    return translated_obj
+            command_type = "waitForDuration"
+
+    dict_command: Dict[str, Any] = {"commandType": command_type, "params": params}
+    if command.key is not None:
+        dict_command["key"] = command.key
+
+    create_type = _COMMAND_CREATE_TYPES.get(command_type)
+    if create_type is None:
+        # Let the union report the unknown command type like it would for any request.
+        return cast(
+            pe_commands.CommandCreate,
+            parse_obj_as(
+                # https://github.com/samuelcolvin/pydantic/issues/1847
+                pe_commands.CommandCreate,  # type: ignore[arg-type]
+                dict_command,
+            ),
+        )
+    # Validating against the known model directly skips the union's
+    # discriminator lookup and wrapper model.
+    return cast(pe_commands.CommandCreate, create_type.parse_obj(dict_command))
 
 
 class JsonTranslator:
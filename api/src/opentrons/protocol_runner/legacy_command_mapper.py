@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from opentrons.hardware_control.modules.types import (
     ModuleModel as HardwareModuleModel,
@@ -85,6 +85,88 @@ _HIGHER_ORDER_COMMAND_TYPES = {
 }
 
 
+def _pick_up_tip_result(
+    running_command: pe_commands.PickUpTip,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.PickUpTipResult:
+    return pe_commands.PickUpTipResult.construct(
+        tipVolume=command["payload"]["location"].max_volume,  # type: ignore[typeddict-item]
+        tipLength=command["payload"]["instrument"].hw_pipette["tip_length"],  # type: ignore[typeddict-item]
+        position=pe_types.DeckPoint(x=0, y=0, z=0),
+    )
+
+
+def _drop_tip_result(
+    running_command: pe_commands.DropTip,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.DropTipResult:
+    return pe_commands.DropTipResult.construct(
+        position=pe_types.DeckPoint(x=0, y=0, z=0)
+    )
+
+
+def _aspirate_result(
+    running_command: pe_commands.Aspirate,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.AspirateResult:
+    # Don't .construct() result, because we want to validate volume.
+    return pe_commands.AspirateResult(
+        volume=running_command.params.volume,
+        position=pe_types.DeckPoint(x=0, y=0, z=0),
+    )
+
+
+def _dispense_result(
+    running_command: pe_commands.Dispense,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.DispenseResult:
+    # Don't .construct() result, because we want to validate volume.
+    return pe_commands.DispenseResult(
+        volume=running_command.params.volume,
+        position=pe_types.DeckPoint(x=0, y=0, z=0),
+    )
+
+
+def _blow_out_result(
+    running_command: pe_commands.BlowOut,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.BlowOutResult:
+    return pe_commands.BlowOutResult.construct(
+        position=pe_types.DeckPoint(x=0, y=0, z=0)
+    )
+
+
+def _comment_result(
+    running_command: pe_commands.Comment,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.CommentResult:
+    return pe_commands.CommentResult.construct()
+
+
+def _custom_result(
+    running_command: pe_commands.Custom,
+    command: legacy_command_types.CommandMessage,
+) -> pe_commands.CustomResult:
+    return pe_commands.CustomResult.construct()
+
+
+# Builders for the results of succeeded commands, keyed by exact command class.
+# Looking up the class in a dict is much cheaper than a chain of isinstance()
+# checks, which matters because this runs for every command a protocol executes.
+_RESULT_BUILDERS: Dict[
+    Type[pe_commands.Command],
+    Callable[[Any, legacy_command_types.CommandMessage], pe_commands.CommandResult],
+] = {
+    pe_commands.PickUpTip: _pick_up_tip_result,
+    pe_commands.DropTip: _drop_tip_result,
+    pe_commands.Aspirate: _aspirate_result,
+    pe_commands.Dispense: _dispense_result,
+    pe_commands.BlowOut: _blow_out_result,
+    pe_commands.Comment: _comment_result,
+    pe_commands.Custom: _custom_result,
+}
+
+
 class LegacyCommandMapper:
     """Map broker commands to protocol engine commands.
 
@@ -115,7 +197,25 @@ class LegacyCommandMapper:
         ] = {}
         self._module_data_provider = module_data_provider or ModuleDataProvider()
 
-    def map_command(  # noqa: C901
+        # builders of the initial running command, keyed by legacy command name.
+        # Any legacy command not in here is mapped to a custom command.
+        self._initial_command_builders: Dict[
+            str,
+            Callable[
+                ...,
+                Tuple[pe_commands.CommandCreate, pe_commands.Command],
+            ],
+        ] = {
+            legacy_command_types.PICK_UP_TIP: self._build_pick_up_tip,
+            legacy_command_types.DROP_TIP: self._build_drop_tip,
+            legacy_command_types.ASPIRATE: self._build_liquid_handling,
+            legacy_command_types.DISPENSE: self._build_liquid_handling,
+            legacy_command_types.BLOW_OUT: self._build_blow_out,
+            legacy_command_types.PAUSE: self._build_pause,
+            legacy_command_types.COMMENT: self._build_comment,
+        }
+
+    def map_command(
         self,
         command: legacy_command_types.CommandMessage,
     ) -> List[pe_actions.Action]:
@@ -171,100 +271,19 @@ class LegacyCommandMapper:
 
         elif stage == "after":
             running_command = self._commands_by_broker_id[broker_id]
-            completed_command: pe_commands.Command
             if command_error is None:
-                if isinstance(running_command, pe_commands.PickUpTip):
-                    completed_command = running_command.copy(
-                        update={
-                            "result": pe_commands.PickUpTipResult.construct(
-                                tipVolume=command["payload"]["location"].max_volume,  # type: ignore[typeddict-item]
-                                tipLength=command["payload"]["instrument"].hw_pipette["tip_length"],  # type: ignore[typeddict-item]
-                                position=pe_types.DeckPoint(x=0, y=0, z=0),
-                            ),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.DropTip):
-                    completed_command = running_command.copy(
-                        update={
-                            "result": pe_commands.DropTipResult.construct(
-                                position=pe_types.DeckPoint(x=0, y=0, z=0)
-                            ),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.Aspirate):
-                    completed_command = running_command.copy(
-                        update={
-                            # Don't .construct() result, because we want to validate
-                            # volume.
-                            "result": pe_commands.AspirateResult(
-                                volume=running_command.params.volume,
-                                position=pe_types.DeckPoint(x=0, y=0, z=0),
-                            ),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.Dispense):
-                    completed_command = running_command.copy(
-                        update={
-                            # Don't .construct() result, because we want to validate
-                            # volume.
-                            "result": pe_commands.DispenseResult(
-                                volume=running_command.params.volume,
-                                position=pe_types.DeckPoint(x=0, y=0, z=0),
-                            ),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.BlowOut):
-                    completed_command = running_command.copy(
-                        update={
-                            "result": pe_commands.BlowOutResult.construct(
-                                position=pe_types.DeckPoint(x=0, y=0, z=0)
-                            ),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.Comment):
-                    completed_command = running_command.copy(
-                        update={
-                            "result": pe_commands.CommentResult.construct(),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                elif isinstance(running_command, pe_commands.Custom):
-                    completed_command = running_command.copy(
-                        update={
-                            "result": pe_commands.CustomResult.construct(),
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
-                else:
-                    # TODO(mm, 2024-06-13): This looks potentially wrong.
-                    # We're creating a `SUCCEEDED` command that does not have a `result`,
-                    # which is not normally possible.
-                    completed_command = running_command.copy(
-                        update={
-                            "status": pe_commands.CommandStatus.SUCCEEDED,
-                            "completedAt": now,
-                            "notes": [],
-                        }
-                    )
+                completed_update: Dict[str, object] = {
+                    "status": pe_commands.CommandStatus.SUCCEEDED,
+                    "completedAt": now,
+                    "notes": [],
+                }
+                build_result = _RESULT_BUILDERS.get(type(running_command))
+                if build_result is not None:
+                    completed_update["result"] = build_result(running_command, command)
+                # TODO(mm, 2024-06-13): This looks potentially wrong for commands
+                # without a result builder. We're creating a `SUCCEEDED` command
+                # that does not have a `result`, which is not normally possible.
+                completed_command = running_command.copy(update=completed_update)
                 results.append(
                     pe_actions.SucceedCommandAction(
                         completed_command, private_result=None
@@ -310,72 +329,76 @@ class LegacyCommandMapper:
         command_id: str,
         now: datetime,
     ) -> Tuple[pe_commands.CommandCreate, pe_commands.Command]:
-        if command["name"] == legacy_command_types.PICK_UP_TIP:
-            return self._build_pick_up_tip(
-                command=command, command_id=command_id, now=now
-            )
-        elif command["name"] == legacy_command_types.DROP_TIP:
-            return self._build_drop_tip(command=command, command_id=command_id, now=now)
-
-        elif (
-            command["name"] == legacy_command_types.ASPIRATE
-            or command["name"] == legacy_command_types.DISPENSE
-        ):
-            return self._build_liquid_handling(
-                command=command, command_id=command_id, now=now
-            )
-        elif command["name"] == legacy_command_types.BLOW_OUT:
-            return self._build_blow_out(command=command, command_id=command_id, now=now)
-        elif command["name"] == legacy_command_types.PAUSE:
-            wait_for_resume_running = pe_commands.WaitForResume.construct(
-                id=command_id,
-                key=command_id,
-                status=pe_commands.CommandStatus.RUNNING,
-                createdAt=now,
-                startedAt=now,
-                params=pe_commands.WaitForResumeParams.construct(
-                    message=command["payload"]["userMessage"],
-                ),
-            )
-            wait_for_resume_create: pe_commands.CommandCreate = (
-                pe_commands.WaitForResumeCreate.construct(
-                    key=wait_for_resume_running.key,
-                    params=wait_for_resume_running.params,
-                )
-            )
-            return wait_for_resume_create, wait_for_resume_running
-        elif command["name"] == legacy_command_types.COMMENT:
-            comment_running = pe_commands.Comment.construct(
-                id=command_id,
-                key=command_id,
-                status=pe_commands.CommandStatus.RUNNING,
-                createdAt=now,
-                startedAt=now,
-                params=pe_commands.CommentParams.construct(
-                    message=command["payload"]["text"],
-                ),
-            )
-            comment_create = pe_commands.CommentCreate.construct(
-                key=comment_running.key, params=comment_running.params
-            )
-            return comment_create, comment_running
-        else:
-            custom_running = pe_commands.Custom.construct(
-                id=command_id,
-                key=command_id,
-                status=pe_commands.CommandStatus.RUNNING,
-                createdAt=now,
-                startedAt=now,
-                params=LegacyCommandParams.construct(
-                    legacyCommandType=command["name"],
-                    legacyCommandText=command["payload"]["text"],
-                ),
-            )
-            custom_create = pe_commands.CustomCreate.construct(
-                key=custom_running.key,
-                params=custom_running.params,
+        build = self._initial_command_builders.get(command["name"], self._build_custom)
+        return build(command=command, command_id=command_id, now=now)
+
+    def _build_pause(
+        self,
+        command: legacy_command_types.PauseMessage,
+        command_id: str,
+        now: datetime,
+    ) -> Tuple[pe_commands.CommandCreate, pe_commands.Command]:
+        wait_for_resume_running = pe_commands.WaitForResume.construct(
+            id=command_id,
+            key=command_id,
+            status=pe_commands.CommandStatus.RUNNING,
+            createdAt=now,
+            startedAt=now,
+            params=pe_commands.WaitForResumeParams.construct(
+                message=command["payload"]["userMessage"],
+            ),
+        )
+        wait_for_resume_create: pe_commands.CommandCreate = (
+            pe_commands.WaitForResumeCreate.construct(
+                key=wait_for_resume_running.key,
+                params=wait_for_resume_running.params,
             )
-            return custom_create, custom_running
+        )
+        return wait_for_resume_create, wait_for_resume_running
+
+    def _build_comment(
+        self,
+        command: legacy_command_types.CommentMessage,
+        command_id: str,
+        now: datetime,
+    ) -> Tuple[pe_commands.CommandCreate, pe_commands.Command]:
+        comment_running = pe_commands.Comment.construct(
+            id=command_id,
+            key=command_id,
+            status=pe_commands.CommandStatus.RUNNING,
+            createdAt=now,
+            startedAt=now,
+            params=pe_commands.CommentParams.construct(
+                message=command["payload"]["text"],
+            ),
+        )
+        comment_create = pe_commands.CommentCreate.construct(
+            key=comment_running.key, params=comment_running.params
+        )
+        return comment_create, comment_running
+
+    def _build_custom(
+        self,
+        command: legacy_command_types.CommandMessage,
+        command_id: str,
+        now: datetime,
+    ) -> Tuple[pe_commands.CommandCreate, pe_commands.Command]:
+        custom_running = pe_commands.Custom.construct(
+            id=command_id,
+            key=command_id,
+            status=pe_commands.CommandStatus.RUNNING,
+            createdAt=now,
+            startedAt=now,
+            params=LegacyCommandParams.construct(
+                legacyCommandType=command["name"],
+                legacyCommandText=command["payload"]["text"],
+            ),
+        )
+        custom_create = pe_commands.CustomCreate.construct(
+            key=custom_running.key,
+            params=custom_running.params,
+        )
+        return custom_create, custom_running
 
     def _build_drop_tip(
         self,
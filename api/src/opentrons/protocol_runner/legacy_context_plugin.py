@@ -1,7 +1,7 @@
 """Customize the ProtocolEngine to monitor and control legacy (APIv2) protocols."""
 from __future__ import annotations
 
-from asyncio import create_task, Task
+from asyncio import create_task, sleep, Task
 from contextlib import ExitStack
 from typing import List, Optional
 
@@ -143,8 +143,11 @@ class LegacyContextPlugin(AbstractPlugin):
         Exits only when `self._actions_to_dispatch` is closed
         (or an unexpected exception is raised).
         """
-        async for action_batch in self._actions_to_dispatch.get_async_until_closed():
-            # It's critical that we dispatch this batch of actions as one atomic
+        # Drain everything the protocol thread has reported since the last time
+        # we looked, instead of waking up once for each report. This matters for
+        # large protocols, whose thread can report much faster than we can wake up.
+        async for batches in self._actions_to_dispatch.get_batch_async_until_closed():
+            # It's critical that we dispatch each batch of actions as one atomic
             # sequence, without yielding to the event loop.
             # Although this plugin only means to use the ProtocolEngine as a way of
             # passively exposing the protocol's progress, the ProtocolEngine is still
@@ -156,5 +159,9 @@ class LegacyContextPlugin(AbstractPlugin):
             # immediately followed by a run action. We cannot let the
             # ProtocolEngine's background task see the command in the `queued` state,
             # or it will try to execute it, which the legacy protocol is already doing.
-            for action in action_batch:
-                self.dispatch(action)
+            for action_batch in batches:
+                for action in action_batch:
+                    self.dispatch(action)
+                # Between batches, it's fine to yield, and we should, so that a
+                # large drain doesn't hold up everything else on the event loop.
+                await sleep(0)
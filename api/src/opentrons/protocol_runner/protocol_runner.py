@@ -10,7 +10,6 @@ from opentrons import protocol_reader
 from opentrons.legacy_broker import LegacyBroker
 from opentrons.protocol_api import ParameterContext
 from opentrons.protocol_api.core.legacy.load_info import LoadInfo
-from opentrons.protocol_engine.commands.command import CommandStatus
 from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
 from opentrons.protocol_reader import (
     ProtocolSource,
@@ -382,33 +381,32 @@ class JsonRunner(AbstractRunner):
         return RunResult(commands=commands, state_summary=run_data, parameters=[])
 
     async def _add_and_execute_commands(self) -> None:
-        for command_request in self._queued_commands:
-            # todo(mm, 2024-07-05): This logic to handle the various command execution
-            # outcomes mirrors PAPI's ChildThreadTransport. Simplify or deduplicate it.
-            executed_command = (
-                await self._protocol_engine.add_and_execute_command_wait_for_recovery(
-                    command_request
-                )
+        # Each command is only added after the one before it has completed,
+        # so the rest of the protocol is never queued ahead of time.
+        executed_commands = (
+            await self._protocol_engine.add_and_execute_commands_wait_for_recovery(
+                self._queued_commands
             )
-            if executed_command.error is not None:
-                error_recovery_type = (
-                    self._protocol_engine.state_view.commands.get_error_recovery_type(
-                        executed_command.id
-                    )
+        )
+        if not executed_commands:
+            return
+
+        # The batch stops early at a command that failed the run, or at one that
+        # was left queued because another task stopped the ProtocolEngine before
+        # it got around to executing it.
+        # See docs on add_and_execute_command_wait_for_recovery().
+        last_command = executed_commands[-1]
+        if last_command.error is not None:
+            error_recovery_type = (
+                self._protocol_engine.state_view.commands.get_error_recovery_type(
+                    last_command.id
                 )
-                error_should_fail_run = (
-                    error_recovery_type == ErrorRecoveryType.FAIL_RUN
+            )
+            if error_recovery_type == ErrorRecoveryType.FAIL_RUN:
+                raise ProtocolCommandFailedError(
+                    original_error=last_command.error,
+                    message=f"{last_command.error.errorType}: {last_command.error.detail}",
                 )
-                if error_should_fail_run:
-                    raise ProtocolCommandFailedError(
-                        original_error=executed_command.error,
-                        message=f"{executed_command.error.errorType}: {executed_command.error.detail}",
-                    )
-            elif executed_command.status == CommandStatus.QUEUED:
-                # This can happen if another task stops the ProtocolEngine before
-                # the ProtocolEngine gets around to executing this command.
-                # See docs on add_and_execute_command_wait_for_recovery().
-                break
 
 
 class LiveRunner(AbstractRunner):
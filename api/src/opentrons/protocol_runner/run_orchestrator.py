@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import enum
-from typing import Optional, Union, List, Dict, AsyncGenerator
+from typing import Optional, Sequence, Union, List, Dict, AsyncGenerator
 
 from anyio import move_on_after
 
@@ -345,6 +345,27 @@ class RunOrchestrator:
                 await self._protocol_engine.wait_for_command(added_command.id)
         return added_command
 
+    async def add_commands_and_wait_for_interval(
+        self,
+        commands: Sequence[CommandCreate],
+        wait_until_complete: bool = False,
+        timeout: Optional[int] = None,
+        failed_command_id: Optional[str] = None,
+    ) -> List[Command]:
+        """Add new commands to execute, in order, and wait for them if needed.
+
+        Commands execute in the order they were added, so waiting for the
+        last one to complete waits for all of them.
+        """
+        added_commands = self._protocol_engine.add_commands(
+            requests=commands, failed_command_id=failed_command_id
+        )
+        if wait_until_complete and added_commands:
+            timeout_sec = None if timeout is None else timeout / 1000.0
+            with move_on_after(timeout_sec):
+                await self._protocol_engine.wait_for_command(added_commands[-1].id)
+        return added_commands
+
     def estop(self) -> None:
         """Handle an E-stop event from the hardware API."""
         return self._protocol_engine.estop()
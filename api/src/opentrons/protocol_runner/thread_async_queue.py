@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from collections import deque
 from threading import Condition
-from typing import AsyncIterable, Deque, Generic, Iterable, TypeVar
+from typing import AsyncIterable, Deque, Generic, Iterable, List, TypeVar
 
 from anyio.to_thread import run_sync
 
@@ -75,6 +75,29 @@ class ThreadAsyncQueue(Generic[_T]):
                     # Wait for something to change, then check again.
                     self._condition.wait()
 
+    def get_batch(self) -> List[_T]:
+        """Remove and return all the values currently in the queue, oldest first.
+
+        Like `get()`, this blocks until at least one value is available.
+        Consumers that can handle several values at once should prefer this,
+        since it takes the lock and wakes up once for all the values
+        that were put while they were busy.
+
+        Raises:
+            QueueClosed: If all values have been consumed
+                and the queue has been closed with `done_putting()`.
+        """
+        with self._condition:
+            while True:
+                if len(self._deque) > 0:
+                    batch = list(self._deque)
+                    self._deque.clear()
+                    return batch
+                elif self._is_closed:
+                    raise QueueClosed("Queue closed; no more items to get.")
+                else:
+                    self._condition.wait()
+
     def get_until_closed(self) -> Iterable[_T]:
         """Remove and return values from the front of the queue until it's closed.
 
@@ -106,6 +129,15 @@ class ThreadAsyncQueue(Generic[_T]):
             cancellable=False,
         )
 
+    async def get_batch_async(self) -> List[_T]:
+        """Like `get_batch()`, except yield to the event loop while waiting.
+
+        Warning:
+            Like `get_async()`, a waiting `get_batch_async()` won't be interrupted
+            by an async cancellation. Close the queue to interrupt it.
+        """
+        return await run_sync(self.get_batch, cancellable=False)
+
     async def get_async_until_closed(self) -> AsyncIterable[_T]:
         """Like `get_until_closed()`, except yield to the event loop while waiting.
 
@@ -125,6 +157,25 @@ class ThreadAsyncQueue(Generic[_T]):
             except QueueClosed:
                 break
 
+    async def get_batch_async_until_closed(self) -> AsyncIterable[List[_T]]:
+        """Like `get_async_until_closed()`, except get values in batches.
+
+        Example:
+            async for batch in queue.get_batch_async_until_closed():
+                for value in batch:
+                    print(value)
+
+        Warning:
+            While the ``async for`` is waiting for new values,
+            it won't be interrupted by an async cancellation.
+            Close the queue to interrupt it.
+        """
+        while True:
+            try:
+                yield await self.get_batch_async()
+            except QueueClosed:
+                break
+
     def done_putting(self) -> None:
         """Close the queue, i.e. signal that no more values will be `put()`.
 
@@ -1,4 +1,16 @@
 from .estimator import DurationEstimator
+from .timeline import (
+    MotionConstraints,
+    TimelineEntry,
+    TimelinePredictor,
+    predict_timeline,
+)
 
 
-__all__ = ["DurationEstimator"]
+__all__ = [
+    "DurationEstimator",
+    "MotionConstraints",
+    "TimelineEntry",
+    "TimelinePredictor",
+    "predict_timeline",
+]
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Optional, List, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, List, cast
 from typing_extensions import Final
 import math
 import functools
@@ -15,6 +15,11 @@ from opentrons.protocols.duration.errors import DurationEstimatorException
 from opentrons.protocol_api.core.legacy.deck import Deck
 from opentrons.types import Location
 
+if TYPE_CHECKING:
+    from opentrons_shared_data.robot.types import RobotType
+    from opentrons.protocol_engine import Command
+    from .timeline import TimelineEntry
+
 
 # We refer to page 3 of the GEN2 Temperature Module White-Paper
 # https://blog.opentrons.com/opentrons-technical-documentation/
@@ -62,6 +67,8 @@ class DurationEstimator:
         self._last_thermocycler_module_temperature = START_MODULE_TEMPERATURE
         # Per step time estimate.
         self._increments: List[TimerEntry] = []
+        # Predicted timeline of protocols that run through Protocol Engine.
+        self._timeline: List["TimelineEntry"] = []
 
         # TODO(mm, 2022-12-01): Allow the caller to configure the deck type.
         self._deck = Deck(deck_type=guess_deck_type_from_global_config())
@@ -70,7 +77,42 @@ class DurationEstimator:
         """Return the total duration"""
         return functools.reduce(
             lambda acc, val: acc + val.duration, self._increments, 0.0
-        )
+        ) + sum(entry.duration for entry in self._timeline)
+
+    def on_engine_commands(
+        self, commands: Iterable["Command"], robot_type: "RobotType"
+    ) -> None:
+        """
+        Estimate the duration of Protocol Engine commands, like the commands of
+        a simulated run.
+
+        Args:
+            commands: The commands, in the order they ran
+            robot_type: The robot the commands would run on
+
+        Returns:
+            None
+        """
+        # Imported here because the timeline reuses this module's ramp rates.
+        from .timeline import predict_timeline
+
+        self._timeline.extend(predict_timeline(commands, robot_type))
+
+    def get_predicted_timeline(self) -> List["TimelineEntry"]:
+        """Return the predicted timeline of Protocol Engine commands"""
+        return self._timeline
+
+    def get_duration_by_command_type(self) -> Dict[str, float]:
+        """Return the total duration of each command type, longest first"""
+        durations: Dict[str, float] = {}
+        for entry in self._timeline:
+            durations[entry.command_type] = (
+                durations.get(entry.command_type, 0.0) + entry.duration
+            )
+        for increment in self._increments:
+            name = increment.command["name"]
+            durations[name] = durations.get(name, 0.0) + increment.duration
+        return dict(sorted(durations.items(), key=lambda item: item[1], reverse=True))
 
     def on_message(self, message: types.CommandMessage) -> None:
         """
@@ -344,7 +386,7 @@ class DurationEstimator:
         temp1 = temperature
         # we are referring to a thermocycler_handler(temp0, temp1) function.
         # Magic numbers come from testing and have been consistent
-        temperature_changing_time = self.thermocycler_handler(temp0, temp1)
+        temperature_changing_time = DurationEstimator.thermocycler_handler(temp0, temp1)
         if hold_time is None:
             hold_time = 0
         else:
@@ -386,7 +428,7 @@ class DurationEstimator:
         thermocycler_temperatures.pop(0)
         for thermocycler_counter in range(0, len(thermocycler_temperatures)):
             cycling_counter.append(
-                self.thermocycler_handler(
+                DurationEstimator.thermocycler_handler(
                     float(thermocycler_temperatures[thermocycler_counter - 1]),
                     float(thermocycler_temperatures[thermocycler_counter]),
                 )
@@ -439,12 +481,13 @@ class DurationEstimator:
         temperature_tempdeck = payload["celsius"]
         temp0 = self._last_temperature_module_temperature
         temp1 = float(temperature_tempdeck)
-        duration = self.temperature_module(temp0, temp1)
+        duration = DurationEstimator.temperature_module(temp0, temp1)
         self._last_temperature_module_temperature = temp0
         logger.info(f"tempdeck {duration} ")
         return duration
 
-    def thermocycler_handler(self, temp0: float, temp1: float) -> float:
+    @staticmethod
+    def thermocycler_handler(temp0: float, temp1: float) -> float:
         total = 0.0
         if temp1 - temp0 > 0:
             # heating up!
@@ -470,15 +513,16 @@ class DurationEstimator:
 
         return total
 
-    def temperature_module(self, temp0: float, temp1: float) -> float:
+    @staticmethod
+    def temperature_module(temp0: float, temp1: float) -> float:
         duration = 0.0
         if temp1 != temp0:
             if temp1 > TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_high(temp0, temp1)
+                duration = DurationEstimator.rate_high(temp0, temp1)
             elif TEMP_MOD_LOW_THRESH <= temp1 <= TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_mid(temp0, temp1)
+                duration = DurationEstimator.rate_mid(temp0, temp1)
             elif temp1 < TEMP_MOD_LOW_THRESH:
-                duration = self.rate_low(temp0, temp1)
+                duration = DurationEstimator.rate_low(temp0, temp1)
         return duration
 
     def on_tempdeck_deactivate(self) -> float:
@@ -0,0 +1,328 @@
+"""Predict how long Protocol Engine commands will take to run.
+
+:py:class:`TimelinePredictor` walks the commands of an analysis or a
+simulation, in order, and predicts how long each will take on a robot:
+
+* Moves take as long as a trapezoidal velocity profile needs to cover each
+  axis' distance, using the robot's default max speeds and accelerations.
+  Moves between wells arc up above both ends first.
+* Liquid handling takes the volume divided by the flow rate.
+* Module commands that wait for a temperature take as long as the module
+  ramps, using the same ramp rates as :py:class:`DurationEstimator`.
+* Delays take their duration.
+
+Commands that the predictor doesn't model are predicted to take no time.
+"""
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+from typing_extensions import Final
+
+from opentrons_shared_data.robot.types import RobotType
+
+from opentrons.config import defaults_ot2, defaults_ot3
+from opentrons.hardware_control.types import OT3AxisKind
+from opentrons.motion_planning.waypoints import DEFAULT_GENERAL_ARC_Z_MARGIN
+
+from .estimator import DurationEstimator, START_MODULE_TEMPERATURE
+
+if TYPE_CHECKING:
+    from opentrons.protocol_engine import Command, DeckPoint
+
+
+# The time to pick up a tip and drop a tip, not counting the move to the
+# tip rack or trash. Determined by testing on hardware.
+PICK_UP_TIP_SECONDS: Final = 4.0
+DROP_TIP_SECONDS: Final = 10.0
+BLOW_OUT_SECONDS: Final = 0.5
+TOUCH_TIP_SECONDS: Final = 0.5
+
+# Hardware said about 1 minute to heat the lid, and about 24 seconds to
+# open or close it.
+THERMOCYCLER_LID_TEMPERATURE_SECONDS: Final = 60.0
+THERMOCYCLER_LID_MOVE_SECONDS: Final = 24.0
+
+# Rough Heater-Shaker figures: how fast it heats, and how long it takes to
+# reach a shake speed or to stop shaking.
+HEATER_SHAKER_RATE: Final = 0.2
+HEATER_SHAKER_SPIN_SECONDS: Final = 5.0
+
+# How long the gripper takes to move a labware, and a magnetic module to
+# engage or disengage.
+GRIPPER_MOVE_LABWARE_SECONDS: Final = 25.0
+MAGNETIC_MODULE_SECONDS: Final = 3.0
+
+
+@dataclass(frozen=True)
+class MotionConstraints:
+    """The speed and acceleration limits of the gantry, in mm/s and mm/s²."""
+
+    max_speed_x: float
+    max_speed_y: float
+    max_speed_z: float
+    acceleration_x: float
+    acceleration_y: float
+    acceleration_z: float
+
+    @classmethod
+    def for_robot_type(cls, robot_type: RobotType) -> "MotionConstraints":
+        """Get a robot's default motion constraints, from its robot config."""
+        if robot_type == "OT-3 Standard":
+            speeds = defaults_ot3.DEFAULT_MAX_SPEEDS.low_throughput
+            accelerations = defaults_ot3.DEFAULT_ACCELERATIONS.low_throughput
+            return cls(
+                max_speed_x=speeds[OT3AxisKind.X],
+                max_speed_y=speeds[OT3AxisKind.Y],
+                max_speed_z=speeds[OT3AxisKind.Z],
+                acceleration_x=accelerations[OT3AxisKind.X],
+                acceleration_y=accelerations[OT3AxisKind.Y],
+                acceleration_z=accelerations[OT3AxisKind.Z],
+            )
+        return cls(
+            max_speed_x=defaults_ot2.DEFAULT_MAX_SPEEDS["X"],
+            max_speed_y=defaults_ot2.DEFAULT_MAX_SPEEDS["Y"],
+            max_speed_z=defaults_ot2.DEFAULT_MAX_SPEEDS["Z"],
+            acceleration_x=defaults_ot2.DEFAULT_ACCELERATION["X"],
+            acceleration_y=defaults_ot2.DEFAULT_ACCELERATION["Y"],
+            acceleration_z=defaults_ot2.DEFAULT_ACCELERATION["Z"],
+        )
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    """When a command is predicted to start, and how long it will take, in seconds."""
+
+    command_id: str
+    command_type: str
+    start_time: float
+    duration: float
+
+    @property
+    def end_time(self) -> float:
+        """When the command is predicted to end."""
+        return self.start_time + self.duration
+
+
+def axis_move_time(distance: float, max_speed: float, acceleration: float) -> float:
+    """Get how long one axis takes to move a distance, starting and ending at rest."""
+    distance = abs(distance)
+    if distance == 0:
+        return 0.0
+    # Accelerating to the max speed and back down covers this distance.
+    ramp_distance = max_speed**2 / acceleration
+    if distance < ramp_distance:
+        # A triangular profile that never reaches the max speed.
+        return 2 * math.sqrt(distance / acceleration)
+    return distance / max_speed + max_speed / acceleration
+
+
+# Commands that move straight to their destination, instead of arcing.
+_DIRECT_MOVE_COMMAND_TYPES: Final = {
+    "moveRelative",
+    "moveToCoordinates",
+    "aspirateInPlace",
+    "dispenseInPlace",
+    "blowOutInPlace",
+    "dropTipInPlace",
+    "liquidProbe",
+    "tryLiquidProbe",
+    "touchTip",
+}
+
+
+class TimelinePredictor:
+    """Predict a timeline of Protocol Engine commands, one command at a time."""
+
+    def __init__(self, constraints: MotionConstraints) -> None:
+        self._constraints = constraints
+        self._position: Optional["DeckPoint"] = None
+        self._module_temperatures: Dict[str, float] = {}
+        self._module_targets: Dict[str, float] = {}
+        # Thermocycler holds only start once the block reaches its target.
+        self._thermocycler_holds: Dict[str, float] = {}
+        self._timeline: List[TimelineEntry] = []
+        self._handlers: Dict[str, Callable[[Any], float]] = {
+            "aspirate": self._liquid_handling_time,
+            "aspirateInPlace": self._liquid_handling_time,
+            "dispense": self._liquid_handling_time,
+            "dispenseInPlace": self._liquid_handling_time,
+            "blowout": lambda params: BLOW_OUT_SECONDS,
+            "blowOutInPlace": lambda params: BLOW_OUT_SECONDS,
+            "touchTip": lambda params: TOUCH_TIP_SECONDS,
+            "pickUpTip": lambda params: PICK_UP_TIP_SECONDS,
+            "dropTip": lambda params: DROP_TIP_SECONDS,
+            "dropTipInPlace": lambda params: DROP_TIP_SECONDS,
+            "waitForDuration": lambda params: float(params.seconds),
+            "moveLabware": self._move_labware_time,
+            "magneticModule/engage": lambda params: MAGNETIC_MODULE_SECONDS,
+            "magneticModule/disengage": lambda params: MAGNETIC_MODULE_SECONDS,
+            "temperatureModule/setTargetTemperature": self._set_target,
+            "temperatureModule/waitForTemperature": self._temperature_module_wait,
+            "heaterShaker/setTargetTemperature": self._set_target,
+            "heaterShaker/waitForTemperature": self._heater_shaker_wait,
+            "heaterShaker/setAndWaitForShakeSpeed": (
+                lambda params: HEATER_SHAKER_SPIN_SECONDS
+            ),
+            "heaterShaker/deactivateShaker": lambda params: HEATER_SHAKER_SPIN_SECONDS,
+            "thermocycler/setTargetBlockTemperature": self._thermocycler_set_block,
+            "thermocycler/waitForBlockTemperature": self._thermocycler_wait_block,
+            "thermocycler/runProfile": self._thermocycler_profile,
+            "thermocycler/waitForLidTemperature": (
+                lambda params: THERMOCYCLER_LID_TEMPERATURE_SECONDS
+            ),
+            "thermocycler/openLid": lambda params: THERMOCYCLER_LID_MOVE_SECONDS,
+            "thermocycler/closeLid": lambda params: THERMOCYCLER_LID_MOVE_SECONDS,
+        }
+
+    @property
+    def timeline(self) -> List[TimelineEntry]:
+        """The predicted timeline of every command added so far."""
+        return self._timeline
+
+    def get_total_duration(self) -> float:
+        """Get the predicted duration of every command added so far."""
+        return self._timeline[-1].end_time if self._timeline else 0.0
+
+    def get_duration_by_command_type(self) -> Dict[str, float]:
+        """Get the total predicted duration of each command type, the longest first."""
+        durations: Dict[str, float] = {}
+        for entry in self._timeline:
+            durations[entry.command_type] = (
+                durations.get(entry.command_type, 0.0) + entry.duration
+            )
+        return dict(sorted(durations.items(), key=lambda item: item[1], reverse=True))
+
+    def add(self, command: "Command") -> TimelineEntry:
+        """Predict how long a command will take, and add it to the timeline."""
+        duration = self._move_time(command)
+        handler = self._handlers.get(command.commandType)
+        if handler is not None:
+            duration += handler(command.params)
+        if command.commandType == "home":
+            # We don't know where home is, so don't guess the next move.
+            self._position = None
+
+        entry = TimelineEntry(
+            command_id=command.id,
+            command_type=command.commandType,
+            start_time=self.get_total_duration(),
+            duration=duration,
+        )
+        self._timeline.append(entry)
+        return entry
+
+    def _move_time(self, command: "Command") -> float:
+        destination: Optional["DeckPoint"] = getattr(command.result, "position", None)
+        if destination is None:
+            return 0.0
+        origin, self._position = self._position, destination
+        if origin is None:
+            return 0.0
+
+        speed = getattr(command.params, "speed", None)
+        if command.commandType in _DIRECT_MOVE_COMMAND_TYPES or (
+            origin.x == destination.x and origin.y == destination.y
+        ):
+            return self._linear_move_time(origin, destination, speed)
+
+        # Arc: up above both ends, across, and back down.
+        travel_z = max(origin.z, destination.z) + DEFAULT_GENERAL_ARC_Z_MARGIN
+        return (
+            self._z_move_time(travel_z - origin.z)
+            + self._xy_move_time(
+                destination.x - origin.x, destination.y - origin.y, speed
+            )
+            + self._z_move_time(travel_z - destination.z)
+        )
+
+    def _linear_move_time(
+        self, origin: "DeckPoint", destination: "DeckPoint", speed: Optional[float]
+    ) -> float:
+        return max(
+            self._xy_move_time(
+                destination.x - origin.x, destination.y - origin.y, speed
+            ),
+            self._z_move_time(destination.z - origin.z),
+        )
+
+    def _xy_move_time(self, dx: float, dy: float, speed: Optional[float]) -> float:
+        c = self._constraints
+        max_speed_x = min(c.max_speed_x, speed) if speed else c.max_speed_x
+        max_speed_y = min(c.max_speed_y, speed) if speed else c.max_speed_y
+        # The axes move together, so the slower one sets the pace.
+        return max(
+            axis_move_time(dx, max_speed_x, c.acceleration_x),
+            axis_move_time(dy, max_speed_y, c.acceleration_y),
+        )
+
+    def _z_move_time(self, dz: float) -> float:
+        c = self._constraints
+        return axis_move_time(dz, c.max_speed_z, c.acceleration_z)
+
+    @staticmethod
+    def _liquid_handling_time(params: Any) -> float:
+        flow_rate = getattr(params, "flowRate", None)
+        if not flow_rate:
+            return 0.0
+        return float(params.volume) / float(flow_rate)
+
+    @staticmethod
+    def _move_labware_time(params: Any) -> float:
+        return (
+            GRIPPER_MOVE_LABWARE_SECONDS if params.strategy == "usingGripper" else 0.0
+        )
+
+    def _set_target(self, params: Any) -> float:
+        self._module_targets[params.moduleId] = float(params.celsius)
+        return 0.0
+
+    def _ramp(self, params: Any, ramp_time: Callable[[float, float], float]) -> float:
+        module_id = params.moduleId
+        current = self._module_temperatures.get(module_id, START_MODULE_TEMPERATURE)
+        celsius = getattr(params, "celsius", None)
+        target = (
+            float(celsius)
+            if celsius is not None
+            else self._module_targets.get(module_id, current)
+        )
+        self._module_temperatures[module_id] = target
+        return ramp_time(current, target)
+
+    def _temperature_module_wait(self, params: Any) -> float:
+        return self._ramp(params, DurationEstimator.temperature_module)
+
+    def _heater_shaker_wait(self, params: Any) -> float:
+        return self._ramp(
+            params, lambda current, target: abs(target - current) / HEATER_SHAKER_RATE
+        )
+
+    def _thermocycler_set_block(self, params: Any) -> float:
+        self._module_targets[params.moduleId] = float(params.celsius)
+        self._thermocycler_holds[params.moduleId] = float(params.holdTimeSeconds or 0)
+        return 0.0
+
+    def _thermocycler_wait_block(self, params: Any) -> float:
+        return self._ramp(
+            params, DurationEstimator.thermocycler_handler
+        ) + self._thermocycler_holds.pop(params.moduleId, 0.0)
+
+    def _thermocycler_profile(self, params: Any) -> float:
+        module_id = params.moduleId
+        current = self._module_temperatures.get(module_id, START_MODULE_TEMPERATURE)
+        duration = 0.0
+        for step in params.profile:
+            duration += DurationEstimator.thermocycler_handler(current, step.celsius)
+            duration += step.holdSeconds
+            current = step.celsius
+        self._module_temperatures[module_id] = current
+        return duration
+
+
+def predict_timeline(
+    commands: Iterable["Command"], robot_type: RobotType
+) -> List[TimelineEntry]:
+    """Predict when each command will start and how long it will take."""
+    predictor = TimelinePredictor(MotionConstraints.for_robot_type(robot_type))
+    for command in commands:
+        predictor.add(command)
+    return predictor.timeline
@@ -583,6 +583,7 @@ def simulate(
                 hardware_api=hardware_simulator,
                 stack_logger=stack_logger,
                 log_level=log_level,
+                duration_estimator=duration_estimator,
             )
 
 
@@ -911,6 +912,7 @@ def _run_file_pe(
     hardware_api: ThreadManagedHardware,
     stack_logger: logging.Logger,
     log_level: str,
+    duration_estimator: Optional[DurationEstimator] = None,
 ) -> _SimulateResult:
     """Run a protocol file with Protocol Engine."""
 
@@ -967,6 +969,11 @@ def _run_file_pe(
                 result.state_summary.errors
             )
 
+        if duration_estimator:
+            duration_estimator.on_engine_commands(
+                protocol_engine.state_view.commands.get_all(), robot_type
+            )
+
         # We don't currently support returning bundle contents from protocols run through
         # Protocol Engine. To get them, bundle_from_sim() requires direct access to the
         # ProtocolContext, which opentrons.protocol_runner does not grant us.
@@ -1050,6 +1057,11 @@ def main() -> int:
         minutes = int((duration_seconds % (60 * 60)) / 60)
         print("--------------------------------------------------------------")
         print(f"Estimated protocol duration: {hours}h:{minutes}m")
+        print("Longest command types:")
+        for command_type, seconds in list(
+            duration_estimator.get_duration_by_command_type().items()
+        )[:5]:
+            print(f"    {command_type}: {seconds:.0f}s")
         print("--------------------------------------------------------------")
         print("WARNING: Protocol duration estimation is an experimental feature")
 
@@ -1,5 +1,6 @@
 """Performance helpers for tracking robot activity."""
 
+import contextlib
 import functools
 from pathlib import Path
 
@@ -12,7 +13,12 @@ from opentrons.config import (
 )
 
 if typing.TYPE_CHECKING:
-    from performance_metrics import RobotActivityState, SupportsTracking
+    from performance_metrics import (
+        EventLoopMonitor,
+        RobotActivityState,
+        SpanTracer,
+        SupportsTracking,
+    )
 
 
 _UnderlyingFunctionParameters = typing.ParamSpec("_UnderlyingFunctionParameters")
@@ -34,9 +40,15 @@ class _StubbedTracker:
         """Initialize the stubbed tracker."""
         pass
 
+    @property
+    def current_state(self) -> typing.Optional["RobotActivityState"]:
+        """Never report a state."""
+        return None
+
     def track(
         self,
         state: "RobotActivityState",
+        profile_id_arg: typing.Optional[str] = None,
     ) -> typing.Callable[
         [_UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]],
         _UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn],
@@ -55,6 +67,10 @@ class _StubbedTracker:
 
         return inner_decorator
 
+    def get_profile(self, profile_id: str) -> typing.Optional[str]:
+        """Never have a profile."""
+        return None
+
     def store(self) -> None:
         """Do nothing."""
         pass
@@ -99,9 +115,88 @@ def _get_robot_activity_tracker() -> "SupportsTracking":
     return _robot_activity_tracker
 
 
+def create_event_loop_monitor(
+    command_id_source: typing.Callable[[], typing.Optional[str]],
+) -> typing.Optional["EventLoopMonitor"]:
+    """Create a monitor for the event loop it is started in.
+
+    Measurements are tagged with the robot activity tracker's current state and
+    with the engine command ID returned by `command_id_source`.
+
+    Returns None if performance metrics are disabled or unavailable.
+    """
+    if not _should_track:
+        return None
+    try:
+        from performance_metrics import EventLoopMonitor
+    except ImportError:
+        return None
+    tracker = _get_robot_activity_tracker()
+    return EventLoopMonitor(
+        get_performance_metrics_data_dir(),
+        should_track=True,
+        activity_source=lambda: tracker.current_state,
+        command_id_source=command_id_source,
+    )
+
+
+_NO_SPAN: typing.ContextManager[None] = contextlib.nullcontext()
+
+
+def _stubbed_trace_span(
+    name: str, **args: typing.Union[int, float, str]
+) -> typing.ContextManager[None]:
+    """Trace nothing."""
+    return _NO_SPAN
+
+
+def _handle_trace_span_import() -> typing.Callable[..., typing.ContextManager[None]]:
+    """Use opentrons_hardware's trace_span if the package is available.
+
+    It falls back to a stub itself if performance_metrics is not available.
+    """
+    try:
+        from opentrons_hardware.tracing import trace_span
+
+        return trace_span
+    except ImportError:
+        return _stubbed_trace_span
+
+
+trace_span = _handle_trace_span_import()
+"""Trace the time spent in a block of code, as a span nested in the current span.
+
+This does nothing unless span tracing was started with `create_span_tracer`.
+"""
+
+
+def create_span_tracer() -> typing.Optional["SpanTracer"]:
+    """Create a tracer that collects spans from `trace_span` once installed.
+
+    Returns None if performance metrics are disabled or unavailable.
+    """
+    if not _should_track:
+        return None
+    try:
+        from performance_metrics import SpanTracer
+    except ImportError:
+        return None
+    return SpanTracer(get_performance_metrics_data_dir(), should_track=True)
+
+
+def get_profile(profile_id: str) -> typing.Optional[str]:
+    """Get the profile of a tracked analysis or run, in the collapsed stack format.
+
+    Profiles are only recorded if performance metrics are enabled and the
+    performance_metrics sampling profiler is enabled in the environment.
+    """
+    return _get_robot_activity_tracker().get_profile(profile_id)
+
+
 def _track_a_function(
     state_name: "RobotActivityState",
     func: _UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn],
+    profile_id_arg: typing.Optional[str] = None,
 ) -> typing.Callable[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]:
     """Wrap a passed function with RobotActivityTracker.track.
 
@@ -111,12 +206,14 @@ def _track_a_function(
     Args:
         state_name: The state to annotate the tracked function with.
         func: The function to decorate.
+        profile_id_arg: The argument of func that identifies its profile,
+            if it should be profiled when profiling is enabled.
 
     Returns:
         The decorated function.
     """
     tracker: SupportsTracking = _get_robot_activity_tracker()
-    wrapped = tracker.track(state=state_name)(func)
+    wrapped = tracker.track(state=state_name, profile_id_arg=profile_id_arg)(func)
 
     @functools.wraps(func)
     def wrapper(
@@ -144,8 +241,25 @@ class TrackingFunctions:
             _UnderlyingFunctionParameters, _UnderlyingFunctionReturn
         ]
     ) -> typing.Callable[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]:
-        """Track a function that runs an analysis."""
-        return _track_a_function("ANALYZING_PROTOCOL", func)
+        """Track a function that runs an analysis.
+
+        The function's `analysis_id` argument identifies its profile.
+        """
+        return _track_a_function(
+            "ANALYZING_PROTOCOL", func, profile_id_arg="analysis_id"
+        )
+
+    @staticmethod
+    def track_run(
+        func: _UnderlyingFunction[
+            _UnderlyingFunctionParameters, _UnderlyingFunctionReturn
+        ]
+    ) -> typing.Callable[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]:
+        """Track a function that runs a protocol.
+
+        The function's `run_id` argument identifies its profile.
+        """
+        return _track_a_function("RUNNING_PROTOCOL", func, profile_id_arg="run_id")
 
     @staticmethod
     def track_getting_cached_protocol_analysis(
@@ -83,6 +83,19 @@ def test_get_ot2_deck_calibration(starting_ot2_calibration_data: Any) -> None:
     )
 
 
+def test_get_ot2_deck_calibration_copies(starting_ot2_calibration_data: Any) -> None:
+    """Changing a returned model should not change what the next call returns."""
+    robot_deck = get_robot_deck_attitude()
+    assert robot_deck
+    robot_deck.attitude[0][0] = 2
+    robot_deck.status.markedBad = True
+
+    robot_deck = get_robot_deck_attitude()
+    assert robot_deck
+    assert robot_deck.attitude[0][0] == 1
+    assert robot_deck.status.markedBad is False
+
+
 def test_get_ot3_deck_calibration(starting_ot3_calibration_data: Any) -> None:
     """Test ability to get an OT-3 belt calibration model."""
     robot_belt = get_robot_belt_attitude()
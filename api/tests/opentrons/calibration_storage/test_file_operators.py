@@ -80,6 +80,50 @@ def test_malformed_calibration(
         io.read_cal_file(malformed_calibration_path)
 
 
+def test_read_cal_file_cached(tmp_path: Path) -> None:
+    """It should only re-read and re-parse a calibration file after it changes."""
+    parsed: typing.List[typing.Dict[str, typing.Any]] = []
+
+    def parse(data: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        parsed.append(data)
+        return data
+
+    calibration_path = tmp_path / "calibrations" / "my_calibration.json"
+    io.save_to_file(calibration_path.parent, "my_calibration", {"value": 1})
+
+    first = io.read_cal_file_cached(calibration_path, parse)
+    assert first == {"value": 1}
+    assert io.read_cal_file_cached(calibration_path, parse) is first
+    assert len(parsed) == 1
+
+    io.save_to_file(calibration_path.parent, "my_calibration", {"value": 2})
+    assert io.read_cal_file_cached(calibration_path, parse) == {"value": 2}
+    assert len(parsed) == 2
+
+    # Changed by something other than this module.
+    calibration_path.write_text(json.dumps({"value": 345}), encoding="utf-8")
+    assert io.read_cal_file_cached(calibration_path, parse) == {"value": 345}
+    assert len(parsed) == 3
+
+    io.delete_file(calibration_path)
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_file_cached(calibration_path, parse)
+
+
+def test_read_cal_file_cached_does_not_cache_failures(tmp_path: Path) -> None:
+    """It should re-read a file if parsing it failed last time."""
+    calibration_path = tmp_path / "calibrations" / "my_calibration.json"
+    io.save_to_file(calibration_path.parent, "my_calibration", {"integer_field": "1"})
+
+    with pytest.raises(pydantic.ValidationError):
+        io.read_cal_file_cached(calibration_path, DummyModel.parse_obj)
+
+    assert (
+        io.read_cal_file_cached(calibration_path, lambda data: data["integer_field"])
+        == "1"
+    )
+
+
 def test_deserialize_pydantic_model_valid() -> None:
     serialized = b'{"integer_field": 123, "! aliased field !": "abc"}'
     assert io.deserialize_pydantic_model(
@@ -0,0 +1,56 @@
+"""Benchmark of looking up tip length calibrations for many tip rack loads.
+
+Run with ``pytest --run-benchmarks``.
+"""
+import time
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+from opentrons import config
+from opentrons.calibration_storage import file_operators as io
+from opentrons.calibration_storage.ot2 import (
+    create_tip_length_data,
+    load_tip_length_calibration,
+    save_tip_length_calibration,
+    tip_length,
+)
+
+if TYPE_CHECKING:
+    from opentrons_shared_data.labware.types import LabwareDefinition
+
+
+_LOADS = 500
+
+
+@pytest.mark.benchmark
+def test_repeated_tip_rack_loads(
+    ot_config_tempdir: Any,
+    minimal_labware_def: "LabwareDefinition",
+    minimal_labware_def2: "LabwareDefinition",
+) -> None:
+    """Look up the same tip length calibration over and over."""
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def, 22.0)
+    )
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def2, 31.0)
+    )
+    tip_length_path = config.get_tip_length_cal_path() / "pip1.json"
+
+    start = time.perf_counter()
+    for _ in range(_LOADS):
+        uncached = tip_length._parse_tip_lengths(io.read_cal_file(tip_length_path))
+    uncached_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(_LOADS):
+        cached = load_tip_length_calibration("pip1", minimal_labware_def)
+    cached_ms = (time.perf_counter() - start) * 1000
+
+    assert cached.tipLength == 22.0
+    assert len(uncached) == 2
+    assert cached_ms < uncached_ms, (
+        f"{_LOADS} cached tip length lookups took {cached_ms:.1f} ms,"
+        f" reading and parsing every time took {uncached_ms:.1f} ms"
+    )
@@ -90,6 +90,17 @@ def test_get_tip_length_calibration(
         load_tip_length_calibration("nopipette", minimal_labware_def)
 
 
+def test_get_tip_length_calibration_copies(
+    starting_calibration_data: Any, minimal_labware_def: "LabwareDefinition"
+) -> None:
+    """Changing a returned model should not change what the next call returns."""
+    tip_length_data = load_tip_length_calibration("pip1", minimal_labware_def)
+    tip_length_data.status.markedBad = True
+
+    tip_length_data = load_tip_length_calibration("pip1", minimal_labware_def)
+    assert tip_length_data.status.markedBad is False
+
+
 def test_delete_specific_tip_calibration(
     starting_calibration_data: Any, minimal_labware_def: "LabwareDefinition"
 ) -> None:
@@ -15,6 +15,7 @@ from typing import (
     Set,
     Tuple,
     Any,
+    Iterable,
     Iterator,
     AsyncIterator,
     ContextManager,
@@ -44,6 +45,7 @@ from opentrons.config.types import (
 from opentrons.config.robot_configs import build_config_ot3
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
+    MessageId,
     NodeId,
     PipetteName as FirmwarePipetteName,
     USBTarget,
@@ -112,20 +114,37 @@ class MockCanMessageNotifier:
     def __init__(self) -> None:
         """Constructor."""
         self._listeners: List[
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]]
+            Tuple[
+                MessageListenerCallback,
+                Optional[MessageListenerCallbackFilter],
+                Optional[List[MessageId]],
+            ]
         ] = []
 
     def add_listener(
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Add listener."""
-        self._listeners.append((listener, filter))
+        self._listeners.append(
+            (
+                listener,
+                filter,
+                list(message_ids) if message_ids is not None else None,
+            )
+        )
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
-        for listener, filter in self._listeners:
+        for listener, filter, message_ids in self._listeners:
+            if (
+                message_ids is not None
+                and arbitration_id.parts.message_id not in message_ids
+            ):
+                continue
             if filter and not filter(arbitration_id):
                 continue
             listener(message, arbitration_id)
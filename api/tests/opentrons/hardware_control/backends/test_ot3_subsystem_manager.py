@@ -492,6 +492,7 @@ async def test_ok_tools_get_mapped(
     ).then_return({})
     await subject.start()
     assert subject.tools == summary
+    assert subject.tools_generation == 1
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,120 @@
+"""Tests for opentrons.hardware_control.clock."""
+import asyncio
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+from decoy import Decoy
+
+from opentrons.hardware_control import clock
+from opentrons.hardware_control.poller import Poller, Reader
+
+
+@pytest.fixture
+def virtual_clock() -> Iterator[clock.VirtualClock]:
+    """Install a jumping virtual clock for the duration of a test."""
+    previous = clock.get_clock()
+    subject = clock.VirtualClock(jump=True, settle_seconds=0.001)
+    clock.set_clock(subject)
+    yield subject
+    clock.set_clock(previous)
+
+
+async def test_speed() -> None:
+    """A sped-up clock should wait a fraction of the real time."""
+    subject = clock.VirtualClock(speed=100)
+
+    start = time.monotonic()
+    virtual_start = subject.monotonic()
+    await subject.sleep(5)
+
+    assert time.monotonic() - start < 1
+    assert subject.monotonic() - virtual_start >= 5
+
+
+async def test_jump_wakes_in_deadline_order(
+    virtual_clock: clock.VirtualClock,
+) -> None:
+    """Sleepers should wake in deadline order, ties in the order they slept."""
+    woken: List[str] = []
+
+    async def _sleep(name: str, seconds: float) -> None:
+        await virtual_clock.sleep(seconds)
+        woken.append(f"{name}@{virtual_clock.monotonic()}")
+
+    start = time.monotonic()
+    await asyncio.gather(
+        _sleep("hold", 3600),
+        _sleep("first", 60),
+        _sleep("second", 60),
+        _sleep("soon", 1),
+    )
+
+    assert time.monotonic() - start < 1
+    assert woken == ["soon@1.0", "first@60.0", "second@60.0", "hold@3600.0"]
+
+
+async def test_jump_lets_sleepers_go_back_to_sleep(
+    virtual_clock: clock.VirtualClock,
+) -> None:
+    """A repeating sleeper should keep running while a long sleep is pending."""
+    ticks: List[float] = []
+
+    async def _tick() -> None:
+        while True:
+            await virtual_clock.sleep(10)
+            ticks.append(virtual_clock.monotonic())
+
+    task = asyncio.create_task(_tick())
+    await virtual_clock.sleep(35)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert ticks == [10.0, 20.0, 30.0]
+
+
+async def test_jump_across_threads(virtual_clock: clock.VirtualClock) -> None:
+    """Blocking sleeps in other threads should share the virtual timeline."""
+    woken: List[float] = []
+
+    def _sleep_in_thread() -> None:
+        virtual_clock.sleep_sync(20)
+        woken.append(virtual_clock.monotonic())
+
+    thread = threading.Thread(target=_sleep_in_thread)
+    thread.start()
+    await virtual_clock.sleep(50)
+    thread.join()
+
+    assert woken == [20.0]
+    assert virtual_clock.monotonic() == 50.0
+
+
+async def test_cancelled_sleeper_does_not_block(
+    virtual_clock: clock.VirtualClock,
+) -> None:
+    """A cancelled sleep should give up its place in line."""
+    task = asyncio.create_task(virtual_clock.sleep(5))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    await virtual_clock.sleep(10)
+
+    assert virtual_clock.monotonic() == 10.0
+
+
+async def test_poller_uses_clock(
+    decoy: Decoy, virtual_clock: clock.VirtualClock
+) -> None:
+    """A poller's interval should pass on the current clock."""
+    reader = decoy.mock(cls=Reader)
+    poller = Poller(reader=reader, interval=60)
+
+    await poller.start()
+    for _ in range(3):
+        await poller.wait_next_poll()
+    await poller.stop()
+
+    assert virtual_clock.monotonic() == 180.0
@@ -1400,6 +1400,35 @@ async def test_cache_gripper(ot3_hardware: ThreadManager[OT3API]) -> None:
     assert ot3_hardware.attached_gripper["gripper_id"] == "g12345"
 
 
+async def test_cache_instruments_if_changed(
+    ot3_hardware: ThreadManager[OT3API],
+    managed_obj: OT3API,
+    hardware_backend: OT3Simulator,
+) -> None:
+    """It should only rescan instruments if the attached tools might have changed."""
+    with patch.object(
+        managed_obj, "_cache_instruments", AsyncMock(return_value=True)
+    ) as mock_cache_instruments:
+        await ot3_hardware.cache_instruments()
+        await ot3_hardware.cache_instruments_if_changed()
+        await ot3_hardware.cache_instruments_if_changed()
+        assert mock_cache_instruments.call_count == 1
+        assert ot3_hardware.skipped_instrument_scans == 2
+
+        with patch.object(
+            OT3Simulator, "tools_generation", PropertyMock(return_value=1)
+        ):
+            await ot3_hardware.cache_instruments_if_changed()
+            assert mock_cache_instruments.call_count == 2
+            await ot3_hardware.cache_instruments_if_changed()
+            assert mock_cache_instruments.call_count == 2
+
+        await ot3_hardware.cache_instruments(require={Mount.LEFT: "p1000_single_flex"})
+        await ot3_hardware.cache_instruments_if_changed()
+        assert mock_cache_instruments.call_count == 4
+        assert ot3_hardware.skipped_instrument_scans == 3
+
+
 async def test_has_gripper(
     ot3_hardware: ThreadManager[OT3API],
 ) -> None:
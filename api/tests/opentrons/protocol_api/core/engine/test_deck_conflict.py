@@ -1,6 +1,6 @@
 """Unit tests for the deck_conflict module."""
 import pytest
-from typing import ContextManager, Any, NamedTuple, List, Tuple
+from typing import ContextManager, Any, Dict, NamedTuple, List, Tuple, Union
 from decoy import Decoy
 from contextlib import nullcontext as does_not_raise
 from opentrons_shared_data.labware.types import LabwareUri
@@ -562,31 +562,16 @@ def test_deck_conflict_raises_for_bad_pipette_move(
         adjacent_slots_getters.get_surrounding_staging_slots(DeckSlotName.SLOT_C2)
     ).then_return([StagingSlotName.SLOT_C4])
 
-    decoy.when(
-        mock_state_view.addressable_areas.get_addressable_area_position(
-            addressable_area_name="C1", do_compatibility_check=False
-        )
-    ).then_return(Point(0, 100, 0))
-    decoy.when(
-        mock_state_view.addressable_areas.get_addressable_area_position(
-            addressable_area_name="D1", do_compatibility_check=False
-        )
-    ).then_return(Point(0, 0, 0))
-    decoy.when(
-        mock_state_view.addressable_areas.get_addressable_area_position(
-            addressable_area_name="D2", do_compatibility_check=False
-        )
-    ).then_return(Point(100, 0, 0))
-    decoy.when(
-        mock_state_view.addressable_areas.get_addressable_area_position(
-            addressable_area_name="C4", do_compatibility_check=False
-        )
-    ).then_return(Point(200, 100, 0))
-    decoy.when(
-        mock_state_view.addressable_areas.get_addressable_area_bounding_box(
-            addressable_area_name="C4", do_compatibility_check=False
-        )
-    ).then_return(Dimensions(90, 90, 0))
+    slot_rectangles: Dict[Union[DeckSlotName, StagingSlotName], Tuple[Point, Point]] = {
+        DeckSlotName.SLOT_C1: (Point(0, 190, 0), Point(90, 100, 0)),
+        DeckSlotName.SLOT_D1: (Point(0, 90, 0), Point(90, 0, 0)),
+        DeckSlotName.SLOT_D2: (Point(100, 90, 0), Point(190, 0, 0)),
+        StagingSlotName.SLOT_C4: (Point(200, 190, 0), Point(290, 100, 0)),
+    }
+    for slot, rectangle in slot_rectangles.items():
+        decoy.when(
+            mock_state_view.geometry.get_slot_bounding_rectangle(slot)
+        ).then_return(rectangle)
     decoy.when(
         mock_state_view.geometry.get_highest_z_in_slot(
             StagingSlotLocation(slotName=StagingSlotName.SLOT_C4)
@@ -598,11 +583,6 @@ def test_deck_conflict_raises_for_bad_pipette_move(
                 DeckSlotLocation(slotName=slot_name)
             )
         ).then_return(50)
-        decoy.when(
-            mock_state_view.addressable_areas.get_addressable_area_bounding_box(
-                addressable_area_name=slot_name.id, do_compatibility_check=False
-            )
-        ).then_return(Dimensions(90, 90, 0))
 
     with expected_raise:
         deck_conflict.check_safe_for_pipette_movement(
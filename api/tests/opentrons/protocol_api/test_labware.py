@@ -236,6 +236,87 @@ def test_wells(
     assert subject.columns_by_name() == {"1": [result_a1, result_b1]}
 
 
+def test_wells_created_on_first_access(
+    decoy: Decoy,
+    api_version: APIVersion,
+    mock_labware_core: LabwareCore,
+    mock_protocol_core: ProtocolCore,
+    mock_map_core: LoadedCoreMap,
+) -> None:
+    """It should only create each well when it's first accessed."""
+    mock_well_core_1 = decoy.mock(cls=WellCore)
+    mock_well_core_2 = decoy.mock(cls=WellCore)
+    grid = well_grid.WellGrid(
+        columns_by_name={"1": ["A1", "B1"]},
+        rows_by_name={"A": ["A1"], "B": ["B1"]},
+    )
+
+    decoy.when(mock_labware_core.get_well_columns()).then_return([["A1", "B1"]])
+    decoy.when(mock_labware_core.get_well_core("A1")).then_return(mock_well_core_1)
+    decoy.when(mock_labware_core.get_well_core("B1")).then_return(mock_well_core_2)
+    decoy.when(well_grid.create([["A1", "B1"]])).then_return(grid)
+
+    subject = Labware(
+        core=mock_labware_core,
+        api_version=api_version,
+        protocol_core=mock_protocol_core,
+        core_map=mock_map_core,
+    )
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=0)
+
+    result_b1 = subject["B1"]
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=0)
+    decoy.verify(mock_labware_core.get_well_core("B1"), times=1)
+
+    assert subject.wells() == [subject["A1"], result_b1]
+    assert subject.well(1) is result_b1
+    assert subject.wells("B1") == [result_b1]
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=1)
+    decoy.verify(mock_labware_core.get_well_core("B1"), times=1)
+
+    with pytest.raises(KeyError):
+        subject["C1"]
+
+
+def test_well_accessors_return_copies(
+    decoy: Decoy,
+    api_version: APIVersion,
+    mock_labware_core: LabwareCore,
+    mock_protocol_core: ProtocolCore,
+    mock_map_core: LoadedCoreMap,
+) -> None:
+    """Mutating an accessor's result should not affect the labware."""
+    grid = well_grid.WellGrid(
+        columns_by_name={"1": ["A1", "B1"]},
+        rows_by_name={"A": ["A1"], "B": ["B1"]},
+    )
+    decoy.when(mock_labware_core.get_well_columns()).then_return([["A1", "B1"]])
+    decoy.when(mock_labware_core.get_well_core("A1")).then_return(
+        decoy.mock(cls=WellCore)
+    )
+    decoy.when(mock_labware_core.get_well_core("B1")).then_return(
+        decoy.mock(cls=WellCore)
+    )
+    decoy.when(well_grid.create([["A1", "B1"]])).then_return(grid)
+
+    subject = Labware(
+        core=mock_labware_core,
+        api_version=api_version,
+        protocol_core=mock_protocol_core,
+        core_map=mock_map_core,
+    )
+
+    subject.wells().pop()
+    subject.wells_by_name().clear()
+    subject.rows()[0].clear()
+    subject.columns_by_name()["1"].pop()
+
+    assert len(subject.wells()) == 2
+    assert list(subject.wells_by_name()) == ["A1", "B1"]
+    assert subject.rows() == [[subject["A1"]], [subject["B1"]]]
+    assert subject.columns_by_name() == {"1": [subject["A1"], subject["B1"]]}
+
+
 def test_reset_tips(
     decoy: Decoy, mock_labware_core: LabwareCore, subject: Labware
 ) -> None:
@@ -0,0 +1,46 @@
+"""Benchmark of loading many large plates and indexing their wells.
+
+Run with ``pytest --run-benchmarks``.
+"""
+import time
+
+import pytest
+
+from opentrons import simulate
+
+_SLOTS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
+
+
+@pytest.mark.benchmark
+def test_load_and_index_384_well_plates() -> None:
+    """Load a deck full of 384-well plates and index into them in a loop."""
+    context = simulate.get_protocol_api("2.20")
+
+    start = time.perf_counter()
+    plates = [
+        context.load_labware("corning_384_wellplate_112ul_flat", slot)
+        for slot in _SLOTS
+    ]
+    loaded_at = time.perf_counter()
+
+    timings = []
+    for _ in range(2):
+        pass_start = time.perf_counter()
+        names = []
+        for plate in plates:
+            for i in range(384):
+                names.append(plate.wells()[i].well_name)
+            for row in plate.rows():
+                names.append(row[0].well_name)
+            names.append(plate["P24"].well_name)
+        timings.append((time.perf_counter() - pass_start) * 1000)
+
+    assert len(names) == len(plates) * (384 + 16 + 1)
+    assert names[0] == "A1"
+    assert names[383] == "P24"
+    # Wells are created on first access and reused after that.
+    assert timings[1] < timings[0], (
+        f"load {len(plates)} plates: {(loaded_at - start) * 1000:.1f} ms,"
+        f" index wells: first pass {timings[0]:.1f} ms,"
+        f" second pass {timings[1]:.1f} ms"
+    )
@@ -0,0 +1,136 @@
+"""Tests for executing transfers in batches of engine commands."""
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from opentrons import simulate
+from opentrons.protocol_api import ProtocolContext, instrument_context
+from opentrons.protocol_engine.commands import aspirate
+
+
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def _run_transfers(version: str) -> List[Dict[str, Any]]:
+    """Run some transfers and return the engine commands they produced."""
+    protocol = simulate.get_protocol_api(version=version, robot_type="OT-2")
+    tip_rack = protocol.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = protocol.load_labware("nest_96_wellplate_200ul_flat", 2)
+    dest = protocol.load_labware("nest_96_wellplate_200ul_flat", 3)
+    pipette = protocol.load_instrument(
+        "p300_single_gen2", mount="left", tip_racks=[tip_rack]
+    )
+
+    pipette.transfer(
+        20,
+        source.wells()[:8],
+        dest.wells()[:8],
+        touch_tip=True,
+        blow_out=True,
+        blowout_location="destination well",
+    )
+    pipette.transfer(
+        [50, 100, 350],
+        source.wells()[8:11],
+        dest.wells()[8:11],
+        new_tip="always",
+        mix_before=(2, 20),
+        mix_after=(2, 30),
+        air_gap=10,
+    )
+    pipette.distribute(10, source.wells()[0], dest.wells()[:24], disposal_volume=20)
+    pipette.consolidate(15, source.wells()[:12], dest.wells()[0], trash=False)
+
+    return _get_commands(protocol)
+
+
+def _get_commands(protocol: ProtocolContext) -> List[Dict[str, Any]]:
+    """Return the engine commands that a protocol has run so far.
+
+    IDs are replaced in order of appearance, so runs can be compared.
+    """
+    commands = protocol._core._engine_client.state.commands.get_all()  # type: ignore[attr-defined]
+    ids: Dict[str, str] = {}
+    serialized = _UUID.sub(
+        lambda match: ids.setdefault(match.group(0), f"id-{len(ids)}"),
+        json.dumps(
+            [
+                {
+                    "commandType": command.commandType,
+                    "params": command.params.dict(),
+                    "result": command.result.dict() if command.result else None,
+                    "status": command.status,
+                }
+                for command in commands
+            ],
+            default=str,
+        ),
+    )
+    return json.loads(serialized)  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize("version", ["2.16", "2.20"])
+def test_batched_transfers_match_unbatched(
+    version: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Batching a transfer's commands should not change which commands run."""
+    batched = _run_transfers(version)
+
+    monkeypatch.setattr(instrument_context, "_BATCHED_TRANSFER_METHODS", frozenset())
+    unbatched = _run_transfers(version)
+
+    assert len(batched) > 100
+    assert batched == unbatched
+
+
+def _run_failing_transfer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Run a transfer whose third aspirate fails.
+
+    Returns the engine commands it produced and the error it raised.
+    """
+    execute = aspirate.AspirateImplementation.execute
+    aspirate_count = 0
+
+    async def fail_third_aspirate(
+        self: aspirate.AspirateImplementation, params: aspirate.AspirateParams
+    ) -> Any:
+        nonlocal aspirate_count
+        aspirate_count += 1
+        if aspirate_count == 3:
+            raise RuntimeError("Oh no, the third aspirate failed.")
+        return await execute(self, params)
+
+    protocol = simulate.get_protocol_api(version="2.20", robot_type="OT-2")
+    tip_rack = protocol.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = protocol.load_labware("nest_96_wellplate_200ul_flat", 2)
+    dest = protocol.load_labware("nest_96_wellplate_200ul_flat", 3)
+    pipette = protocol.load_instrument(
+        "p300_single_gen2", mount="left", tip_racks=[tip_rack]
+    )
+
+    with monkeypatch.context() as patch:
+        patch.setattr(aspirate.AspirateImplementation, "execute", fail_third_aspirate)
+        with pytest.raises(Exception) as exc_info:
+            pipette.transfer(20, source.wells()[:8], dest.wells()[:8], new_tip="once")
+
+    return _get_commands(protocol), str(exc_info.value)
+
+
+def test_failed_batched_transfer_matches_unbatched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Commands after a failed one in a batch should never be added."""
+    batched_commands, batched_error = _run_failing_transfer(monkeypatch)
+
+    monkeypatch.setattr(instrument_context, "_BATCHED_TRANSFER_METHODS", frozenset())
+    unbatched_commands, unbatched_error = _run_failing_transfer(monkeypatch)
+
+    assert batched_commands == unbatched_commands
+    assert batched_error == unbatched_error
+    assert "third aspirate failed" in batched_error
+    assert batched_commands[-1]["commandType"] == "aspirate"
+    assert batched_commands[-1]["status"] == "failed"
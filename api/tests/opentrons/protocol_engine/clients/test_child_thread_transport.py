@@ -14,6 +14,7 @@ from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons.protocol_engine import ProtocolEngine, commands, DeckPoint
 from opentrons.protocol_engine.errors import ProtocolCommandFailedError, ErrorOccurrence
 from opentrons.protocol_engine.clients.transports import ChildThreadTransport
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
 
 
 @pytest.fixture
@@ -98,6 +99,77 @@ async def test_execute_command_failure(
         await get_running_loop().run_in_executor(None, task)
 
 
+async def test_execute_commands_wait_for_recovery(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: ChildThreadTransport,
+) -> None:
+    """It should execute several commands in a single call to the engine."""
+    requests = [
+        commands.CommentCreate(params=commands.CommentParams(message="hello")),
+        commands.CommentCreate(params=commands.CommentParams(message="world")),
+    ]
+    completed = [
+        commands.Comment(
+            id=f"cmd-id-{n}",
+            key=f"cmd-key-{n}",
+            status=commands.CommandStatus.SUCCEEDED,
+            params=request.params,
+            result=commands.CommentResult(),
+            createdAt=datetime.now(),
+        )
+        for n, request in enumerate(requests)
+    ]
+
+    decoy.when(
+        await engine.add_and_execute_commands_wait_for_recovery(requests=requests)
+    ).then_return(completed)
+
+    task = partial(subject.execute_commands_wait_for_recovery, requests=requests)
+    result = await get_running_loop().run_in_executor(None, task)
+
+    assert result == completed
+
+
+async def test_execute_commands_wait_for_recovery_failure(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: ChildThreadTransport,
+) -> None:
+    """It should raise if a command failed and the run can't recover from it."""
+    request = commands.CommentCreate(params=commands.CommentParams(message="hello"))
+    error = ErrorOccurrence(
+        id="error-id",
+        errorType="PrettyBadError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="Things are not looking good.",
+        errorCode="1234",
+    )
+
+    decoy.when(
+        await engine.add_and_execute_commands_wait_for_recovery(requests=[request])
+    ).then_return(
+        [
+            commands.Comment(
+                id="cmd-id",
+                key="cmd-key",
+                status=commands.CommandStatus.FAILED,
+                params=request.params,
+                error=error,
+                createdAt=datetime.now(),
+            )
+        ]
+    )
+    decoy.when(
+        engine.state_view.commands.get_error_recovery_type("cmd-id")
+    ).then_return(ErrorRecoveryType.FAIL_RUN)
+
+    task = partial(subject.execute_commands_wait_for_recovery, requests=[request])
+
+    with pytest.raises(ProtocolCommandFailedError):
+        await get_running_loop().run_in_executor(None, task)
+
+
 async def test_call_method(
     decoy: Decoy,
     engine: ProtocolEngine,
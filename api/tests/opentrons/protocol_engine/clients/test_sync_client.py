@@ -10,7 +10,7 @@ the subject's methods in a synchronous context in a child thread to ensure:
 """
 
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 
 from opentrons_shared_data.labware.types import LabwareUri
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
@@ -64,6 +64,64 @@ def test_execute_command_without_recovery(
     assert result_from_subject == result_from_transport
 
 
+def test_batch_commands(
+    decoy: Decoy, transport: ChildThreadTransport, subject: SyncClient
+) -> None:
+    """It should execute the commands of a batch together, when the batch exits."""
+    params_1 = commands.CommentParams(message="hello")
+    params_2 = commands.CommentParams(message="world")
+
+    with subject.batch_commands():
+        subject.execute_command(params_1)
+        subject.execute_command(params_2)
+        decoy.verify(
+            transport.execute_commands_wait_for_recovery(matchers.Anything()),
+            times=0,
+        )
+
+    decoy.verify(
+        transport.execute_commands_wait_for_recovery(
+            [
+                commands.CommentCreate(params=params_1),
+                commands.CommentCreate(params=params_2),
+            ]
+        ),
+        times=1,
+    )
+    decoy.verify(
+        transport.execute_command_wait_for_recovery(matchers.Anything()), times=0
+    )
+
+
+def test_batch_commands_flush(
+    decoy: Decoy, transport: ChildThreadTransport, subject: SyncClient
+) -> None:
+    """It should flush a pending batch before anything else goes to the engine."""
+    comment_params = commands.CommentParams(message="hello")
+    load_params = commands.LoadLabwareParams(
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_A1),
+        loadName="loadName",
+        namespace="namespace",
+        version=0,
+    )
+
+    with subject.batch_commands():
+        subject.execute_command(comment_params)
+        subject.execute_command_without_recovery(load_params)
+        subject.reset_tips(labware_id="tip-rack-id")
+
+    decoy.verify(
+        transport.execute_commands_wait_for_recovery(
+            [commands.CommentCreate(params=comment_params)]
+        ),
+        transport.execute_command(commands.LoadLabwareCreate(params=load_params)),
+        transport.call_method("reset_tips", labware_id="tip-rack-id"),
+    )
+    decoy.verify(
+        transport.execute_commands_wait_for_recovery(matchers.Anything()), times=1
+    )
+
+
 def test_add_labware_definition(
     decoy: Decoy,
     transport: ChildThreadTransport,
@@ -37,6 +37,7 @@ from opentrons.protocol_engine.commands.command import DefinedErrorData, Success
 
 from opentrons.protocol_engine.execution import (
     CommandExecutor,
+    CommandProfiler,
     EquipmentHandler,
     MovementHandler,
     GantryMover,
@@ -168,6 +169,12 @@ def command_note_tracker(
     return get_next_tracker(decoy, command_note_tracker_provider)
 
 
+@pytest.fixture
+def command_profiler() -> CommandProfiler:
+    """Get a real CommandProfiler to record executed commands."""
+    return CommandProfiler()
+
+
 @pytest.fixture
 def subject(
     hardware_api: HardwareControlAPI,
@@ -184,6 +191,7 @@ def subject(
     status_bar: StatusBarHandler,
     model_utils: ModelUtils,
     command_note_tracker_provider: CommandNoteTrackerProvider,
+    command_profiler: CommandProfiler,
 ) -> CommandExecutor:
     """Get a CommandExecutor test subject with its dependencies mocked out."""
     return CommandExecutor(
@@ -201,6 +209,7 @@ def subject(
         rail_lights=rail_lights,
         status_bar=status_bar,
         command_note_tracker_provider=command_note_tracker_provider,
+        command_profiler=command_profiler,
     )
 
 
@@ -244,9 +253,10 @@ async def test_execute(
     status_bar: StatusBarHandler,
     model_utils: ModelUtils,
     command_note_tracker: CommandNoteTracker,
+    command_profiler: CommandProfiler,
     subject: CommandExecutor,
 ) -> None:
-    """It should be able to execute a command."""
+    """It should be able to execute a command, and profile it."""
     TestCommandImplCls = decoy.mock(func=_TestCommandImpl)
     command_impl = decoy.mock(cls=_TestCommandImpl)
 
@@ -364,6 +374,11 @@ async def test_execute(
         ),
     )
 
+    [profile] = command_profiler.get_profiles()
+    assert profile.command_type == "testCommand"
+    assert profile.count == 1
+    assert profile.wall_time >= profile.hardware_time + profile.state_update_time
+
 
 @pytest.mark.parametrize(
     ["command_error", "expected_error"],
@@ -0,0 +1,41 @@
+"""Tests for the CommandProfiler."""
+import pytest
+
+from opentrons.protocol_engine.execution import CommandProfiler
+
+
+def test_profiles_by_command_type() -> None:
+    """It should add up times by command type, the longest first."""
+    subject = CommandProfiler()
+    subject.add(
+        command_type="aspirate",
+        wall_time=1.0,
+        hardware_time=0.8,
+        state_update_time=0.1,
+    )
+    subject.add(
+        command_type="home",
+        wall_time=5.0,
+        hardware_time=4.9,
+        state_update_time=0.05,
+    )
+    subject.add(
+        command_type="aspirate",
+        wall_time=3.0,
+        hardware_time=2.5,
+        state_update_time=0.2,
+    )
+
+    home, aspirate = subject.get_profiles()
+
+    assert home.command_type == "home"
+    assert aspirate.command_type == "aspirate"
+    assert aspirate.count == 2
+    assert aspirate.wall_time == 4.0
+    assert aspirate.hardware_time == pytest.approx(3.3)
+    assert aspirate.state_update_time == pytest.approx(0.3)
+    assert aspirate.max_wall_time == 3.0
+    assert aspirate.mean_wall_time == 2.0
+
+    subject.clear()
+    assert subject.get_profiles() == []
@@ -2,16 +2,24 @@
 from typing import cast
 
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 
-from opentrons.types import Mount
+from opentrons_shared_data.errors.exceptions import (
+    PipetteLiquidNotFoundError,
+    StallOrCollisionDetectedError,
+)
+from opentrons.types import Mount, Point
 from opentrons.hardware_control import API as HardwareAPI
 from opentrons.hardware_control.dev_types import PipetteDict
+from opentrons.hardware_control.ot3api import OT3API
+from opentrons.protocols.models import WellDefinition
 
 from opentrons.protocol_engine.state import StateView, HardwarePipette
-from opentrons.protocol_engine.types import TipGeometry
+from opentrons.protocol_engine.state.wells import LiquidHeightInfo
+from opentrons.protocol_engine.types import TipGeometry, WellLocation, WellOffset
 from opentrons.protocol_engine.execution.pipetting import (
     HardwarePipettingHandler,
+    LiquidProbeStats,
     VirtualPipettingHandler,
     create_pipetting_handler,
 )
@@ -588,3 +596,259 @@ async def test_dispense_volume_validation(
             await subject.dispense_in_place(
                 pipette_id="pipette-id", volume=not_ok_volume, flow_rate=5, push_out=7
             )
+
+
+@pytest.fixture
+def ot3_hardware_api(decoy: Decoy) -> OT3API:
+    """Get a mock in the shape of an OT3API."""
+    return decoy.mock(cls=OT3API)
+
+
+@pytest.fixture
+def liquid_probe_stats() -> LiquidProbeStats:
+    """Get the liquid probe stats that a hardware subject should record to."""
+    return LiquidProbeStats()
+
+
+@pytest.fixture
+async def ot3_subject(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+) -> HardwarePipettingHandler:
+    """Get a HardwarePipettingHandler test subject that can liquid probe."""
+    decoy.when(ot3_hardware_api.attached_instruments).then_return({})
+    decoy.when(
+        mock_state_view.pipettes.get_hardware_pipette(
+            pipette_id="pipette-id", attached_pipettes={}
+        )
+    ).then_return(HardwarePipette(mount=Mount.LEFT, config=cast(PipetteDict, {})))
+    decoy.when(
+        mock_state_view.pipettes.get_current_tip_lld_settings(pipette_id="pipette-id")
+    ).then_return(0.5)
+    decoy.when(
+        mock_state_view.tips.get_pipette_active_channels("pipette-id")
+    ).then_return(1)
+    decoy.when(
+        mock_state_view.labware.get_well_definition("labware-id", "A1")
+    ).then_return(
+        WellDefinition(
+            depth=40.5,
+            x=0,
+            y=0,
+            z=1,
+            totalLiquidVolume=20000,
+            shape="rectangular",
+            xDimension=10,
+            yDimension=20,
+        )
+    )
+    decoy.when(
+        await ot3_hardware_api.gantry_position(Mount.LEFT, refresh=True)
+    ).then_return(Point(x=1, y=2, z=50))
+    return HardwarePipettingHandler(
+        state_view=mock_state_view,
+        hardware_api=ot3_hardware_api,
+        liquid_probe_stats=liquid_probe_stats,
+    )
+
+
+async def test_liquid_probe_in_place(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should search the whole well for liquid it hasn't measured before."""
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(None)
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=42)
+    ).then_return(15)
+
+    result = await ot3_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=WellLocation(offset=WellOffset(z=2)),
+    )
+
+    assert result == 15
+    assert liquid_probe_stats == LiquidProbeStats(probes=1)
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, matchers.Anything()), times=0
+    )
+
+
+async def test_liquid_probe_in_place_predicted(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should start just above where previously measured liquid should be now."""
+    # 400 µL out of a 10 mm x 20 mm well lowers the liquid by 2 mm.
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(LiquidHeightInfo(height=30, volume_change=-400))
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=8)
+    ).then_return(27.5)
+
+    result = await ot3_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=WellLocation(offset=WellOffset(z=2)),
+    )
+
+    assert result == 27.5
+    assert liquid_probe_stats == LiquidProbeStats(
+        probes=1, predicted_probes=1, z_distance_saved=18
+    )
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, Point(x=1, y=2, z=32)),
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=8),
+        await ot3_hardware_api.move_to(Mount.LEFT, Point(x=1, y=2, z=50)),
+    )
+
+
+async def test_liquid_probe_in_place_multi_channel(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should search the whole well when probing with more than one channel."""
+    decoy.when(
+        mock_state_view.tips.get_pipette_active_channels("pipette-id")
+    ).then_return(8)
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(LiquidHeightInfo(height=30, volume_change=0))
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=42)
+    ).then_return(29)
+
+    result = await ot3_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=WellLocation(offset=WellOffset(z=2)),
+    )
+
+    assert result == 29
+    assert liquid_probe_stats == LiquidProbeStats(probes=1)
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, matchers.Anything()), times=0
+    )
+
+
+async def test_liquid_probe_in_place_prediction_missed(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should search the whole well if liquid isn't where it was predicted."""
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(LiquidHeightInfo(height=30, volume_change=0))
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=4)
+    ).then_raise(PipetteLiquidNotFoundError())
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=42)
+    ).then_return(12)
+
+    result = await ot3_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=WellLocation(offset=WellOffset(z=2)),
+    )
+
+    assert result == 12
+    assert liquid_probe_stats == LiquidProbeStats(
+        probes=1, predicted_probes=1, missed_predictions=1
+    )
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, Point(x=1, y=2, z=32)),
+        times=1,
+    )
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, Point(x=1, y=2, z=50)),
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=42),
+    )
+
+
+async def test_liquid_probe_in_place_prediction_error(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should not move the pipette after a probe fails for another reason."""
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(LiquidHeightInfo(height=30, volume_change=0))
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=4)
+    ).then_raise(StallOrCollisionDetectedError())
+
+    with pytest.raises(StallOrCollisionDetectedError):
+        await ot3_subject.liquid_probe_in_place(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A1",
+            well_location=WellLocation(offset=WellOffset(z=2)),
+        )
+
+    decoy.verify(
+        await ot3_hardware_api.move_to(Mount.LEFT, Point(x=1, y=2, z=50)),
+        times=0,
+    )
+
+
+async def test_liquid_probe_in_place_prediction_out_of_range(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    ot3_hardware_api: OT3API,
+    liquid_probe_stats: LiquidProbeStats,
+    ot3_subject: HardwarePipettingHandler,
+) -> None:
+    """It should search the whole well if the prediction can't save any travel."""
+    decoy.when(
+        mock_state_view.wells.get_last_measured_liquid_height(
+            labware_id="labware-id", well_name="A1"
+        )
+    ).then_return(LiquidHeightInfo(height=47, volume_change=0))
+    decoy.when(
+        await ot3_hardware_api.liquid_probe(mount=Mount.LEFT, max_z_dist=42)
+    ).then_return(47)
+
+    result = await ot3_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=WellLocation(offset=WellOffset(z=2)),
+    )
+
+    assert result == 47
+    assert liquid_probe_stats == LiquidProbeStats(probes=1)
@@ -7,13 +7,13 @@ from decoy import Decoy
 from typing import cast, List, Tuple, Optional, NamedTuple
 from datetime import datetime
 
-from opentrons_shared_data.deck.types import DeckDefinitionV5
+from opentrons_shared_data.deck.types import CutoutFixture, DeckDefinitionV5
 from opentrons_shared_data.deck import load as load_deck
 from opentrons_shared_data.labware.types import LabwareUri
 from opentrons_shared_data.pipette import pipette_definition
 from opentrons.calibration_storage.helpers import uri_from_details
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.types import Point, DeckSlotName, MountType
+from opentrons.types import Point, DeckSlotName, MountType, StagingSlotName
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons_shared_data.labware.labware_definition import (
     Dimensions as LabwareDimensions,
@@ -1097,6 +1097,56 @@ def test_get_highest_z_in_slot_with_labware_stack_on_module(
     )
 
 
+def test_get_highest_z_in_slot_cached_until_deck_layout_changes(
+    decoy: Decoy,
+    mock_labware_view: LabwareView,
+    mock_module_view: ModuleView,
+    mock_addressable_area_view: AddressableAreaView,
+    subject: GeometryView,
+) -> None:
+    """It should reuse slot heights until labware, modules, or areas change."""
+    decoy.when(mock_labware_view.get_deck_layout_version()).then_return(1)
+    decoy.when(mock_module_view.get_deck_layout_version()).then_return(1)
+    decoy.when(mock_addressable_area_view.get_deck_layout_version()).then_return(1)
+    slot = DeckSlotLocation(slotName=DeckSlotName.SLOT_A1)
+
+    assert subject.get_highest_z_in_slot(slot) == 0
+
+    decoy.when(
+        mock_addressable_area_view.get_fixture_by_deck_slot_name(DeckSlotName.SLOT_A1)
+    ).then_return(cast(CutoutFixture, {"id": "fixture-id"}))
+    decoy.when(mock_addressable_area_view.get_fixture_height("fixture-id")).then_return(
+        42
+    )
+    assert subject.get_highest_z_in_slot(slot) == 0
+
+    decoy.when(mock_addressable_area_view.get_deck_layout_version()).then_return(2)
+    assert subject.get_highest_z_in_slot(slot) == 42
+
+
+def test_get_slot_bounding_rectangle(
+    decoy: Decoy,
+    mock_addressable_area_view: AddressableAreaView,
+    subject: GeometryView,
+) -> None:
+    """It should get the back-left and front-right corners of a slot."""
+    decoy.when(
+        mock_addressable_area_view.get_addressable_area_position(
+            addressable_area_name="C4", do_compatibility_check=False
+        )
+    ).then_return(Point(200, 100, 5))
+    decoy.when(
+        mock_addressable_area_view.get_addressable_area_bounding_box(
+            addressable_area_name="C4", do_compatibility_check=False
+        )
+    ).then_return(Dimensions(x=90, y=80, z=0))
+
+    assert subject.get_slot_bounding_rectangle(StagingSlotName.SLOT_C4) == (
+        Point(200, 180, 5),
+        Point(290, 100, 5),
+    )
+
+
 @pytest.mark.parametrize(
     ["location", "min_z_height", "expected_min_z"],
     [
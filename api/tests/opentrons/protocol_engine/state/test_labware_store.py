@@ -241,6 +241,7 @@ def test_handles_move_labware(
         offset_id="my-new-offset",
         strategy=LabwareMovementStrategy.MANUAL_MOVE_WITH_PAUSE,
     )
+    version_before_move = subject.state.deck_layout_version
     subject.handle_action(
         SucceedCommandAction(private_result=None, command=move_command)
     )
@@ -249,6 +250,7 @@ def test_handles_move_labware(
         slotName=DeckSlotName.SLOT_4
     )
     assert subject.state.labware_by_id["my-labware-id"].offsetId == "my-new-offset"
+    assert subject.state.deck_layout_version > version_before_move
 
 
 def test_handles_move_labware_off_deck(
@@ -222,6 +222,7 @@ def test_load_module(
         substate_by_module_id={"module-id": expected_substate},
         module_offset_by_serial={},
         additional_slots_occupied_by_module_id={},
+        deck_layout_version=1,
     )
 
 
@@ -368,6 +369,7 @@ def test_add_module_action(
         substate_by_module_id={"module-id": expected_substate},
         module_offset_by_serial={},
         additional_slots_occupied_by_module_id={},
+        deck_layout_version=1,
     )
 
 
@@ -0,0 +1,266 @@
+"""Well state store tests."""
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from opentrons_shared_data.errors.exceptions import PipetteOverpressureError
+from opentrons_shared_data.pipette.types import PipetteNameType
+from opentrons.protocol_engine import commands as cmd
+from opentrons.protocol_engine.commands.configure_nozzle_layout import (
+    ConfigureNozzleLayoutPrivateResult,
+)
+from opentrons.hardware_control.types import DoorState
+from opentrons.protocol_engine.actions import (
+    Action,
+    DoorChangeAction,
+    FailCommandAction,
+    PauseAction,
+    PauseSource,
+    PlayAction,
+    ResumeFromRecoveryAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
+from opentrons.protocol_engine.state.wells import LiquidHeightInfo, WellStore
+from opentrons.protocol_engine.types import (
+    AllNozzleLayoutConfiguration,
+    DeckPoint,
+    DeckSlotLocation,
+    LabwareMovementStrategy,
+)
+from opentrons.types import DeckSlotName
+
+from .command_fixtures import (
+    create_aspirate_command,
+    create_aspirate_in_place_command,
+    create_blow_out_command,
+    create_dispense_command,
+    create_move_labware_command,
+)
+from ..pipette_fixtures import get_default_nozzle_map
+
+
+@pytest.fixture
+def subject() -> WellStore:
+    """Well store test subject."""
+    return WellStore()
+
+
+def _create_liquid_probe_command(
+    z_position: float, labware_id: str = "labware-id", well_name: str = "A1"
+) -> cmd.LiquidProbe:
+    return cmd.LiquidProbe(
+        id="command-id",
+        key="command-key",
+        status=cmd.CommandStatus.SUCCEEDED,
+        createdAt=datetime.now(),
+        params=cmd.LiquidProbeParams(
+            pipetteId="pipette-id", labwareId=labware_id, wellName=well_name
+        ),
+        result=cmd.LiquidProbeResult(
+            z_position=z_position, position=DeckPoint(x=0, y=0, z=0)
+        ),
+    )
+
+
+def _succeed(subject: WellStore, command: cmd.Command) -> None:
+    subject.handle_action(SucceedCommandAction(private_result=None, command=command))
+
+
+def _configure_nozzles(
+    subject: WellStore, pipette_id: str, pipette_type: PipetteNameType
+) -> None:
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=ConfigureNozzleLayoutPrivateResult(
+                pipette_id=pipette_id,
+                nozzle_map=get_default_nozzle_map(pipette_type),
+            ),
+            command=cmd.ConfigureNozzleLayout(
+                id="command-id",
+                key="command-key",
+                status=cmd.CommandStatus.SUCCEEDED,
+                createdAt=datetime.now(),
+                params=cmd.ConfigureNozzleLayoutParams(
+                    pipetteId=pipette_id,
+                    configurationParams=AllNozzleLayoutConfiguration(),
+                ),
+                result=cmd.ConfigureNozzleLayoutResult(),
+            ),
+        )
+    )
+
+
+def test_handles_liquid_probe(subject: WellStore) -> None:
+    """It should remember measured liquid heights."""
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(subject, _create_liquid_probe_command(z_position=30, well_name="B1"))
+    _succeed(subject, _create_liquid_probe_command(z_position=25))
+
+    assert subject.state.measured_liquid_heights == {
+        "labware-id": {
+            "A1": LiquidHeightInfo(height=25, volume_change=0),
+            "B1": LiquidHeightInfo(height=30, volume_change=0),
+        }
+    }
+
+
+def test_handles_try_liquid_probe_without_liquid(subject: WellStore) -> None:
+    """It should forget a well's height if liquid wasn't found there."""
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(
+        subject,
+        cmd.TryLiquidProbe(
+            id="command-id",
+            key="command-key",
+            status=cmd.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(),
+            params=cmd.TryLiquidProbeParams(
+                pipetteId="pipette-id", labwareId="labware-id", wellName="A1"
+            ),
+            result=cmd.TryLiquidProbeResult(
+                z_position=None, position=DeckPoint(x=0, y=0, z=0)
+            ),
+        ),
+    )
+
+    assert subject.state.measured_liquid_heights == {"labware-id": {}}
+
+
+def test_handles_aspirate_and_dispense(subject: WellStore) -> None:
+    """It should track volumes moved in and out of measured wells."""
+    _configure_nozzles(subject, "pipette-id", PipetteNameType.P1000_SINGLE_FLEX)
+    _configure_nozzles(subject, "other-pipette-id", PipetteNameType.P50_SINGLE_FLEX)
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(subject, create_aspirate_command("pipette-id", volume=50, flow_rate=1))
+    _succeed(subject, create_dispense_command("pipette-id", volume=20, flow_rate=1))
+    _succeed(
+        subject, create_aspirate_command("other-pipette-id", volume=5, flow_rate=1)
+    )
+    _succeed(
+        subject,
+        create_aspirate_command(
+            "pipette-id", volume=50, flow_rate=1, well_name="not-measured"
+        ),
+    )
+
+    assert subject.state.measured_liquid_heights == {
+        "labware-id": {"A1": LiquidHeightInfo(height=20, volume_change=-35)}
+    }
+
+
+@pytest.mark.parametrize(
+    "pipette_type", [PipetteNameType.P1000_MULTI_FLEX, PipetteNameType.P1000_96, None]
+)
+def test_multi_channel_aspirate_forgets_labware(
+    subject: WellStore, pipette_type: Optional[PipetteNameType]
+) -> None:
+    """It should forget a labware's heights if more than one channel may have used it."""
+    if pipette_type is not None:
+        _configure_nozzles(subject, "pipette-id", pipette_type)
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(subject, _create_liquid_probe_command(z_position=30, well_name="B1"))
+    _succeed(
+        subject,
+        _create_liquid_probe_command(z_position=25, labware_id="other-labware-id"),
+    )
+    _succeed(
+        subject,
+        create_aspirate_command(
+            "pipette-id", volume=50, flow_rate=1, well_name="not-measured"
+        ),
+    )
+
+    assert subject.state.measured_liquid_heights == {
+        "other-labware-id": {"A1": LiquidHeightInfo(height=25, volume_change=0)}
+    }
+
+
+def test_handles_blow_out(subject: WellStore) -> None:
+    """It should forget a well's height after blowing out into it."""
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(subject, _create_liquid_probe_command(z_position=30, well_name="B1"))
+    _succeed(
+        subject,
+        create_blow_out_command("pipette-id", flow_rate=1, well_name="A1"),
+    )
+
+    assert subject.state.measured_liquid_heights == {
+        "labware-id": {"B1": LiquidHeightInfo(height=30, volume_change=0)}
+    }
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        create_aspirate_in_place_command("pipette-id", volume=50, flow_rate=1),
+        create_move_labware_command(
+            new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+            strategy=LabwareMovementStrategy.MANUAL_MOVE_WITH_PAUSE,
+            labware_id="other-labware-id",
+        ),
+        cmd.WaitForResume(
+            id="command-id",
+            key="command-key",
+            status=cmd.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(),
+            params=cmd.WaitForResumeParams(),
+            result=cmd.WaitForResumeResult(),
+        ),
+    ],
+)
+def test_forgets_all_heights(subject: WellStore, command: cmd.Command) -> None:
+    """It should forget every height after commands it can't attribute to a well."""
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    _succeed(subject, command)
+
+    assert subject.state.measured_liquid_heights == {}
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        PauseAction(source=PauseSource.CLIENT),
+        PlayAction(requested_at=datetime.now()),
+        DoorChangeAction(door_state=DoorState.OPEN),
+        ResumeFromRecoveryAction(),
+    ],
+)
+def test_forgets_all_heights_on_action(subject: WellStore, action: Action) -> None:
+    """It should forget every height when someone may have changed the liquid by hand."""
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    subject.handle_action(action)
+
+    assert subject.state.measured_liquid_heights == {}
+
+
+def test_handles_failed_aspirate(subject: WellStore) -> None:
+    """It should forget a well's height if an aspirate from it failed."""
+    _configure_nozzles(subject, "pipette-id", PipetteNameType.P1000_SINGLE_FLEX)
+    _succeed(subject, _create_liquid_probe_command(z_position=20))
+    subject.handle_action(
+        FailCommandAction(
+            running_command=cmd.Aspirate(
+                params=cmd.AspirateParams(
+                    pipetteId="pipette-id",
+                    labwareId="labware-id",
+                    wellName="A1",
+                    volume=50,
+                    flowRate=1.23,
+                ),
+                id="command-id",
+                key="command-key",
+                createdAt=datetime.now(),
+                status=cmd.CommandStatus.RUNNING,
+            ),
+            error=PipetteOverpressureError(),
+            command_id="command-id",
+            error_id="error-id",
+            failed_at=datetime.now(),
+            notes=[],
+            type=ErrorRecoveryType.FAIL_RUN,
+        )
+    )
+
+    assert subject.state.measured_liquid_heights == {"labware-id": {}}
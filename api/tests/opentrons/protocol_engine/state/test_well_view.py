@@ -0,0 +1,30 @@
+"""Well view tests."""
+import pytest
+
+from opentrons.protocol_engine.state.wells import (
+    LiquidHeightInfo,
+    WellState,
+    WellView,
+)
+
+
+@pytest.fixture
+def subject() -> WellView:
+    """Get a well view test subject."""
+    state = WellState(
+        measured_liquid_heights={
+            "labware-id": {"A1": LiquidHeightInfo(height=20, volume_change=-30)}
+        },
+        active_channels_by_pipette_id={},
+    )
+
+    return WellView(state)
+
+
+def test_get_last_measured_liquid_height(subject: WellView) -> None:
+    """It should return the last measured height of a well, if any."""
+    assert subject.get_last_measured_liquid_height(
+        "labware-id", "A1"
+    ) == LiquidHeightInfo(height=20, volume_change=-30)
+    assert subject.get_last_measured_liquid_height("labware-id", "B1") is None
+    assert subject.get_last_measured_liquid_height("other-labware-id", "A1") is None
@@ -19,6 +19,7 @@ from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocol_engine import ProtocolEngine, commands, slot_standardization
 from opentrons.protocol_engine.errors.exceptions import (
     CommandNotAllowedError,
+    SetupCommandNotAllowedError,
 )
 from opentrons.protocol_engine.types import (
     DeckType,
@@ -42,6 +43,7 @@ from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
 from opentrons.protocol_engine.state import Config, StateStore
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 from opentrons.protocol_engine.errors import ProtocolCommandFailedError, ErrorOccurrence
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
 
 from opentrons.protocol_engine.actions import (
     ActionDispatcher,
@@ -252,6 +254,133 @@ def test_add_command(
     assert result == queued
 
 
+def test_add_commands(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should validate every command in a batch, then queue them in order."""
+    created_at = datetime(year=2021, month=1, day=1)
+    request_1 = commands.HomeCreate(params=commands.HomeParams())
+    request_2 = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+    queued_1 = commands.Home(
+        id="command-id-1",
+        key="command-key-1",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=commands.HomeParams(),
+    )
+    queued_2 = commands.WaitForResume(
+        id="command-id-2",
+        key="command-key-2",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=commands.WaitForResumeParams(),
+    )
+    action_1 = QueueCommandAction(
+        command_id="command-id-1",
+        created_at=created_at,
+        request=request_1,
+        request_hash="hash-1",
+    )
+    action_2 = QueueCommandAction(
+        command_id="command-id-2",
+        created_at=created_at,
+        request=request_2,
+        request_hash="hash-2",
+    )
+
+    robot_type: RobotType = "OT-3 Standard"
+    decoy.when(state_store.config).then_return(
+        Config(robot_type=robot_type, deck_type=DeckType.OT3_STANDARD)
+    )
+    decoy.when(
+        slot_standardization.standardize_command(request_1, robot_type)
+    ).then_return(request_1)
+    decoy.when(
+        slot_standardization.standardize_command(request_2, robot_type)
+    ).then_return(request_2)
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(state_store.commands.get_latest_protocol_command_hash()).then_return(
+        "abc"
+    )
+    decoy.when(
+        commands.hash_protocol_command_params(create=request_1, last_hash="abc")
+    ).then_return("hash-1")
+    decoy.when(
+        commands.hash_protocol_command_params(create=request_2, last_hash="hash-1")
+    ).then_return("hash-2")
+    decoy.when(state_store.commands.validate_action_allowed(action_1)).then_return(
+        action_1
+    )
+    decoy.when(state_store.commands.validate_action_allowed(action_2)).then_return(
+        action_2
+    )
+    decoy.when(state_store.commands.get("command-id-1")).then_return(queued_1)
+    decoy.when(state_store.commands.get("command-id-2")).then_return(queued_2)
+
+    result = subject.add_commands([request_1, request_2])
+
+    assert result == [queued_1, queued_2]
+    decoy.verify(
+        action_dispatcher.dispatch(action_1),
+        action_dispatcher.dispatch(action_2),
+    )
+
+
+def test_add_commands_not_allowed(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should queue none of a batch's commands if any is not allowed."""
+    created_at = datetime(year=2021, month=1, day=1)
+    request_1 = commands.HomeCreate(
+        params=commands.HomeParams(), intent=commands.CommandIntent.SETUP
+    )
+    request_2 = commands.HomeCreate(
+        params=commands.HomeParams(), intent=commands.CommandIntent.SETUP
+    )
+    action_1 = QueueCommandAction(
+        command_id="command-id-1",
+        created_at=created_at,
+        request=request_1,
+        request_hash=None,
+    )
+    action_2 = QueueCommandAction(
+        command_id="command-id-2",
+        created_at=created_at,
+        request=request_2,
+        request_hash=None,
+    )
+
+    robot_type: RobotType = "OT-3 Standard"
+    decoy.when(state_store.config).then_return(
+        Config(robot_type=robot_type, deck_type=DeckType.OT3_STANDARD)
+    )
+    decoy.when(
+        slot_standardization.standardize_command(request_1, robot_type)
+    ).then_return(request_1)
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(state_store.commands.validate_action_allowed(action_1)).then_return(
+        action_1
+    )
+    decoy.when(state_store.commands.validate_action_allowed(action_2)).then_raise(
+        SetupCommandNotAllowedError("oh no")
+    )
+
+    with pytest.raises(SetupCommandNotAllowedError):
+        subject.add_commands([request_1, request_2])
+
+    decoy.verify(action_dispatcher.dispatch(action_1), times=0)
+
+
 def test_add_fixit_command(
     decoy: Decoy,
     state_store: StateStore,
@@ -532,6 +661,75 @@ async def test_add_and_execute_command_wait_for_recovery(
     )
 
 
+async def test_add_and_execute_commands_wait_for_recovery(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should add each command after the last one, and stop at a failure."""
+    created_at = datetime(year=2021, month=1, day=1)
+    request = commands.HomeCreate(
+        params=commands.HomeParams(), intent=commands.CommandIntent.SETUP
+    )
+    failed = commands.Home(
+        id="command-id-1",
+        key="command-key-1",
+        status=commands.CommandStatus.FAILED,
+        createdAt=created_at,
+        params=commands.HomeParams(),
+        error=ErrorOccurrence(
+            id="error-id",
+            errorType="PrettyBadError",
+            createdAt=created_at,
+            detail="Things are not looking good.",
+            errorCode="1234",
+        ),
+    )
+
+    robot_type: RobotType = "OT-3 Standard"
+    decoy.when(state_store.config).then_return(
+        Config(robot_type=robot_type, deck_type=DeckType.OT3_STANDARD)
+    )
+    decoy.when(
+        slot_standardization.standardize_command(request, robot_type)
+    ).then_return(request)
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    for command_id in ["command-id-1", "command-id-2"]:
+        action = QueueCommandAction(
+            command_id=command_id,
+            created_at=created_at,
+            request=request,
+            request_hash=None,
+        )
+        decoy.when(state_store.commands.validate_action_allowed(action)).then_return(
+            action
+        )
+    decoy.when(state_store.commands.get("command-id-1")).then_return(failed)
+    decoy.when(
+        state_store.commands.get_error_recovery_type("command-id-1")
+    ).then_return(ErrorRecoveryType.FAIL_RUN)
+
+    result = await subject.add_and_execute_commands_wait_for_recovery(
+        [request, request]
+    )
+
+    assert result == [failed]
+    decoy.verify(
+        action_dispatcher.dispatch(
+            QueueCommandAction(
+                command_id="command-id-2",
+                created_at=created_at,
+                request=request,
+                request_hash=None,
+            )
+        ),
+        times=0,
+    )
+
+
 def test_play(
     decoy: Decoy,
     state_store: StateStore,
@@ -0,0 +1,61 @@
+"""Benchmark of analyzing legacy (apiLevel < 2.14) protocols from the snapshot corpus.
+
+These protocols run through the legacy context plugin and command mapper.
+
+Run with ``pytest --run-benchmarks``.
+"""
+import time
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocol_engine import EngineStatus
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner.create_simulating_orchestrator import (
+    create_simulating_orchestrator,
+)
+
+_SNAPSHOT_PROTOCOLS_DIR = (
+    Path(__file__).resolve().parents[5]
+    / "analyses-snapshot-testing"
+    / "files"
+    / "protocols"
+)
+
+
+# Comfortably above what each analysis takes here (about 2 s, 4 s and 0.15 s),
+# so that only a real regression fails.
+_BUDGETS_SECONDS = {
+    "OT2_S_v2_4_P300M_None_MM_TM_Zymo.py": 4.0,
+    "OT2_S_v2_11_P10S_P300M_MM_TC1_TM_Swift.py": 8.0,
+    "OT2_S_v2_7_P20S_None_Walkthrough.py": 0.5,
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("protocol_name", "budget_seconds"), _BUDGETS_SECONDS.items())
+async def test_analyze_legacy_snapshot_protocol(
+    protocol_name: str, budget_seconds: float
+) -> None:
+    """Analyze a large legacy protocol within its time budget."""
+    protocol_file = _SNAPSHOT_PROTOCOLS_DIR / protocol_name
+    if not protocol_file.exists():
+        pytest.skip("The analyses snapshot protocols are not available.")
+
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file], directory=None
+    )
+    subject = await create_simulating_orchestrator(
+        robot_type="OT-2 Standard", protocol_config=protocol_source.config
+    )
+
+    start = time.perf_counter()
+    result = await subject.run(deck_configuration=[], protocol_source=protocol_source)
+    elapsed = time.perf_counter() - start
+
+    assert result.state_summary.errors == []
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+    assert elapsed < budget_seconds, (
+        f"{len(result.commands)} commands in {elapsed * 1000:.0f} ms"
+        f" ({elapsed / len(result.commands) * 1e6:.0f} us per command)"
+    )
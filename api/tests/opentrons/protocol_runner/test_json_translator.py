@@ -1,5 +1,6 @@
 """Tests for the JSON JsonTranslator interface."""
 import pytest
+from pydantic import ValidationError
 from typing import Dict, List
 
 from opentrons_shared_data.labware.labware_definition import (
@@ -839,3 +840,19 @@ def test_load_liquid(
             displayColor=HexColor(__root__="#F00"),
         )
     ]
+
+
+def test_unknown_command_type(subject: JsonTranslator) -> None:
+    """It should fail validation for command types the engine doesn't know."""
+    protocol = _make_v8_json_protocol(
+        commands=[
+            protocol_schema_v8.Command(
+                commandType="notARealCommand",
+                key=None,
+                params=protocol_schema_v8.Params(pipetteId="pipette-id-1"),
+            )
+        ]
+    )
+
+    with pytest.raises(ValidationError):
+        subject.translate_commands(protocol)
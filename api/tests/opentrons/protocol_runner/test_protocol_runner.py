@@ -390,28 +390,20 @@ async def test_run_json_runner_stop_requested_stops_enqueuing(
     decoy.when(json_translator.translate_commands(json_protocol)).then_return(commands)
     decoy.when(json_translator.translate_liquids(json_protocol)).then_return(liquids)
     decoy.when(
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            pe_commands.HomeCreate(params=pe_commands.HomeParams()),
-        )
+        await protocol_engine.add_and_execute_commands_wait_for_recovery(commands)
     ).then_return(
-        pe_commands.Home.construct(status=pe_commands.CommandStatus.SUCCEEDED)  # type: ignore[call-arg]
-    )
-    decoy.when(
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            pe_commands.WaitForDurationCreate(
-                params=pe_commands.WaitForDurationParams(seconds=10)
+        [
+            pe_commands.Home.construct(status=pe_commands.CommandStatus.SUCCEEDED),  # type: ignore[call-arg]
+            pe_commands.WaitForDuration.construct(  # type: ignore[call-arg]
+                id="protocol-command-id",
+                error=pe_errors.ErrorOccurrence.from_failed(
+                    id="some-id",
+                    createdAt=datetime(year=2021, month=1, day=1),
+                    error=pe_errors.ProtocolEngineError(),
+                ),
+                status=pe_commands.CommandStatus.FAILED,
             ),
-        )
-    ).then_return(
-        pe_commands.WaitForDuration.construct(  # type: ignore[call-arg]
-            id="protocol-command-id",
-            error=pe_errors.ErrorOccurrence.from_failed(
-                id="some-id",
-                createdAt=datetime(year=2021, month=1, day=1),
-                error=pe_errors.ProtocolEngineError(),
-            ),
-            status=pe_commands.CommandStatus.FAILED,
-        )
+        ]
     )
     decoy.when(
         protocol_engine.state_view.commands.get_error_recovery_type(
@@ -514,72 +506,30 @@ async def test_load_json_runner(
     # Verify that the run func calls the right things:
     run_func = run_func_captor.value
     decoy.when(
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="hello")
-            ),
-        )
+        await protocol_engine.add_and_execute_commands_wait_for_recovery(commands)
     ).then_return(
-        pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
-            id="command-id-1",
-            status=CommandStatus.SUCCEEDED,
-            error=None,
-        )
-    )
-    decoy.when(
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="goodbye")
+        [
+            pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
+                id="command-id-1",
+                status=CommandStatus.SUCCEEDED,
+                error=None,
             ),
-        )
-    ).then_return(
-        pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
-            id="command-id-2",
-            status=CommandStatus.SUCCEEDED,
-            error=None,
-        )
-    )
-    decoy.when(
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.LoadLiquidCreate(
-                params=pe_commands.LoadLiquidParams(
-                    liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-                )
+            pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
+                id="command-id-2",
+                status=CommandStatus.SUCCEEDED,
+                error=None,
             ),
-        )
-    ).then_return(
-        pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
-            id="command-id-3",
-            status=CommandStatus.SUCCEEDED,
-            error=None,
-        )
+            pe_commands.LoadLiquid.construct(  # type: ignore[call-arg]
+                id="command-id-3",
+                status=CommandStatus.SUCCEEDED,
+                error=None,
+            ),
+        ]
     )
     await run_func()
     decoy.verify(
-        # todo(mm, 2024-07-08): This triggers decoy.RedundantVerifyWarning.
-        # Above, we're rehearsing each add_and_execute_command() call because the
-        # subject needs the return values. But the subject doesn't return anything
-        # based on on those return values, so here, we need to "redundantly" verify
-        # each call to make sure the subject actually did some work.
-        # It doesn't seem like Decoy wants subjects to be like this, so it's unclear
-        # how to fix this.
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="hello")
-            ),
-        ),
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="goodbye")
-            ),
-        ),
-        await protocol_engine.add_and_execute_command_wait_for_recovery(
-            request=pe_commands.LoadLiquidCreate(
-                params=pe_commands.LoadLiquidParams(
-                    liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-                )
-            ),
-        ),
+        await protocol_engine.add_and_execute_commands_wait_for_recovery(commands),
+        times=1,
     )
 
 
@@ -282,6 +282,53 @@ async def test_add_command_and_wait_for_interval(
     )
 
 
+@pytest.mark.parametrize(
+    "wait_for_interval_input, verify_calls", [(True, 1), (False, 0)]
+)
+async def test_add_commands_and_wait_for_interval(
+    decoy: Decoy,
+    json_protocol_subject: RunOrchestrator,
+    mock_protocol_engine: ProtocolEngine,
+    wait_for_interval_input: bool,
+    verify_calls: int,
+) -> None:
+    """Should add commands and wait for the last one to complete."""
+    home_command = pe_commands.HomeCreate.construct(
+        params=pe_commands.HomeParams.construct()
+    )
+    added_commands = [
+        pe_commands.Home(
+            params=pe_commands.HomeParams.construct(),
+            id=f"test-{n}",
+            createdAt=datetime(year=2024, month=1, day=1),
+            key=str(n),
+            status=pe_commands.CommandStatus.QUEUED,
+        )
+        for n in range(2)
+    ]
+    decoy.when(
+        mock_protocol_engine.add_commands(
+            requests=[home_command, home_command], failed_command_id=None
+        )
+    ).then_return(added_commands)
+
+    result = await json_protocol_subject.add_commands_and_wait_for_interval(
+        commands=[home_command, home_command],
+        wait_until_complete=wait_for_interval_input,
+        timeout=999,
+    )
+
+    assert result == added_commands
+
+    decoy.verify(
+        await mock_protocol_engine.wait_for_command(command_id="test-0"), times=0
+    )
+    decoy.verify(
+        await mock_protocol_engine.wait_for_command(command_id="test-1"),
+        times=verify_calls,
+    )
+
+
 def test_estop(
     decoy: Decoy,
     live_protocol_subject: RunOrchestrator,
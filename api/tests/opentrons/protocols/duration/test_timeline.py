@@ -0,0 +1,194 @@
+"""Tests for opentrons.protocols.duration.timeline."""
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from opentrons.protocol_engine import DeckPoint, commands
+from opentrons.protocols.duration import DurationEstimator
+from opentrons.protocols.duration.timeline import (
+    DROP_TIP_SECONDS,
+    MotionConstraints,
+    TimelinePredictor,
+    axis_move_time,
+    predict_timeline,
+)
+
+
+CONSTRAINTS = MotionConstraints(
+    max_speed_x=100,
+    max_speed_y=50,
+    max_speed_z=10,
+    acceleration_x=1000,
+    acceleration_y=1000,
+    acceleration_z=100,
+)
+
+
+def _move_to_well(
+    position: DeckPoint, speed: Optional[float] = None
+) -> commands.MoveToWell:
+    return commands.MoveToWell(
+        id="move-id",
+        key="move-key",
+        createdAt=datetime(year=2024, month=1, day=1),
+        status=commands.CommandStatus.SUCCEEDED,
+        params=commands.MoveToWellParams(
+            pipetteId="pipette-id",
+            labwareId="labware-id",
+            wellName="A1",
+            speed=speed,
+        ),
+        result=commands.MoveToWellResult(position=position),
+    )
+
+
+@pytest.mark.parametrize(
+    ("distance", "expected_seconds"),
+    [
+        (0, 0),
+        # Reaches 100 mm/s after 5 mm, cruises 90 mm, and slows down for 5 mm.
+        (100, 1.1),
+        (-100, 1.1),
+        # Too short to reach 100 mm/s.
+        (4, 2 * (4 / 1000) ** 0.5),
+    ],
+)
+def test_axis_move_time(distance: float, expected_seconds: float) -> None:
+    """It should follow a trapezoidal velocity profile."""
+    assert axis_move_time(distance, 100, 1000) == pytest.approx(expected_seconds)
+
+
+def test_move_time() -> None:
+    """Moves should arc above both ends, with the slowest axis setting the pace."""
+    subject = TimelinePredictor(CONSTRAINTS)
+
+    first = subject.add(_move_to_well(DeckPoint(x=0, y=0, z=50)))
+    # Straight down: only Z moves.
+    down = subject.add(_move_to_well(DeckPoint(x=0, y=0, z=40)))
+    # Up 20 mm, across (Y is slower than X), and down 10 mm.
+    across = subject.add(_move_to_well(DeckPoint(x=100, y=100, z=50)))
+    # A speed limit slows X and Y down.
+    back = subject.add(_move_to_well(DeckPoint(x=0, y=0, z=50), speed=25))
+
+    assert first.duration == 0
+    assert down.duration == pytest.approx(axis_move_time(10, 10, 100))
+    assert across.duration == pytest.approx(
+        axis_move_time(20, 10, 100)
+        + axis_move_time(100, 50, 1000)
+        + axis_move_time(10, 10, 100)
+    )
+    assert back.duration == pytest.approx(
+        2 * axis_move_time(10, 10, 100) + axis_move_time(100, 25, 1000)
+    )
+    assert back.start_time == pytest.approx(down.duration + across.duration)
+    assert subject.get_total_duration() == pytest.approx(back.end_time)
+
+
+def test_liquid_handling_and_delays() -> None:
+    """Liquid handling should take the volume over the flow rate."""
+    created_at = datetime(year=2024, month=1, day=1)
+    timeline = predict_timeline(
+        [
+            commands.AspirateInPlace(
+                id="aspirate-id",
+                key="aspirate-key",
+                createdAt=created_at,
+                status=commands.CommandStatus.SUCCEEDED,
+                params=commands.AspirateInPlaceParams(
+                    pipetteId="pipette-id", volume=50, flowRate=25
+                ),
+            ),
+            commands.WaitForDuration(
+                id="wait-id",
+                key="wait-key",
+                createdAt=created_at,
+                status=commands.CommandStatus.SUCCEEDED,
+                params=commands.WaitForDurationParams(seconds=30),
+            ),
+            commands.DropTipInPlace(
+                id="drop-tip-id",
+                key="drop-tip-key",
+                createdAt=created_at,
+                status=commands.CommandStatus.SUCCEEDED,
+                params=commands.DropTipInPlaceParams(pipetteId="pipette-id"),
+            ),
+        ],
+        robot_type="OT-3 Standard",
+    )
+
+    assert [(entry.command_type, entry.duration) for entry in timeline] == [
+        ("aspirateInPlace", 2),
+        ("waitForDuration", 30),
+        ("dropTipInPlace", DROP_TIP_SECONDS),
+    ]
+    assert timeline[-1].start_time == 32
+
+
+def test_module_temperatures() -> None:
+    """Waiting for a temperature should take as long as the module ramps."""
+    created_at = datetime(year=2024, month=1, day=1)
+    subject = TimelinePredictor(CONSTRAINTS)
+
+    subject.add(
+        commands.temperature_module.SetTargetTemperature(
+            id="set-id",
+            key="set-key",
+            createdAt=created_at,
+            status=commands.CommandStatus.SUCCEEDED,
+            params=commands.temperature_module.SetTargetTemperatureParams(
+                moduleId="temperature-module-id", celsius=4
+            ),
+        )
+    )
+    wait = subject.add(
+        commands.temperature_module.WaitForTemperature(
+            id="wait-id",
+            key="wait-key",
+            createdAt=created_at,
+            status=commands.CommandStatus.SUCCEEDED,
+            params=commands.temperature_module.WaitForTemperatureParams(
+                moduleId="temperature-module-id"
+            ),
+        )
+    )
+    profile = subject.add(
+        commands.thermocycler.RunProfile(
+            id="profile-id",
+            key="profile-key",
+            createdAt=created_at,
+            status=commands.CommandStatus.SUCCEEDED,
+            params=commands.thermocycler.RunProfileParams(
+                moduleId="thermocycler-id",
+                profile=[
+                    commands.thermocycler.RunProfileStepParams(
+                        celsius=95, holdSeconds=30
+                    ),
+                    commands.thermocycler.RunProfileStepParams(
+                        celsius=60, holdSeconds=60
+                    ),
+                ],
+            ),
+        )
+    )
+
+    assert wait.duration == pytest.approx(DurationEstimator.temperature_module(25, 4))
+    assert profile.duration == pytest.approx(
+        DurationEstimator.thermocycler_handler(25, 95)
+        + 30
+        + DurationEstimator.thermocycler_handler(95, 60)
+        + 60
+    )
+    assert list(subject.get_duration_by_command_type()) == [
+        "temperatureModule/waitForTemperature",
+        "thermocycler/runProfile",
+        "temperatureModule/setTargetTemperature",
+    ]
+
+
+def test_constraints_from_robot_config() -> None:
+    """It should use each robot's default max speeds and accelerations."""
+    ot2 = MotionConstraints.for_robot_type("OT-2 Standard")
+    flex = MotionConstraints.for_robot_type("OT-3 Standard")
+    assert (ot2.max_speed_x, ot2.acceleration_x) == (600, 3000)
+    assert (flex.max_speed_x, flex.acceleration_x) == (350, 800)
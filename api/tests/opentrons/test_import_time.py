@@ -0,0 +1,91 @@
+"""Import-time budgets for the opentrons package's main entry points.
+
+Each test imports a module in a fresh interpreter with `python -X importtime`.
+
+The time budgets are deliberately loose, so they only catch large regressions,
+and they are benchmarks, only run with `--run-benchmarks`. A failing budget
+reports how long the import took. The module checks are strict and always run.
+"""
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+# Module -> the most seconds importing it in a fresh interpreter may take.
+_BUDGETS_SECONDS = {
+    "opentrons": 1.0,
+    "opentrons.simulate": 10.0,
+    "opentrons.execute": 10.0,
+    "opentrons.cli.analyze": 10.0,
+}
+
+# Packages that `import opentrons` alone must not pull in.
+_NOT_IMPORTED_BY_OPENTRONS = [
+    "opentrons.hardware_control",
+    "opentrons.drivers",
+    "opentrons.protocol_api",
+    "opentrons.protocol_engine",
+    "serial",
+    "numpy",
+    "pydantic",
+]
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter.
+
+    Returns the cumulative import time, in microseconds, of every module that
+    importing it imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("module", "budget_seconds"), _BUDGETS_SECONDS.items())
+def test_import_time_budget(module: str, budget_seconds: float) -> None:
+    """Each entry point should import within its budget."""
+    seconds = _import_times(module)[module] / 1e6
+    assert (
+        seconds < budget_seconds
+    ), f"import {module} took {seconds:.3f} s (budget {budget_seconds} s)"
+
+
+def test_import_opentrons_is_lazy() -> None:
+    """`import opentrons` should leave the heavy subpackages unimported."""
+    imported = _import_times("opentrons")
+
+    for package in _NOT_IMPORTED_BY_OPENTRONS:
+        assert not [
+            name
+            for name in imported
+            if name == package or name.startswith(f"{package}.")
+        ], f"import opentrons imported {package}"
+
+
+def test_lazy_attributes() -> None:
+    """Names that are imported on first use should still be available."""
+    import opentrons
+    from opentrons.hardware_control import API, ThreadManager
+    from opentrons.protocols.api_support.types import APIVersion
+
+    assert opentrons.HardwareAPI is API
+    assert opentrons.ThreadManager is ThreadManager
+    assert opentrons.APIVersion is APIVersion
+    assert opentrons.robot_configs.load
+
+    with pytest.raises(AttributeError):
+        opentrons.not_a_real_attribute
@@ -1,6 +1,10 @@
 """Tests for performance_helpers."""
 
 from pathlib import Path
+
+import pytest
+
+from opentrons.util import performance_helpers
 from opentrons.util.performance_helpers import (
     _StubbedTracker,
     _get_robot_activity_tracker,
@@ -22,3 +26,27 @@ def test_singleton_tracker() -> None:
     tracker = _get_robot_activity_tracker()
     tracker2 = _get_robot_activity_tracker()
     assert tracker is tracker2
+
+
+def test_stubbed_tracker_has_no_state() -> None:
+    """Test that _StubbedTracker never reports a current state."""
+    tracker = _StubbedTracker(Path("/path/to/storage"), True)
+    assert tracker.current_state is None
+
+
+def test_no_event_loop_monitor_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that no event loop monitor is created when tracking is disabled."""
+    monkeypatch.setattr(performance_helpers, "_should_track", False)
+    assert performance_helpers.create_event_loop_monitor(lambda: None) is None
+
+
+def test_no_span_tracer_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that no span tracer is created when tracking is disabled."""
+    monkeypatch.setattr(performance_helpers, "_should_track", False)
+    assert performance_helpers.create_span_tracer() is None
+
+
+def test_stubbed_tracker_has_no_profiles() -> None:
+    """Test that _StubbedTracker never has a profile."""
+    tracker = _StubbedTracker(Path("/path/to/storage"), True)
+    assert tracker.get_profile("run-id") is None
@@ -42,6 +42,16 @@ class RunnableConfiguration:
         return hash(repr(self))
 
 
+@dataclass
+class ConfigurationResult:
+    """The outcome of running one configuration in its own process."""
+
+    config_name: str
+    output: str
+    seconds: float
+    succeeded: bool
+
+
 class GCodeCLI:
     """CLI for G-Code Parser.
 
@@ -59,6 +69,8 @@ class GCodeCLI:
     FILE_PATH_2_KEY = "file_path_2"
     ERROR_ON_DIFFERENT_FILES = "error_on_different_files"
     ERROR_ON_MISSING_FILES = "error_on_missing_configuration_files"
+    TOLERANCE = "tolerance"
+    JOBS = "jobs"
 
     CONFIGURATION_COMMAND = "configurations"
     CONFIGURATIONS = HTTP_CONFIGURATIONS + PROTOCOL_CONFIGURATIONS
@@ -134,13 +146,14 @@ class GCodeCLI:
             expected = configuration.get_comparison_file()
 
         differ = GCodeDiffer(actual, expected)
-        strings_equal = differ.strings_are_equal()
+        tolerance = self.args.get(self.TOLERANCE, 0.0)
+        strings_equal = differ.strings_are_equivalent(tolerance)
 
         if not strings_equal and able_to_respond_with_error_code:
             self.respond_with_error_code = True
 
         if not strings_equal:
-            text = differ.get_html_diff()
+            text = differ.get_text_summary(tolerance)
             differ.save_html_diff_to_file(
                 os.path.join("results", f"{str(time.time_ns())[:-3]}result.html")
             )
@@ -307,6 +320,66 @@ class GCodeCLI:
             for run_config in runnable_configurations
         ]
 
+    async def run_commands_in_parallel(self, jobs: int) -> str:
+        """Run each matching configuration in its own process, `jobs` at a time.
+
+        Every G-Code engine starts its emulators on ports of its own, so the
+        processes don't interfere with each other. The output ends with how
+        long each configuration took.
+        """
+        passed_command_name = self.args[self.COMMAND_KEY]
+        flags = (
+            [f"--{self.ERROR_ON_DIFFERENT_FILES}"]
+            if self.args.get(self.ERROR_ON_DIFFERENT_FILES)
+            else []
+        )
+        if self.args.get(self.TOLERANCE):
+            flags.append(f"--{self.TOLERANCE}={self.args[self.TOLERANCE]}")
+        config_names = self._get_config_matches(self.args[self.CONFIGURATION_NAME])
+        semaphore = asyncio.Semaphore(jobs)
+
+        async def _run_one(config_name: str) -> ConfigurationResult:
+            async with semaphore:
+                start = time.perf_counter()
+                process = await asyncio.create_subprocess_exec(
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    passed_command_name,
+                    *flags,
+                    config_name,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, stderr = await process.communicate()
+                return ConfigurationResult(
+                    config_name=config_name,
+                    output=(stdout if process.returncode == 0 else stderr)
+                    .decode()
+                    .strip(),
+                    seconds=time.perf_counter() - start,
+                    succeeded=process.returncode == 0,
+                )
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_run_one(name) for name in config_names))
+        total_seconds = time.perf_counter() - start
+
+        if not all(result.succeeded for result in results):
+            self.respond_with_error_code = True
+
+        timings = "\n".join(
+            f"{result.seconds:8.1f} s  {result.config_name}"
+            + ("" if result.succeeded else "  (failed)")
+            for result in sorted(results, key=lambda r: r.seconds, reverse=True)
+        )
+        return "\n".join(
+            [result.output for result in results]
+            + [
+                f"\nTimings ({len(results)} configurations, {jobs} at a time, "
+                f"{total_seconds:.1f} s total):\n{timings}"
+            ]
+        )
+
     @staticmethod
     async def run_commands(commands_to_run: List[Callable]) -> str:
         """Runs passed commands and returns their output."""
@@ -318,6 +391,16 @@ class GCodeCLI:
                 out.append(command())
         return "\n".join(out)
 
+    @classmethod
+    def _add_jobs_argument(cls, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            f"--{cls.JOBS}",
+            type=int,
+            default=1,
+            help="How many configurations to run at once, each in its own process. "
+            "0 means one per CPU core.",
+        )
+
     @classmethod
     def parser(cls) -> argparse.ArgumentParser:
         """Generates argparse ArgumentParser class for parsing command line input."""
@@ -343,6 +426,7 @@ class GCodeCLI:
         run_parser.add_argument(
             "configuration_name", type=str, help="Name of configuration you want to run"
         )
+        cls._add_jobs_argument(run_parser)
 
         diff_parser = subparsers.add_parser(
             cls.DIFF_FILES_COMMAND, help="Diff 2 G-Code files"
@@ -353,11 +437,19 @@ class GCodeCLI:
             action="store_true",
             default=False,
         )
+        diff_parser.add_argument(
+            f"--{cls.TOLERANCE}",
+            help="How much numbers in G-Code lines may differ and still be "
+            "considered equal",
+            type=float,
+            default=0.0,
+        )
         diff_parser.add_argument(
             "configuration_name",
             type=str,
             help="Name of configuration you want to diff",
         )
+        cls._add_jobs_argument(diff_parser)
 
         subparsers.add_parser(
             cls.CONFIGURATION_COMMAND, help="List of available configurations"
@@ -395,6 +487,7 @@ class GCodeCLI:
             type=str,
             help="Name of configuration you want to push",
         )
+        cls._add_jobs_argument(update_comparison_parser)
 
         return parser
 
@@ -412,8 +505,12 @@ class GCodeCLI:
 async def main() -> None:
     """Main function."""
     cli = await GCodeCLI.create()
-    funcs_to_run = cli.get_runnable_commands()
-    output = await cli.run_commands(funcs_to_run)
+    jobs = cli.args.get(cli.JOBS, 1) or os.cpu_count() or 1
+    if jobs > 1:
+        output = await cli.run_commands_in_parallel(jobs)
+    else:
+        funcs_to_run = cli.get_runnable_commands()
+        output = await cli.run_commands(funcs_to_run)
 
     if cli.respond_with_error:
         sys.exit(output)
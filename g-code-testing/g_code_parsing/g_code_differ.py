@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Tuple
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 from diff_match_patch import diff_match_patch as dmp  # type: ignore
 from g_code_parsing.g_code_program.g_code_program import (
     GCodeProgram,
@@ -10,6 +12,101 @@ from g_code_parsing.g_code_program.supported_text_modes import (
 )
 
 
+# The device name and G-Code at the start of a concise line, like "smoothie: G28.2"
+COMMAND_REGEX = re.compile(r"^[^:]*: [A-Z]\d+(?:\.\d+)?")
+NUMBER_REGEX = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+class LineDiff(NamedTuple):
+    """One aligned line of a line diff.
+
+    line_1 is None for insertions and line_2 is None for deletions.
+    """
+
+    diff_type: str
+    line_1: Optional[str]
+    line_2: Optional[str]
+    line_number_1: Optional[int]
+    line_number_2: Optional[int]
+
+
+def _split_numbers(line: str) -> Tuple[str, List[float]]:
+    """Split a line into its text with numbers blanked out, and the numbers.
+
+    The command itself (like G28.2) is part of the text, so that only its
+    arguments and the numbers in its explanation are compared numerically.
+    """
+    command = COMMAND_REGEX.match(line)
+    head = command.group(0) if command else ""
+    tail = line[len(head) :]
+    return head + NUMBER_REGEX.sub("#", tail), [
+        float(number) for number in NUMBER_REGEX.findall(tail)
+    ]
+
+
+def lines_match(line_1: str, line_2: str, tolerance: float) -> bool:
+    """Whether 2 lines are the same, allowing numbers to differ by tolerance."""
+    if line_1 == line_2:
+        return True
+    if tolerance <= 0:
+        return False
+    text_1, numbers_1 = _split_numbers(line_1)
+    text_2, numbers_2 = _split_numbers(line_2)
+    return text_1 == text_2 and all(
+        math.isclose(number_1, number_2, rel_tol=0, abs_tol=tolerance)
+        for number_1, number_2 in zip(numbers_1, numbers_2)
+    )
+
+
+def _shortest_edit_matches(
+    a: Sequence[int], b: Sequence[int], max_edits: int
+) -> Optional[List[Tuple[int, int]]]:
+    """Find the matching index pairs of a shortest edit script from a to b.
+
+    This is Myers' O((N+M)D) algorithm, where D is the number of inserted and
+    deleted lines, so it is close to linear for programs that mostly agree.
+    Returns None if more than max_edits edits would be needed.
+    """
+    n, m = len(a), len(b)
+    v: Dict[int, int] = {1: 0}
+    trace: List[Dict[int, int]] = []
+    for d in range(max_edits + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+    return None
+
+
+def _backtrack(trace: List[Dict[int, int]], x: int, y: int) -> List[Tuple[int, int]]:
+    matches = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            previous_k = k + 1
+        else:
+            previous_k = k - 1
+        previous_x = v[previous_k]
+        previous_y = previous_x - previous_k
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = previous_x, previous_y
+    matches.reverse()
+    return matches
+
+
 class GCodeDiffer:
     INSERTION_TYPE = "Insertion"
     INSERTION_VALUE = 1
@@ -17,6 +114,11 @@ class GCodeDiffer:
     EQUALITY_VALUE = 0
     DELETION_TYPE = "Deletion"
     DELETION_VALUE = -1
+    CHANGE_TYPE = "Change"
+
+    # Past this many inserted and deleted lines, stop aligning and report the
+    # rest of the programs as changed.
+    MAX_LINE_EDITS = 2000
 
     DIFF_TYPE_LOOKUP = {
         DELETION_VALUE: DELETION_TYPE,
@@ -89,6 +191,146 @@ class GCodeDiffer:
     def strings_are_equal(self):
         return self._string_1 == self._string_2
 
+    def strings_are_equivalent(self, tolerance: float = 0.0) -> bool:
+        """Whether every line matches, allowing numbers to differ by tolerance."""
+        return self.strings_are_equal() or all(
+            line_diff.diff_type == self.EQUALITY_TYPE
+            for line_diff in self.get_line_diff(tolerance)
+        )
+
+    def get_line_diff(self, tolerance: float = 0.0) -> List[LineDiff]:
+        """
+        Diff the strings line by line. In the concise text mode every line is
+        one G-Code, so this aligns the programs on whole commands.
+
+        Lines whose numbers differ by no more than tolerance count as equal.
+        Removed lines that line up with added ones are reported as changes.
+        :param tolerance: The largest difference allowed between numbers
+        :return: The aligned lines
+        """
+        lines_1 = self._string_1.splitlines()
+        lines_2 = self._string_2.splitlines()
+
+        # Aligning on exact matches first is fast, and the lines that are
+        # left over are few enough to compare with the tolerance.
+        line_ids: Dict[str, int] = {}
+        ids_1 = [line_ids.setdefault(line, len(line_ids)) for line in lines_1]
+        ids_2 = [line_ids.setdefault(line, len(line_ids)) for line in lines_2]
+
+        start = 0
+        while (
+            start < len(ids_1) and start < len(ids_2) and ids_1[start] == ids_2[start]
+        ):
+            start += 1
+        end_1, end_2 = len(ids_1), len(ids_2)
+        while end_1 > start and end_2 > start and ids_1[end_1 - 1] == ids_2[end_2 - 1]:
+            end_1 -= 1
+            end_2 -= 1
+
+        middle_matches = _shortest_edit_matches(
+            ids_1[start:end_1], ids_2[start:end_2], self.MAX_LINE_EDITS
+        )
+        matches = (
+            [(i, i) for i in range(start)]
+            + [(start + i, start + j) for i, j in middle_matches or []]
+            + [(end_1 + i, end_2 + i) for i in range(len(ids_1) - end_1)]
+            # A sentinel so the lines after the last match are handled too.
+            + [(len(ids_1), len(ids_2))]
+        )
+
+        line_diffs = []
+        i = j = 0
+        for match_1, match_2 in matches:
+            line_diffs.extend(
+                self._diff_unmatched(
+                    lines_1, range(i, match_1), lines_2, range(j, match_2), tolerance
+                )
+            )
+            if match_1 < len(lines_1):
+                line_diffs.append(
+                    LineDiff(
+                        self.EQUALITY_TYPE,
+                        lines_1[match_1],
+                        lines_2[match_2],
+                        match_1 + 1,
+                        match_2 + 1,
+                    )
+                )
+            i, j = match_1 + 1, match_2 + 1
+        return line_diffs
+
+    def _diff_unmatched(
+        self,
+        lines_1: List[str],
+        indices_1: range,
+        lines_2: List[str],
+        indices_2: range,
+        tolerance: float,
+    ) -> List[LineDiff]:
+        """Pair up removed and added lines that sit between the same matches."""
+        line_diffs = []
+        for i, j in zip(indices_1, indices_2):
+            diff_type = (
+                self.EQUALITY_TYPE
+                if lines_match(lines_1[i], lines_2[j], tolerance)
+                else self.CHANGE_TYPE
+            )
+            line_diffs.append(LineDiff(diff_type, lines_1[i], lines_2[j], i + 1, j + 1))
+        paired = min(len(indices_1), len(indices_2))
+        for i in indices_1[paired:]:
+            line_diffs.append(
+                LineDiff(self.DELETION_TYPE, lines_1[i], None, i + 1, None)
+            )
+        for j in indices_2[paired:]:
+            line_diffs.append(
+                LineDiff(self.INSERTION_TYPE, None, lines_2[j], None, j + 1)
+            )
+        return line_diffs
+
+    def get_text_summary(self, tolerance: float = 0.0, max_lines: int = 50) -> str:
+        """
+        Summarize the line diff: counts of each kind of difference, followed by
+        the first differing lines
+        :param tolerance: The largest difference allowed between numbers
+        :param max_lines: How many differing lines to show
+        :return: The summary
+        """
+        line_diffs = self.get_line_diff(tolerance)
+        counts = {
+            diff_type: 0
+            for diff_type in (
+                self.EQUALITY_TYPE,
+                self.CHANGE_TYPE,
+                self.INSERTION_TYPE,
+                self.DELETION_TYPE,
+            )
+        }
+        for line_diff in line_diffs:
+            counts[line_diff.diff_type] += 1
+        differences = [
+            line_diff
+            for line_diff in line_diffs
+            if line_diff.diff_type != self.EQUALITY_TYPE
+        ]
+
+        summary = [
+            f"{len(differences)} of {len(line_diffs)} lines differ: "
+            f"{counts[self.CHANGE_TYPE]} changed, "
+            f"{counts[self.INSERTION_TYPE]} inserted, "
+            f"{counts[self.DELETION_TYPE]} deleted"
+        ]
+        for line_diff in differences[:max_lines]:
+            summary.append(
+                f"@@ {line_diff.line_number_1 or '-'},{line_diff.line_number_2 or '-'} @@"
+            )
+            if line_diff.line_1 is not None:
+                summary.append(f"- {line_diff.line_1}")
+            if line_diff.line_2 is not None:
+                summary.append(f"+ {line_diff.line_2}")
+        if len(differences) > max_lines:
+            summary.append(f"... and {len(differences) - max_lines} more")
+        return "\n".join(summary)
+
     @classmethod
     def get_diff_type(cls, diff_tuple: Tuple[int, str]) -> str:
         return cls.DIFF_TYPE_LOOKUP[diff_tuple[0]]
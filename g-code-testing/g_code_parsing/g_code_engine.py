@@ -1,13 +1,15 @@
 import asyncio
+import os
 from pathlib import Path
 import time
-from multiprocessing import Process
+from multiprocessing import Pipe, Process
 from typing import AsyncGenerator, Callable, Iterator, Union
 from collections import namedtuple
 
 from opentrons import APIVersion
 from opentrons.hardware_control.emulation.settings import Settings
-from opentrons.protocol_engine import create_protocol_engine, Config, DeckType
+from opentrons.protocol_engine import Config, DeckType, error_recovery_policy
+from opentrons.protocol_engine.create_protocol_engine import create_protocol_engine
 from opentrons.protocol_reader.protocol_source import (
     JsonProtocolConfig,
     ProtocolConfig,
@@ -27,16 +29,19 @@ from opentrons.hardware_control.emulation.module_server.helpers import (
 )
 from opentrons.hardware_control.emulation.scripts import run_app, run_smoothie
 from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.clock import set_clock
 from opentrons.hardware_control.types import HardwareFeatureFlags
 from g_code_parsing.g_code_program.g_code_program import (
     GCodeProgram,
 )
 from g_code_parsing.g_code_watcher import GCodeWatcher
-from g_code_parsing.utils import get_configuration_dir
+from g_code_parsing.utils import get_configuration_dir, with_free_ports
 from opentrons_shared_data.robot.types import RobotType
 
 Protocol = namedtuple("Protocol", ["text", "filename", "filelike"])
 
+MODULE_SERVER_ENV_VAR = "OT_EMULATOR_module_server"
+
 
 class GCodeEngine:
     """
@@ -54,21 +59,34 @@ class GCodeEngine:
 
     URI_TEMPLATE = "socket://127.0.0.1:%s"
 
+    # How long to wait for the emulator process to be ready, in seconds.
+    EMULATOR_READY_TIMEOUT = 10.0
+
     def __init__(self, emulator_settings: Settings) -> None:
-        self._config = emulator_settings
+        self._config = with_free_ports(emulator_settings)
 
     @contextmanager
     def _emulate(self) -> Iterator[ThreadManager]:
         """Context manager that starts emulated OT-2 hardware environment. A
         hardware controller is returned."""
         modules = self._config.modules
+        ready_receiver, ready_sender = Pipe(duplex=False)
 
         # Entry point for the emulator app process
         def _run_app():
+            async def _signal_ready() -> None:
+                c = await ModuleStatusClient.connect(
+                    host="localhost", port=self._config.module_server.port
+                )
+                await wait_emulators(client=c, modules=modules, timeout=5)
+                c.close()
+                ready_sender.send(True)
+
             async def _async_entry():
                 await asyncio.gather(
                     run_smoothie.run(self._config),
                     run_app.run(self._config, modules=[m.value for m in modules]),
+                    _signal_ready(),
                 )
 
             asyncio.run(_async_entry())
@@ -77,23 +95,19 @@ class GCodeEngine:
         proc.daemon = True
         proc.start()
 
-        # Entry point for process that waits for emulation to be ready.
-        async def _wait_ready() -> None:
-            c = await ModuleStatusClient.connect(
-                host="localhost", port=self._config.module_server.port
-            )
-            await wait_emulators(client=c, modules=modules, timeout=5)
-            c.close()
+        if not ready_receiver.poll(self.EMULATOR_READY_TIMEOUT):
+            proc.kill()
+            proc.join()
+            raise TimeoutError("Emulators did not start in time.")
 
-        def _run_wait_ready():
-            asyncio.run(_wait_ready())
+        # The hardware controller finds emulated modules through the module
+        # server named by the environment, so point it at this engine's.
+        previous_module_server = os.environ.get(MODULE_SERVER_ENV_VAR)
+        os.environ[MODULE_SERVER_ENV_VAR] = self._config.module_server.json()
 
-        ready_proc = Process(target=_run_wait_ready)
-        ready_proc.daemon = True
-        ready_proc.start()
-        ready_proc.join()
-
-        # Hardware controller
+        # Hardware controller. Module polls and delays should pass on the
+        # same clock as the emulators.
+        set_clock(self._config.clock.build_clock())
         conf = build_config({})
         emulator = ThreadManager(
             API.build_hardware_controller,
@@ -101,15 +115,20 @@ class GCodeEngine:
             GCodeEngine.URI_TEMPLATE % self._config.smoothie.port,
             feature_flags=HardwareFeatureFlags.build_from_ff(),
         )
-        # Wait for modules to be present
+        # Wait for the hardware controller to register the modules.
         while len(emulator.attached_modules) != len(modules):
             time.sleep(0.1)
 
-        yield emulator
-
-        # Finished. Stop the emulator
-        proc.kill()
-        proc.join()
+        try:
+            yield emulator
+        finally:
+            # Finished. Stop the emulator
+            proc.kill()
+            proc.join()
+            if previous_module_server is None:
+                del os.environ[MODULE_SERVER_ENV_VAR]
+            else:
+                os.environ[MODULE_SERVER_ENV_VAR] = previous_module_server
 
     @staticmethod
     def _get_protocol(file_path: Path) -> Protocol:
@@ -174,6 +193,7 @@ class GCodeEngine:
                             ),
                             use_simulated_deck_config=True,
                         ),
+                        error_recovery_policy=error_recovery_policy.never_recover,
                         load_fixed_trash=deck_type.should_load_fixed_trash(config),
                     ),
                     hardware_api=hardware,  # type: ignore
@@ -1,11 +1,13 @@
 import os
 import re
-from typing import Dict, Type, Union
+import socket
+from typing import Dict, List, Type, Union
 from opentrons.drivers.smoothie_drivers.driver_3_0 import GCODE as SMOOTHIE_G_CODE
 from opentrons.drivers.mag_deck.driver import GCODE as MAGDECK_G_CODE
 from opentrons.drivers.temp_deck.driver import GCODE as TEMPDECK_G_CODE
 from opentrons.drivers.thermocycler.driver import GCODE as THERMOCYCLER_G_CODE
 from opentrons.drivers.heater_shaker.driver import GCODE as HEATER_SHAKER_G_CODE
+from opentrons.hardware_control.emulation.settings import ProxySettings, Settings
 
 
 WRITE_REGEX = re.compile(r"(.*?) \| (.*?) \|(.*?)$")
@@ -43,3 +45,47 @@ def get_configuration_dir() -> str:
 
 def get_configuration_file_path() -> str:
     return os.path.join(get_configuration_dir(), "configurations.py")
+
+
+def get_free_ports(count: int) -> List[int]:
+    """
+    Ask the OS for distinct TCP ports that nothing is listening on
+    :param count: How many ports to get
+    :return: The port numbers
+    """
+    sockets = []
+    try:
+        for _ in range(count):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.bind(("127.0.0.1", 0))
+            sockets.append(s)
+        return [s.getsockname()[1] for s in sockets]
+    finally:
+        for s in sockets:
+            s.close()
+
+
+def with_free_ports(settings: Settings) -> Settings:
+    """
+    Copy emulator settings, moving every server onto a free port, so that
+    several emulators can run side by side
+    :param settings: The settings to copy
+    :return: The copied settings
+    """
+    ports = iter(get_free_ports(10))
+
+    def _proxy(proxy: ProxySettings) -> ProxySettings:
+        return proxy.copy(
+            update={"emulator_port": next(ports), "driver_port": next(ports)}
+        )
+
+    return settings.copy(
+        update={
+            "smoothie": settings.smoothie.copy(update={"port": next(ports)}),
+            "module_server": settings.module_server.copy(update={"port": next(ports)}),
+            "heatershaker_proxy": _proxy(settings.heatershaker_proxy),
+            "thermocycler_proxy": _proxy(settings.thermocycler_proxy),
+            "temperature_proxy": _proxy(settings.temperature_proxy),
+            "magdeck_proxy": _proxy(settings.magdeck_proxy),
+        }
+    )
@@ -1,6 +1,6 @@
 import pytest
 from textwrap import dedent
-from g_code_parsing.g_code_differ import GCodeDiffer
+from g_code_parsing.g_code_differ import GCodeDiffer, LineDiff, lines_match
 from g_code_parsing.g_code import GCode
 from g_code_parsing.g_code_program.g_code_program import (
     GCodeProgram,
@@ -283,3 +283,74 @@ def test_html_diff(first_g_code_explanation, second_g_code_explanation):
     diff = GCodeDiffer(first_g_code_explanation, second_g_code_explanation)
     html = diff.get_html_diff()
     assert html == expected_html
+
+
+def test_line_diff(first_g_code_explanation, second_g_code_explanation):
+    line_diff = GCodeDiffer(
+        first_g_code_explanation, second_g_code_explanation
+    ).get_line_diff()
+    assert [line.diff_type for line in line_diff] == [
+        GCodeDiffer.EQUALITY_TYPE,
+        GCodeDiffer.DELETION_TYPE,
+        GCodeDiffer.EQUALITY_TYPE,
+    ]
+    assert line_diff[1].line_number_1 == 2
+    assert line_diff[1].line_2 is None
+    assert line_diff[2].line_number_1 == 3
+    assert line_diff[2].line_number_2 == 2
+
+
+def test_line_diff_pairs_changed_lines():
+    line_diff = GCodeDiffer(G_CODE_1, "G28.2 ABC\nG0 F6.005").get_line_diff()
+    assert line_diff[1] == LineDiff(
+        GCodeDiffer.CHANGE_TYPE, "G0 F5.005", "G0 F6.005", 2, 2
+    )
+
+
+@pytest.mark.parametrize(
+    "line_1,line_2,tolerance,expected_match",
+    [
+        ["smoothie: G0 X1.0 -> Move", "smoothie: G0 X1.0 -> Move", 0.0, True],
+        ["smoothie: G0 X1.0 -> Move", "smoothie: G0 X1.001 -> Move", 0.0, False],
+        ["smoothie: G0 X1.0 -> Move", "smoothie: G0 X1.001 -> Move", 0.01, True],
+        ["smoothie: G0 X1.0 -> Move", "smoothie: G0 X1.1 -> Move", 0.01, False],
+        ["smoothie: G0 X1.0 -> Move", "smoothie: G0 Y1.0 -> Move", 0.01, False],
+        # The G-Code itself is never compared numerically.
+        ["smoothie: G28.2 X -> Home", "smoothie: G28.3 X -> Home", 0.5, False],
+    ],
+)
+def test_lines_match(line_1, line_2, tolerance, expected_match):
+    assert lines_match(line_1, line_2, tolerance) == expected_match
+
+
+def test_strings_are_equivalent():
+    differ = GCodeDiffer(G_CODE_1, "G28.2 ABC\nG0 F5.0051")
+    assert not differ.strings_are_equal()
+    assert not differ.strings_are_equivalent()
+    assert differ.strings_are_equivalent(tolerance=0.001)
+
+
+def test_text_summary(first_g_code_explanation, second_g_code_explanation):
+    summary = GCodeDiffer(
+        first_g_code_explanation, second_g_code_explanation
+    ).get_text_summary()
+    assert summary == (
+        "1 of 3 lines differ: 0 changed, 0 inserted, 1 deleted\n"
+        "@@ 2,- @@\n"
+        "- smoothie: G38.2 F420.0 Y-40.0 -> Probing -40.0 on the Y axis, "
+        "at a speed of 420.0 -> Probed to : X Axis: 296.825 Y Axis: 292.663 "
+        "Z Axis: 218.000"
+    )
+
+
+def test_line_diff_of_many_lines():
+    lines = [f"smoothie: G0 X{i}.0 -> Move" for i in range(50000)]
+    changed = lines[:100] + lines[101:25000] + ["smoothie: M400"] + lines[25000:]
+    line_diff = GCodeDiffer("\n".join(lines), "\n".join(changed)).get_line_diff()
+    differences = [
+        line for line in line_diff if line.diff_type != GCodeDiffer.EQUALITY_TYPE
+    ]
+    assert differences == [
+        LineDiff(GCodeDiffer.DELETION_TYPE, lines[100], None, 101, None),
+        LineDiff(GCodeDiffer.INSERTION_TYPE, None, "smoothie: M400", None, 25000),
+    ]
@@ -1,6 +1,8 @@
 import pytest
 from g_code_parsing.g_code import reverse_enum
-from typing import Dict, Type
+from g_code_parsing.utils import with_free_ports
+from opentrons.hardware_control.emulation.settings import Settings
+from typing import Dict, Set, Type
 from enum import Enum
 
 
@@ -36,3 +38,43 @@ def expected_dict() -> Dict:
 
 def test_enum_reverse(input_enum, expected_dict) -> None:
     assert reverse_enum(input_enum) == expected_dict
+
+
+def test_with_free_ports() -> None:
+    settings = Settings()
+    first = with_free_ports(settings)
+    second = with_free_ports(settings)
+
+    def _ports(s: Settings) -> Set[int]:
+        return {
+            s.smoothie.port,
+            s.module_server.port,
+            *(
+                port
+                for proxy in (
+                    s.heatershaker_proxy,
+                    s.thermocycler_proxy,
+                    s.temperature_proxy,
+                    s.magdeck_proxy,
+                )
+                for port in (proxy.emulator_port, proxy.driver_port)
+            ),
+        }
+
+    # Every server gets its own port, and the original settings are untouched.
+    assert len(_ports(first)) == 10
+    assert _ports(settings) == {
+        9996,
+        8989,
+        9000,
+        9995,
+        9002,
+        9997,
+        9003,
+        9998,
+        9004,
+        9999,
+    }
+    assert first.smoothie.left == settings.smoothie.left
+    assert first.modules == settings.modules
+    assert _ports(first) != _ports(second)
@@ -20,7 +20,7 @@ def test_http(g_code_configuration: HTTPGCodeConfirmConfig):
     actual_output = g_code_configuration.execute()
     assert actual_output == expected_output, GCodeDiffer(
         actual_output, expected_output
-    ).get_html_diff()
+    ).get_text_summary()
 
 
 @pytest.mark.parametrize(
@@ -43,4 +43,4 @@ async def test_protocols(
     actual_output = await g_code_configuration.execute(version)
     assert actual_output == expected_output, GCodeDiffer(
         actual_output, expected_output
-    ).get_html_diff()
+    ).get_text_summary()
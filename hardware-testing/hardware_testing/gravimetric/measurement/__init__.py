@@ -7,7 +7,7 @@ from typing_extensions import Final
 
 from opentrons.protocol_api import ProtocolContext
 
-from .record import GravimetricRecorder, GravimetricRecording
+from .record import GravimetricRecorder
 from .environment import read_environment_data, EnvironmentData, get_average_reading
 from hardware_testing.drivers import asair_sensor
 
@@ -125,16 +125,12 @@ def _build_measurement_data(
     simulating: bool = False,
 ) -> MeasurementData:
     # gather only samples of the specified tag
-    segment = GravimetricRecording(
-        [sample for sample in recorder.recording if sample.tag and sample.tag == tag]
-    )
+    segment = recorder.recording.get_tagged_samples(tag)
     if simulating and len(segment) == 1:
         segment.append(segment[0])
     if stable and not simulating:
         # try to isolate only "stable" scale readings if sample length >= 2
-        stable_only = GravimetricRecording(
-            [sample for sample in segment if sample.stable]
-        )
+        stable_only = segment.get_stable_samples()
         if len(stable_only) >= 2:
             segment = stable_only
 
@@ -1,11 +1,23 @@
 """Record weight measurements."""
 from contextlib import contextmanager
 from dataclasses import dataclass
-from statistics import stdev
+from math import sqrt
+from statistics import StatisticsError
 from subprocess import Popen
 from threading import Thread, Event
 from time import sleep, time
-from typing import List, Optional, Callable, Generator
+from typing import (
+    List,
+    Optional,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Union,
+    overload,
+)
+
+import numpy as np
 
 from hardware_testing.data import (
     dump_data_to_file,
@@ -22,6 +34,17 @@ SLEEP_TIME_IN_RECORD_LOOP_SIMULATING = 0.01
 SERVER_CMD = "python3 -m hardware_testing.tools.plot"
 
 
+def _sample_as_csv(
+    _time: float, grams: float, stable: bool, tag: Optional[str], start_time: float
+) -> str:
+    unstable_grams = str(grams) if not stable else ""
+    stable_grams = str(grams) if stable else ""
+    return (
+        f"{_time},{_time - start_time},{grams},"
+        f"{unstable_grams},{stable_grams},{int(stable)},{tag if tag else ''}"
+    )
+
+
 @dataclass
 class GravimetricSample:
     """Class to store individual scale readings."""
@@ -38,14 +61,7 @@ class GravimetricSample:
 
     def as_csv(self, start_time: float) -> str:
         """Get data as a single CSV line."""
-        rel_time = self.relative_time(start_time)
-        unstable_grams = str(self.grams) if not self.stable else ""
-        stable_grams = str(self.grams) if self.stable else ""
-        tag = self.tag if self.tag else ""
-        return (
-            f"{self.time},{rel_time},{self.grams},"
-            f"{unstable_grams},{stable_grams},{int(self.stable)},{tag}"
-        )
+        return _sample_as_csv(self.time, self.grams, self.stable, self.tag, start_time)
 
     def relative_time(self, start_time: float) -> float:
         """Get the sample's relative time in seconds, from a starting time."""
@@ -56,8 +72,66 @@ class GravimetricSample:
         return self.grams - start_grams
 
 
-class GravimetricRecording(List):
-    """Gravimetric Recording."""
+class GravimetricRecording:
+    """Gravimetric Recording.
+
+    Samples are stored in columns (time, grams, stable, tag) instead of as a
+    list of GravimetricSample objects, so that slicing by time is a binary
+    search and statistics don't have to walk every sample. The mean and
+    variance are updated as each sample is appended.
+
+    Indexing and iterating still give GravimetricSample objects, and slicing
+    gives a new GravimetricRecording. Samples must be appended in time order.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, samples: Optional[Iterable[GravimetricSample]] = None) -> None:
+        """Gravimetric Recording."""
+        self._times = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._grams = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._stable = np.empty(self._INITIAL_CAPACITY, dtype=np.bool_)
+        self._tags: List[Optional[str]] = []
+        self._length = 0
+        # running statistics of the grams, using Welford's algorithm
+        self._mean = 0.0
+        self._sum_of_squares = 0.0
+        for sample in samples or []:
+            self.append(sample)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        times: np.ndarray,
+        grams: np.ndarray,
+        stable: np.ndarray,
+        tags: List[Optional[str]],
+    ) -> "GravimetricRecording":
+        recording = cls()
+        length = len(times)
+        recording._times = np.array(times, dtype=np.float64)
+        recording._grams = np.array(grams, dtype=np.float64)
+        recording._stable = np.array(stable, dtype=np.bool_)
+        recording._tags = list(tags)
+        recording._length = length
+        if length:
+            recording._mean = float(np.mean(recording._grams))
+            recording._sum_of_squares = float(
+                np.sum((recording._grams - recording._mean) ** 2)
+            )
+        return recording
+
+    def _take(self, indices: Union[slice, np.ndarray]) -> "GravimetricRecording":
+        if isinstance(indices, slice):
+            tags = self._tags[: self._length][indices]
+        else:
+            tags = [self._tags[i] for i in indices]
+        return self._from_columns(
+            self.time_array[indices],
+            self.grams_array[indices],
+            self.stable_array[indices],
+            tags,
+        )
 
     def __str__(self) -> str:
         """Get string."""
@@ -68,6 +142,72 @@ class GravimetricRecording(List):
             f"start_time={self.start_time})"
         )
 
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> GravimetricSample:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "GravimetricRecording":  # noqa: D105
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[GravimetricSample, "GravimetricRecording"]:
+        """Get a sample, or a slice of the recording."""
+        if isinstance(index, slice):
+            return self._take(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("recording index out of range")
+        return GravimetricSample(
+            time=float(self._times[index]),
+            grams=float(self._grams[index]),
+            stable=bool(self._stable[index]),
+            tag=self._tags[index],
+        )
+
+    def __iter__(self) -> Iterator[GravimetricSample]:
+        """Iterate over the samples."""
+        for i in range(self._length):
+            yield self[i]
+
+    def append(self, sample: GravimetricSample) -> None:
+        """Add a sample to the end of the recording."""
+        length = self._length
+        if length == len(self._times):
+            # grow every column together, doubling so appends stay O(1)
+            capacity = max(2 * length, self._INITIAL_CAPACITY)
+            for name in ("_times", "_grams", "_stable"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:length] = column[:length]
+                setattr(self, name, grown)
+        self._times[length] = sample.time
+        self._grams[length] = sample.grams
+        self._stable[length] = sample.stable
+        self._tags.append(sample.tag)
+        delta = sample.grams - self._mean
+        self._mean += delta / (length + 1)
+        self._sum_of_squares += delta * (sample.grams - self._mean)
+        self._length = length + 1
+
+    def extend(self, samples: Iterable[GravimetricSample]) -> None:
+        """Add samples to the end of the recording."""
+        for sample in samples:
+            self.append(sample)
+
+    def clear(self) -> None:
+        """Delete all samples."""
+        self._length = 0
+        self._tags = []
+        self._mean = 0.0
+        self._sum_of_squares = 0.0
+
     @classmethod
     def load(cls, file_path: str) -> "GravimetricRecording":
         """Build a GravimetricRecording instance."""
@@ -79,53 +219,63 @@ class GravimetricRecording(List):
         expected_header = GravimetricSample.csv_header()
         assert expected_header.strip() == lines[0].strip()
         header_list = expected_header.split(",")
-        time_idx = header_list.index("time")
-        grams_idx = header_list.index("grams")
-        stable_idx = header_list.index("stable")
-        tag_idx = header_list.index("tag")
         split_lines = [line.strip().split(",") for line in lines[1:] if line]
-
-        def _parse_tag(tag_from_csv: str) -> Optional[str]:
-            if not tag_from_csv:
-                return None
-            return tag_from_csv
-
-        return GravimetricRecording(
-            [
-                GravimetricSample(
-                    time=float(split_line[time_idx]),
-                    grams=float(split_line[grams_idx]),
-                    stable=bool(int(split_line[stable_idx])),
-                    tag=_parse_tag(split_line[tag_idx]),
-                )
-                for split_line in split_lines
-                if len(split_line) > 1
-            ]
+        split_lines = [split_line for split_line in split_lines if len(split_line) > 1]
+        if not split_lines:
+            return cls()
+        columns = list(zip(*split_lines))
+        return cls._from_columns(
+            times=np.array(columns[header_list.index("time")], dtype=np.float64),
+            grams=np.array(columns[header_list.index("grams")], dtype=np.float64),
+            stable=np.array(columns[header_list.index("stable")], dtype=np.int8),
+            tags=[tag or None for tag in columns[header_list.index("tag")]],
         )
 
+    def save(self, file_path: str, start_time: Optional[float] = None) -> None:
+        """Save the recording to a CSV file that can be loaded again."""
+        if start_time is None:
+            start_time = self.start_time if len(self) else 0.0
+        with open(file_path, "w") as f:
+            f.write(self.as_csv(start_time))
+
+    @property
+    def time_array(self) -> np.ndarray:
+        """Get the recorded times as an array, in seconds."""
+        return self._times[: self._length]
+
+    @property
+    def grams_array(self) -> np.ndarray:
+        """Get the recorded weights as an array, in grams."""
+        return self._grams[: self._length]
+
+    @property
+    def stable_array(self) -> np.ndarray:
+        """Get whether each recorded weight was stable, as an array."""
+        return self._stable[: self._length]
+
     @property
     def start_time(self) -> float:
         """Get the starting time, in seconds."""
         assert len(self), "No samples recorded"
-        return self[0].time
+        return float(self._times[0])
 
     @property
     def end_time(self) -> float:
         """Get the ending time, in seconds."""
         assert len(self), "No samples recorded"
-        return self[-1].time
+        return float(self._times[self._length - 1])
 
     @property
     def start_grams(self) -> float:
         """Get the starting weight, in grams."""
         assert len(self), "No samples recorded"
-        return self[0].grams
+        return float(self._grams[0])
 
     @property
     def end_grams(self) -> float:
         """Get the ending weight, in grams."""
         assert len(self), "No samples recorded"
-        return self[-1].grams
+        return float(self._grams[self._length - 1])
 
     @property
     def duration(self) -> float:
@@ -135,20 +285,21 @@ class GravimetricRecording(List):
     @property
     def grams_as_list(self) -> List[float]:
         """Get the recorded weights as a list of floats."""
-        return [s.grams for s in self]
+        return self.grams_array.tolist()  # type: ignore[no-any-return]
 
     @property
     def average(self) -> float:
         """Get the average weight of the recording, in grams."""
         assert len(self), "No samples recorded"
-        _grams_list = self.grams_as_list
-        return sum(_grams_list) / len(_grams_list)
+        return self._mean
 
     @property
     def stdev(self) -> float:
         """Get the standard deviation of the recording."""
         assert len(self), "No samples recorded"
-        return stdev(self.grams_as_list)
+        if len(self) < 2:
+            raise StatisticsError("stdev requires at least two data points")
+        return sqrt(max(self._sum_of_squares, 0.0) / (len(self) - 1))
 
     def calculate_cv(self) -> float:
         """Calculate the percent CV of the recording."""
@@ -160,10 +311,17 @@ class GravimetricRecording(List):
 
     def as_csv(self, start_time: float) -> str:
         """Convert the recording into a string that can be saved to a CSV file."""
-        csv_file_str = GravimetricSample.csv_header() + "\n"
-        for s in self:
-            csv_file_str += s.as_csv(start_time) + "\n"
-        return csv_file_str + "\n"
+        lines = [GravimetricSample.csv_header()]
+        lines.extend(
+            _sample_as_csv(_time, grams, stable, tag, start_time)
+            for _time, grams, stable, tag in zip(
+                self.time_array.tolist(),
+                self.grams_array.tolist(),
+                self.stable_array.tolist(),
+                self._tags,
+            )
+        )
+        return "\n".join(lines) + "\n\n"
 
     def _get_nearest_sample_index(self, _time: float, round_to: str = "closest") -> int:
         if _time < self.start_time or _time > self.end_time:
@@ -171,20 +329,19 @@ class GravimetricRecording(List):
                 f"Time ({_time}) is not within recording "
                 f"(start={self.start_time}, end={self.end_time})"
             )
-        for i in range(len(self) - 1):
-            diff_before = _time - self[i].time
-            diff_after = self[i + 1].time - _time
-            if diff_before >= 0 and diff_after >= 0:
-                if round_to == "down" or (
-                    round_to == "closest" and diff_before < diff_after
-                ):
-                    return i
-                else:
-                    return i + 1
-        raise ValueError(
-            f"Unable to find time ({_time}) in recording "
-            f"(start={self.start_time}, end={self.end_time})"
-        )
+        if len(self) < 2:
+            raise ValueError(
+                f"Unable to find time ({_time}) in recording "
+                f"(start={self.start_time}, end={self.end_time})"
+            )
+        # the first pair of samples that the time falls between
+        times = self.time_array
+        i = min(max(int(np.searchsorted(times, _time)) - 1, 0), len(self) - 2)
+        diff_before = _time - times[i]
+        diff_after = times[i + 1] - _time
+        if round_to == "down" or (round_to == "closest" and diff_before < diff_after):
+            return i
+        return i + 1
 
     def get_time_slice(
         self, start: float, duration: float, stable: bool = False, timeout: float = 3
@@ -195,37 +352,39 @@ class GravimetricRecording(List):
         avail_timeout_idx = self._get_nearest_sample_index(
             start + timeout, round_to="up"
         )
-        available_samples = GravimetricRecording(
-            self[avail_start_idx : avail_timeout_idx + 1]
-        )
+        available_samples = self[avail_start_idx : avail_timeout_idx + 1]
         if not stable:
             end_idx = available_samples._get_nearest_sample_index(start + duration)
-            return GravimetricRecording(available_samples[: end_idx + 1])
-        else:
-            # only include the first stable segment of samples
-            # once the samples become unstable, stop including
-            stable_samples = GravimetricRecording()
-            for s in available_samples:
-                if s.stable:
-                    stable_samples.append(s)
-                    if stable_samples.duration >= duration:
-                        return stable_samples
-                elif len(stable_samples):
-                    stable_samples = GravimetricRecording()
-            raise RuntimeError(
-                f"Unable to slice recording into stable piece"
-                f"(start={start}, duration={duration})"
-            )
+            return available_samples[: end_idx + 1]
+        # only include the first stable segment of samples
+        # once the samples become unstable, stop including
+        times = available_samples.time_array
+        is_stable = available_samples.stable_array.astype(np.int8)
+        edges = np.flatnonzero(np.diff(np.pad(is_stable, 1)))
+        for segment_start, segment_end in zip(edges[::2], edges[1::2]):
+            segment_times = times[segment_start:segment_end]
+            long_enough = np.flatnonzero(segment_times - segment_times[0] >= duration)
+            if len(long_enough):
+                return available_samples[
+                    segment_start : segment_start + long_enough[0] + 1
+                ]
+        raise RuntimeError(
+            f"Unable to slice recording into stable piece"
+            f"(start={start}, duration={duration})"
+        )
 
     def get_tagged_samples(self, tag: str) -> "GravimetricRecording":
         """Get samples with given tag."""
-        return GravimetricRecording(
-            [sample for sample in self if sample.tag and sample.tag == tag]
+        return self._take(
+            np.array(
+                [i for i, t in enumerate(self._tags[: self._length]) if t and t == tag],
+                dtype=np.intp,
+            )
         )
 
     def get_stable_samples(self) -> "GravimetricRecording":
         """Get stable samples."""
-        return GravimetricRecording([sample for sample in self if sample.stable])
+        return self._take(np.flatnonzero(self.stable_array))
 
 
 class GravimetricRecorderConfig:
@@ -0,0 +1,97 @@
+from pathlib import Path
+from statistics import StatisticsError, mean, stdev
+from typing import List
+
+import pytest
+
+from hardware_testing.gravimetric.measurement.record import (
+    GravimetricRecording,
+    GravimetricSample,
+)
+
+
+def _samples() -> List[GravimetricSample]:
+    # 1 sample every 0.1 seconds, unstable from 0.5 to 0.7 seconds
+    return [
+        GravimetricSample(
+            time=10 + i * 0.1,
+            grams=1.0 + (i % 3) * 0.01,
+            stable=not 5 <= i <= 7,
+            tag="aspirate" if i < 10 else "dispense",
+        )
+        for i in range(20)
+    ]
+
+
+def test_append_and_index() -> None:
+    samples = _samples()
+    recording = GravimetricRecording(samples)
+    assert len(recording) == 20
+    assert recording[0] == samples[0]
+    assert recording[-1] == samples[-1]
+    assert list(recording) == samples
+    assert recording.grams_as_list == [s.grams for s in samples]
+    with pytest.raises(IndexError):
+        recording[20]
+
+
+def test_statistics() -> None:
+    samples = _samples()
+    recording = GravimetricRecording(samples[:10])
+    recording.extend(samples[10:])
+    grams = [s.grams for s in samples]
+    assert recording.average == pytest.approx(mean(grams))
+    assert recording.stdev == pytest.approx(stdev(grams))
+    assert recording[3:12].stdev == pytest.approx(stdev(grams[3:12]))
+    recording.clear()
+    assert len(recording) == 0
+    recording.append(samples[0])
+    assert recording.average == samples[0].grams
+    with pytest.raises(StatisticsError):
+        recording.stdev
+
+
+def test_nearest_sample_index() -> None:
+    recording = GravimetricRecording(_samples())
+    assert recording._get_nearest_sample_index(10.0) == 0
+    assert recording._get_nearest_sample_index(10.52) == 5
+    assert recording._get_nearest_sample_index(10.58) == 6
+    assert recording._get_nearest_sample_index(10.52, round_to="up") == 6
+    assert recording._get_nearest_sample_index(10.58, round_to="down") == 5
+    assert recording._get_nearest_sample_index(11.9) == 19
+    with pytest.raises(ValueError):
+        recording._get_nearest_sample_index(12.0)
+
+
+def test_get_time_slice() -> None:
+    samples = _samples()
+    recording = GravimetricRecording(samples)
+    assert list(recording.get_time_slice(10.22, 0.3, timeout=1)) == samples[2:6]
+    # the stable samples before 10.5 are too short, so it starts after 10.7
+    stable = recording.get_time_slice(10.22, 0.25, stable=True, timeout=1)
+    assert list(stable) == samples[8:12]
+    with pytest.raises(RuntimeError):
+        recording.get_time_slice(10.22, 0.5, stable=True, timeout=0.6)
+
+
+def test_tagged_and_stable_samples() -> None:
+    samples = _samples()
+    recording = GravimetricRecording(samples)
+    assert list(recording.get_tagged_samples("dispense")) == samples[10:]
+    assert list(recording.get_stable_samples()) == [s for s in samples if s.stable]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    samples = _samples()
+    samples[0].tag = None
+    recording = GravimetricRecording(samples)
+    file_path = str(tmp_path / "recording.csv")
+    recording.save(file_path)
+    assert list(GravimetricRecording.load(file_path)) == samples
+    with open(file_path, "r") as f:
+        assert f.read() == (
+            GravimetricSample.csv_header()
+            + "\n"
+            + "".join(s.as_csv(recording.start_time) + "\n" for s in samples)
+            + "\n"
+        )
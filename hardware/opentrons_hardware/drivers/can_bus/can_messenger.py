@@ -1,18 +1,23 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+import contextlib
 from inspect import Traceback
+from itertools import chain
 from typing import (
     Optional,
     Callable,
+    ContextManager,
     Tuple,
     Dict,
+    Iterable,
     Union,
     List,
     cast,
     TypeVar,
     Type,
     Set,
+    FrozenSet,
 )
 
 import logging
@@ -43,9 +48,12 @@ from opentrons_hardware.firmware_bindings.messages.messages import (
     get_definition,
 )
 from opentrons_hardware.firmware_bindings.utils import BinarySerializableException
+from opentrons_hardware.tracing import is_tracing, trace_span
 
 log = logging.getLogger(__name__)
 
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
 
 MessageListenerCallback = Callable[[MessageDefinition, ArbitrationId], None]
 """Incoming message listener."""
@@ -55,6 +63,14 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+_ListenerEntry = Tuple[
+    MessageListenerCallback,
+    Optional[MessageListenerCallbackFilter],
+    Optional[FrozenSet[NodeId]],
+]
+"""A registered listener, its filter, and the originating nodes it accepts."""
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -135,12 +151,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             if self._exclusive:
                 await self._can_messenger.send_exclusive(self._node_id, self._message)
@@ -176,7 +187,10 @@ class CanMessenger:
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener. Listeners
+    that only care about specific message ids should say so when they are added;
+    incoming frames are dispatched to them through a lookup table keyed on message
+    id, and only fall through to the generic (unkeyed) listeners otherwise.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -186,10 +200,14 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
+        # Listeners that did not specify message ids and must see every frame.
+        self._generic_listeners: Dict[MessageListenerCallback, _ListenerEntry] = {}
+        # Listeners keyed on the message ids they registered for.
+        self._keyed_listeners: Dict[
+            MessageId, Dict[MessageListenerCallback, _ListenerEntry]
         ] = {}
+        # The message ids each keyed listener is registered under, for removal.
+        self._listener_keys: Dict[MessageListenerCallback, FrozenSet[MessageId]] = {}
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
         self._exclusive_condvar = asyncio.Condition(self._access_lock)
@@ -234,9 +252,20 @@ class CanMessenger:
             f"payload: {message.payload}"
         )
         try:
-            await self._drive.send(
-                message=CanMessage(arbitration_id=arbitration_id, data=data)
-            )
+            # Every move sends many messages, so don't look up the enum names
+            # for the span unless it will be recorded.
+            with (
+                trace_span(
+                    "CanMessenger.send",
+                    message=message.message_id.name,
+                    node=node_id.name,
+                )
+                if is_tracing()
+                else _NO_SPAN
+            ):
+                await self._drive.send(
+                    message=CanMessage(arbitration_id=arbitration_id, data=data)
+                )
         except EnumeratedError:
             raise
         except Exception as exc:
@@ -344,14 +373,44 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: The callback to notify.
+            filter: Optional function called with the arbitration id of each
+                candidate message; the listener is only notified if it returns True.
+            message_ids: If specified, the listener is only offered messages with
+                one of these ids. This is much cheaper than an equivalent filter.
+            node_ids: If specified, the listener is only offered messages that
+                originate from one of these nodes.
+        """
+        self.remove_listener(listener)
+        entry: _ListenerEntry = (
+            listener,
+            filter,
+            frozenset(node_ids) if node_ids is not None else None,
+        )
+        if message_ids is None:
+            self._generic_listeners[listener] = entry
+            return
+        keys = frozenset(message_ids)
+        self._listener_keys[listener] = keys
+        for message_id in keys:
+            self._keyed_listeners.setdefault(message_id, {})[listener] = entry
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            self._listeners.pop(listener)
+        self._generic_listeners.pop(listener, None)
+        for message_id in self._listener_keys.pop(listener, frozenset()):
+            keyed = self._keyed_listeners.get(message_id)
+            if keyed is None:
+                continue
+            keyed.pop(listener, None)
+            if not keyed:
+                del self._keyed_listeners[message_id]
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -366,34 +425,61 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
+            self._handle_message(message)
+
+    def _handle_message(self, message: CanMessage) -> None:
+        """Dispatch one incoming message to the listeners that want it."""
+        message_id = message.arbitration_id.parts.message_id
+        message_definition = get_definition(MessageId(message_id))
+        if not message_definition:
+            log.error(f"Message {message} is not recognized.")
+            return
+        try:
+            handled = self._notify_listeners(message_definition, message)
+        except BinarySerializableException:
+            log.exception(f"Failed to build from {message}")
+            return
+        if not handled:
+            if message_id == MessageId.error_message:
+                log.error(f"Asynchronous error message ignored: {message}")
+            elif log.isEnabledFor(logging.INFO):
+                # Formatting the message is most of the cost of an ignored frame.
+                log.info(f"Message ignored: {message}")
+
+    def _notify_listeners(
+        self, message_definition: Type[MessageDefinition], message: CanMessage
+    ) -> bool:
+        """Call every listener that accepts the message; return whether any did.
+
+        The payload is only decoded once a listener has accepted the message, and
+        the decoded message is shared by every listener that accepts it.
+        """
+        arbitration_id = message.arbitration_id
+        keyed = self._keyed_listeners.get(arbitration_id.parts.message_id)
+        candidates: Iterable[_ListenerEntry] = (
+            chain(keyed.values(), self._generic_listeners.values())
+            if keyed
+            else self._generic_listeners.values()
+        )
+        decoded: Optional[MessageDefinition] = None
+        for listener, filter, node_ids in candidates:
+            if (
+                node_ids is not None
+                and arbitration_id.parts.originating_node_id not in node_ids
+            ):
+                continue
+            if filter and not filter(arbitration_id):
+                continue
+            if decoded is None:
+                build = message_definition.payload_type.build(message.data)
+                if log.isEnabledFor(logging.DEBUG):
                     log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+                        f"Received <--\n\tarbitration_id: {arbitration_id},\n\t"
                         f"payload: {build}"
                     )
-                    handled = False
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                        handled = True
-                    if not handled:
-                        if (
-                            message.arbitration_id.parts.message_id
-                            == MessageId.error_message
-                        ):
-                            log.error(f"Asynchronous error message ignored: {message}")
-                        else:
-                            log.info(f"Message ignored: {message}")
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+                decoded = message_definition(payload=build)  # type: ignore[arg-type]
+            listener(decoded, arbitration_id)
+        return decoded is not None
 
     @property
     def exclusive_writer(self) -> asyncio.Lock:
@@ -420,15 +506,21 @@ class WaitableCallback:
         self,
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
         Args:
             messenger: Messenger to listen on.
             filter: Optional message filtering function
+            message_ids: Optional message ids to listen for, see `add_listener`
+            node_ids: Optional originating nodes to listen to, see `add_listener`
         """
         self._messenger = messenger
         self._filter = filter
+        self._message_ids = message_ids
+        self._node_ids = node_ids
         self._queue: asyncio.Queue[
             Tuple[MessageDefinition, ArbitrationId]
         ] = asyncio.Queue()
@@ -441,7 +533,9 @@ class WaitableCallback:
 
     def __enter__(self) -> WaitableCallback:
         """Enter context manager."""
-        self._messenger.add_listener(self, self._filter)
+        self._messenger.add_listener(
+            self, self._filter, message_ids=self._message_ids, node_ids=self._node_ids
+        )
         return self
 
     def __exit__(
@@ -475,6 +569,8 @@ class MultipleMessagesWaitableCallback(WaitableCallback):
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
         number_of_messages: Optional[int] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
@@ -483,8 +579,10 @@ class MultipleMessagesWaitableCallback(WaitableCallback):
             filter: Optional message filtering function
             number_of_messages: Optional number of messages to wait for or
             default to 1.
+            message_ids: Optional message ids to listen for, see `add_listener`
+            node_ids: Optional originating nodes to listen to, see `add_listener`
         """
-        super().__init__(messenger, filter)
+        super().__init__(messenger, filter, message_ids=message_ids, node_ids=node_ids)
         self._number_of_messages: int = number_of_messages or 1
 
     async def __anext__(self) -> Tuple[MessageDefinition, ArbitrationId]:
@@ -126,9 +126,6 @@ async def set_jaw_holdoff(
 async def get_jaw_holdoff_ms(can_messenger: CanMessenger) -> float:
     """Get the idle holdoff value for gripper jaw."""
 
-    def _filter(arbitration_id: ArbitrationId) -> bool:
-        return NodeId(arbitration_id.parts.originating_node_id) == NodeId.gripper_g
-
     async def _wait_for_response(reader: WaitableCallback) -> float:
         """Listener for receiving messages back."""
         async for response, _ in reader:
@@ -136,7 +133,11 @@ async def get_jaw_holdoff_ms(can_messenger: CanMessenger) -> float:
                 return float(response.payload.holdoff_ms.value / (2**16))
         raise StopAsyncIteration
 
-    with WaitableCallback(can_messenger, _filter) as reader:
+    with WaitableCallback(
+        can_messenger,
+        message_ids=[GripperJawHoldoffResponse.message_id],
+        node_ids=[NodeId.gripper_g],
+    ) as reader:
         await can_messenger.send(
             node_id=NodeId.gripper_g,
             message=GripperJawHoldoffRequest(),
@@ -153,9 +154,6 @@ async def get_gripper_jaw_motor_param(
 ) -> DriverConfig:
     """Get gripper brushed motor driver params: reference voltage and duty cycle."""
 
-    def _filter(arbitration_id: ArbitrationId) -> bool:
-        return NodeId(arbitration_id.parts.originating_node_id) == NodeId.gripper_g
-
     async def _wait_for_response(reader: WaitableCallback) -> DriverConfig:
         """Listener for receiving messages back."""
         async for response, _ in reader:
@@ -166,7 +164,11 @@ async def get_gripper_jaw_motor_param(
                 )
         raise StopAsyncIteration
 
-    with WaitableCallback(can_messenger, _filter) as reader:
+    with WaitableCallback(
+        can_messenger,
+        message_ids=[BrushedMotorConfResponse.message_id],
+        node_ids=[NodeId.gripper_g],
+    ) as reader:
         await can_messenger.send(
             node_id=NodeId.gripper_g,
             message=BrushedMotorConfRequest(),
@@ -264,12 +266,11 @@ async def get_gripper_jaw_state(
             event.set()
             jaw_state = GripperJawState(message.payload.state.value)
 
-    def _filter(arb_id: ArbitrationId) -> bool:
-        return (NodeId(arb_id.parts.originating_node_id) == NodeId.gripper_g) and (
-            MessageId(arb_id.parts.message_id) == MessageId.gripper_jaw_state_response
-        )
-
-    can_messenger.add_listener(_listener, _filter)
+    can_messenger.add_listener(
+        _listener,
+        message_ids=[MessageId.gripper_jaw_state_response],
+        node_ids=[NodeId.gripper_g],
+    )
     await can_messenger.send(node_id=NodeId.gripper_g, message=GripperJawStateRequest())
     try:
         await asyncio.wait_for(event.wait(), 1.0)
@@ -86,12 +86,11 @@ async def get_hepa_fan_state(can_messenger: CanMessenger) -> Optional[HepaFanSta
                 fan_rpm=int(message.payload.fan_rpm.value),
             )
 
-    def _filter(arb_id: ArbitrationId) -> bool:
-        return (NodeId(arb_id.parts.originating_node_id) == NodeId.hepa_uv) and (
-            MessageId(arb_id.parts.message_id) == MessageId.get_hepa_fan_state_response
-        )
-
-    can_messenger.add_listener(_listener, _filter)
+    can_messenger.add_listener(
+        _listener,
+        message_ids=[MessageId.get_hepa_fan_state_response],
+        node_ids=[NodeId.hepa_uv],
+    )
     await can_messenger.send(node_id=NodeId.hepa_uv, message=GetHepaFanStateRequest())
     try:
         await asyncio.wait_for(event.wait(), 1.0)
@@ -141,12 +140,11 @@ async def get_hepa_uv_state(can_messenger: CanMessenger) -> Optional[HepaUVState
                 safety_relay_active=bool(message.payload.safety_relay_active.value),
             )
 
-    def _filter(arb_id: ArbitrationId) -> bool:
-        return (NodeId(arb_id.parts.originating_node_id) == NodeId.hepa_uv) and (
-            MessageId(arb_id.parts.message_id) == MessageId.get_hepa_uv_state_response
-        )
-
-    can_messenger.add_listener(_listener, _filter)
+    can_messenger.add_listener(
+        _listener,
+        message_ids=[MessageId.get_hepa_uv_state_response],
+        node_ids=[NodeId.hepa_uv],
+    )
     await can_messenger.send(node_id=NodeId.hepa_uv, message=GetHepaUVStateRequest())
     try:
         await asyncio.wait_for(event.wait(), 1.0)
@@ -19,7 +19,6 @@ from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
     ErrorCode,
-    MessageId,
 )
 from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
 
@@ -96,9 +95,6 @@ async def get_motor_enabled(
     reported: Dict[NodeId, bool] = {}
     event = asyncio.Event()
 
-    def _filter(arb_id: ArbitrationId) -> bool:
-        return MessageId(arb_id.parts.message_id) == GetStatusResponse.message_id
-
     def _listener(message: MessageDefinition, arb_id: ArbitrationId) -> None:
         """Listener for receving motor status messages."""
         if isinstance(message, GetStatusResponse):
@@ -110,7 +106,7 @@ async def get_motor_enabled(
         if expected.issubset(reported):
             event.set()
 
-    can_messenger.add_listener(_listener, _filter)
+    can_messenger.add_listener(_listener, message_ids=[GetStatusResponse.message_id])
     await can_messenger.send(node_id=NodeId.broadcast, message=GetStatusRequest())
     try:
         await asyncio.wait_for(event.wait(), timeout)
@@ -134,11 +130,6 @@ async def get_tip_motor_enabled(
 ) -> bool:
     """Get motor status of a node."""
 
-    def _filter(arbitration_id: ArbitrationId) -> bool:
-        return (NodeId(arbitration_id.parts.originating_node_id) == node) and (
-            MessageId(arbitration_id.parts.message_id) == GetStatusResponse.message_id
-        )
-
     async def _wait_for_response(reader: WaitableCallback) -> bool:
         """Listener for receving motor status messages."""
         async for response, _ in reader:
@@ -146,7 +137,9 @@ async def get_tip_motor_enabled(
                 return bool(response.payload.status.value)
         raise StopAsyncIteration
 
-    with WaitableCallback(can_messenger, _filter) as reader:
+    with WaitableCallback(
+        can_messenger, message_ids=[GetStatusResponse.message_id], node_ids=[node]
+    ) as reader:
         await can_messenger.send(node_id=node, message=GetStatusRequest())
         try:
             return await asyncio.wait_for(_wait_for_response(reader), timeout)
@@ -24,6 +24,7 @@ from opentrons_hardware.firmware_bindings.constants import (
     GearMotorId,
     MoveAckId,
     MotorDriverErrorCode,
+    MessageId,
 )
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
@@ -83,9 +84,18 @@ from opentrons_hardware.hardware_control.motor_position_status import (
 )
 
 from .types import NodeDict, MotorPositionStatus
+from opentrons_hardware.tracing import trace_span
 
 log = logging.getLogger(__name__)
 
+_SCHEDULER_MESSAGE_IDS = [
+    MessageId.move_completed,
+    MessageId.do_self_contained_tip_action_response,
+    MessageId.error_message,
+    MessageId.read_motor_driver_error_status_response,
+]
+"""The messages a MoveScheduler handles; everything else is dispatched elsewhere."""
+
 _AcceptableMoves = Union[MoveCompleted, TipActionResponse]
 _CompletionPacket = Tuple[ArbitrationId, _AcceptableMoves]
 _Completions = List[_CompletionPacket]
@@ -130,8 +140,9 @@ class MoveGroupRunner:
         if not self._has_moves(self._move_groups):
             log.debug("No moves. Nothing to do.")
             return
-        await self._clear_groups(can_messenger)
-        await self._send_groups(can_messenger)
+        with trace_span("MoveGroupRunner.prep", groups=len(self._move_groups)):
+            await self._clear_groups(can_messenger)
+            await self._send_groups(can_messenger)
         self._is_prepped = True
 
     async def execute(
@@ -150,7 +161,8 @@ class MoveGroupRunner:
             raise GeneralError(
                 message="A move group must be prepped before it can be executed."
             )
-        move_completion_data = await self._move(can_messenger, self._start_at_index)
+        with trace_span("MoveGroupRunner.execute"):
+            move_completion_data = await self._move(can_messenger, self._start_at_index)
         return self._accumulate_move_completions(move_completion_data)
 
     async def run(self, can_messenger: CanMessenger) -> NodeDict[MotorPositionStatus]:
@@ -394,7 +406,7 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups, start_at_index)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(scheduler, message_ids=_SCHEDULER_MESSAGE_IDS)
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
@@ -18,6 +18,7 @@ from typing_extensions import Literal
 
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
+    MessageId,
     SensorId,
     SensorType,
     SensorOutputBinding,
@@ -87,6 +88,9 @@ capacitive_output_file_heading = [
 
 PLUNGER_SOLO_MOVE_TIME = 0.2
 
+# The messages a LogListener handles.
+_LOG_LISTENER_MESSAGE_IDS = [MessageId.read_sensor_response, MessageId.acknowledgement]
+
 
 def _fix_pass_step_for_buffer(
     move_group: MoveGroupStep,
@@ -213,7 +217,11 @@ async def run_sync_buffer_to_csv(
             sensor_metadata=sensor_metadata,
         )
         async with sensor_capturer:
-            messenger.add_listener(sensor_capturer, None)
+            messenger.add_listener(
+                sensor_capturer,
+                message_ids=_LOG_LISTENER_MESSAGE_IDS,
+                node_ids=[tool],
+            )
             request = SendAccumulatedSensorDataRequest(
                 payload=SendAccumulatedSensorDataPayload(
                     sensor_id=SensorIdField(sensor_id),
@@ -268,7 +276,11 @@ async def run_stream_output_to_csv(
             expected_nodes=[sensor_info.node_id],
         )
 
-    messenger.add_listener(sensor_capturer, None)
+    messenger.add_listener(
+        sensor_capturer,
+        message_ids=_LOG_LISTENER_MESSAGE_IDS,
+        node_ids=[sensors[sensor_id].sensor.node_id for sensor_id in sensors],
+    )
     async with sensor_capturer:
         positions = await move_group.run(can_messenger=messenger)
     messenger.remove_listener(sensor_capturer)
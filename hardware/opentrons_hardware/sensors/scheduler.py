@@ -459,17 +459,11 @@ class SensorScheduler:
             if isinstance(message, ErrorMessage):
                 log.error(f"Received error message {str(message)}")
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-                or MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
-
-        can_messenger.add_listener(_logging_listener, _filter)
+        can_messenger.add_listener(
+            _logging_listener,
+            message_ids=[MessageId.read_sensor_response, MessageId.error_message],
+            node_ids=[target_sensor.node_id],
+        )
         error = await can_messenger.ensure_send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
@@ -537,15 +531,6 @@ class SensorScheduler:
                     )
                 )
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            node_id_match = any(
-                NodeId(arbitration_id.parts.originating_node_id) == s.node_id
-                for s in target_sensors
-            )
-            return (node_id_match) and (
-                MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
-
         for sensor in target_sensors:
             error = await can_messenger.ensure_send(
                 node_id=sensor.node_id,
@@ -566,7 +551,11 @@ class SensorScheduler:
                 )
 
         try:
-            can_messenger.add_listener(_async_error_listener, _filter)
+            can_messenger.add_listener(
+                _async_error_listener,
+                message_ids=[MessageId.error_message],
+                node_ids=[s.node_id for s in target_sensors],
+            )
             yield error_response_queue
         finally:
             can_messenger.remove_listener(_async_error_listener)
@@ -0,0 +1,41 @@
+"""Span tracing of hardware operations, when performance-metrics is available.
+
+See performance_metrics.trace_span and performance_metrics.is_tracing. Tracing
+is off until a performance_metrics.SpanTracer is installed by the application.
+"""
+import contextlib
+from typing import Callable, ContextManager, Union
+
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+
+def _stubbed_trace_span(
+    name: str, **args: Union[int, float, str]
+) -> ContextManager[None]:
+    return _NO_SPAN
+
+
+def _stubbed_is_tracing() -> bool:
+    return False
+
+
+def _handle_trace_span_import() -> Callable[..., ContextManager[None]]:
+    try:
+        from performance_metrics import trace_span
+
+        return trace_span
+    except ImportError:
+        return _stubbed_trace_span
+
+
+def _handle_is_tracing_import() -> Callable[[], bool]:
+    try:
+        from performance_metrics import is_tracing
+
+        return is_tracing
+    except ImportError:
+        return _stubbed_is_tracing
+
+
+trace_span = _handle_trace_span_import()
+is_tracing = _handle_is_tracing_import()
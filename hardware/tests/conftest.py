@@ -1,12 +1,12 @@
 """Pytest shared fixtures."""
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from typing_extensions import Protocol
 
 import pytest
 from mock.mock import AsyncMock
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
-from opentrons_hardware.firmware_bindings import NodeId
+from opentrons_hardware.firmware_bindings import NodeId, MessageId
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.drivers.can_bus.can_messenger import (
@@ -15,26 +15,59 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
 )
 
 
+pytest_plugins = ["opentrons_shared_data.pytest_benchmarks"]
+
+
 class MockCanMessageNotifier:
     """A CanMessage notifier."""
 
     def __init__(self) -> None:
         """Constructor."""
         self._listeners: List[
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]]
+            Tuple[
+                MessageListenerCallback,
+                Optional[MessageListenerCallbackFilter],
+                Optional[List[MessageId]],
+                Optional[List[NodeId]],
+            ]
         ] = []
 
     def add_listener(
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add listener."""
-        self._listeners.append((listener, filter))
+        """Add listener, replacing it if it was already added."""
+        self.remove_listener(listener)
+        self._listeners.append(
+            (
+                listener,
+                filter,
+                list(message_ids) if message_ids is not None else None,
+                list(node_ids) if node_ids is not None else None,
+            )
+        )
+
+    def remove_listener(self, listener: MessageListenerCallback) -> None:
+        """Remove listener."""
+        self._listeners = [entry for entry in self._listeners if entry[0] != listener]
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
-        for listener, filter in self._listeners:
+        # Copy, since listeners may remove themselves when notified.
+        for listener, filter, message_ids, node_ids in list(self._listeners):
+            if (
+                message_ids is not None
+                and arbitration_id.parts.message_id not in message_ids
+            ):
+                continue
+            if (
+                node_ids is not None
+                and arbitration_id.parts.originating_node_id not in node_ids
+            ):
+                continue
             if filter and not filter(arbitration_id):
                 continue
             listener(message, arbitration_id)
@@ -51,6 +84,7 @@ def mock_messenger(can_message_notifier: MockCanMessageNotifier) -> AsyncMock:
     """Mock can messenger."""
     mock = AsyncMock(spec=CanMessenger)
     mock.add_listener.side_effect = can_message_notifier.add_listener
+    mock.remove_listener.side_effect = can_message_notifier.remove_listener
     return mock
 
 
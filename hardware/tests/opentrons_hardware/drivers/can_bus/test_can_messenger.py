@@ -440,7 +440,9 @@ async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
     with WaitableCallback(mock_messenger) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, None)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, None, message_ids=None, node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
 
 
@@ -452,5 +454,127 @@ async def test_waitable_callback_context_with_filter() -> None:
         return False
 
     with WaitableCallback(mock_messenger, some_func) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, some_func)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, some_func, message_ids=None, node_ids=None
+        )
+    mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+async def test_waitable_callback_context_with_keys() -> None:
+    """It should register for the message and node ids it was given."""
+    mock_messenger = Mock(spec=CanMessenger)
+
+    with WaitableCallback(
+        mock_messenger,
+        message_ids=[MessageId.acknowledgement],
+        node_ids=[NodeId.gantry_x],
+    ) as callback:
+        mock_messenger.add_listener.assert_called_once_with(
+            callback,
+            None,
+            message_ids=[MessageId.acknowledgement],
+            node_ids=[NodeId.gantry_x],
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _incoming(
+    message_id: MessageId, data: bytes, origin: NodeId = NodeId.gantry_x
+) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=origin,
+            )
+        ),
+        data=data,
+    )
+
+
+def _move_completed_data() -> bytes:
+    payload = MoveCompletedPayload(
+        group_id=UInt8Field(1),
+        seq_id=UInt8Field(2),
+        current_position_um=UInt32Field(3),
+        encoder_position_um=Int32Field(4),
+        position_flags=MotorPositionFlagsField(0),
+        ack_id=UInt8Field(1),
+    )
+    payload.message_index = UInt32Field(0)
+    return payload.serialize()
+
+
+_MOVE_COMPLETED_DATA = _move_completed_data()
+
+
+def test_keyed_listener_dispatch(subject: CanMessenger) -> None:
+    """Keyed listeners should only see their message ids; generic ones see all."""
+    keyed = Mock(spec=MessageListenerCallback)
+    generic = Mock(spec=MessageListenerCallback)
+    subject.add_listener(keyed, message_ids=[MessageId.move_completed])
+    subject.add_listener(generic)
+
+    subject._handle_message(_incoming(MessageId.move_completed, _MOVE_COMPLETED_DATA))
+    subject._handle_message(
+        _incoming(MessageId.get_move_group_request, b"\x00\x00\x00\x01\1")
+    )
+
+    keyed.assert_called_once()
+    assert isinstance(keyed.call_args[0][0], MoveCompleted)
+    assert generic.call_count == 2
+
+    subject.remove_listener(keyed)
+    subject._handle_message(_incoming(MessageId.move_completed, _MOVE_COMPLETED_DATA))
+    keyed.assert_called_once()
+    assert generic.call_count == 3
+
+
+def test_keyed_listener_node_ids(subject: CanMessenger) -> None:
+    """Listeners registered with node ids should only see those nodes' messages."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        message_ids=[MessageId.move_completed],
+        node_ids=[NodeId.gantry_y],
+    )
+
+    subject._handle_message(_incoming(MessageId.move_completed, _MOVE_COMPLETED_DATA))
+    listener.assert_not_called()
+    subject._handle_message(
+        _incoming(MessageId.move_completed, _MOVE_COMPLETED_DATA, NodeId.gantry_y)
+    )
+    listener.assert_called_once()
+
+
+def test_payload_decoded_only_when_handled(
+    subject: CanMessenger, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Messages no listener wants should not be decoded at all."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.get_move_group_request])
+
+    # This payload is too short to build, but nobody asked for it.
+    subject._handle_message(_incoming(MessageId.move_completed, b"\x01"))
+    assert "Failed to build" not in caplog.text
+
+    subject.add_listener(listener, message_ids=[MessageId.move_completed])
+    subject._handle_message(_incoming(MessageId.move_completed, b"\x01"))
+    assert "Failed to build" in caplog.text
+    listener.assert_not_called()
+
+
+def test_readding_listener_replaces_registration(subject: CanMessenger) -> None:
+    """Adding a listener again should replace its previous keys."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.move_completed])
+    subject.add_listener(listener, message_ids=[MessageId.get_move_group_request])
+
+    subject._handle_message(_incoming(MessageId.move_completed, _MOVE_COMPLETED_DATA))
+    listener.assert_not_called()
+    subject._handle_message(
+        _incoming(MessageId.get_move_group_request, b"\x00\x00\x00\x01\1")
+    )
+    listener.assert_called_once()
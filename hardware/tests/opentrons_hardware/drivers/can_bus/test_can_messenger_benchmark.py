@@ -0,0 +1,136 @@
+"""Microbenchmark of CanMessenger incoming frame dispatch.
+
+Run with ``pytest --run-benchmarks``.
+"""
+import time
+from typing import Callable, List, Tuple
+
+import pytest
+from mock import AsyncMock
+
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import MessageId, NodeId
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    MotorPositionFlagsField,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    MoveCompletedPayload,
+)
+from opentrons_hardware.firmware_bindings.utils import (
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+)
+
+_FRAMES = 20000
+
+# Roughly what is registered while a move runs with sensors and monitors active:
+# move scheduler, ack listener, sensor capture, overpressure, tip presence,
+# estop/heartbeat style monitors.
+_LISTENER_IDS: List[List[MessageId]] = [
+    [
+        MessageId.move_completed,
+        MessageId.do_self_contained_tip_action_response,
+        MessageId.error_message,
+        MessageId.read_motor_driver_error_status_response,
+    ],
+    [MessageId.acknowledgement, MessageId.error_message],
+    [MessageId.read_sensor_response, MessageId.error_message],
+    [MessageId.error_message],
+    [MessageId.tip_presence_notification],
+    [MessageId.heartbeat_response],
+    [MessageId.limit_sw_response],
+    [MessageId.motor_position_response],
+]
+
+
+def _frames() -> List[CanMessage]:
+    payload = MoveCompletedPayload(
+        group_id=UInt8Field(0),
+        seq_id=UInt8Field(0),
+        current_position_um=UInt32Field(100),
+        encoder_position_um=Int32Field(100),
+        position_flags=MotorPositionFlagsField(0),
+        ack_id=UInt8Field(1),
+    )
+    payload.message_index = UInt32Field(0)
+    move_completed = payload.serialize()
+    frames = []
+    for i in range(_FRAMES):
+        # Mostly sensor traffic nobody is listening to, with some move completions.
+        message_id = (
+            MessageId.move_completed
+            if i % 4 == 0
+            else MessageId.peripheral_status_response
+        )
+        frames.append(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message_id,
+                        node_id=NodeId.host,
+                        function_code=0,
+                        originating_node_id=NodeId.gantry_x,
+                    )
+                ),
+                data=move_completed if message_id == MessageId.move_completed else b"",
+            )
+        )
+    return frames
+
+
+def _counter() -> Tuple[List[int], Callable[[MessageDefinition, ArbitrationId], None]]:
+    count = [0]
+
+    def _listener(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+        count[0] += 1
+
+    return count, _listener
+
+
+def _filter_for(ids: List[MessageId]) -> Callable[[ArbitrationId], bool]:
+    return lambda arbitration_id: arbitration_id.parts.message_id in ids
+
+
+def _run(subject: CanMessenger, frames: List[CanMessage]) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        subject._handle_message(frame)
+    return len(frames) / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_dispatch_throughput() -> None:
+    """Compare keyed dispatch with the equivalent filter-only listener set."""
+    frames = _frames()
+
+    keyed = CanMessenger(AsyncMock())
+    keyed_counts = []
+    for ids in _LISTENER_IDS:
+        count, listener = _counter()
+        keyed_counts.append(count)
+        keyed.add_listener(listener, message_ids=ids)
+
+    filtered = CanMessenger(AsyncMock())
+    filtered_counts = []
+    for ids in _LISTENER_IDS:
+        count, listener = _counter()
+        filtered_counts.append(count)
+        filtered.add_listener(listener, _filter_for(ids))
+
+    keyed_rate = _run(keyed, frames)
+    filtered_rate = _run(filtered, frames)
+
+    # Both strategies must deliver exactly the same messages.
+    assert [c[0] for c in keyed_counts] == [c[0] for c in filtered_counts]
+    assert keyed_counts[0][0] == _FRAMES // 4
+    assert keyed_rate > filtered_rate, (
+        f"keyed dispatch {keyed_rate:.0f} frames/s,"
+        f" filtered dispatch {filtered_rate:.0f} frames/s"
+    )
@@ -0,0 +1,46 @@
+import hashlib
+import math
+import re
+from typing import List
+
+from llama_index.core.embeddings import BaseEmbedding
+
+# The dimension of OpenAI's text-embedding-3-large, which the stored indexes were built with.
+OPENAI_EMBED_DIM: int = 3072
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class LocalHashEmbedding(BaseEmbedding):
+    """
+    A deterministic, offline stand-in for the OpenAI embedding model.
+
+    Each word of the text is hashed into one of `embed_dim` buckets and the resulting
+    bag-of-words vector is normalized. This needs no network access and no API key, so
+    retrieval latency can be benchmarked locally. Its vectors are not comparable to the
+    OpenAI vectors stored in the indexes, so the documents it retrieves are not meaningful.
+    """
+
+    embed_dim: int = OPENAI_EMBED_DIM
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "LocalHashEmbedding"
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.embed_dim
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.embed_dim
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(text)
@@ -1,9 +1,7 @@
 import logging
-from pathlib import Path
 from typing import List, Tuple
 
 from llama_index.core import Settings as li_settings
-from llama_index.core import StorageContext, load_index_from_storage
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.llms.openai import OpenAI as li_OpenAI
 from llama_index.program.openai import OpenAIPydanticProgram
@@ -11,6 +9,7 @@ from openai import OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionFunctionMessageParam, ChatCompletionMessage, ChatCompletionMessageParam
 from pydantic import BaseModel
 
+from api.domain.local_embedding import LocalHashEmbedding
 from api.domain.prompts import (
     example_pcr_1,
     execute_function_call,
@@ -22,52 +21,46 @@ from api.domain.prompts import (
     system_notes,
     tools,
 )
+from api.domain.retriever_cache import RetrieverCache
 from api.domain.utils import refine_characters
 from api.settings import Settings
 
 logger = logging.getLogger(__name__)
 
-ROOT_PATH: Path = Path(Path(__file__)).parent.parent.parent
-
 
 class OpenAIPredict:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, retrievers: RetrieverCache | None = None) -> None:
         self.settings: Settings = settings
         self.client: OpenAI = OpenAI(api_key=settings.openai_api_key.get_secret_value())
-        li_settings.embed_model = OpenAIEmbedding(
-            model_name="text-embedding-3-large", api_key=self.settings.openai_api_key.get_secret_value()
-        )
+        if settings.use_local_embeddings:
+            li_settings.embed_model = LocalHashEmbedding()
+        else:
+            li_settings.embed_model = OpenAIEmbedding(
+                model_name="text-embedding-3-large", api_key=self.settings.openai_api_key.get_secret_value()
+            )
+        # Load the indexes once, up front, instead of from disk on every request.
+        self.retrievers: RetrieverCache = retrievers if retrievers is not None else RetrieverCache()
+        self.retrievers.load()
 
     def get_docs_all(self, query: str) -> Tuple[str, str, str]:
         commands = self.extract_atomic_description(query)
         logger.info("Commands", extra={"commands": commands})
 
-        # define file paths for storage
-        example_command_path = str(ROOT_PATH / "api" / "storage" / "index" / "commands")
-        documentation_path = str(ROOT_PATH / "api" / "storage" / "index" / "v215")
         labware_api_path = standard_labware_api
 
         # retrieve example commands
         example_commands = f"\n\n{'='*15} EXAMPLE COMMANDS {'='*15}\n"
-        storage_context = StorageContext.from_defaults(persist_dir=example_command_path)
-        index = load_index_from_storage(storage_context)
-        retriever = index.as_retriever(similarity_top_k=1)
         content_all = ""
         if isinstance(commands, list):
             for command in commands:
-                nodes = retriever.retrieve(command)
-                content = "\n".join(node.text for node in nodes)
+                content = "\n".join(self.retrievers.retrieve("commands", command))
                 content_all += f">>>> >>>> \n\\{content}n"
             example_commands += content_all
         else:
             example_commands = []
 
         # retrieve documentation
-        storage_context = StorageContext.from_defaults(persist_dir=documentation_path)
-        index = load_index_from_storage(storage_context)
-        retriever = index.as_retriever(similarity_top_k=3)
-        nodes = retriever.retrieve(query)
-        docs = "\n".join(node.text.strip() for node in nodes)
+        docs = "\n".join(text.strip() for text in self.retrievers.retrieve("v215", query))
         docs_v215 = f"\n{'='*15} DOCUMENTATION {'='*15}\n\n" + docs
 
         # standard api names
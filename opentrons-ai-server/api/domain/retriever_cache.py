@@ -0,0 +1,98 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+from llama_index.core import StorageContext, load_index_from_storage
+
+logger = logging.getLogger(__name__)
+
+ROOT_PATH: Path = Path(Path(__file__)).parent.parent.parent
+INDEX_PATH: Path = ROOT_PATH / "api" / "storage" / "index"
+
+# Index name (its directory under INDEX_PATH) -> how many nodes to retrieve per query.
+DEFAULT_SIMILARITY_TOP_K: Dict[str, int] = {"commands": 1, "v215": 3}
+
+
+def load_index(persist_dir: Path) -> Any:
+    """Load a persisted llama-index index from disk."""
+    storage_context = StorageContext.from_defaults(persist_dir=str(persist_dir))
+    return load_index_from_storage(storage_context)
+
+
+class RetrieverCache:
+    """
+    Holds a retriever for each persisted index, and remembers recent retrievals.
+
+    Loading an index from disk takes much longer than querying it, so each index is loaded
+    once and shared by all requests. The most recent `max_cached_queries` query results are
+    kept so that repeated queries don't have to be embedded and searched again.
+
+    Safe to use from multiple threads, like the worker threads FastAPI runs sync endpoints in.
+    """
+
+    def __init__(
+        self,
+        index_path: Path = INDEX_PATH,
+        similarity_top_k: Mapping[str, int] = DEFAULT_SIMILARITY_TOP_K,
+        max_cached_queries: int = 256,
+        loader: Callable[[Path], Any] = load_index,
+    ) -> None:
+        self._index_path = index_path
+        self._similarity_top_k = dict(similarity_top_k)
+        self._max_cached_queries = max_cached_queries
+        self._loader = loader
+        self._retrievers: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+        self._results: OrderedDict[Tuple[str, str], Tuple[str, ...]] = OrderedDict()
+        self._results_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """Load every index that isn't loaded yet. Call this at startup to keep it off the first request."""
+        with self._load_lock:
+            for index_name, top_k in self._similarity_top_k.items():
+                if index_name in self._retrievers:
+                    continue
+                start = time.perf_counter()
+                index = self._loader(self._index_path / index_name)
+                self._retrievers[index_name] = index.as_retriever(similarity_top_k=top_k)
+                logger.info("Index loaded", extra={"index": index_name, "seconds": round(time.perf_counter() - start, 3)})
+
+    def retrieve(self, index_name: str, query: str) -> Tuple[str, ...]:
+        """Return the text of the nodes in the named index that best match the query."""
+        key = (index_name, query)
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Retrieve outside the lock so that concurrent requests for different queries don't wait on each other.
+        texts = tuple(node.text for node in self._get_retriever(index_name).retrieve(query))
+
+        with self._results_lock:
+            self._results[key] = texts
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_cached_queries:
+                self._results.popitem(last=False)
+        return texts
+
+    def clear(self) -> None:
+        """Forget all remembered query results. Loaded indexes are kept."""
+        with self._results_lock:
+            self._results.clear()
+
+    def _get_retriever(self, index_name: str) -> Any:
+        retriever = self._retrievers.get(index_name)
+        if retriever is None:
+            if index_name not in self._similarity_top_k:
+                raise KeyError(f"Unknown index: {index_name}")
+            self.load()
+            retriever = self._retrievers[index_name]
+        return retriever
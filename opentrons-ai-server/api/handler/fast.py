@@ -1,10 +1,11 @@
 import asyncio
 import os
+from functools import lru_cache
 from typing import Any, Awaitable, Callable, List, Literal, Union
 
 import ddtrace
 from ddtrace import tracer
-from fastapi import FastAPI, HTTPException, Query, Request, Response, Security, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, Security, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
@@ -26,7 +27,12 @@ logger = get_logger(__name__)
 ddtrace.patch(logging=True)
 settings: Settings = Settings()
 auth: VerifyToken = VerifyToken()
-openai: OpenAIPredict = OpenAIPredict(settings)
+
+
+@lru_cache(maxsize=1)
+def get_openai_predict() -> OpenAIPredict:
+    """Build the predictor on first use, instead of at import, since it loads the indexes from disk."""
+    return OpenAIPredict(settings)
 
 
 # Initialize FastAPI app with metadata
@@ -55,6 +61,12 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def load_openai_predict() -> None:
+    """Build the predictor at startup, off the event loop, so that the first request doesn't wait for it."""
+    await asyncio.to_thread(get_openai_predict)
+
+
 # Add Timeout middleware
 class TimeoutMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: FastAPI, timeout_s: int) -> None:
@@ -109,7 +121,9 @@ class CorsHeadersResponse(BaseModel):
     description="Generate a chat response based on the provided prompt.",
 )
 async def create_chat_completion(
-    body: ChatRequest, auth_result: Any = Security(auth.verify)  # noqa: B008
+    body: ChatRequest,
+    auth_result: Any = Security(auth.verify),  # noqa: B008
+    openai: OpenAIPredict = Depends(get_openai_predict),  # noqa: B008
 ) -> Union[ChatResponse, ErrorResponse]:  # noqa: B008
     """
     Generate a chat completion response using OpenAI.
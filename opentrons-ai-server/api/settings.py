@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     dd_logs_injection: str = "true"
     cpu: str = "1028"
     memory: str = "2048"
+    # Embed queries locally instead of with OpenAI, to benchmark retrieval offline.
+    use_local_embeddings: bool = False
 
     # Secrets
     # These come from environment variables in the local and deployed execution environments
@@ -0,0 +1,35 @@
+"""Benchmark index loading and retrieval offline, using the local stand-in embedding model."""
+
+import time
+
+from api.domain.local_embedding import LocalHashEmbedding
+from api.domain.retriever_cache import RetrieverCache
+from llama_index.core import Settings as li_settings
+from rich import print
+
+QUERIES = [
+    "Transfer 10 uL from A1 to B1",
+    "Load a 96 well plate in slot 2",
+    "Set the temperature module to 4 C",
+]
+
+
+def main() -> None:
+    li_settings.embed_model = LocalHashEmbedding()
+
+    start = time.perf_counter()
+    cache = RetrieverCache()
+    cache.load()
+    print(f"load indexes: {time.perf_counter() - start:.3f} s")
+
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        for query in QUERIES:
+            cache.retrieve("commands", query)
+            cache.retrieve("v215", query)
+        print(f"{label} retrieval of {len(QUERIES)} queries: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"cache hits: {cache.hits}, misses: {cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generator, List
+
+import pytest
+from api.domain.local_embedding import LocalHashEmbedding
+from api.domain.openai_predict import OpenAIPredict
+from api.domain.retriever_cache import RetrieverCache
+from api.settings import Settings
+from llama_index.core import Document, StorageContext, VectorStoreIndex
+from llama_index.core import Settings as li_settings
+
+
+@dataclass
+class FakeNode:
+    text: str
+
+
+class FakeRetriever:
+    def __init__(self, name: str, top_k: int) -> None:
+        self.name = name
+        self.top_k = top_k
+        self.queries: List[str] = []
+
+    def retrieve(self, query: str) -> List[FakeNode]:
+        self.queries.append(query)
+        return [FakeNode(f"{self.name}:{query}:{i}") for i in range(self.top_k)]
+
+
+class FakeIndex:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.retriever: FakeRetriever | None = None
+
+    def as_retriever(self, similarity_top_k: int) -> FakeRetriever:
+        self.retriever = FakeRetriever(self.name, similarity_top_k)
+        return self.retriever
+
+
+class FakeLoader:
+    def __init__(self) -> None:
+        self.loaded: List[Path] = []
+        self.indexes: dict[str, FakeIndex] = {}
+
+    def __call__(self, persist_dir: Path) -> Any:
+        self.loaded.append(persist_dir)
+        index = FakeIndex(persist_dir.name)
+        self.indexes[persist_dir.name] = index
+        return index
+
+
+@pytest.mark.unit
+def test_indexes_are_loaded_once() -> None:
+    loader = FakeLoader()
+    cache = RetrieverCache(index_path=Path("/indexes"), similarity_top_k={"commands": 1, "v215": 3}, loader=loader)
+
+    cache.load()
+    cache.load()
+    assert cache.retrieve("v215", "query") == ("v215:query:0", "v215:query:1", "v215:query:2")
+    assert cache.retrieve("commands", "other query") == ("commands:other query:0",)
+
+    assert loader.loaded == [Path("/indexes/commands"), Path("/indexes/v215")]
+
+
+@pytest.mark.unit
+def test_indexes_are_loaded_on_first_use() -> None:
+    loader = FakeLoader()
+    cache = RetrieverCache(index_path=Path("/indexes"), similarity_top_k={"commands": 1}, loader=loader)
+
+    assert cache.retrieve("commands", "query") == ("commands:query:0",)
+    assert loader.loaded == [Path("/indexes/commands")]
+    with pytest.raises(KeyError):
+        cache.retrieve("not-an-index", "query")
+
+
+@pytest.mark.unit
+def test_recent_results_are_remembered() -> None:
+    loader = FakeLoader()
+    cache = RetrieverCache(index_path=Path("/indexes"), similarity_top_k={"commands": 1}, max_cached_queries=2, loader=loader)
+    cache.load()
+    retriever = loader.indexes["commands"].retriever
+    assert retriever is not None
+
+    cache.retrieve("commands", "a")
+    cache.retrieve("commands", "b")
+    cache.retrieve("commands", "a")  # hit, and now the most recently used
+    cache.retrieve("commands", "c")  # evicts "b"
+    cache.retrieve("commands", "a")  # hit
+    cache.retrieve("commands", "b")  # miss
+
+    assert retriever.queries == ["a", "b", "c", "b"]
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+    cache.retrieve("commands", "a")
+    assert retriever.queries[-1] == "a"
+
+
+@pytest.mark.unit
+def test_concurrent_retrieval() -> None:
+    loader = FakeLoader()
+    cache = RetrieverCache(index_path=Path("/indexes"), similarity_top_k={"commands": 1}, max_cached_queries=8, loader=loader)
+    errors: List[AssertionError] = []
+
+    def worker(worker_id: int) -> None:
+        try:
+            for i in range(200):
+                query = f"query {(worker_id + i) % 16}"
+                assert cache.retrieve("commands", query) == (f"commands:{query}:0",)
+        except AssertionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert loader.loaded == [Path("/indexes/commands")]
+    assert cache.hits + cache.misses == 8 * 200
+
+
+@pytest.mark.unit
+def test_local_embedding_is_deterministic_and_normalized() -> None:
+    embedding = LocalHashEmbedding(embed_dim=64)
+
+    first = embedding.get_query_embedding("Transfer 10 uL from A1 to B1")
+    second = embedding.get_text_embedding("transfer 10 uL from a1 to b1")
+
+    assert first == second
+    assert len(first) == 64
+    assert sum(value * value for value in first) == pytest.approx(1.0)
+
+
+COMMAND_DOCS = [
+    "pipette.transfer(10, plate['A1'], plate['B1'])",
+    "plate = protocol.load_labware('corning_96_wellplate_360ul_flat', 2)",
+    "temp_mod.set_temperature(celsius=4)",
+]
+
+
+@pytest.fixture
+def local_embeddings() -> Generator[None, None, None]:
+    """Embed with the local stand-in model, and put back whatever model was set before."""
+    previous = li_settings._embed_model
+    li_settings.embed_model = LocalHashEmbedding()
+    yield
+    li_settings._embed_model = previous
+
+
+@pytest.fixture
+def index_path(tmp_path: Path, local_embeddings: None) -> Path:
+    """Persist small real indexes, laid out like the ones under api/storage/index."""
+    for index_name in ("commands", "v215"):
+        storage_context = StorageContext.from_defaults()
+        VectorStoreIndex.from_documents([Document(text=text) for text in COMMAND_DOCS], storage_context=storage_context)
+        storage_context.persist(persist_dir=str(tmp_path / index_name))
+    return tmp_path
+
+
+@pytest.mark.unit
+def test_persisted_indexes_are_loaded_and_retrieved(index_path: Path) -> None:
+    cache = RetrieverCache(index_path=index_path)
+    cache.load()
+
+    assert cache.retrieve("commands", "transfer 10 from A1 to B1") == (COMMAND_DOCS[0],)
+    assert cache.retrieve("commands", "transfer 10 from A1 to B1") == (COMMAND_DOCS[0],)
+    assert len(cache.retrieve("v215", "set the temperature to 4")) == 3
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.unit
+def test_openai_predict_retrieves_from_loaded_indexes(index_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = RetrieverCache(index_path=index_path)
+    subject = OpenAIPredict(Settings(use_local_embeddings=True), retrievers=cache)
+    assert isinstance(li_settings.embed_model, LocalHashEmbedding)
+
+    # Splitting the description into commands asks OpenAI, so skip that.
+    monkeypatch.setattr(subject, "extract_atomic_description", lambda query: ["set the temperature to 4"])
+    example_commands, docs, _ = subject.get_docs_all("set the temperature to 4")
+
+    assert COMMAND_DOCS[2] in example_commands
+    assert all(text in docs for text in COMMAND_DOCS)
+    assert cache.misses == 2
@@ -1,11 +1,20 @@
 """Opentrons performance metrics library."""
 
+from ._event_loop_monitor import EventLoopMonitor
 from ._robot_activity_tracker import RobotActivityTracker
+from ._sampling_profiler import SamplingProfiler, SamplingProfilerConfiguration
+from ._tracing import SpanTracer, is_tracing, trace_span
 from ._types import RobotActivityState, SupportsTracking
 
 
 __all__ = [
+    "EventLoopMonitor",
     "RobotActivityTracker",
     "RobotActivityState",
+    "SamplingProfiler",
+    "SamplingProfilerConfiguration",
     "SupportsTracking",
+    "SpanTracer",
+    "is_tracing",
+    "trace_span",
 ]
@@ -21,7 +21,8 @@ class CSVStorageBase:
 
     def csv_row(self) -> typing.Tuple[StorableData, ...]:
         """Returns the object as a CSV row."""
-        return dataclasses.astuple(self)
+        # Unlike dataclasses.astuple, this doesn't deep copy every field.
+        return tuple(getattr(self, field.name) for field in dataclasses.fields(self))
 
     @classmethod
     def from_csv_row(cls, row: typing.Sequence[StorableData]) -> "CSVStorageBase":
@@ -65,6 +66,59 @@ class ProcessResourceUsageSnapshot(CSVStorageBase):
     memory_percent: float
 
 
+@dataclasses.dataclass(frozen=True)
+class EventLoopLagHistogram(CSVStorageBase):
+    """Represents how late the event loop ran a periodic wakeup, over a window of time.
+
+    The window ends early if the robot activity state or the current engine
+    command changes, so that every window can be attributed to one of each.
+
+    Attributes:
+    - window_start (int): The wall clock time the window started, in nanoseconds.
+    - window_duration (int): The length of the window in nanoseconds.
+    - state (str): The robot activity state during the window, or "" if none.
+    - command_id (str): The current engine command during the window, or "" if none.
+    - samples (int): The number of wakeups in the window.
+    - max_lag (int): The latest wakeup in the window, in nanoseconds.
+    - lag_under_1ms ... lag_over_500ms (int): The number of wakeups in each lag range.
+    """
+
+    window_start: int
+    window_duration: int
+    state: str
+    command_id: str
+    samples: int
+    max_lag: int
+    lag_under_1ms: int
+    lag_under_5ms: int
+    lag_under_10ms: int
+    lag_under_50ms: int
+    lag_under_100ms: int
+    lag_under_500ms: int
+    lag_over_500ms: int
+
+
+@dataclasses.dataclass(frozen=True)
+class SlowCallbackData(CSVStorageBase):
+    """Represents a time the event loop was blocked for longer than a threshold.
+
+    Attributes:
+    - func_start (int): The wall clock time the event loop was blocked from, in nanoseconds.
+    - duration (int): How long the event loop was blocked, in nanoseconds.
+    - state (str): The robot activity state at the time, or "" if none.
+    - command_id (str): The current engine command at the time, or "" if none.
+    - stack (str): The innermost frames of what the event loop was running,
+      outermost first, separated by ";". Empty if the event loop unblocked
+      before its stack could be captured.
+    """
+
+    func_start: int
+    duration: int
+    state: str
+    command_id: str
+    stack: str
+
+
 @dataclasses.dataclass(frozen=True)
 class MetricsMetadata:
     """Dataclass to store metadata about the metrics."""
@@ -0,0 +1,228 @@
+"""Module for measuring how responsive an asyncio event loop is."""
+
+import asyncio
+import sys
+import threading
+import traceback
+import typing
+from pathlib import Path
+from time import perf_counter_ns
+
+from ._data_shapes import EventLoopLagHistogram, MetricsMetadata, SlowCallbackData
+from ._metrics_store import MetricsStore
+from ._types import RobotActivityState
+from ._util import get_timing_function
+
+_timing_function = get_timing_function()
+
+_MS = 1_000_000
+
+# Upper bounds of each lag range in EventLoopLagHistogram, in nanoseconds
+_LAG_BUCKET_BOUNDS = (1 * _MS, 5 * _MS, 10 * _MS, 50 * _MS, 100 * _MS, 500 * _MS)
+
+_MAX_STACK_FRAMES = 15
+
+
+def _no_source() -> None:
+    return None
+
+
+def _summarize_stack(frame: typing.Optional[typing.Any]) -> str:
+    if frame is None:
+        return ""
+    return ";".join(
+        f"{Path(summary.filename).name}:{summary.lineno}({summary.name})"
+        for summary in traceback.extract_stack(frame, limit=_MAX_STACK_FRAMES)
+    )
+
+
+class EventLoopMonitor:
+    """Measures event loop scheduling lag and catches callbacks that block it.
+
+    A task on the monitored loop wakes up every `sample_interval` seconds and
+    records how late it woke up in a histogram. A watchdog thread notices when
+    that task hasn't been able to run for `slow_callback_threshold` seconds,
+    and captures the stack of whatever the loop is running instead.
+
+    Each measurement is tagged with the current robot activity state and engine
+    command, as reported by `activity_source` and `command_id_source`.
+    """
+
+    LAG_METADATA_NAME: typing.Final[
+        typing.Literal["event_loop_lag_data"]
+    ] = "event_loop_lag_data"
+    SLOW_CALLBACK_METADATA_NAME: typing.Final[
+        typing.Literal["slow_callback_data"]
+    ] = "slow_callback_data"
+
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        activity_source: typing.Callable[
+            [], typing.Optional[RobotActivityState]
+        ] = _no_source,
+        command_id_source: typing.Callable[[], typing.Optional[str]] = _no_source,
+        sample_interval: float = 0.05,
+        slow_callback_threshold: float = 0.1,
+        histogram_window: float = 60.0,
+    ) -> None:
+        """Initializes the EventLoopMonitor without starting it."""
+        self._lag_store = MetricsStore[EventLoopLagHistogram](
+            MetricsMetadata(
+                name=self.LAG_METADATA_NAME,
+                storage_dir=storage_location,
+                headers=EventLoopLagHistogram.headers(),
+            ),
+            flush_interval=histogram_window,
+        )
+        self._slow_callback_store = MetricsStore[SlowCallbackData](
+            MetricsMetadata(
+                name=self.SLOW_CALLBACK_METADATA_NAME,
+                storage_dir=storage_location,
+                headers=SlowCallbackData.headers(),
+            ),
+            flush_interval=histogram_window,
+        )
+        self._should_track = should_track
+        self._activity_source = activity_source
+        self._command_id_source = command_id_source
+        self._sample_interval = sample_interval
+        self._slow_callback_threshold_ns = int(slow_callback_threshold * 1e9)
+        self._histogram_window_ns = int(histogram_window * 1e9)
+
+        self._sampler: typing.Optional["asyncio.Task[None]"] = None
+        self._watchdog: typing.Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop_thread_id: typing.Optional[int] = None
+        # Written by the sampler and read by the watchdog thread.
+        self._last_wakeup = 0
+        self._blocked_stack: typing.Tuple[int, str] = (0, "")
+
+        self._reset_window(state="", command_id="")
+
+        if self._should_track:
+            self._lag_store.setup()
+            self._slow_callback_store.setup()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop.
+
+        Must be called from a coroutine running in the loop to monitor.
+        """
+        if not self._should_track or self._sampler is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_wakeup = perf_counter_ns()
+        self._stopping.clear()
+        self._sampler = asyncio.get_running_loop().create_task(self._sample())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event loop watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring and store everything measured so far."""
+        if self._sampler is None:
+            return
+        self._stopping.set()
+        self._sampler.cancel()
+        try:
+            await self._sampler
+        except asyncio.CancelledError:
+            pass
+        self._sampler = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        self._close_window(perf_counter_ns())
+        self._lag_store.close()
+        self._slow_callback_store.close()
+
+    def store(self) -> None:
+        """Write measured data to storage."""
+        if not self._should_track:
+            return
+        self._lag_store.store()
+        self._slow_callback_store.store()
+
+    def _current_context(self) -> typing.Tuple[str, str]:
+        return self._activity_source() or "", self._command_id_source() or ""
+
+    async def _sample(self) -> None:
+        interval_ns = int(self._sample_interval * 1e9)
+        while True:
+            state, command_id = self._current_context()
+            wakeup = perf_counter_ns()
+            self._last_wakeup = wakeup
+            await asyncio.sleep(self._sample_interval)
+            now = perf_counter_ns()
+            lag = max(0, now - wakeup - interval_ns)
+            self._record_lag(now, lag, state, command_id)
+            if lag >= self._slow_callback_threshold_ns:
+                blocked_since, stack = self._blocked_stack
+                self._slow_callback_store.add(
+                    SlowCallbackData(
+                        func_start=_timing_function() - lag,
+                        duration=lag,
+                        state=state,
+                        command_id=command_id,
+                        stack=stack if blocked_since == wakeup else "",
+                    )
+                )
+
+    def _watch(self) -> None:
+        threshold_ns = self._slow_callback_threshold_ns
+        interval_ns = int(self._sample_interval * 1e9)
+        check_interval = threshold_ns / 2e9
+        while not self._stopping.wait(check_interval):
+            wakeup = self._last_wakeup
+            blocked_for = perf_counter_ns() - wakeup - interval_ns
+            if blocked_for >= threshold_ns and self._blocked_stack[0] != wakeup:
+                assert self._loop_thread_id is not None
+                frame = sys._current_frames().get(self._loop_thread_id)
+                self._blocked_stack = (wakeup, _summarize_stack(frame))
+
+    def _reset_window(self, state: str, command_id: str) -> None:
+        self._window_start = perf_counter_ns()
+        self._window_wall_start = _timing_function()
+        self._window_state = state
+        self._window_command_id = command_id
+        self._window_max_lag = 0
+        self._window_counts = [0] * (len(_LAG_BUCKET_BOUNDS) + 1)
+
+    def _close_window(self, now: int) -> None:
+        if sum(self._window_counts) > 0:
+            self._lag_store.add(
+                EventLoopLagHistogram(
+                    window_start=self._window_wall_start,
+                    window_duration=now - self._window_start,
+                    state=self._window_state,
+                    command_id=self._window_command_id,
+                    samples=sum(self._window_counts),
+                    max_lag=self._window_max_lag,
+                    lag_under_1ms=self._window_counts[0],
+                    lag_under_5ms=self._window_counts[1],
+                    lag_under_10ms=self._window_counts[2],
+                    lag_under_50ms=self._window_counts[3],
+                    lag_under_100ms=self._window_counts[4],
+                    lag_under_500ms=self._window_counts[5],
+                    lag_over_500ms=self._window_counts[6],
+                )
+            )
+
+    def _record_lag(self, now: int, lag: int, state: str, command_id: str) -> None:
+        window_elapsed = now - self._window_start >= self._histogram_window_ns
+        if (
+            window_elapsed
+            or state != self._window_state
+            or command_id != self._window_command_id
+        ):
+            self._close_window(now)
+            self._reset_window(state, command_id)
+        bucket = next(
+            (index for index, bound in enumerate(_LAG_BUCKET_BOUNDS) if lag < bound),
+            len(_LAG_BUCKET_BOUNDS),
+        )
+        self._window_counts[bucket] += 1
+        self._window_max_lag = max(self._window_max_lag, lag)
@@ -1,10 +1,11 @@
-"""Interface for storing performance metrics data to a CSV file."""
+"""Interface for storing performance metrics data to a file."""
 
-import csv
+import threading
 import typing
 import logging
 from ._data_shapes import MetricsMetadata, CSVStorageBase
 from ._logging_config import LOGGER_NAME
+from ._storage_backends import CSVStorageBackend, StorageBackend
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -14,18 +15,38 @@ T = typing.TypeVar("T", bound=CSVStorageBase)
 class MetricsStore(typing.Generic[T]):
     """Dataclass to store data for tracking robot activity."""
 
-    def __init__(self, metadata: MetricsMetadata) -> None:
-        """Initialize the metrics store."""
+    def __init__(
+        self,
+        metadata: MetricsMetadata,
+        backend: typing.Optional[StorageBackend] = None,
+        flush_interval: typing.Optional[float] = None,
+    ) -> None:
+        """Initialize the metrics store.
+
+        Args:
+            metadata: What is being stored, and where.
+            backend: How to write the data. Defaults to appending to a CSV file.
+            flush_interval: If set, store() is called from a background thread
+                this often, in seconds, between setup() and close().
+        """
         self.metadata = metadata
+        self._backend = backend if backend is not None else CSVStorageBackend()
+        self._flush_interval = flush_interval
         self._data_store: typing.List[T] = []
+        self._data_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop_flushing = threading.Event()
+        self._flusher: typing.Optional[threading.Thread] = None
 
     def add(self, data: T) -> None:
         """Add data to the store."""
-        self._data_store.append(data)
+        with self._data_lock:
+            self._data_store.append(data)
 
     def add_all(self, data: typing.Iterable[T]) -> None:
         """Add data to the store."""
-        self._data_store.extend(data)
+        with self._data_lock:
+            self._data_store.extend(data)
 
     def setup(self) -> None:
         """Set up the data store."""
@@ -33,18 +54,41 @@ class MetricsStore(typing.Generic[T]):
             f"Setting up metrics store for {self.metadata.name} at {self.metadata.storage_dir}"
         )
         self.metadata.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata.data_file_location.touch(exist_ok=True)
         self.metadata.headers_file_location.touch(exist_ok=True)
         self.metadata.headers_file_location.write_text(",".join(self.metadata.headers))
+        self._backend.setup(self.metadata)
+        if self._flush_interval is not None and self._flusher is None:
+            self._stop_flushing.clear()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name=f"{self.metadata.name} flusher",
+                daemon=True,
+            )
+            self._flusher.start()
 
     def store(self) -> None:
-        """Clear the stored data and write it to the storage file."""
-        stored_data = self._data_store.copy()
-        self._data_store.clear()
+        """Clear the stored data and write it to storage."""
+        with self._data_lock:
+            stored_data = self._data_store
+            self._data_store = []
+        if not stored_data:
+            return
         rows_to_write = [activity_data.csv_row() for activity_data in stored_data]
-        with open(self.metadata.data_file_location, "a") as storage_file:
-            logger.debug(
-                f"Writing {len(rows_to_write)} rows to {self.metadata.data_file_location}"
-            )
-            writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
-            writer.writerows(rows_to_write)
+        with self._write_lock:
+            self._backend.write(rows_to_write)
+
+    def close(self) -> None:
+        """Stop flushing in the background and store any remaining data."""
+        if self._flusher is not None:
+            self._stop_flushing.set()
+            self._flusher.join()
+            self._flusher = None
+        self.store()
+
+    def _flush_periodically(self) -> None:
+        assert self._flush_interval is not None
+        while not self._stop_flushing.wait(self._flush_interval):
+            try:
+                self.store()
+            except Exception:
+                logger.exception(f"Failed to store {self.metadata.name}")
@@ -1,5 +1,6 @@
 """Module for tracking robot activity and execution duration for different operations."""
 
+import contextlib
 import inspect
 from pathlib import Path
 
@@ -9,6 +10,12 @@ import typing
 
 from ._metrics_store import MetricsStore
 from ._data_shapes import RawActivityData, MetricsMetadata
+from ._sampling_profiler import (
+    SamplingProfiler,
+    SamplingProfilerConfiguration,
+    is_valid_profile_id,
+    read_profile,
+)
 from ._types import SupportsTracking, RobotActivityState
 from ._util import get_timing_function
 
@@ -29,8 +36,22 @@ class RobotActivityTracker(SupportsTracking):
         typing.Literal["robot_activity_data"]
     ] = "robot_activity_data"
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
-        """Initializes the RobotActivityTracker with an empty storage list."""
+    PROFILES_DIRECTORY_NAME: typing.Final[typing.Literal["profiles"]] = "profiles"
+
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        profiler_config: typing.Optional[SamplingProfilerConfiguration] = None,
+    ) -> None:
+        """Initializes the RobotActivityTracker with an empty storage list.
+
+        Args:
+            storage_location: Where to store tracked data.
+            should_track: Whether to track anything.
+            profiler_config: How to profile tracked functions that identify a
+                profile. Read from the environment by default.
+        """
         self._store = MetricsStore[RawActivityData](
             MetricsMetadata(
                 name=self.METADATA_NAME,
@@ -39,13 +60,55 @@ class RobotActivityTracker(SupportsTracking):
             )
         )
         self._should_track = should_track
+        self._active_states: typing.List[RobotActivityState] = []
+        self._profiles_dir = storage_location / self.PROFILES_DIRECTORY_NAME
+        self._profiler: typing.Optional[SamplingProfiler] = None
 
         if self._should_track:
             self._store.setup()
+            if profiler_config is None:
+                profiler_config = SamplingProfilerConfiguration.from_env()
+            if profiler_config.enabled:
+                self._profiler = SamplingProfiler.from_config(
+                    self._profiles_dir, profiler_config
+                )
+
+    @property
+    def current_state(self) -> typing.Optional[RobotActivityState]:
+        """The state of the innermost tracked function that is running, if any."""
+        try:
+            return self._active_states[-1]
+        except IndexError:
+            return None
+
+    def get_profile(self, profile_id: str) -> typing.Optional[str]:
+        """Get the stored profile of a tracked function call, in the collapsed stack format."""
+        if not self._should_track:
+            return None
+        return read_profile(self._profiles_dir, profile_id)
+
+    def _profile_call(
+        self,
+        signature: typing.Optional[inspect.Signature],
+        profile_id_arg: typing.Optional[str],
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.ContextManager[None]:
+        if self._profiler is None or signature is None or profile_id_arg is None:
+            return contextlib.nullcontext()
+        try:
+            profile_id = signature.bind(*args, **kwargs).arguments.get(profile_id_arg)
+        except TypeError:
+            # Let the call itself raise the error.
+            return contextlib.nullcontext()
+        if not isinstance(profile_id, str) or not is_valid_profile_id(profile_id):
+            return contextlib.nullcontext()
+        return self._profiler.profile(profile_id)
 
     def track(
         self,
         state: RobotActivityState,
+        profile_id_arg: typing.Optional[str] = None,
     ) -> typing.Callable[
         [_UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]],
         _UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn],
@@ -57,6 +120,9 @@ class RobotActivityTracker(SupportsTracking):
         Args:
             func_to_track: The function to track.
             state: The state of the robot activity during the function execution.
+            profile_id_arg: The name of the function's argument that identifies
+                each call, such as "analysis_id". If given and profiling is
+                enabled, each call is profiled and stored under that ID.
             *args: The arguments to pass to the function.
             **kwargs: The keyword arguments to pass to the function.
 
@@ -75,6 +141,12 @@ class RobotActivityTracker(SupportsTracking):
             if not self._should_track:
                 return func_to_track
 
+            signature = (
+                inspect.signature(func_to_track)
+                if self._profiler is not None and profile_id_arg is not None
+                else None
+            )
+
             if inspect.iscoroutinefunction(func_to_track):
 
                 @wraps(func_to_track)
@@ -84,10 +156,15 @@ class RobotActivityTracker(SupportsTracking):
                 ) -> _UnderlyingFunctionReturn:
                     function_start_time = _timing_function()
                     duration_start_time = perf_counter_ns()
+                    self._active_states.append(state)
                     try:
-                        result = await func_to_track(*args, **kwargs)
+                        with self._profile_call(
+                            signature, profile_id_arg, args, kwargs
+                        ):
+                            result = await func_to_track(*args, **kwargs)
                     finally:
                         duration_end_time = perf_counter_ns()
+                        self._active_states.remove(state)
 
                         self._store.add(
                             RawActivityData(
@@ -109,11 +186,15 @@ class RobotActivityTracker(SupportsTracking):
                 ) -> _UnderlyingFunctionReturn:
                     function_start_time = _timing_function()
                     duration_start_time = perf_counter_ns()
-
+                    self._active_states.append(state)
                     try:
-                        result = func_to_track(*args, **kwargs)
+                        with self._profile_call(
+                            signature, profile_id_arg, args, kwargs
+                        ):
+                            result = func_to_track(*args, **kwargs)
                     finally:
                         duration_end_time = perf_counter_ns()
+                        self._active_states.remove(state)
 
                         self._store.add(
                             RawActivityData(
@@ -0,0 +1,285 @@
+"""Module for statistical profiling of everything a process does during an operation."""
+
+import contextlib
+import dataclasses
+import logging
+import os
+import re
+import sys
+import threading
+import typing
+from pathlib import Path
+from types import CodeType, FrameType
+
+from ._logging_config import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+_ENV_VAR_PREFIX: typing.Final[str] = "OT_PERFORMANCE_METRICS_PROFILER"
+
+PROFILER_ENABLED_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_ENABLED"
+SAMPLE_INTERVAL_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_SAMPLE_INTERVAL"
+MAX_STACKS_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_MAX_STACKS"
+MAX_PROFILES_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_MAX_PROFILES"
+
+# Profile IDs become file names, so they must not be able to name other paths.
+_PROFILE_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+_TRUNCATED_FRAME = "[truncated]"
+_OTHER_STACKS = "[other stacks]"
+
+Stack = typing.Tuple[str, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class SamplingProfilerConfiguration:
+    """Settings for the sampling profiler.
+
+    Attributes:
+    - enabled (bool): Whether to profile at all.
+    - sample_interval (float): Seconds between samples of every thread's stack.
+    - max_stacks (int): The number of distinct stacks to count per profile.
+      Samples of any further stacks are counted together as "[other stacks]".
+    - max_profiles (int): The number of finished profiles to keep on disk.
+    """
+
+    enabled: bool = False
+    sample_interval: float = 0.01
+    max_stacks: int = 5000
+    max_profiles: int = 20
+
+    @classmethod
+    def from_env(cls) -> "SamplingProfilerConfiguration":
+        """Create a configuration from environment variables.
+
+        Invalid values are logged and replaced with defaults, so that a typo
+        can't stop the server from starting.
+        """
+        kwargs: typing.Dict[str, typing.Any] = {}
+        parsers: typing.List[
+            typing.Tuple[str, str, typing.Callable[[str], typing.Any]]
+        ] = [
+            (PROFILER_ENABLED_ENV_VAR_NAME, "enabled", _parse_bool),
+            (SAMPLE_INTERVAL_ENV_VAR_NAME, "sample_interval", _parse_positive_float),
+            (MAX_STACKS_ENV_VAR_NAME, "max_stacks", _parse_positive_int),
+            (MAX_PROFILES_ENV_VAR_NAME, "max_profiles", _parse_positive_int),
+        ]
+        for env_var_name, field_name, parse in parsers:
+            if (value := os.environ.get(env_var_name)) is None:
+                continue
+            try:
+                kwargs[field_name] = parse(value)
+            except ValueError:
+                logger.warning(
+                    f"Ignoring invalid {env_var_name} environment variable: {value}"
+                )
+        return cls(**kwargs)
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() not in ("true", "false"):
+        raise ValueError(value)
+    return value.lower() == "true"
+
+
+def _parse_positive_float(value: str) -> float:
+    parsed = float(value)
+    if parsed <= 0:
+        raise ValueError(value)
+    return parsed
+
+
+def _parse_positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed <= 0:
+        raise ValueError(value)
+    return parsed
+
+
+def is_valid_profile_id(profile_id: str) -> bool:
+    """Whether profile_id can be used to store and look up a profile."""
+    return _PROFILE_ID_PATTERN.fullmatch(profile_id) is not None
+
+
+class _Profile:
+    """Sample counts for one profiled operation."""
+
+    def __init__(self, max_stacks: int) -> None:
+        self.counts: typing.Dict[Stack, int] = {}
+        self.other_stacks = 0
+        self.depth = 1
+        self._max_stacks = max_stacks
+
+    def add(self, stack: Stack) -> None:
+        if stack in self.counts:
+            self.counts[stack] += 1
+        elif len(self.counts) < self._max_stacks:
+            self.counts[stack] = 1
+        else:
+            self.other_stacks += 1
+
+    def collapsed(self) -> str:
+        lines = [
+            f"{';'.join(stack)} {count}"
+            for stack, count in sorted(
+                self.counts.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
+        if self.other_stacks:
+            lines.append(f"{_OTHER_STACKS} {self.other_stacks}")
+        return "".join(f"{line}\n" for line in lines)
+
+
+class SamplingProfiler:
+    """Samples the stack of every thread while any profile is running.
+
+    A single background thread wakes up every `sample_interval` seconds and
+    counts each thread's current stack in every running profile. When a
+    profile stops, it is written to `<storage_dir>/<profile_id>.folded` in the
+    collapsed stack format read by flamegraph.pl, speedscope and similar tools.
+    """
+
+    FILE_SUFFIX: typing.Final[typing.Literal[".folded"]] = ".folded"
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        sample_interval: float = 0.01,
+        max_stacks: int = 5000,
+        max_profiles: int = 20,
+        max_depth: int = 64,
+    ) -> None:
+        """Initialize the profiler without starting any profiles."""
+        self._storage_dir = storage_dir
+        self._sample_interval = sample_interval
+        self._max_stacks = max_stacks
+        self._max_profiles = max_profiles
+        self._max_depth = max_depth
+        self._profiles: typing.Dict[str, _Profile] = {}
+        self._lock = threading.Lock()
+        self._sampler_stopping: typing.Optional[threading.Event] = None
+        self._frame_labels: typing.Dict[CodeType, str] = {}
+
+    @classmethod
+    def from_config(
+        cls, storage_dir: Path, config: SamplingProfilerConfiguration
+    ) -> "SamplingProfiler":
+        """Create a profiler with the given configuration."""
+        return cls(
+            storage_dir,
+            sample_interval=config.sample_interval,
+            max_stacks=config.max_stacks,
+            max_profiles=config.max_profiles,
+        )
+
+    def start(self, profile_id: str) -> None:
+        """Start profiling, if this profile isn't already running.
+
+        Raises:
+            ValueError: If profile_id is not valid.
+        """
+        if not is_valid_profile_id(profile_id):
+            raise ValueError(f"Invalid profile ID: {profile_id!r}")
+        with self._lock:
+            if profile_id in self._profiles:
+                self._profiles[profile_id].depth += 1
+                return
+            self._profiles[profile_id] = _Profile(self._max_stacks)
+            if self._sampler_stopping is None:
+                self._sampler_stopping = threading.Event()
+                threading.Thread(
+                    target=self._sample,
+                    args=(self._sampler_stopping,),
+                    name="sampling profiler",
+                    daemon=True,
+                ).start()
+
+    def stop(self, profile_id: str) -> None:
+        """Stop profiling once every start of this profile has been stopped, and store it."""
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is None:
+                return
+            profile.depth -= 1
+            if profile.depth > 0:
+                return
+            del self._profiles[profile_id]
+            if not self._profiles and self._sampler_stopping is not None:
+                self._sampler_stopping.set()
+                self._sampler_stopping = None
+        try:
+            self._write(profile_id, profile.collapsed())
+        except OSError:
+            logger.exception(f"Failed to store profile {profile_id}")
+
+    @contextlib.contextmanager
+    def profile(self, profile_id: str) -> typing.Iterator[None]:
+        """Profile the code run inside this context."""
+        self.start(profile_id)
+        try:
+            yield
+        finally:
+            self.stop(profile_id)
+
+    def get(self, profile_id: str) -> typing.Optional[str]:
+        """Get a stored profile in the collapsed stack format, if there is one."""
+        return read_profile(self._storage_dir, profile_id)
+
+    def _write(self, profile_id: str, collapsed: str) -> None:
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self._storage_dir / f"{profile_id}{self.FILE_SUFFIX}"
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(collapsed)
+        os.replace(temporary_path, path)
+        stored = sorted(
+            self._storage_dir.glob(f"*{self.FILE_SUFFIX}"),
+            key=lambda stored_path: stored_path.stat().st_mtime,
+        )
+        for old_path in stored[: -self._max_profiles]:
+            old_path.unlink(missing_ok=True)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._frame_labels.get(code)
+        if label is None:
+            label = (
+                f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            )
+            self._frame_labels[code] = label
+        return label
+
+    def _stack(self, thread_name: str, frame: typing.Optional[FrameType]) -> Stack:
+        labels: typing.List[str] = []
+        while frame is not None and len(labels) < self._max_depth:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        if frame is not None:
+            labels.append(_TRUNCATED_FRAME)
+        labels.append(thread_name)
+        labels.reverse()
+        return tuple(labels)
+
+    def _sample(self, stopping: threading.Event) -> None:
+        own_id = threading.get_ident()
+        while not stopping.wait(self._sample_interval):
+            thread_names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+            stacks = [
+                self._stack(thread_names.get(thread_id, str(thread_id)), frame)
+                for thread_id, frame in sys._current_frames().items()
+                if thread_id != own_id
+            ]
+            with self._lock:
+                for profile in self._profiles.values():
+                    for stack in stacks:
+                        profile.add(stack)
+
+
+def read_profile(storage_dir: Path, profile_id: str) -> typing.Optional[str]:
+    """Read a profile stored by a SamplingProfiler, if there is one."""
+    if not is_valid_profile_id(profile_id):
+        return None
+    try:
+        return (storage_dir / f"{profile_id}{SamplingProfiler.FILE_SUFFIX}").read_text()
+    except FileNotFoundError:
+        return None
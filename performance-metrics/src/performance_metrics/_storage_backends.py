@@ -0,0 +1,310 @@
+"""Backends that MetricsStore uses to write performance metrics data to disk."""
+
+import csv
+import logging
+import os
+import struct
+import time
+import typing
+from pathlib import Path
+
+from ._data_shapes import MetricsMetadata
+from ._logging_config import LOGGER_NAME
+from ._types import StorableData
+
+logger = logging.getLogger(LOGGER_NAME)
+
+Row = typing.Tuple[StorableData, ...]
+
+
+class StorageBackend(typing.Protocol):
+    """Writes rows of metrics data for a single MetricsStore."""
+
+    def setup(self, metadata: MetricsMetadata) -> None:
+        """Prepare to write the data described by metadata."""
+        ...
+
+    def write(self, rows: typing.Sequence[Row]) -> None:
+        """Write rows after any previously written rows."""
+        ...
+
+
+class CSVStorageBackend:
+    """Appends rows to a single, unbounded CSV file."""
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._file_location: typing.Optional[Path] = None
+
+    def setup(self, metadata: MetricsMetadata) -> None:
+        """Create the CSV file if it doesn't exist."""
+        self._file_location = metadata.data_file_location
+        self._file_location.touch(exist_ok=True)
+
+    def write(self, rows: typing.Sequence[Row]) -> None:
+        """Append rows to the CSV file."""
+        assert self._file_location is not None, "setup() must be called first"
+        with open(self._file_location, "a") as storage_file:
+            logger.debug(f"Writing {len(rows)} rows to {self._file_location}")
+            writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
+            writer.writerows(rows)
+
+
+# Binary file layout:
+#
+# A file starts with _MAGIC and is followed by blocks. The first block holds a
+# single row with the column headers. Each block after it holds the rows from
+# one write. A block is a _BLOCK_HEADER (payload size, row count and column
+# count) followed by a payload of:
+#
+# - One struct format character per column: "q" for int64, "d" for float64,
+#   or "I" for a uint32 index into the block's string table.
+# - The string table: a uint32 count, then each string as a uint32 length
+#   and that many bytes of UTF-8. Each distinct string is only stored once.
+# - The rows, packed back to back in that little-endian struct format.
+#
+# Since rows are fixed size, a whole block is unpacked with one iter_unpack.
+# Blocks are only ever appended, so a reader can always parse a file up to
+# a partially written block at the end, and stops there.
+_MAGIC = b"OTPMBIN1"
+_BLOCK_HEADER = struct.Struct("<III")
+_UINT32 = struct.Struct("<I")
+_STRING_COLUMN = "I"
+
+BINARY_FILE_SUFFIX: typing.Final = ".bin"
+
+
+def _column_format(column: typing.Sequence[StorableData]) -> str:
+    kinds = set(map(type, column))
+    if str in kinds:
+        return _STRING_COLUMN
+    elif float in kinds:
+        return "d"
+    else:
+        return "q"
+
+
+def _encode_block(rows: typing.Sequence[Row]) -> bytes:
+    columns: typing.List[typing.Sequence[StorableData]] = list(zip(*rows))
+    formats = [_column_format(column) for column in columns]
+    strings: typing.Dict[str, int] = {}
+    for index, column_format in enumerate(formats):
+        if column_format == _STRING_COLUMN:
+            columns[index] = [
+                strings.setdefault(str(value), len(strings)) for value in columns[index]
+            ]
+    row_struct = struct.Struct("<" + "".join(formats))
+    parts = [
+        "".join(formats).encode("ascii"),
+        _UINT32.pack(len(strings)),
+    ]
+    for string in strings:
+        encoded = string.encode("utf-8")
+        parts.append(_UINT32.pack(len(encoded)))
+        parts.append(encoded)
+    parts.extend(row_struct.pack(*row) for row in zip(*columns))
+    payload = b"".join(parts)
+    return _BLOCK_HEADER.pack(len(payload), len(rows), len(formats)) + payload
+
+
+def _decode_block(
+    data: bytes, start: int, row_count: int, column_count: int
+) -> typing.List[Row]:
+    formats = data[start : start + column_count].decode("ascii")
+    position = start + column_count
+    (string_count,) = _UINT32.unpack_from(data, position)
+    position += _UINT32.size
+    strings: typing.List[str] = []
+    for _ in range(string_count):
+        (length,) = _UINT32.unpack_from(data, position)
+        position += _UINT32.size
+        strings.append(data[position : position + length].decode("utf-8"))
+        position += length
+    row_struct = struct.Struct("<" + formats)
+    rows_end = position + row_struct.size * row_count
+    rows: typing.List[Row] = list(row_struct.iter_unpack(data[position:rows_end]))
+    if _STRING_COLUMN in formats:
+        columns: typing.List[typing.Sequence[StorableData]] = list(zip(*rows))
+        for index, column_format in enumerate(formats):
+            if column_format == _STRING_COLUMN:
+                columns[index] = [
+                    strings[typing.cast(int, value)] for value in columns[index]
+                ]
+        rows = list(zip(*columns))
+    return rows
+
+
+def _read_headers(path: Path) -> typing.Optional[typing.Tuple[str, ...]]:
+    try:
+        with open(path, "rb") as binary_file:
+            start = binary_file.read(len(_MAGIC) + _BLOCK_HEADER.size)
+            if not start.startswith(_MAGIC):
+                return None
+            payload_size, row_count, column_count = _BLOCK_HEADER.unpack_from(
+                start, len(_MAGIC)
+            )
+            payload = binary_file.read(payload_size)
+            if row_count != 1 or len(payload) < payload_size:
+                return None
+            headers = _decode_block(payload, 0, row_count, column_count)[0]
+            return typing.cast(typing.Tuple[str, ...], headers)
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def _complete_blocks_size(path: Path) -> int:
+    """Get the size of a file up to the end of its last completely written block."""
+    file_size = path.stat().st_size
+    with open(path, "rb") as binary_file:
+        position = len(_MAGIC)
+        while position + _BLOCK_HEADER.size <= file_size:
+            binary_file.seek(position)
+            payload_size, _, _ = _BLOCK_HEADER.unpack(
+                binary_file.read(_BLOCK_HEADER.size)
+            )
+            block_end = position + _BLOCK_HEADER.size + payload_size
+            if block_end > file_size:
+                break
+            position = block_end
+    return position
+
+
+def read_binary_file(
+    path: Path,
+) -> typing.Tuple[typing.Tuple[str, ...], typing.List[Row]]:
+    """Read a file written by RotatingBinaryStorageBackend.
+
+    Returns:
+        The column headers and every completely written row in the file.
+    """
+    data = path.read_bytes()
+    if not data.startswith(_MAGIC):
+        raise ValueError(f"{path} is not a performance metrics binary file")
+    headers: typing.Optional[typing.Tuple[str, ...]] = None
+    rows: typing.List[Row] = []
+    position = len(_MAGIC)
+    while position + _BLOCK_HEADER.size <= len(data):
+        payload_size, row_count, column_count = _BLOCK_HEADER.unpack_from(
+            data, position
+        )
+        payload_start = position + _BLOCK_HEADER.size
+        position = payload_start + payload_size
+        if position > len(data):
+            logger.warning(f"Ignoring a partially written block at the end of {path}")
+            break
+        block = _decode_block(data, payload_start, row_count, column_count)
+        if headers is None:
+            headers = typing.cast(typing.Tuple[str, ...], block[0])
+        else:
+            rows.extend(block)
+    return headers or (), rows
+
+
+def binary_files(storage_dir: Path, name: str) -> typing.List[Path]:
+    """Get the binary files holding the data called `name`, oldest first."""
+    rotated = {
+        int(path.suffixes[-2][1:]): path
+        for path in storage_dir.glob(f"{name}.*{BINARY_FILE_SUFFIX}")
+        if len(path.suffixes) >= 2 and path.suffixes[-2][1:].isdigit()
+    }
+    files = [rotated[index] for index in sorted(rotated, reverse=True)]
+    current = storage_dir / f"{name}{BINARY_FILE_SUFFIX}"
+    if current.exists():
+        files.append(current)
+    return files
+
+
+class RotatingBinaryStorageBackend:
+    """Appends rows to a compact binary file, rotating it when it gets too big or old.
+
+    The current file is `<name>.bin`. When it is rotated it becomes `<name>.1.bin`,
+    the previous `<name>.1.bin` becomes `<name>.2.bin`, and so on, keeping at most
+    `max_files` files in total.
+    """
+
+    def __init__(
+        self,
+        max_file_size: int = 4 * 1024 * 1024,
+        max_file_age: float = 24 * 60 * 60,
+        max_files: int = 5,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_file_size: The size in bytes after which the file is rotated.
+            max_file_age: The time in seconds after which the file is rotated,
+                counted from when this backend started writing to it.
+            max_files: The number of files to keep, including the current one.
+        """
+        self._max_file_size = max_file_size
+        self._max_file_age = max_file_age
+        self._max_files = max_files
+        self._storage_dir: typing.Optional[Path] = None
+        self._name = ""
+        self._headers: typing.Tuple[str, ...] = ()
+        self._file_size = 0
+        self._empty_file_size = 0
+        self._file_started_at = 0.0
+
+    @property
+    def _file_location(self) -> Path:
+        assert self._storage_dir is not None, "setup() must be called first"
+        return self._storage_dir / f"{self._name}{BINARY_FILE_SUFFIX}"
+
+    def _rotated_location(self, index: int) -> Path:
+        assert self._storage_dir is not None, "setup() must be called first"
+        return self._storage_dir / f"{self._name}.{index}{BINARY_FILE_SUFFIX}"
+
+    def setup(self, metadata: MetricsMetadata) -> None:
+        """Start a new file unless there is one with the same headers to append to."""
+        self._storage_dir = metadata.storage_dir
+        self._name = metadata.name
+        self._headers = metadata.headers
+        self._empty_file_size = len(_MAGIC) + len(_encode_block([self._headers]))
+        self._file_started_at = time.monotonic()
+        if _read_headers(self._file_location) == self._headers:
+            # A crash may have left a partially written block at the end. Rows
+            # appended after it would be read as part of it, so cut it off first.
+            self._file_size = _complete_blocks_size(self._file_location)
+            if self._file_size < self._file_location.stat().st_size:
+                logger.warning(
+                    f"Removing a partially written block at the end of {self._file_location}"
+                )
+                os.truncate(self._file_location, self._file_size)
+        else:
+            self._rotate()
+
+    def write(self, rows: typing.Sequence[Row]) -> None:
+        """Append rows to the current file, rotating it first if it is due."""
+        if not rows:
+            return
+        if self._file_size > self._empty_file_size and (
+            self._file_size >= self._max_file_size
+            or time.monotonic() - self._file_started_at >= self._max_file_age
+        ):
+            self._rotate()
+        self._append(_encode_block(rows))
+        logger.debug(f"Wrote {len(rows)} rows to {self._file_location}")
+
+    def _append(self, data: bytes) -> None:
+        with open(self._file_location, "ab") as storage_file:
+            storage_file.write(data)
+        self._file_size += len(data)
+
+    def _rotate(self) -> None:
+        if self._file_location.exists():
+            if self._max_files > 1:
+                for index in range(self._max_files - 1, 0, -1):
+                    source = (
+                        self._rotated_location(index - 1)
+                        if index > 1
+                        else self._file_location
+                    )
+                    if source.exists():
+                        os.replace(source, self._rotated_location(index))
+            else:
+                self._file_location.unlink()
+        self._file_location.write_bytes(_MAGIC)
+        self._file_size = len(_MAGIC)
+        self._file_started_at = time.monotonic()
+        self._append(_encode_block([self._headers]))
@@ -0,0 +1,322 @@
+"""Module for tracing where time goes within an operation, as nested spans.
+
+Spans are written to a file in the Chrome trace event format, which can be
+opened in https://ui.perfetto.dev or chrome://tracing.
+"""
+
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import typing
+from pathlib import Path
+from types import TracebackType
+
+from ._logging_config import LOGGER_NAME
+from ._util import get_timing_function
+
+_timing_function = get_timing_function()
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# The Chrome trace event format allows leaving the array unterminated, so events
+# can be appended to the file as they come in.
+_TRACE_START = "[\n"
+
+SpanArgs = typing.Dict[str, typing.Union[int, float, str]]
+
+
+class _SpanContext:
+    """The currently open span in a context, as seen by spans opened inside it."""
+
+    __slots__ = ("track", "open_children")
+
+    def __init__(self, track: int) -> None:
+        self.track = track
+        self.open_children = 0
+
+
+_current_span: contextvars.ContextVar[
+    typing.Optional[_SpanContext]
+] = contextvars.ContextVar("performance_metrics_current_span", default=None)
+
+_active_tracer: typing.Optional["SpanTracer"] = None
+
+
+class _NoopSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[TracebackType],
+    ) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = (
+        "_tracer",
+        "_name",
+        "_args",
+        "_start",
+        "_parent",
+        "_context",
+        "_token",
+        "_owns_track",
+    )
+
+    def __init__(self, tracer: "SpanTracer", name: str, args: SpanArgs) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+
+    def __enter__(self) -> None:
+        parent = _current_span.get()
+        if parent is not None and parent.open_children == 0:
+            track = parent.track
+            self._owns_track = False
+        else:
+            # Spans without a parent, and spans running concurrently with a
+            # sibling, each get a track to themselves so that spans on a track
+            # nest. They give it back when they end.
+            track = self._tracer.acquire_track()
+            self._owns_track = True
+        if parent is not None:
+            parent.open_children += 1
+        self._parent = parent
+        self._context = _SpanContext(track)
+        self._token = _current_span.set(self._context)
+        self._start = _timing_function()
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[TracebackType],
+    ) -> None:
+        end = _timing_function()
+        _current_span.reset(self._token)
+        if self._parent is not None:
+            self._parent.open_children -= 1
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.add(self._name, self._start, end, self._context.track, self._args)
+        if self._owns_track:
+            self._tracer.release_track(self._context.track)
+
+
+def is_tracing() -> bool:
+    """Return whether spans from trace_span are being recorded."""
+    return _active_tracer is not None
+
+
+def trace_span(
+    name: str, **args: typing.Union[int, float, str]
+) -> typing.ContextManager[None]:
+    """Trace the time spent in a block of code, as a span nested in the current span.
+
+    This does nothing unless a SpanTracer is installed, so it is cheap enough to
+    leave in code that runs often. Keep `args` cheap to compute for the same reason,
+    or only compute them if `is_tracing()`.
+
+    Args:
+        name: The name of the span.
+        args: Extra information to show for the span.
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return _Span(tracer, name, args)
+
+
+class SpanTracer:
+    """Collects spans from trace_span and writes them to a trace file.
+
+    Spans are written from a background thread, so code being traced, like the
+    event loop, never waits on the file. The current file is `span_trace.json`.
+    When it gets too big it becomes `span_trace.1.json`, the previous
+    `span_trace.1.json` becomes `span_trace.2.json`, and so on, keeping at most
+    `max_files` files in total.
+    """
+
+    FILE_NAME: typing.Final[typing.Literal["span_trace.json"]] = "span_trace.json"
+
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        flush_every: int = 10_000,
+        flush_interval: float = 1.0,
+        max_file_size: int = 4 * 1024 * 1024,
+        max_files: int = 5,
+    ) -> None:
+        """Initialize the SpanTracer without installing it.
+
+        Args:
+            storage_location: The directory to write the trace files to.
+            should_track: Whether to collect spans at all.
+            flush_every: The number of collected spans after which they are
+                written out without waiting for `flush_interval`.
+            flush_interval: How often, in seconds, collected spans are written
+                out while the tracer is installed.
+            max_file_size: The size in bytes after which the file is rotated.
+            max_files: The number of files to keep, including the current one.
+        """
+        self._file_location = storage_location / self.FILE_NAME
+        self._should_track = should_track
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._max_file_size = max_file_size
+        self._max_files = max_files
+        self._pid = os.getpid()
+        self._tracks = itertools.count(1)
+        self._free_tracks: typing.List[int] = []
+        self._track_names: typing.List[typing.Dict[str, typing.Any]] = []
+        self._events: typing.List[typing.Dict[str, typing.Any]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._file_size = 0
+        self._tracks_in_file = 0
+        self._flush_requested = threading.Event()
+        self._stop_flushing = threading.Event()
+        self._flusher: typing.Optional[threading.Thread] = None
+
+        if self._should_track:
+            storage_location.mkdir(parents=True, exist_ok=True)
+            self._rotate()
+
+    def install(self) -> None:
+        """Start collecting spans, from every thread."""
+        global _active_tracer
+        if not self._should_track:
+            return
+        _active_tracer = self
+        if self._flusher is None:
+            self._stop_flushing.clear()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="span tracer flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def uninstall(self) -> None:
+        """Stop collecting spans and store everything collected so far."""
+        global _active_tracer
+        if _active_tracer is self:
+            _active_tracer = None
+        if self._flusher is not None:
+            self._stop_flushing.set()
+            self._flush_requested.set()
+            self._flusher.join()
+            self._flusher = None
+        self.store()
+
+    def acquire_track(self) -> int:
+        """Get a track to show spans on that no open span is using.
+
+        Tracks are reused once released, lowest first, so the number of tracks
+        only grows with how many spans are ever open at once.
+        """
+        with self._lock:
+            if self._free_tracks:
+                return heapq.heappop(self._free_tracks)
+            track = next(self._tracks)
+            self._track_names.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": track,
+                    "args": {"name": f"Spans #{track}"},
+                }
+            )
+        return track
+
+    def release_track(self, track: int) -> None:
+        """Give back a track from `acquire_track()` once its spans have ended."""
+        with self._lock:
+            heapq.heappush(self._free_tracks, track)
+
+    def add(self, name: str, start: int, end: int, track: int, args: SpanArgs) -> None:
+        """Add a finished span, with start and end times in nanoseconds."""
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": (end - start) / 1000,
+            "pid": self._pid,
+            "tid": track,
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+            should_store = len(self._events) >= self._flush_every
+        if should_store:
+            self._flush_requested.set()
+
+    def store(self) -> None:
+        """Append collected spans to the trace file, rotating it first if it is due."""
+        if not self._should_track:
+            return
+        with self._lock:
+            events = self._events
+            self._events = []
+            track_names = list(self._track_names)
+        if not events:
+            return
+        with self._write_lock:
+            has_events = self._file_size > len(_TRACE_START)
+            if has_events and self._file_size >= self._max_file_size:
+                self._rotate()
+            # Every file names the tracks it shows spans on, so that each file
+            # can be opened on its own.
+            to_write = track_names[self._tracks_in_file :] + events
+            self._tracks_in_file = len(track_names)
+            self._append("".join(json.dumps(event) + ",\n" for event in to_write))
+
+    def _rotated_location(self, index: int) -> Path:
+        return self._file_location.with_name(
+            f"{self._file_location.stem}.{index}{self._file_location.suffix}"
+        )
+
+    def _append(self, text: str) -> None:
+        with open(self._file_location, "a") as trace_file:
+            trace_file.write(text)
+        self._file_size += len(text)
+
+    def _rotate(self) -> None:
+        if self._file_location.exists():
+            if self._max_files > 1:
+                for index in range(self._max_files - 1, 0, -1):
+                    source = (
+                        self._rotated_location(index - 1)
+                        if index > 1
+                        else self._file_location
+                    )
+                    if source.exists():
+                        os.replace(source, self._rotated_location(index))
+            else:
+                self._file_location.unlink()
+        self._file_location.write_text(_TRACE_START)
+        self._file_size = len(_TRACE_START)
+        self._tracks_in_file = 0
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.is_set():
+            self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
+            if self._stop_flushing.is_set():
+                # uninstall() stores what is left once this thread is done.
+                return
+            try:
+                self.store()
+            except Exception:
+                logger.exception("Failed to store spans")
@@ -27,14 +27,28 @@ class SupportsTracking(typing.Protocol):
         """Initialize the tracker."""
         ...
 
+    @property
+    def current_state(self) -> typing.Optional["RobotActivityState"]:
+        """The state of the innermost tracked function that is running, if any."""
+        ...
+
     def track(
         self,
         state: "RobotActivityState",
+        profile_id_arg: typing.Optional[str] = None,
     ) -> typing.Callable[
         [_UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn]],
         _UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn],
     ]:
-        """Decorator to track the given state for the decorated function."""
+        """Decorator to track the given state for the decorated function.
+
+        If profile_id_arg names one of the function's arguments, calls may also
+        be profiled, identified by that argument's value.
+        """
+        ...
+
+    def get_profile(self, profile_id: str) -> typing.Optional[str]:
+        """Get the stored profile of a tracked function call, in the collapsed stack format."""
         ...
 
     def store(self) -> None:
@@ -0,0 +1,75 @@
+"""Export metrics stored in the binary format to CSV.
+
+Usage: python -m performance_metrics.export_csv STORAGE_DIR NAME [-o OUTPUT] [--headers]
+
+The output matches what the CSV storage backend writes, so tools that read
+the CSV data files can read the export too.
+"""
+
+import argparse
+import csv
+import sys
+import typing
+from pathlib import Path
+
+from ._storage_backends import binary_files, read_binary_file
+
+
+def export_csv(
+    storage_dir: Path, name: str, output: typing.TextIO, include_headers: bool
+) -> int:
+    """Write all the stored data called `name` to `output` as CSV, oldest first.
+
+    Returns:
+        The number of rows written, not counting the headers.
+    """
+    writer = csv.writer(output, quoting=csv.QUOTE_ALL)
+    row_count = 0
+    for index, path in enumerate(binary_files(storage_dir, name)):
+        headers, rows = read_binary_file(path)
+        if include_headers and index == 0:
+            writer.writerow(headers)
+        writer.writerows(rows)
+        row_count += len(rows)
+    return row_count
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        prog="python -m performance_metrics.export_csv",
+        description="Export metrics stored in the binary format to CSV.",
+    )
+    parser.add_argument(
+        "storage_dir", type=Path, help="The directory the metrics are stored in."
+    )
+    parser.add_argument(
+        "name", help="The name of the metrics, such as system_resource_data."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="The CSV file to write. Defaults to standard output.",
+    )
+    parser.add_argument(
+        "--headers",
+        action="store_true",
+        help="Write the column headers as the first row.",
+    )
+    args = parser.parse_args(argv)
+
+    if not binary_files(args.storage_dir, args.name):
+        parser.error(f"No {args.name} binary files found in {args.storage_dir}")
+
+    if args.output is None:
+        export_csv(args.storage_dir, args.name, sys.stdout, args.headers)
+    else:
+        with open(args.output, "w", newline="") as output:
+            row_count = export_csv(args.storage_dir, args.name, output, args.headers)
+        print(f"Wrote {row_count} rows to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,9 @@ PROCESS_FILTERS_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_PROCESS_FI
 REFRESH_INTERVAL_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_REFRESH_INTERVAL"
 STORAGE_DIR_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_STORAGE_DIR"
 LOGGING_LEVEL_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_LOGGING_LEVEL"
+STORAGE_FORMAT_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_STORAGE_FORMAT"
+
+StorageFormat = typing.Literal["csv", "binary"]
 
 
 def default_filters() -> typing.Tuple[str, str]:
@@ -123,6 +126,22 @@ def _eval_logging_level(value: str) -> str:
     return value
 
 
+def _eval_storage_format(value: str) -> StorageFormat:
+    """Parse the storage format environment variable.
+
+    Returns:
+        StorageFormat: The parsed value.
+    """
+    if value not in typing.get_args(StorageFormat):
+        raise EnvironmentParseError(
+            f"{STORAGE_FORMAT_ENV_VAR_NAME} environment variable must be one of {list(typing.get_args(StorageFormat))}. "
+            f"You specified: {value}"
+        )
+
+    logger.debug(f"Storage format: {value}")
+    return typing.cast(StorageFormat, value)
+
+
 @dataclasses.dataclass(frozen=True)
 class SystemResourceTrackerConfiguration:
     """Environment variables for the system resource tracker."""
@@ -134,6 +153,7 @@ class SystemResourceTrackerConfiguration:
     refresh_interval: float = 10.0
     storage_dir: Path = Path("/data/performance_metrics_data/")
     logging_level: str = "INFO"
+    storage_format: StorageFormat = "binary"
 
     def __str__(self) -> str:
         """Get a string representation of the configuration."""
@@ -144,6 +164,7 @@ class SystemResourceTrackerConfiguration:
             f"refresh_interval={self.refresh_interval}\n"
             f"storage_dir={self.storage_dir}\n"
             f"logging_level={self.logging_level}\n"
+            f"storage_format={self.storage_format}\n"
         )
 
     @classmethod
@@ -174,4 +195,7 @@ class SystemResourceTrackerConfiguration:
         if (logging_level := os.environ.get(LOGGING_LEVEL_ENV_VAR_NAME)) is not None:
             kwargs["logging_level"] = _eval_logging_level(logging_level)
 
+        if (storage_format := os.environ.get(STORAGE_FORMAT_ENV_VAR_NAME)) is not None:
+            kwargs["storage_format"] = _eval_storage_format(storage_format)
+
         return cls(**kwargs)
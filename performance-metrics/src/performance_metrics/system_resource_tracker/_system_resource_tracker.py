@@ -10,6 +10,11 @@ from .._logging_config import LOGGER_NAME
 from .._util import format_command, get_timing_function
 from .._data_shapes import ProcessResourceUsageSnapshot, MetricsMetadata
 from .._metrics_store import MetricsStore
+from .._storage_backends import (
+    CSVStorageBackend,
+    RotatingBinaryStorageBackend,
+    StorageBackend,
+)
 
 _timing_function = get_timing_function()
 
@@ -25,12 +30,18 @@ class SystemResourceTracker:
         self._processes: typing.List[
             psutil.Process
         ]  # intentionally not public as process.kill can be called
+        backend: StorageBackend
+        if self.config.storage_format == "binary":
+            backend = RotatingBinaryStorageBackend()
+        else:
+            backend = CSVStorageBackend()
         self._store = MetricsStore[ProcessResourceUsageSnapshot](
             MetricsMetadata(
                 name="system_resource_data",
                 storage_dir=self.config.storage_dir,
                 headers=ProcessResourceUsageSnapshot.headers(),
-            )
+            ),
+            backend=backend,
         )
         self._store.setup()
         self.refresh_processes()
@@ -0,0 +1,97 @@
+"""Tests for the EventLoopMonitor class in performance_metrics._event_loop_monitor."""
+
+import asyncio
+import csv
+import typing
+from pathlib import Path
+from time import sleep
+
+from performance_metrics._data_shapes import EventLoopLagHistogram, SlowCallbackData
+from performance_metrics._event_loop_monitor import EventLoopMonitor
+from performance_metrics._types import RobotActivityState
+
+BLOCKING_TIME = 0.2
+THRESHOLD = 0.05
+SAMPLE_INTERVAL = 0.01
+# The block can start partway through a sample interval, so the measured lag can
+# fall short of the blocking time by up to one interval.
+MIN_MEASURED_BLOCK_NS = int((BLOCKING_TIME - SAMPLE_INTERVAL) * 1e9)
+
+
+def _read_rows(path: Path) -> typing.List[typing.List[str]]:
+    with open(path, "r") as file:
+        return list(csv.reader(file))
+
+
+def _block_the_event_loop() -> None:
+    sleep(BLOCKING_TIME)
+
+
+async def test_event_loop_monitor(tmp_path: Path) -> None:
+    """It should record lag and the stacks of callbacks that block the loop."""
+    state: typing.Optional[RobotActivityState] = None
+    command_id: typing.Optional[str] = None
+    subject = EventLoopMonitor(
+        tmp_path,
+        should_track=True,
+        activity_source=lambda: state,
+        command_id_source=lambda: command_id,
+        sample_interval=SAMPLE_INTERVAL,
+        slow_callback_threshold=THRESHOLD,
+    )
+
+    subject.start()
+    await asyncio.sleep(0.05)
+    state = "RUNNING_PROTOCOL"
+    command_id = "command-id"
+    await asyncio.sleep(0.05)
+    _block_the_event_loop()
+    await asyncio.sleep(0.05)
+    await subject.stop()
+
+    histograms = [
+        dict(zip(EventLoopLagHistogram.headers(), row))
+        for row in _read_rows(tmp_path / EventLoopMonitor.LAG_METADATA_NAME)
+    ]
+    assert {(h["state"], h["command_id"]) for h in histograms} == {
+        ("", ""),
+        ("RUNNING_PROTOCOL", "command-id"),
+    }
+    for histogram in histograms:
+        assert int(histogram["samples"]) == sum(
+            int(count) for name, count in histogram.items() if name.startswith("lag_")
+        )
+    assert max(int(h["max_lag"]) for h in histograms) >= MIN_MEASURED_BLOCK_NS
+    # A loaded machine can add other slow samples, so only look for ours.
+    assert sum(int(h["lag_under_500ms"]) for h in histograms) >= 1
+
+    slow_rows = _read_rows(tmp_path / EventLoopMonitor.SLOW_CALLBACK_METADATA_NAME)
+    slow_callbacks = [
+        typing.cast(SlowCallbackData, SlowCallbackData.from_csv_row(row))
+        for row in slow_rows
+    ]
+    blocking_callbacks = [
+        callback
+        for callback in slow_callbacks
+        if "(_block_the_event_loop)" in callback.stack
+    ]
+    assert len(blocking_callbacks) == 1
+    slow_callback = blocking_callbacks[0]
+    assert int(slow_callback.duration) >= MIN_MEASURED_BLOCK_NS
+    assert slow_callback.state == "RUNNING_PROTOCOL"
+    assert slow_callback.command_id == "command-id"
+    assert "(_block_the_event_loop)" in slow_callback.stack
+    assert slow_callback.stack.index("(test_event_loop_monitor)") < (
+        slow_callback.stack.index("(_block_the_event_loop)")
+    )
+
+
+async def test_event_loop_monitor_disabled(tmp_path: Path) -> None:
+    """It should do nothing if tracking is disabled."""
+    subject = EventLoopMonitor(tmp_path, should_track=False)
+
+    subject.start()
+    await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert list(tmp_path.iterdir()) == []
@@ -4,7 +4,12 @@ from pathlib import Path
 from time import sleep
 
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
-from performance_metrics._data_shapes import RawActivityData
+from performance_metrics._data_shapes import MetricsMetadata, RawActivityData
+from performance_metrics._metrics_store import MetricsStore
+from performance_metrics._storage_backends import (
+    RotatingBinaryStorageBackend,
+    read_binary_file,
+)
 
 # Corrected times in seconds
 STARTING_TIME = 0.001
@@ -53,3 +58,28 @@ async def test_storing_to_file(tmp_path: Path) -> None:
         headers = file.readlines()
         assert len(headers) == 1, "Header should be written to the headers file."
         assert tuple(headers[0].strip().split(",")) == RawActivityData.headers()
+
+
+def test_storing_with_backend_and_periodic_flush(tmp_path: Path) -> None:
+    """Tests storing data with another backend, from a background thread."""
+    store = MetricsStore[RawActivityData](
+        MetricsMetadata(
+            name="test_data", storage_dir=tmp_path, headers=RawActivityData.headers()
+        ),
+        backend=RotatingBinaryStorageBackend(),
+        flush_interval=0.01,
+    )
+    store.setup()
+    store.add(RawActivityData("ROBOT_STARTING_UP", 1, 2))
+    sleep(0.1)
+
+    assert read_binary_file(tmp_path / "test_data.bin") == (
+        RawActivityData.headers(),
+        [("ROBOT_STARTING_UP", 1, 2)],
+    )
+
+    store.add(RawActivityData("CALIBRATING", 3, 4))
+    store.close()
+    _, rows = read_binary_file(tmp_path / "test_data.bin")
+    assert rows[-1] == ("CALIBRATING", 3, 4)
+    assert not (tmp_path / "test_data").exists()
@@ -303,3 +303,23 @@ def test_using_non_linux_time_functions(tmp_path: Path) -> None:
         data.duration > 0 for data in storage
     ), "All duration times should be greater than 0."
     assert len(storage) == 2, "Both operations should be tracked."
+
+
+async def test_current_state(robot_activity_tracker: RobotActivityTracker) -> None:
+    """Tests that the current state follows the innermost running tracked function."""
+    states_seen = []
+
+    @robot_activity_tracker.track(state="CALIBRATING")
+    def calibrating_robot() -> None:
+        states_seen.append(robot_activity_tracker.current_state)
+
+    @robot_activity_tracker.track(state="RUNNING_PROTOCOL")
+    async def running_protocol() -> None:
+        states_seen.append(robot_activity_tracker.current_state)
+        calibrating_robot()
+        states_seen.append(robot_activity_tracker.current_state)
+
+    assert robot_activity_tracker.current_state is None
+    await running_protocol()
+    assert robot_activity_tracker.current_state is None
+    assert states_seen == ["RUNNING_PROTOCOL", "CALIBRATING", "RUNNING_PROTOCOL"]
@@ -0,0 +1,171 @@
+"""Tests for the SamplingProfiler class in performance_metrics._sampling_profiler."""
+
+import asyncio
+import threading
+import typing
+from pathlib import Path
+from time import perf_counter, sleep
+
+import pytest
+
+from performance_metrics._robot_activity_tracker import RobotActivityTracker
+from performance_metrics._sampling_profiler import (
+    MAX_STACKS_ENV_VAR_NAME,
+    PROFILER_ENABLED_ENV_VAR_NAME,
+    SAMPLE_INTERVAL_ENV_VAR_NAME,
+    SamplingProfiler,
+    SamplingProfilerConfiguration,
+)
+
+SAMPLE_INTERVAL = 0.001
+
+
+def _busy_for(seconds: float) -> None:
+    end = perf_counter() + seconds
+    while perf_counter() < end:
+        pass
+
+
+def _parse_collapsed(collapsed: str) -> typing.Dict[str, int]:
+    counts: typing.Dict[str, int] = {}
+    for line in collapsed.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        counts[stack] = int(count)
+    return counts
+
+
+def _samples_in(counts: typing.Dict[str, int], function_name: str) -> int:
+    return sum(
+        count for stack, count in counts.items() if f";{function_name} (" in stack
+    )
+
+
+def test_profile(tmp_path: Path) -> None:
+    """It should count the stacks of every thread, and store them when stopped."""
+    subject = SamplingProfiler(tmp_path, sample_interval=SAMPLE_INTERVAL)
+    worker = threading.Thread(target=_busy_for, args=(0.1,), name="worker")
+
+    with subject.profile("profile-1"):
+        worker.start()
+        _busy_for(0.1)
+        worker.join()
+
+    collapsed = subject.get("profile-1")
+    assert collapsed is not None
+    assert collapsed == (tmp_path / "profile-1.folded").read_text()
+    counts = _parse_collapsed(collapsed)
+    assert _samples_in(counts, "_busy_for") > 10
+    assert any(stack.startswith("worker;") for stack in counts)
+    assert any(
+        stack.startswith("MainThread;") and "test_profile (" in stack
+        for stack in counts
+    )
+    assert not any("sampling profiler" in stack for stack in counts)
+    assert list(counts.values()) == sorted(counts.values(), reverse=True)
+
+
+def test_bounded_stacks_and_profiles(tmp_path: Path) -> None:
+    """It should cap the stacks counted per profile, and the profiles kept."""
+    subject = SamplingProfiler(
+        tmp_path, sample_interval=SAMPLE_INTERVAL, max_stacks=1, max_profiles=2
+    )
+
+    for profile_id in ("first", "second", "third"):
+        worker = threading.Thread(target=_busy_for, args=(0.05,))
+        with subject.profile(profile_id):
+            worker.start()
+            _busy_for(0.05)
+            worker.join()
+
+    assert subject.get("first") is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "second.folded",
+        "third.folded",
+    ]
+    counts = _parse_collapsed(subject.get("third") or "")
+    assert len(counts) == 2
+    assert counts["[other stacks]"] > 0
+
+
+def test_nested_and_concurrent_profiles(tmp_path: Path) -> None:
+    """It should keep a profile running until it is stopped as often as it was started."""
+    subject = SamplingProfiler(tmp_path, sample_interval=SAMPLE_INTERVAL)
+
+    subject.start("outer")
+    subject.start("outer")
+    subject.start("other")
+    subject.stop("outer")
+    assert subject.get("outer") is None
+    subject.stop("other")
+    _busy_for(0.05)
+    subject.stop("outer")
+
+    assert _samples_in(_parse_collapsed(subject.get("outer") or ""), "_busy_for") > 0
+
+
+def test_invalid_profile_ids(tmp_path: Path) -> None:
+    """It should reject IDs that could name other files."""
+    subject = SamplingProfiler(tmp_path)
+    with pytest.raises(ValueError):
+        subject.start("../escape")
+    assert subject.get("../escape") is None
+
+
+def test_configuration_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It should read the configuration from the environment, ignoring bad values."""
+    assert SamplingProfilerConfiguration.from_env() == SamplingProfilerConfiguration()
+
+    monkeypatch.setenv(PROFILER_ENABLED_ENV_VAR_NAME, "true")
+    monkeypatch.setenv(SAMPLE_INTERVAL_ENV_VAR_NAME, "0.05")
+    monkeypatch.setenv(MAX_STACKS_ENV_VAR_NAME, "-3")
+    config = SamplingProfilerConfiguration.from_env()
+
+    assert config.enabled is True
+    assert config.sample_interval == 0.05
+    assert config.max_stacks == SamplingProfilerConfiguration().max_stacks
+
+
+async def test_tracker_profiles_calls(tmp_path: Path) -> None:
+    """The tracker should profile calls identified by profile_id_arg."""
+    tracker = RobotActivityTracker(
+        tmp_path,
+        should_track=True,
+        profiler_config=SamplingProfilerConfiguration(
+            enabled=True, sample_interval=SAMPLE_INTERVAL
+        ),
+    )
+
+    @tracker.track("ANALYZING_PROTOCOL", profile_id_arg="analysis_id")
+    async def analyze(analysis_id: str) -> None:
+        _busy_for(0.05)
+        await asyncio.sleep(0)
+
+    @tracker.track("CALIBRATING")
+    def calibrate(analysis_id: str) -> None:
+        _busy_for(0.01)
+
+    await analyze(analysis_id="analysis-1")
+    calibrate("not-profiled")
+
+    profile = tracker.get_profile("analysis-1")
+    assert profile is not None
+    assert _samples_in(_parse_collapsed(profile), "analyze") > 0
+    assert tracker.get_profile("not-profiled") is None
+
+
+def test_tracker_does_not_profile_by_default(tmp_path: Path) -> None:
+    """The tracker should only profile when profiling is enabled."""
+    tracker = RobotActivityTracker(
+        tmp_path,
+        should_track=True,
+        profiler_config=SamplingProfilerConfiguration(enabled=False),
+    )
+
+    @tracker.track("ANALYZING_PROTOCOL", profile_id_arg="analysis_id")
+    def analyze(analysis_id: str) -> None:
+        sleep(0.01)
+
+    analyze("analysis-1")
+
+    assert tracker.get_profile("analysis-1") is None
+    assert not (tmp_path / RobotActivityTracker.PROFILES_DIRECTORY_NAME).exists()
@@ -0,0 +1,174 @@
+"""Tests for the storage backends in performance_metrics._storage_backends."""
+
+import csv
+import io
+import typing
+from pathlib import Path
+
+import pytest
+
+from performance_metrics._data_shapes import MetricsMetadata
+from performance_metrics._storage_backends import (
+    BINARY_FILE_SUFFIX,
+    CSVStorageBackend,
+    RotatingBinaryStorageBackend,
+    binary_files,
+    read_binary_file,
+)
+from performance_metrics.export_csv import export_csv
+
+HEADERS = ("time", "command", "usage")
+ROWS = [
+    (1_700_000_000_000_000_000, "python3 -m robot_server", 1.5),
+    (-1, "", 0.0),
+    (2, "unicode µ", -2.25),
+]
+
+
+def _metadata(
+    tmp_path: Path, headers: typing.Tuple[str, ...] = HEADERS
+) -> MetricsMetadata:
+    return MetricsMetadata(name="test_data", storage_dir=tmp_path, headers=headers)
+
+
+def test_csv_backend(tmp_path: Path) -> None:
+    """It should append quoted rows to a CSV file."""
+    subject = CSVStorageBackend()
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS[:1])
+    subject.write(ROWS[1:])
+
+    text = (tmp_path / "test_data").read_text()
+    assert text.startswith('"1700000000000000000","python3 -m robot_server","1.5"')
+    assert len(list(csv.reader(io.StringIO(text)))) == len(ROWS)
+
+
+def test_binary_round_trip(tmp_path: Path) -> None:
+    """It should read back exactly what was written, across writes and restarts."""
+    subject = RotatingBinaryStorageBackend()
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS[:2])
+    subject.write([])
+
+    restarted = RotatingBinaryStorageBackend()
+    restarted.setup(_metadata(tmp_path))
+    restarted.write(ROWS[2:])
+
+    assert binary_files(tmp_path, "test_data") == [tmp_path / "test_data.bin"]
+    assert read_binary_file(tmp_path / "test_data.bin") == (HEADERS, ROWS)
+
+
+def test_binary_is_smaller_than_csv(tmp_path: Path) -> None:
+    """The binary format should take less space than CSV for typical numeric data."""
+    rows = [
+        (1_700_000_000_000_000_000 + i, "ROBOT_STARTING_UP", i * 0.1)
+        for i in range(100)
+    ]
+    csv_backend = CSVStorageBackend()
+    csv_backend.setup(MetricsMetadata("csv", tmp_path, HEADERS))
+    csv_backend.write(rows)
+    binary_backend = RotatingBinaryStorageBackend()
+    binary_backend.setup(MetricsMetadata("binary", tmp_path, HEADERS))
+    binary_backend.write(rows)
+
+    assert (tmp_path / f"binary{BINARY_FILE_SUFFIX}").stat().st_size < (
+        tmp_path / "csv"
+    ).stat().st_size
+
+
+def test_binary_ignores_partial_block(tmp_path: Path) -> None:
+    """It should read every complete block in a file that was cut off mid-write."""
+    subject = RotatingBinaryStorageBackend()
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS[:1])
+    subject.write(ROWS[1:])
+    path = tmp_path / "test_data.bin"
+    path.write_bytes(path.read_bytes()[:-3])
+
+    assert read_binary_file(path) == (HEADERS, ROWS[:1])
+
+
+def test_binary_appends_after_partial_block(tmp_path: Path) -> None:
+    """It should drop a partial block left by a crash before appending more rows."""
+    subject = RotatingBinaryStorageBackend()
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS[:1])
+    subject.write(ROWS[1:2])
+    path = tmp_path / "test_data.bin"
+    path.write_bytes(path.read_bytes()[:-3])
+
+    restarted = RotatingBinaryStorageBackend()
+    restarted.setup(_metadata(tmp_path))
+    restarted.write(ROWS[2:])
+
+    assert binary_files(tmp_path, "test_data") == [path]
+    assert read_binary_file(path) == (HEADERS, [ROWS[0], ROWS[2]])
+    assert export_csv(tmp_path, "test_data", io.StringIO(), include_headers=False) == 2
+
+
+def test_binary_rejects_other_files(tmp_path: Path) -> None:
+    """It should refuse to read files that aren't in the binary format."""
+    path = tmp_path / "test_data.bin"
+    path.write_text('"1","2"\n')
+    with pytest.raises(ValueError):
+        read_binary_file(path)
+
+
+def test_binary_rotates_by_size(tmp_path: Path) -> None:
+    """It should rotate the file once it is too big, keeping a limited number."""
+    subject = RotatingBinaryStorageBackend(max_file_size=1, max_files=3)
+    subject.setup(_metadata(tmp_path))
+    for row in ROWS * 2:
+        subject.write([row])
+
+    files = binary_files(tmp_path, "test_data")
+    assert files == [
+        tmp_path / "test_data.2.bin",
+        tmp_path / "test_data.1.bin",
+        tmp_path / "test_data.bin",
+    ]
+    assert [read_binary_file(path) for path in files] == [
+        (HEADERS, [row]) for row in ROWS
+    ]
+
+
+def test_binary_rotates_by_age(tmp_path: Path) -> None:
+    """It should rotate the file once it has been written to for long enough."""
+    subject = RotatingBinaryStorageBackend(max_file_age=0)
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS[:1])
+    subject.write(ROWS[1:])
+
+    assert binary_files(tmp_path, "test_data") == [
+        tmp_path / "test_data.1.bin",
+        tmp_path / "test_data.bin",
+    ]
+
+
+def test_binary_rotates_on_new_headers(tmp_path: Path) -> None:
+    """It should start a new file instead of appending rows with different columns."""
+    old = RotatingBinaryStorageBackend()
+    old.setup(_metadata(tmp_path, headers=("time",)))
+    old.write([(1,)])
+
+    subject = RotatingBinaryStorageBackend()
+    subject.setup(_metadata(tmp_path))
+    subject.write(ROWS)
+
+    assert read_binary_file(tmp_path / "test_data.1.bin") == (("time",), [(1,)])
+    assert read_binary_file(tmp_path / "test_data.bin") == (HEADERS, ROWS)
+
+
+def test_export_csv(tmp_path: Path) -> None:
+    """It should export every rotated file to CSV, oldest first."""
+    subject = RotatingBinaryStorageBackend(max_file_size=1)
+    subject.setup(_metadata(tmp_path))
+    for row in ROWS:
+        subject.write([row])
+    output = io.StringIO()
+
+    assert export_csv(tmp_path, "test_data", output, include_headers=True) == 3
+
+    expected = io.StringIO()
+    csv.writer(expected, quoting=csv.QUOTE_ALL).writerows([HEADERS, *ROWS])
+    assert output.getvalue() == expected.getvalue()
@@ -0,0 +1,185 @@
+"""Tests for span tracing in performance_metrics._tracing."""
+
+import asyncio
+import json
+import time
+import typing
+from pathlib import Path
+
+import pytest
+
+from performance_metrics._tracing import SpanTracer, is_tracing, trace_span
+
+
+def _read_trace(path: Path) -> typing.List[typing.Dict[str, typing.Any]]:
+    # The trace file is an unterminated JSON array, which trace viewers accept.
+    text = path.read_text().rstrip().rstrip(",")
+    return typing.cast(
+        typing.List[typing.Dict[str, typing.Any]], json.loads(text + "]")
+    )
+
+
+def _spans(path: Path) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    return {event["name"]: event for event in _read_trace(path) if event["ph"] == "X"}
+
+
+@pytest.fixture
+def tracer(tmp_path: Path) -> typing.Iterator[SpanTracer]:
+    """An installed SpanTracer."""
+    subject = SpanTracer(tmp_path, should_track=True)
+    subject.install()
+    yield subject
+    subject.uninstall()
+
+
+async def test_nested_spans(tmp_path: Path, tracer: SpanTracer) -> None:
+    """Spans opened inside other spans should nest on the same track."""
+    with trace_span("outer", command_id="abc"):
+        with trace_span("inner"):
+            await asyncio.sleep(0.01)
+        with trace_span("after"):
+            pass
+    tracer.uninstall()
+
+    spans = _spans(tmp_path / SpanTracer.FILE_NAME)
+    assert spans["outer"]["args"] == {"command_id": "abc"}
+    assert {span["tid"] for span in spans.values()} == {spans["outer"]["tid"]}
+    outer, inner, after = spans["outer"], spans["inner"], spans["after"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= after["ts"]
+    assert after["ts"] + after["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["dur"] >= 10_000
+
+
+async def test_concurrent_spans(tmp_path: Path, tracer: SpanTracer) -> None:
+    """Spans that overlap their siblings should each get their own track."""
+
+    async def _child(name: str) -> None:
+        with trace_span(name):
+            await asyncio.sleep(0.01)
+
+    with trace_span("root"):
+        await asyncio.gather(_child("first"), _child("second"))
+    with trace_span("other root"):
+        pass
+    tracer.uninstall()
+
+    spans = _spans(tmp_path / SpanTracer.FILE_NAME)
+    assert spans["first"]["tid"] == spans["root"]["tid"]
+    assert spans["second"]["tid"] != spans["root"]["tid"]
+    # Once a root span ends, its track is reused.
+    assert spans["other root"]["tid"] == spans["root"]["tid"]
+
+
+async def test_tracks_are_reused(tmp_path: Path, tracer: SpanTracer) -> None:
+    """The number of tracks should only grow with the number of concurrent spans."""
+
+    async def _root(n: int) -> None:
+        with trace_span(f"root {n}"):
+            await asyncio.sleep(0)
+
+    for _ in range(10):
+        await asyncio.gather(_root(1), _root(2))
+    tracer.uninstall()
+
+    events = _read_trace(tmp_path / SpanTracer.FILE_NAME)
+    track_names = [event for event in events if event["name"] == "thread_name"]
+    assert len(track_names) == 2
+    assert {event["tid"] for event in events} == {1, 2}
+
+
+def test_span_records_errors(tmp_path: Path, tracer: SpanTracer) -> None:
+    """Exceptions raised through a span should be noted on it."""
+    with pytest.raises(ValueError):
+        with trace_span("failing"):
+            raise ValueError("oh no")
+    tracer.uninstall()
+
+    assert _spans(tmp_path / SpanTracer.FILE_NAME)["failing"]["args"] == {
+        "error": "ValueError"
+    }
+
+
+def test_nothing_traced_without_tracer(tmp_path: Path) -> None:
+    """Spans should not be recorded when no tracer is installed."""
+    subject = SpanTracer(tmp_path, should_track=True)
+    with trace_span("untraced"):
+        pass
+    subject.install()
+    subject.uninstall()
+    with trace_span("also untraced"):
+        pass
+    subject.store()
+
+    assert _read_trace(tmp_path / SpanTracer.FILE_NAME) == []
+
+
+def test_disabled_tracer(tmp_path: Path) -> None:
+    """A tracer should do nothing if tracking is disabled."""
+    subject = SpanTracer(tmp_path, should_track=False)
+    subject.install()
+    with trace_span("untraced"):
+        pass
+    subject.uninstall()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_flushes_in_background(tmp_path: Path) -> None:
+    """Spans should be written out from another thread once enough have been collected."""
+    subject = SpanTracer(tmp_path, should_track=True, flush_every=1, flush_interval=60)
+    subject.install()
+    try:
+        with trace_span("root"):
+            pass
+        deadline = time.monotonic() + 5
+        while len(_read_trace(tmp_path / SpanTracer.FILE_NAME)) < 2:
+            assert time.monotonic() < deadline, "spans were not written out"
+            time.sleep(0.01)
+    finally:
+        subject.uninstall()
+
+
+def test_rotates_trace_file(tmp_path: Path) -> None:
+    """The trace file should be rotated once it is too big, keeping max_files files."""
+    subject = SpanTracer(tmp_path, should_track=True, max_file_size=1, max_files=3)
+    subject.install()
+    try:
+        for n in range(5):
+            with trace_span(f"span {n}"):
+                pass
+            subject.store()
+    finally:
+        subject.uninstall()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "span_trace.1.json",
+        "span_trace.2.json",
+        "span_trace.json",
+    ]
+    for path, name in [
+        (tmp_path / "span_trace.2.json", "span 2"),
+        (tmp_path / "span_trace.1.json", "span 3"),
+        (tmp_path / "span_trace.json", "span 4"),
+    ]:
+        # Each file should be viewable on its own, so should name its track.
+        assert [event["name"] for event in _read_trace(path)] == ["thread_name", name]
+
+
+def test_rotates_previous_trace_file(tmp_path: Path) -> None:
+    """Starting a tracer should keep the trace file of the previous one."""
+    (tmp_path / SpanTracer.FILE_NAME).write_text("previous")
+    SpanTracer(tmp_path, should_track=True)
+
+    assert (tmp_path / "span_trace.1.json").read_text() == "previous"
+    assert _read_trace(tmp_path / SpanTracer.FILE_NAME) == []
+
+
+def test_is_tracing(tmp_path: Path) -> None:
+    """It should say whether an installed tracer is recording spans."""
+    subject = SpanTracer(tmp_path, should_track=True)
+    assert not is_tracing()
+    subject.install()
+    assert is_tracing()
+    subject.uninstall()
+    assert not is_tracing()
@@ -19,12 +19,18 @@ from .hardware import (
     fbl_start_blinking,
     fbl_clean_up,
 )
+from .persistence.pydantic import get_json_backend_by_name, set_json_backend
 from .persistence.fastapi_dependencies import (
     start_initializing_persistence,
     clean_up_persistence,
 )
 from .router import router
+from .service.event_loop_monitor import (
+    start_event_loop_monitor,
+    clean_up_event_loop_monitor,
+)
 from .service.logging import initialize_logging
+from .service.span_tracing import start_span_tracing, clean_up_span_tracing
 from .service.task_runner import (
     initialize_task_runner,
     clean_up_task_runner,
@@ -83,6 +89,9 @@ async def on_startup() -> None:
         persistence_directory = settings.persistence_directory
 
     initialize_logging()
+    set_json_backend(get_json_backend_by_name(settings.json_backend))
+    start_event_loop_monitor(app_state=app.state)
+    start_span_tracing(app_state=app.state)
     initialize_task_runner(app_state=app.state)
     fbl_init(app_state=app.state)
     start_initializing_hardware(
@@ -124,6 +133,8 @@ async def on_shutdown() -> None:
         clean_up_persistence(app.state),
         clean_up_task_runner(app.state),
         clean_up_notification_client(app.state),
+        clean_up_event_loop_monitor(app.state),
+        clean_up_span_tracing(app.state),
         return_exceptions=True,
     )
 
@@ -9,7 +9,7 @@ from typing import Optional, List, Set
 import sqlalchemy.engine
 
 from robot_server.deletion_planner import FileUsageInfo
-from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.database import begin_write, sqlite_rowid
 from robot_server.persistence.tables import (
     data_files_table,
     analysis_csv_rtp_table,
@@ -57,7 +57,7 @@ class DataFilesStore:
             "file_hash": file_info.file_hash,
         }
         statement = sqlalchemy.insert(data_files_table).values(file_info_dict)
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             transaction.execute(statement)
 
     def get(self, data_file_id: str) -> DataFileInfo:
@@ -137,7 +137,7 @@ class DataFilesStore:
         delete_statement = sqlalchemy.delete(data_files_table).where(
             data_files_table.c.id == file_id
         )
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             files_used_in_analyses: Set[str] = set(
                 transaction.execute(select_ids_used_in_analyses).scalars().all()
             )
@@ -1,7 +1,7 @@
 """Instruments routes."""
 from typing import Annotated, Optional, Dict, List, cast
 
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Query
 
 from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
     PipetteOffsetSummary,
@@ -213,10 +213,13 @@ async def _get_instrument_data(
 
 
 async def _get_attached_instruments_ot3(
-    hardware: OT3HardwareControlAPI,
+    hardware: OT3HardwareControlAPI, refresh: bool
 ) -> PydanticResponse[SimpleMultiBody[AttachedItem]]:
     # OT3
-    await hardware.cache_instruments(skip_if_would_block=True)
+    if refresh:
+        await hardware.cache_instruments(skip_if_would_block=True)
+    else:
+        await hardware.cache_instruments_if_changed()
     response_data = await _get_instrument_data(hardware)
     return await PydanticResponse.create(
         content=SimpleMultiBody.construct(
@@ -266,13 +269,23 @@ async def _get_attached_instruments_ot2(
 )
 async def get_attached_instruments(
     hardware: Annotated[HardwareControlAPI, Depends(get_hardware)],
+    refresh: Annotated[
+        bool,
+        Query(
+            description=(
+                "If `true`, rescan the attached instruments even if the robot"
+                " hasn't detected any change since it last scanned them."
+                " Only applies to Flex robots."
+            ),
+        ),
+    ] = False,
 ) -> PydanticResponse[SimpleMultiBody[AttachedItem]]:
     """Get a list of all attached instruments."""
     try:
         # TODO (spp, 2023-01-06): revise according to
         #  https://opentrons.atlassian.net/browse/RET-1295
         ot3_hardware = ensure_ot3_hardware(hardware_api=hardware)
-        return await _get_attached_instruments_ot3(ot3_hardware)
+        return await _get_attached_instruments_ot3(ot3_hardware, refresh)
     except HardwareNotSupportedError:
         # OT2
         pass
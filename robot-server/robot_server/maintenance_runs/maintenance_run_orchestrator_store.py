@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Sequence
 
 from opentrons.protocol_engine.errors.exceptions import EStopActivatedError
 from opentrons.protocol_engine.types import PostRunHardwareState, DeckConfigurationType
@@ -255,6 +255,17 @@ class MaintenanceRunOrchestratorStore:
             command=request, wait_until_complete=wait_until_complete, timeout=timeout
         )
 
+    async def add_commands_and_wait_for_interval(
+        self,
+        requests: Sequence[CommandCreate],
+        wait_until_complete: bool = False,
+        timeout: Optional[int] = None,
+    ) -> List[Command]:
+        """Add new commands to execute and wait for them to complete if needed."""
+        return await self.run_orchestrator.add_commands_and_wait_for_interval(
+            commands=requests, wait_until_complete=wait_until_complete, timeout=timeout
+        )
+
     def add_labware_offset(self, request: LabwareOffsetCreate) -> LabwareOffset:
         """Add a new labware offset to state."""
         return self.run_orchestrator.add_labware_offset(request)
@@ -17,10 +17,12 @@ from robot_server.service.json_api import (
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    SimpleMultiBody,
 )
 from robot_server.robot.control.dependencies import require_estop_in_good_state
 from robot_server.runs.command_models import (
     RequestModelWithCommandCreate,
+    RequestModelWithCommandCreates,
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
@@ -171,6 +173,96 @@ async def create_run_command(
     )
 
 
+@PydanticResponse.wrap_route(
+    commands_router.post,
+    path="/maintenance_runs/{runId}/commands/batch",
+    summary="Enqueue several commands",
+    description=textwrap.dedent(
+        """
+        Add several commands to the maintenance run at once, in order.
+        This behaves like `POST /maintenance_runs/{runId}/commands` called
+        once per command, but takes a single request.
+        """
+    ),
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": SimpleMultiBody[pe_commands.Command]},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_409_CONFLICT: {"model": ErrorBody[CommandNotAllowed]},
+    },
+)
+async def create_run_commands(
+    request_body: RequestModelWithCommandCreates,
+    run_orchestrator_store: Annotated[
+        MaintenanceRunOrchestratorStore, Depends(get_maintenance_run_orchestrator_store)
+    ],
+    run_id: Annotated[str, Depends(get_current_run_from_url)],
+    check_estop: Annotated[bool, Depends(require_estop_in_good_state)],
+    waitUntilComplete: Annotated[
+        bool,
+        Query(
+            description=(
+                "If `false`, return immediately, while the new commands are still"
+                " queued. If `true`, only return once the last new command succeeds"
+                " or fails, or when the timeout is reached."
+                " See the `timeout` query parameter."
+            ),
+        ),
+    ] = False,
+    timeout: Annotated[
+        Optional[int],
+        Query(
+            gt=0,
+            description=(
+                "If `waitUntilComplete` is `true`,"
+                " the maximum time in milliseconds to wait before returning."
+                " The default is infinite."
+                "\n\n"
+                "The timer starts as soon as you enqueue the new commands with"
+                " this request. If the timeout elapses before the commands"
+                " succeed or fail, they will be returned with their current status."
+            ),
+        ),
+    ] = None,
+) -> PydanticResponse[SimpleMultiBody[pe_commands.Command]]:
+    """Enqueue several commands.
+
+    Arguments:
+        request_body: The request containing the commands that the client wants
+            to enqueue, in order.
+        waitUntilComplete: If True, return only once the last command is completed.
+            Else, return immediately. Comes from a query parameter in the URL.
+        timeout: The maximum time, in seconds, to wait before returning.
+            Comes from a query parameter in the URL.
+        run_orchestrator_store: The run's `EngineStore` on which the new
+            commands will be enqueued.
+        check_estop: Dependency to verify the estop is in a valid state.
+        run_id: Run identification to attach commands to.
+    """
+    command_creates = [
+        command_create.copy(update={"intent": pe_commands.CommandIntent.SETUP})
+        for command_create in request_body.data
+    ]
+
+    commands = await run_orchestrator_store.add_commands_and_wait_for_interval(
+        requests=command_creates,
+        wait_until_complete=waitUntilComplete,
+        timeout=timeout,
+    )
+
+    response_data = [
+        run_orchestrator_store.get_command(command.id) for command in commands
+    ]
+
+    return await PydanticResponse.create(
+        content=SimpleMultiBody.construct(
+            data=response_data,
+            meta=MultiBodyMeta(cursor=0, totalLength=len(response_data)),
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/maintenance_runs/{runId}/commands",
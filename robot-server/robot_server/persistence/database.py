@@ -1,7 +1,7 @@
 """SQLite database initialization and utilities."""
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import ContextManager, Generator
 
 import sqlalchemy
 
@@ -23,17 +23,42 @@ from server_utils import sql_utils
 sqlite_rowid = sqlalchemy.column("_ROWID_")
 
 
+# How many connections to keep open. Reads in worker threads each check out their
+# own connection, and in WAL mode they don't have to wait for a write to finish.
+_POOL_SIZE = 4
+
+# Per-connection page cache. SQLite's default is 2 MiB.
+_CACHE_SIZE_KIB = 8 * 1024
+
+
 def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     """Return an engine for accessing the given SQLite database file.
 
     If the file does not already exist, it will be created, empty.
     You must separately set up any tables you're expecting.
+
+    The database is put in write-ahead-log mode, so it may have accompanying
+    `-wal` and `-shm` files while the engine is open. SQLite folds these back into
+    the main file when the last connection closes, i.e. when the engine is disposed.
+    Anything that copies the database file while an engine might have been open on it
+    (for instance, after an unclean shutdown) must copy those files too.
     """
-    sql_engine = sqlalchemy.create_engine(sql_utils.get_connection_url(path))
+    sql_engine = sqlalchemy.create_engine(
+        sql_utils.get_connection_url(path),
+        # Keep connections open between transactions instead of reconnecting (and
+        # re-running all the connection setup pragmas) every time.
+        poolclass=sqlalchemy.pool.QueuePool,
+        pool_size=_POOL_SIZE,
+        # Connections can be used from worker threads, but only by one at a time,
+        # which the pool guarantees.
+        connect_args={"check_same_thread": False},
+    )
 
     try:
         sql_utils.enable_foreign_key_constraints(sql_engine)
         sql_utils.fix_transactions(sql_engine)
+        sql_utils.enable_write_ahead_logging(sql_engine)
+        sql_utils.set_page_cache_size(sql_engine, _CACHE_SIZE_KIB)
 
     except Exception:
         sql_engine.dispose()
@@ -42,6 +67,24 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     return sql_engine
 
 
+def begin_write(
+    sql_engine: sqlalchemy.engine.Engine,
+) -> ContextManager[sqlalchemy.engine.Connection]:
+    """Begin a transaction that may write to the database.
+
+    Use this instead of `sql_engine.begin()` for every transaction that writes.
+    It takes SQLite's write lock up front, so a writer on another connection makes it
+    wait its turn, instead of failing with "database is locked" partway through.
+    Read-only transactions should keep using `sql_engine.begin()`, so that they
+    don't wait for writes.
+
+    Waiting for the lock blocks the calling thread. So that it never blocks the
+    event loop, do every write from the event loop thread, and keep the work inside
+    write transactions short; do slow preparation, like serialization, beforehand.
+    """
+    return sql_engine.execution_options(**{sql_utils.BEGIN_IMMEDIATE: True}).begin()
+
+
 @contextmanager
 def sql_engine_ctx(path: Path) -> Generator[sqlalchemy.engine.Engine, None, None]:
     """Like `create_sql_engine()`, but clean up when done."""
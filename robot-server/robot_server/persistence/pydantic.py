@@ -1,33 +1,148 @@
 """Store Pydantic objects in the SQL database."""
 
 import json
-from typing import Type, TypeVar, List, Sequence
-from pydantic import BaseModel, parse_raw_as, parse_obj_as
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from pydantic import BaseModel, parse_obj_as
+from pydantic.json import pydantic_encoder
 
 
 _BaseModelT = TypeVar("_BaseModelT", bound=BaseModel)
 
 
+class JSONBackend(NamedTuple):
+    """The functions used to turn plain Python data into JSON text and back.
+
+    `dumps` receives the output of Pydantic's `.dict()` along with the encoder
+    Pydantic would use for values it doesn't natively know how to serialize,
+    like datetimes.
+    """
+
+    name: str
+    dumps: Callable[[object, Callable[[Any], Any]], str]
+    loads: Callable[[Union[str, bytes]], Any]
+
+
+def _stdlib_dumps(obj: object, default: Callable[[Any], Any]) -> str:
+    return json.dumps(obj, default=default)
+
+
+STDLIB_JSON_BACKEND = JSONBackend(name="json", dumps=_stdlib_dumps, loads=json.loads)
+"""The standard library `json` module. Matches Pydantic's own `.json()` output."""
+
+
+def _make_orjson_backend() -> Union[JSONBackend, None]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    # Hand datetimes to Pydantic's encoder so they're formatted exactly like
+    # the stdlib backend formats them.
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _orjson_dumps(obj: object, default: Callable[[Any], Any]) -> str:
+        return orjson.dumps(obj, default=default, option=options).decode("utf-8")
+
+    return JSONBackend(name="orjson", dumps=_orjson_dumps, loads=orjson.loads)
+
+
+ORJSON_BACKEND = _make_orjson_backend()
+"""An `orjson`-backed backend, or `None` if `orjson` isn't installed.
+
+This is several times faster than the stdlib backend for large documents. Its
+output is compact (no whitespace), but otherwise equivalent.
+
+`orjson` isn't a dependency of the robot server, so this is only used if it's
+selected with the `json_backend` setting.
+"""
+
+
+_backend: JSONBackend = STDLIB_JSON_BACKEND
+
+
+def get_json_backend() -> JSONBackend:
+    """Return the backend currently used to serialize and parse stored JSON."""
+    return _backend
+
+
+def get_json_backend_by_name(name: str) -> JSONBackend:
+    """Return the backend with the given name, `json` or `orjson`.
+
+    Raises:
+        ValueError: There's no backend with that name, or it isn't installed.
+    """
+    for backend in (STDLIB_JSON_BACKEND, ORJSON_BACKEND):
+        if backend is not None and backend.name == name:
+            return backend
+    raise ValueError(f'JSON backend "{name}" is not available.')
+
+
+def set_json_backend(backend: JSONBackend) -> None:
+    """Replace the backend used to serialize and parse stored JSON.
+
+    Documents written by any backend can be read by any other.
+    """
+    global _backend
+    _backend = backend
+
+
+@lru_cache(maxsize=None)
+def _get_parser(model: Type[_BaseModelT]) -> Callable[[object], _BaseModelT]:
+    """Return a function that validates parsed JSON data as the given type.
+
+    Parsing into a plain model class doesn't need `parse_obj_as()`'s
+    wrapper-model machinery, and for everything else (unions and the like)
+    we look up the parsing function once per type instead of once per call.
+    """
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return cast(Callable[[object], _BaseModelT], model.parse_obj)
+
+    def _parse(obj: object) -> _BaseModelT:
+        return parse_obj_as(model, obj)
+
+    return _parse
+
+
 def pydantic_to_json(obj: BaseModel) -> str:
     """Serialize a Pydantic object for storing in the SQL database."""
-    return obj.json(
-        # by_alias and exclude_none should match how
-        # FastAPI + Pydantic + our customizations serialize these objects
-        by_alias=True,
-        exclude_none=True,
+    return _backend.dumps(
+        obj.dict(
+            # by_alias and exclude_none should match how
+            # FastAPI + Pydantic + our customizations serialize these objects
+            by_alias=True,
+            exclude_none=True,
+        ),
+        # The same encoder obj.json() would use, including any custom json_encoders.
+        cast(Callable[[Any], Any], obj.__json_encoder__),
     )
 
 
 def pydantic_list_to_json(obj_list: Sequence[BaseModel]) -> str:
     """Serialize a list of Pydantic objects for storing in the SQL database."""
-    return json.dumps([obj.dict(by_alias=True, exclude_none=True) for obj in obj_list])
+    return _backend.dumps(
+        [obj.dict(by_alias=True, exclude_none=True) for obj in obj_list],
+        pydantic_encoder,
+    )
 
 
 def json_to_pydantic(model: Type[_BaseModelT], json_str: str) -> _BaseModelT:
     """Parse a Pydantic object stored in the SQL database."""
-    return parse_raw_as(model, json_str)
+    parse: Callable[[object], _BaseModelT] = _get_parser(model)
+    return parse(_backend.loads(json_str))
 
 
 def json_to_pydantic_list(model: Type[_BaseModelT], json_str: str) -> List[_BaseModelT]:
     """Parse a list of Pydantic objects stored in the SQL database."""
-    return [parse_obj_as(model, obj_dict) for obj_dict in json.loads(json_str)]
+    parse = _get_parser(model)
+    return [parse(obj_dict) for obj_dict in _backend.loads(json_str)]
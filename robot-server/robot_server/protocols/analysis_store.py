@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import sqlalchemy
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from typing_extensions import Final
 
 from opentrons_shared_data.robot.types import RobotType
@@ -287,6 +287,38 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_as_document_chunks(self, analysis_id: str) -> Iterator[str]:
+        """Like `get_as_document()`, but return the document in pieces.
+
+        The concatenation of the returned pieces is the same document that
+        `get_as_document()` would return. Use this to stream large analyses
+        to clients a piece at a time.
+
+        Raises:
+            AnalysisNotFoundError: If there is no completed analysis with the given ID.
+        """
+        chunks = await self._completed_store.get_by_id_as_document_chunks(
+            analysis_id=analysis_id
+        )
+        if chunks is not None:
+            return chunks
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
+    async def get_as_current_document(self, analysis_id: str) -> Optional[str]:
+        """Get a completed analysis as a pre-serialized JSON document, if it can pass through.
+
+        This returns the stored document if it's exactly what serializing the result of
+        `get()` would produce, so callers can skip parsing and re-serializing it.
+        Otherwise (the analysis is pending, missing, or was stored by a different
+        analyzer version), returns `None`, and callers should fall back to `get()`.
+        """
+        if self._pending_store.get(analysis_id=analysis_id) is not None:
+            return None
+        return await self._completed_store.get_by_id_as_current_document(
+            analysis_id=analysis_id
+        )
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional, Union, Mapping
+from typing import Dict, Iterator, List, Optional, Union, Mapping
 from logging import getLogger
 from dataclasses import dataclass
 
@@ -10,7 +10,7 @@ import sqlalchemy
 import anyio
 from opentrons.protocols.parameters.types import PrimitiveAllowedTypes
 
-from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.database import begin_write, sqlite_rowid
 from robot_server.persistence.tables import (
     analysis_table,
     analysis_primitive_type_rtp_table,
@@ -26,6 +26,10 @@ _log = getLogger(__name__)
 
 MAX_ANALYSES_TO_STORE = 5
 
+# How many characters of a stored analysis document to send at a time when
+# streaming it.
+_DOCUMENT_CHUNK_SIZE = 256 * 1024
+
 
 @dataclass
 class CompletedAnalysisResource:
@@ -191,6 +195,44 @@ class CompletedAnalysisStore:
 
         return document
 
+    async def get_by_id_as_document_chunks(
+        self, analysis_id: str, chunk_size: int = _DOCUMENT_CHUNK_SIZE
+    ) -> Optional[Iterator[str]]:
+        """Like `get_by_id_as_document()`, but return the document in pieces.
+
+        Returns `None` if there is no analysis with this ID. Otherwise, returns an
+        iterator over consecutive pieces of the document, each at most `chunk_size`
+        characters long, so that a response can stream them out one at a time.
+        The document is read in a single query up front, so every piece comes from
+        the same version of it.
+        """
+        document = await self.get_by_id_as_document(analysis_id)
+        if document is None:
+            return None
+        return _iter_chunks(document, chunk_size)
+
+    async def get_by_id_as_current_document(self, analysis_id: str) -> Optional[str]:
+        """Like `get_by_id_as_document()`, but only for analyses from this analyzer version.
+
+        A document stored by the current analyzer version is equivalent to what parsing
+        it and serializing it again would produce, so it can be passed straight through
+        to clients in place of the parsed model.
+
+        Returns `None` if there is no analysis with this ID, or if it was stored by a
+        different analyzer version.
+        """
+        statement = sqlalchemy.select(
+            analysis_table.c.completed_analysis, analysis_table.c.analyzer_version
+        ).where(analysis_table.c.id == analysis_id)
+
+        with self._sql_engine.begin() as transaction:
+            row = transaction.execute(statement).one_or_none()
+
+        if row is None or row.analyzer_version != self._current_analyzer_version:
+            return None
+        document: str = row.completed_analysis
+        return document
+
     async def get_by_protocol(
         self, protocol_id: str
     ) -> List[CompletedAnalysisResource]:
@@ -349,7 +391,7 @@ class CompletedAnalysisStore:
         insert_rtp_statement = analysis_primitive_type_rtp_table.insert()
         insert_csv_rtp_statement = analysis_csv_rtp_table.insert()
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             transaction.execute(delete_primitive_rtp_statement)
             transaction.execute(delete_csv_rtp_statement)
             transaction.execute(delete_statement)
@@ -367,3 +409,8 @@ class CompletedAnalysisStore:
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+
+
+def _iter_chunks(document: str, chunk_size: int) -> Iterator[str]:
+    for start in range(0, len(document), chunk_size):
+        yield document[start : start + chunk_size]
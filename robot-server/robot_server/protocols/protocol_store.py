@@ -16,7 +16,7 @@ from opentrons.protocols.parse import PythonParseMode
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 
 from robot_server.data_files.models import DataFile
-from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.database import begin_write, sqlite_rowid
 from robot_server.persistence.tables import (
     analysis_table,
     protocol_table,
@@ -370,7 +370,7 @@ class ProtocolStore:
         statement = sqlalchemy.insert(protocol_table).values(
             _convert_dataclass_to_sql_values(resource=resource)
         )
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             transaction.execute(statement)
 
     def _sql_get(self, protocol_id: str) -> _DBProtocolResource:
@@ -419,7 +419,7 @@ class ProtocolStore:
             protocol_table.c.id == protocol_id
         )
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             # TODO(mm, 2022-04-28): Deleting analyses, and any RTP tables that reference
             #  those analyses, from the table is enough to avoid a SQL foreign key conflict.
             #  But, if this protocol had any *pending* analyses, they'll be left behind
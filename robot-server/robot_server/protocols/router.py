@@ -24,7 +24,7 @@ from fastapi import (
     status,
     Form,
 )
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from opentrons.protocol_reader import (
@@ -38,6 +38,11 @@ from opentrons_shared_data.robot.types import RobotType
 from robot_server.errors.error_responses import ErrorDetails, ErrorBody
 from robot_server.hardware import get_robot_type
 from robot_server.service.dependencies import get_unique_id, get_current_time
+from robot_server.service.profiling import (
+    PROFILE_DESCRIPTION,
+    ProfileNotFound,
+    get_profile_response,
+)
 from robot_server.service.json_api import (
     Body,
     SimpleBody,
@@ -845,9 +850,15 @@ async def get_protocol_analysis_by_id(
             status.HTTP_404_NOT_FOUND
         )
 
+    # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
+    # this analysis isn't owned by this protocol. This should be an error.
+    document = await analysis_store.get_as_current_document(analysisId)
+    if document is not None:
+        # Skip parsing and re-serializing the stored analysis, which is slow
+        # for large protocols.
+        return PydanticResponse.create_pre_serialized(content=f'{{"data": {document}}}')
+
     try:
-        # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
-        # this analysis isn't owned by this protocol. This should be an error.
         analysis = await analysis_store.get(analysisId)
     except AnalysisNotFoundError as error:
         raise AnalysisNotFound(detail=str(error)).as_error(
@@ -886,8 +897,8 @@ async def get_protocol_analysis_as_document(
     analysisId: str,
     protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
     analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
-) -> PlainTextResponse:
-    """Get a protocol analysis by analysis ID.
+) -> StreamingResponse:
+    """Get a protocol analysis by analysis ID, as a streamed JSON document.
 
     Arguments:
         protocolId: The ID of the protocol, pulled from the URL.
@@ -903,13 +914,63 @@ async def get_protocol_analysis_as_document(
     try:
         # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
         # this analysis isn't owned by this protocol. This should be an error.
-        analysis = await analysis_store.get_as_document(analysisId)
+        analysis_chunks = await analysis_store.get_as_document_chunks(analysisId)
     except AnalysisNotFoundError as error:
         raise AnalysisNotFound(detail=str(error)).as_error(
             status.HTTP_404_NOT_FOUND
         ) from error
 
-    return PlainTextResponse(content=analysis, media_type="application/json")
+    return StreamingResponse(content=analysis_chunks, media_type="application/json")
+
+
+@protocols_router.get(
+    path="/protocols/{protocolId}/analyses/{analysisId}/profile",
+    summary="[Experimental] Get a profile of one of a protocol's analyses",
+    description=(
+        "Get a statistical profile of what the robot server did while analyzing"
+        " the protocol, once the analysis has completed."
+        "\n\n" + PROFILE_DESCRIPTION
+    ),
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/plain": {}}},
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[
+                Union[ProtocolNotFound, AnalysisNotFound, ProfileNotFound]
+            ]
+        },
+    },
+)
+async def get_protocol_analysis_profile(
+    protocolId: str,
+    analysisId: str,
+    protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+) -> Response:
+    """Get the sampling profile of a protocol analysis.
+
+    Arguments:
+        protocolId: The ID of the protocol, pulled from the URL.
+        analysisId: The ID of the analysis, pulled from the URL.
+        protocol_store: Protocol resource storage.
+        analysis_store: Analysis resource storage.
+    """
+    if not protocol_store.has(protocolId):
+        raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
+            status.HTTP_404_NOT_FOUND
+        )
+
+    # Profiles of runs and analyses are stored together, so make sure this ID
+    # really is one of this protocol's analyses.
+    analysis_ids = [
+        summary.id for summary in analysis_store.get_summaries_by_protocol(protocolId)
+    ]
+    if analysisId not in analysis_ids:
+        raise AnalysisNotFound(
+            detail=f"Analysis {analysisId} of protocol {protocolId} not found."
+        ).as_error(status.HTTP_404_NOT_FOUND)
+
+    return get_profile_response(analysisId)
 
 
 @PydanticResponse.wrap_route(
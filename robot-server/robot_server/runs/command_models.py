@@ -4,7 +4,7 @@ These are shared between the `/runs` and `/maintenance_runs` endpoints.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,15 @@ class RequestModelWithCommandCreate(RequestModel[pe_commands.CommandCreate]):
     data: pe_commands.CommandCreate
 
 
+class RequestModelWithCommandCreates(RequestModel[List[pe_commands.CommandCreate]]):
+    """Equivalent to RequestModel[List[CommandCreate]].
+
+    See `RequestModelWithCommandCreate` for why this is needed.
+    """
+
+    data: List[pe_commands.CommandCreate]
+
+
 class CommandLinkMeta(BaseModel):
     """Metadata about a command resource referenced in `links`."""
 
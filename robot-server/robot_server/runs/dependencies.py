@@ -1,5 +1,5 @@
 """Run router dependency-injection wire-up."""
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, status
 from robot_server.protocols.dependencies import get_protocol_store
@@ -136,6 +136,19 @@ async def get_run_orchestrator_store(
     return run_orchestrator_store
 
 
+def get_current_command_id(app_state: AppState) -> Optional[str]:
+    """Get the ID of the current run's current command, if there is one.
+
+    Unlike the dependencies here, this won't create anything that doesn't exist yet,
+    so it is safe to call outside of a request, and often.
+    """
+    run_orchestrator_store = _run_orchestrator_store_accessor.get_from(app_state)
+    if run_orchestrator_store is None or run_orchestrator_store.current_run_id is None:
+        return None
+    current_command = run_orchestrator_store.get_current_command()
+    return current_command.command_id if current_command is not None else None
+
+
 async def get_is_okay_to_create_maintenance_run(
     run_orchestrator_store: Annotated[
         RunOrchestratorStore, Depends(get_run_orchestrator_store)
@@ -9,6 +9,7 @@ from textwrap import dedent
 from typing import Annotated, Callable, Final, Literal, Optional, Union
 
 from fastapi import APIRouter, Depends, status, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from opentrons_shared_data.errors import ErrorCodes
@@ -26,6 +27,11 @@ from robot_server.data_files.data_files_store import DataFilesStore
 from robot_server.errors.error_responses import ErrorDetails, ErrorBody
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.service.dependencies import get_current_time, get_unique_id
+from robot_server.service.profiling import (
+    PROFILE_DESCRIPTION,
+    ProfileNotFound,
+    get_profile_response,
+)
 from robot_server.robot.control.dependencies import require_estop_in_good_state
 
 from robot_server.service.json_api import (
@@ -327,6 +333,40 @@ async def get_run(
     )
 
 
+@base_router.get(
+    path="/runs/{runId}/profile",
+    summary="[Experimental] Get a profile of a run",
+    description=(
+        "Get a statistical profile of what the robot server did while the run's"
+        " protocol was running, once the protocol has finished."
+        "\n\n" + PROFILE_DESCRIPTION
+    ),
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/plain": {}}},
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[Union[RunNotFound, ProfileNotFound]]
+        },
+    },
+)
+async def get_run_profile(
+    runId: str,
+    run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
+) -> Response:
+    """Get the sampling profile of a run.
+
+    Args:
+        runId: Run ID pulled from URL.
+        run_data_manager: Current and historical run data management.
+    """
+    try:
+        run_data_manager.get(runId)
+    except RunNotFoundError as e:
+        raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
+
+    return get_profile_response(runId)
+
+
 @PydanticResponse.wrap_route(
     base_router.delete,
     path="/runs/{runId}",
@@ -1,4 +1,5 @@
 """Router for /runs commands endpoints."""
+import json
 import textwrap
 from typing import Annotated, Final, Literal, Optional, Union
 
@@ -17,11 +18,13 @@ from robot_server.service.json_api import (
     MultiBodyMeta,
     PydanticResponse,
     SimpleMultiBody,
+    StreamingMultiBodyResponse,
 )
 from robot_server.robot.control.dependencies import require_estop_in_good_state
 
 from ..command_models import (
     RequestModelWithCommandCreate,
+    RequestModelWithCommandCreates,
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
@@ -246,6 +249,124 @@ async def create_run_command(
     )
 
 
+@PydanticResponse.wrap_route(
+    commands_router.post,
+    path="/runs/{runId}/commands/batch",
+    summary="Enqueue several commands",
+    description=textwrap.dedent(
+        """
+        Add several commands to the run at once, in order. This behaves
+        like `POST /runs/{runId}/commands` called once per command,
+        but takes a single request, and the commands are added atomically:
+        if any of them is not allowed, none of them are added.
+
+        Like `POST /runs/{runId}/commands`, commands that don't specify
+        an intent are treated as setup commands.
+        """
+    ),
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": SimpleMultiBody[pe_commands.Command]},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorBody[Union[RunStopped, SetupCommandNotAllowed]]
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorBody[CommandNotAllowed]},
+    },
+)
+async def create_run_commands(
+    request_body: RequestModelWithCommandCreates,
+    run_orchestrator_store: Annotated[
+        RunOrchestratorStore, Depends(get_run_orchestrator_store)
+    ],
+    check_estop: Annotated[bool, Depends(require_estop_in_good_state)],
+    run_id: Annotated[str, Depends(get_current_run_from_url)],
+    waitUntilComplete: Annotated[
+        bool,
+        Query(
+            description=(
+                "If `false`, return immediately, while the new commands are still"
+                " queued. If `true`, only return once the last new command succeeds"
+                " or fails, or when the timeout is reached."
+                " See the `timeout` query parameter."
+            ),
+        ),
+    ] = False,
+    timeout: Annotated[
+        Optional[int],
+        Query(
+            gt=0,
+            description=(
+                "If `waitUntilComplete` is `true`,"
+                " the maximum time in milliseconds to wait before returning."
+                " The default is infinite."
+                "\n\n"
+                "The timer starts as soon as you enqueue the new commands with"
+                " this request. If the timeout elapses before the commands"
+                " succeed or fail, they will be returned with their current status."
+            ),
+        ),
+    ] = None,
+    failedCommandId: Annotated[
+        Optional[str],
+        Query(
+            description=(
+                "FIXIT command use only. Reference of the failed command id we are trying to fix."
+            ),
+        ),
+    ] = None,
+) -> PydanticResponse[SimpleMultiBody[pe_commands.Command]]:
+    """Enqueue several protocol commands.
+
+    Arguments:
+        request_body: The request containing the commands that the client wants
+            to enqueue, in order.
+        waitUntilComplete: If True, return only once the last command is completed.
+            Else, return immediately. Comes from a query parameter in the URL.
+        timeout: The maximum time, in seconds, to wait before returning.
+            Comes from a query parameter in the URL.
+        failedCommandId: FIXIT command use only.
+            Reference of the failed command id we are trying to fix.
+        run_orchestrator_store: The run's `EngineStore` on which the new
+            commands will be enqueued.
+        check_estop: Dependency to verify the estop is in a valid state.
+        run_id: Run identification to attach commands to.
+    """
+    command_creates = [
+        command_create.copy(
+            update={"intent": command_create.intent or pe_commands.CommandIntent.SETUP}
+        )
+        for command_create in request_body.data
+    ]
+
+    try:
+        commands = await run_orchestrator_store.add_commands_and_wait_for_interval(
+            requests=command_creates,
+            failed_command_id=failedCommandId,
+            wait_until_complete=waitUntilComplete,
+            timeout=timeout,
+        )
+
+    except pe_errors.SetupCommandNotAllowedError as e:
+        raise SetupCommandNotAllowed.from_exc(e).as_error(status.HTTP_409_CONFLICT)
+    except pe_errors.RunStoppedError as e:
+        raise RunStopped.from_exc(e).as_error(status.HTTP_409_CONFLICT)
+    except pe_errors.CommandNotAllowedError as e:
+        raise CommandNotAllowed.from_exc(e).as_error(status.HTTP_400_BAD_REQUEST)
+
+    response_data = [
+        run_orchestrator_store.get_command(command.id) for command in commands
+    ]
+
+    return await PydanticResponse.create(
+        content=SimpleMultiBody.construct(
+            data=response_data,
+            meta=MultiBodyMeta(cursor=0, totalLength=len(response_data)),
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/runs/{runId}/commands",
@@ -343,8 +464,7 @@ async def get_run_commands(
 # TODO (spp, 2024-05-01): explore alternatives to returning commands as list of strings.
 #                Options: 1. JSON Lines
 #                         2. Simple de-serialized commands list w/o pydantic model conversion
-@PydanticResponse.wrap_route(
-    commands_router.get,
+@commands_router.get(
     path="/runs/{runId}/commandsAsPreSerializedList",
     summary="Get all commands of a completed run as a list of pre-serialized commands",
     description=(
@@ -357,7 +477,11 @@ async def get_run_commands(
         " This is a faster alternative to fetching the full commands list using"
         " `GET /runs/{runId}/commands`. For large protocols (10k+ commands), the above"
         " endpoint can take minutes to respond, whereas this one should only take a few seconds."
+        "\n\n"
+        "The response is streamed as it's read from the database. Use `cursor` and"
+        " `pageLength` to fetch the commands a page at a time."
     ),
+    response_model=SimpleMultiBody[str],
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
         status.HTTP_503_SERVICE_UNAVAILABLE: {
@@ -368,25 +492,51 @@ async def get_run_commands(
 async def get_run_commands_as_pre_serialized_list(
     runId: str,
     run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
-) -> PydanticResponse[SimpleMultiBody[str]]:
+    cursor: Annotated[
+        Optional[int],
+        Query(
+            description=(
+                "The index of the first command in the list to return."
+                " If unspecified, starts from the first command of the run."
+            ),
+            ge=0,
+        ),
+    ] = None,
+    pageLength: Annotated[
+        Optional[int],
+        Query(
+            description=(
+                "The maximum number of commands in the list to return."
+                " If unspecified, returns all commands from the cursor onwards."
+            ),
+            ge=1,
+        ),
+    ] = None,
+) -> StreamingMultiBodyResponse:
     """Get all commands of a completed run as a list of pre-serialized (string encoded) commands.
 
     Arguments:
         runId: Requested run ID, from the URL
         run_data_manager: Run data retrieval interface.
+        cursor: Index of the first command to return.
+        pageLength: Maximum number of commands to return.
     """
     try:
-        commands = run_data_manager.get_all_commands_as_preserialized_list(runId)
+        command_slice = run_data_manager.get_commands_as_preserialized_slice(
+            run_id=runId, cursor=cursor, length=pageLength
+        )
     except RunNotFoundError as e:
         raise RunNotFound.from_exc(e).as_error(status.HTTP_404_NOT_FOUND) from e
     except PreSerializedCommandsNotAvailableError as e:
         raise PreSerializedCommandsNotAvailable.from_exc(e).as_error(
             status.HTTP_503_SERVICE_UNAVAILABLE
         ) from e
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=commands, meta=MultiBodyMeta(cursor=0, totalLength=len(commands))
-        )
+    return StreamingMultiBodyResponse(
+        # Each command is itself a JSON string, so it's encoded again as a string item.
+        data=(json.dumps(command) for command in command_slice.commands),
+        meta=MultiBodyMeta(
+            cursor=command_slice.cursor, totalLength=command_slice.total_length
+        ),
     )
 
 
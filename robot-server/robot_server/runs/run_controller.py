@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 from opentrons.protocol_engine import ProtocolEngineError
+from opentrons.util.performance_helpers import TrackingFunctions
 from opentrons_shared_data.errors.exceptions import RoboticsInteractionError
 
 from robot_server.service.task_runner import TaskRunner
@@ -102,16 +103,23 @@ class RunController:
 
     async def _run_protocol_and_insert_result(
         self, deck_configuration: DeckConfigurationType
+    ) -> None:
+        await self._track_run_and_insert_result(
+            run_id=self._run_id, deck_configuration=deck_configuration
+        )
+
+    # Takes the run ID as an argument so the run can be profiled under it.
+    @TrackingFunctions.track_run
+    async def _track_run_and_insert_result(
+        self, run_id: str, deck_configuration: DeckConfigurationType
     ) -> None:
         result = await self._run_orchestrator_store.run(
             deck_configuration=deck_configuration,
         )
-        self._run_store.update_run_state(
-            run_id=self._run_id,
+        await self._run_store.update_run_state_async(
+            run_id=run_id,
             summary=result.state_summary,
             commands=result.commands,
             run_time_parameters=result.parameters,
         )
-        await self._runs_publisher.publish_pre_serialized_commands_notification(
-            self._run_id
-        )
+        await self._runs_publisher.publish_pre_serialized_commands_notification(run_id)
@@ -26,7 +26,13 @@ from . import error_recovery_mapping
 from .error_recovery_models import ErrorRecoveryRule
 
 from .run_orchestrator_store import RunOrchestratorStore
-from .run_store import RunResource, RunStore, BadRunResource, BadStateSummary
+from .run_store import (
+    RunResource,
+    RunStore,
+    BadRunResource,
+    BadStateSummary,
+    PreSerializedCommandSlice,
+)
 from .run_models import Run, BadRun, RunDataError
 
 from opentrons.protocol_engine.types import DeckConfigurationType, RunTimeParameter
@@ -187,7 +193,7 @@ class RunDataManager:
         prev_run_id = self._run_orchestrator_store.current_run_id
         if prev_run_id is not None:
             prev_run_result = await self._run_orchestrator_store.clear()
-            self._run_store.update_run_state(
+            await self._run_store.update_run_state_async(
                 run_id=prev_run_id,
                 summary=prev_run_result.state_summary,
                 commands=prev_run_result.commands,
@@ -345,7 +351,7 @@ class RunDataManager:
             ) = await self._run_orchestrator_store.clear()
             run_resource: Union[
                 RunResource, BadRunResource
-            ] = self._run_store.update_run_state(
+            ] = await self._run_store.update_run_state_async(
                 run_id=run_id,
                 summary=state_summary,
                 commands=commands,
@@ -468,8 +474,25 @@ class RunDataManager:
         # TODO(tz, 8-5-2024): Change this to return to error list from the DB when we implement https://opentrons.atlassian.net/browse/EXEC-655.
         raise RunNotCurrentError()
 
-    def get_all_commands_as_preserialized_list(self, run_id: str) -> List[str]:
-        """Get all commands of a run in a serialized json list."""
+    def get_commands_as_preserialized_slice(
+        self,
+        run_id: str,
+        cursor: Optional[int],
+        length: Optional[int],
+    ) -> PreSerializedCommandSlice:
+        """Get a range of a run's commands as serialized json, read lazily from the database.
+
+        Args:
+            run_id: ID of the run.
+            cursor: The index of the first command to return. Defaults to 0.
+            length: The maximum number of commands to return. Defaults to all of them.
+        """
+        self._raise_if_preserialized_commands_not_available(run_id)
+        return self._run_store.get_commands_as_preserialized_slice(
+            run_id=run_id, cursor=cursor, length=length
+        )
+
+    def _raise_if_preserialized_commands_not_available(self, run_id: str) -> None:
         if (
             run_id == self._run_orchestrator_store.current_run_id
             and not self._run_orchestrator_store.get_is_run_terminal()
@@ -477,7 +500,6 @@ class RunDataManager:
             raise PreSerializedCommandsNotAvailableError(
                 "Pre-serialized commands are only available after a run has ended."
             )
-        return self._run_store.get_all_commands_as_preserialized_list(run_id)
 
     def set_policies(self, run_id: str, policies: List[ErrorRecoveryRule]) -> None:
         """Create run policy rules for error recovery."""
@@ -1,7 +1,7 @@
 """In-memory storage of ProtocolEngine instances."""
 import asyncio
 import logging
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Sequence
 
 from opentrons.protocol_engine.errors.exceptions import EStopActivatedError
 from opentrons.protocol_engine.types import (
@@ -409,3 +409,18 @@ class RunOrchestratorStore:
             wait_until_complete=wait_until_complete,
             timeout=timeout,
         )
+
+    async def add_commands_and_wait_for_interval(
+        self,
+        requests: Sequence[CommandCreate],
+        wait_until_complete: bool = False,
+        timeout: Optional[int] = None,
+        failed_command_id: Optional[str] = None,
+    ) -> List[Command]:
+        """Add new commands to execute and wait for them to complete if needed."""
+        return await self.run_orchestrator.add_commands_and_wait_for_interval(
+            commands=requests,
+            failed_command_id=failed_command_id,
+            wait_until_complete=wait_until_complete,
+            timeout=timeout,
+        )
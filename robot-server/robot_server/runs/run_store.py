@@ -4,8 +4,9 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, Iterator, List, Optional, Literal, Tuple, Union
 
+import anyio
 import sqlalchemy
 from pydantic import ValidationError
 
@@ -20,7 +21,7 @@ from opentrons_shared_data.errors.exceptions import (
     InvalidStoredData,
 )
 
-from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.database import begin_write, sqlite_rowid
 from robot_server.persistence.tables import (
     run_table,
     run_command_table,
@@ -42,6 +43,23 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+# How many pre-serialized commands to read from the database at a time when
+# streaming a run's commands.
+_PRESERIALIZED_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PreSerializedCommandSlice:
+    """A range of a run's commands, as JSON strings read lazily from the database.
+
+    `commands` is a one-shot iterator. It reads from the database in chunks as it's
+    consumed, so memory use doesn't grow with the size of the run.
+    """
+
+    commands: Iterator[str]
+    cursor: int
+    total_length: int
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -134,6 +152,47 @@ class RunStore:
         Raises:
             RunNotFoundError: Run ID was not found in the database.
         """
+        run_row, action_rows = self._write_run_state(
+            run_id=run_id,
+            summary=summary,
+            command_rows=_convert_commands_to_sql_values(run_id, commands),
+            run_time_parameters=run_time_parameters,
+        )
+        self._clear_caches()
+        return _convert_updated_row_to_run(run_row, action_rows)
+
+    async def update_run_state_async(
+        self,
+        run_id: str,
+        summary: StateSummary,
+        commands: List[Command],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> RunResource:
+        """Like `update_run_state()`, but serialize the commands in a worker thread.
+
+        Serializing a long run's commands is slow, so it's done off the event loop.
+        The write itself stays on the event loop, like every other write. That way
+        writes never wait for each other's database locks, which would block the loop.
+        """
+        command_rows = await anyio.to_thread.run_sync(
+            _convert_commands_to_sql_values, run_id, commands
+        )
+        run_row, action_rows = self._write_run_state(
+            run_id=run_id,
+            summary=summary,
+            command_rows=command_rows,
+            run_time_parameters=run_time_parameters,
+        )
+        self._clear_caches()
+        return _convert_updated_row_to_run(run_row, action_rows)
+
+    def _write_run_state(
+        self,
+        run_id: str,
+        summary: StateSummary,
+        command_rows: List[Dict[str, object]],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> Tuple[sqlalchemy.engine.Row, List[sqlalchemy.engine.Row]]:
         update_run = (
             sqlalchemy.update(run_table)
             .where(run_table.c.id == run_id)
@@ -161,31 +220,20 @@ class RunStore:
             .order_by(sqlite_rowid)
         )
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
 
             transaction.execute(update_run)
             transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
-                transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                    },
-                )
+            if command_rows:
+                # One executemany() instead of a round trip per command.
+                transaction.execute(insert_command, command_rows)
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
 
-        self._clear_caches()
-        maybe_run_resource = _convert_row_to_run(row=run_row, action_rows=action_rows)
-        if not maybe_run_resource.ok:
-            raise maybe_run_resource.error
-        return maybe_run_resource
+        return run_row, action_rows
 
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
@@ -201,7 +249,7 @@ class RunStore:
             _convert_action_to_sql_values(run_id=run_id, action=action),
         )
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
             transaction.execute(insert)
@@ -225,7 +273,7 @@ class RunStore:
         """Save csv rtp to the run_csv_rtp_table."""
         insert_csv_rtp = sqlalchemy.insert(run_csv_rtp_table)
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
             for run_time_param in run_time_parameters:
@@ -272,7 +320,7 @@ class RunStore:
             _convert_run_to_sql_values(run=run)
         )
 
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             try:
                 transaction.execute(insert)
             except sqlalchemy.exc.IntegrityError:
@@ -484,18 +532,74 @@ class RunStore:
             commands=sliced_commands,
         )
 
-    def get_all_commands_as_preserialized_list(self, run_id: str) -> List[str]:
-        """Get all commands of the run as a list of strings of json command objects."""
+    def get_commands_as_preserialized_slice(
+        self,
+        run_id: str,
+        cursor: Optional[int] = None,
+        length: Optional[int] = None,
+        chunk_size: int = _PRESERIALIZED_CHUNK_SIZE,
+    ) -> PreSerializedCommandSlice:
+        """Get a range of the run's commands as strings of json command objects.
+
+        The commands are not loaded up front. They're read `chunk_size` at a time,
+        each chunk in its own short transaction, as the returned iterator is consumed.
+
+        Args:
+            run_id: Run ID to pull commands from.
+            cursor: The index of the first command to return. Defaults to 0.
+            length: The maximum number of commands to return. Defaults to all
+                commands from `cursor` onwards.
+            chunk_size: The number of commands to read from the database at a time.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found. This is raised
+                immediately. If the run is deleted while the returned iterator is
+                being consumed, the iterator raises it instead of ending early.
+        """
         with self._sql_engine.begin() as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
-            select_commands = (
+            select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+                run_command_table.c.run_id == run_id
+            )
+            total_length: int = transaction.execute(select_count).scalar_one()
+
+        start = max(0, min(cursor or 0, total_length))
+        stop = total_length if length is None else min(start + length, total_length)
+
+        return PreSerializedCommandSlice(
+            commands=self._iter_preserialized_commands(
+                run_id=run_id, start=start, stop=stop, chunk_size=chunk_size
+            ),
+            cursor=start,
+            total_length=total_length,
+        )
+
+    def _iter_preserialized_commands(
+        self, run_id: str, start: int, stop: int, chunk_size: int
+    ) -> Iterator[str]:
+        # Use the index_in_run index to seek to each chunk, instead of holding a
+        # cursor (and a pooled connection) open while the client reads slowly.
+        chunk_start = start
+        while chunk_start < stop:
+            chunk_stop = min(chunk_start + chunk_size, stop)
+            select_chunk = (
                 sqlalchemy.select(run_command_table.c.command)
-                .where(run_command_table.c.run_id == run_id)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= chunk_start,
+                    run_command_table.c.index_in_run < chunk_stop,
+                )
                 .order_by(run_command_table.c.index_in_run)
             )
-            commands_result = transaction.scalars(select_commands).all()
-        return commands_result
+            with self._sql_engine.begin() as transaction:
+                chunk: List[str] = transaction.scalars(select_chunk).all()
+            if len(chunk) < chunk_stop - chunk_start:
+                # The run was deleted out from under us. Ending early would look
+                # like a complete, shorter list, so fail instead.
+                raise RunNotFoundError(run_id=run_id)
+            yield from chunk
+            chunk_start = chunk_stop
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
@@ -546,7 +650,7 @@ class RunStore:
         delete_csv_rtps = sqlalchemy.delete(run_csv_rtp_table).where(
             run_csv_rtp_table.c.run_id == run_id
         )
-        with self._sql_engine.begin() as transaction:
+        with begin_write(self._sql_engine) as transaction:
             transaction.execute(delete_actions)
             transaction.execute(delete_commands)
             transaction.execute(delete_csv_rtps)
@@ -594,6 +698,16 @@ def _convert_row_to_csv_rtp(
     )
 
 
+def _convert_updated_row_to_run(
+    row: sqlalchemy.engine.Row,
+    action_rows: List[sqlalchemy.engine.Row],
+) -> RunResource:
+    maybe_run_resource = _convert_row_to_run(row=row, action_rows=action_rows)
+    if not maybe_run_resource.ok:
+        raise maybe_run_resource.error
+    return maybe_run_resource
+
+
 def _convert_row_to_run(
     row: sqlalchemy.engine.Row,
     action_rows: List[sqlalchemy.engine.Row],
@@ -651,6 +765,20 @@ def _convert_run_to_sql_values(run: RunResource) -> Dict[str, object]:
     }
 
 
+def _convert_commands_to_sql_values(
+    run_id: str, commands: List[Command]
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": command_index,
+            "command_id": command.id,
+            "command": pydantic_to_json(command),
+        }
+        for command_index, command in enumerate(commands)
+    ]
+
+
 def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, object]:
     return {
         "id": action.id,
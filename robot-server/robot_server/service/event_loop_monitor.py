@@ -0,0 +1,41 @@
+"""Monitoring of the server's event loop, when performance metrics are enabled."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from opentrons.util.performance_helpers import create_event_loop_monitor
+from server_utils.fastapi_utils.app_state import AppState, AppStateAccessor
+
+from robot_server.runs.dependencies import get_current_command_id
+
+if TYPE_CHECKING:
+    from performance_metrics import EventLoopMonitor
+
+
+_event_loop_monitor_accessor: AppStateAccessor[EventLoopMonitor] = AppStateAccessor(
+    "event_loop_monitor"
+)
+
+
+def start_event_loop_monitor(app_state: AppState) -> None:
+    """Start monitoring the running event loop, if performance metrics are enabled.
+
+    Intended to be called just once, when the server starts up.
+    """
+    monitor = create_event_loop_monitor(
+        command_id_source=lambda: get_current_command_id(app_state)
+    )
+    if monitor is not None:
+        monitor.start()
+        _event_loop_monitor_accessor.set_on(app_state, monitor)
+
+
+async def clean_up_event_loop_monitor(app_state: AppState) -> None:
+    """Stop the event loop monitor stored on `app_state`, storing what it measured.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    monitor = _event_loop_monitor_accessor.get_from(app_state)
+
+    if monitor is not None:
+        await monitor.stop()
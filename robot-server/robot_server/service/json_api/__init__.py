@@ -14,6 +14,7 @@ from .response import (
     DeprecatedResponseDataModel,
     ResourceModel,
     PydanticResponse,
+    StreamingMultiBodyResponse,
     ResponseList,
     NotifyRefetchBody,
     NotifyUnsubscribeBody,
@@ -25,6 +26,7 @@ __all__ = [
     "RequestModel",
     # response models
     "PydanticResponse",
+    "StreamingMultiBodyResponse",
     # response body models
     "BaseResponseBody",
     "Body",
@@ -1,20 +1,24 @@
 from __future__ import annotations
 from anyio import to_thread
+from itertools import islice
 from typing import (
     Any,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     TypeVar,
     Sequence,
     ParamSpec,
     Callable,
+    cast,
 )
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
 from pydantic.typing import get_args
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.dependencies.utils import get_typed_return_annotation
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
@@ -223,11 +227,82 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         """
         return await to_thread.run_sync(cls, content, status_code)
 
+    @classmethod
+    def create_pre_serialized(
+        cls,
+        content: str,
+        status_code: int = 200,
+    ) -> PydanticResponse[ResponseBodyT]:
+        """Create a response object from an already-serialized JSON body.
+
+        The caller is responsible for making sure that `content` is what serializing
+        the route's response model would have produced. This lets routes pass stored
+        documents straight through without parsing and re-serializing them.
+        """
+        return cls(cast(ResponseBodyT, _PreSerializedBody(content)), status_code)
+
     def render(self, content: ResponseBodyT) -> bytes:
         """Render the response body to JSON bytes."""
+        if isinstance(content, _PreSerializedBody):
+            return content.json.encode(self.charset)
         return content.json().encode(self.charset)
 
 
+class _PreSerializedBody:
+    """A response body that has already been serialized to JSON."""
+
+    def __init__(self, json: str) -> None:
+        self.json = json
+
+
+class StreamingMultiBodyResponse(StreamingResponse):
+    """A `SimpleMultiBody`-shaped JSON response whose items are produced lazily.
+
+    Use this for collections too large to hold in memory all at once, like every
+    command of a long run. The body is written out in batches as `data` is consumed,
+    so memory use stays flat regardless of the collection's size.
+
+    Because the body isn't rendered through a Pydantic model, routes returning this
+    should declare their `response_model` explicitly.
+
+    If `data` raises partway through, the exception propagates and the response is
+    aborted, so the client never gets a truncated body that looks complete.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        data: Iterable[str],
+        meta: MultiBodyMeta,
+        status_code: int = 200,
+        batch_size: int = 500,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            data: The collection's items, each already serialized to JSON.
+            meta: Metadata about the collection, written after the last item.
+            status_code: The HTTP status code of the response.
+            batch_size: How many items to write to the client at a time.
+        """
+        super().__init__(
+            content=self._render(data, meta, batch_size), status_code=status_code
+        )
+
+    @staticmethod
+    def _render(
+        data: Iterable[str], meta: MultiBodyMeta, batch_size: int
+    ) -> Iterator[bytes]:
+        items = iter(data)
+        separator = ""
+        yield b'{"data": ['
+        while batch := list(islice(items, batch_size)):
+            yield (separator + ", ".join(batch)).encode("utf-8")
+            separator = ", "
+        yield f'], "meta": {meta.json()}}}'.encode("utf-8")
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
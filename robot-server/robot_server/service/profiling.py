@@ -0,0 +1,45 @@
+"""Sampling profiles of protocol runs and analyses, when profiling is enabled."""
+
+from typing import Literal
+
+from fastapi import status
+from fastapi.responses import Response
+
+from opentrons.util import performance_helpers
+from opentrons_shared_data.errors import ErrorCodes
+
+from robot_server.errors.error_responses import ErrorDetails
+
+
+PROFILE_DESCRIPTION = (
+    "**Warning:** This endpoint is experimental. We may change or remove it without warning."
+    "\n\n"
+    "Profiles are only recorded when performance metrics are enabled and the"
+    " `OT_PERFORMANCE_METRICS_PROFILER_ENABLED` environment variable is `true`."
+    "\n\n"
+    "The profile is returned as plain text in the collapsed stack format,"
+    " with one line per sampled stack and its sample count,"
+    " which tools like flamegraph.pl and speedscope can display."
+)
+
+
+class ProfileNotFound(ErrorDetails):
+    """An error returned when a run or analysis was not profiled."""
+
+    id: Literal["ProfileNotFound"] = "ProfileNotFound"
+    title: str = "Profile Not Found"
+    errorCode: str = ErrorCodes.GENERAL_ERROR.value.code
+
+
+def get_profile_response(profile_id: str) -> Response:
+    """Get a stored profile as a plain text response.
+
+    Raises:
+        ApiError: 404 if there is no finished profile with this ID.
+    """
+    profile = performance_helpers.get_profile(profile_id)
+    if profile is None:
+        raise ProfileNotFound(
+            detail=f"No profile was recorded for {profile_id}."
+        ).as_error(status.HTTP_404_NOT_FOUND)
+    return Response(content=profile, media_type="text/plain")
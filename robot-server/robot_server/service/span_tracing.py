@@ -0,0 +1,36 @@
+"""Span tracing of protocol commands, when performance metrics are enabled."""
+
+from __future__ import annotations
+import asyncio
+from typing import TYPE_CHECKING
+
+from opentrons.util.performance_helpers import create_span_tracer
+from server_utils.fastapi_utils.app_state import AppState, AppStateAccessor
+
+if TYPE_CHECKING:
+    from performance_metrics import SpanTracer
+
+
+_span_tracer_accessor: AppStateAccessor[SpanTracer] = AppStateAccessor("span_tracer")
+
+
+def start_span_tracing(app_state: AppState) -> None:
+    """Start collecting spans, if performance metrics are enabled.
+
+    Intended to be called just once, when the server starts up.
+    """
+    tracer = create_span_tracer()
+    if tracer is not None:
+        tracer.install()
+        _span_tracer_accessor.set_on(app_state, tracer)
+
+
+async def clean_up_span_tracing(app_state: AppState) -> None:
+    """Stop collecting spans and store the ones collected so far.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    tracer = _span_tracer_accessor.get_from(app_state)
+
+    if tracer is not None:
+        await asyncio.to_thread(tracer.uninstall)
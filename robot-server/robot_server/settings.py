@@ -111,5 +111,16 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    json_backend: typing_extensions.Literal["json", "orjson"] = Field(
+        default="json",
+        description=(
+            "The library used to serialize and parse JSON stored in the database."
+            " `orjson` is faster for large documents, like long runs' commands,"
+            " but it isn't a dependency of the robot server, so it must be"
+            " installed separately. Documents written with either can be read"
+            " with the other."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -45,6 +45,8 @@ from robot_server.persistence.tables import metadata
 from robot_server.persistence.fastapi_dependencies import get_sql_engine
 from robot_server.health.router import ComponentVersions, get_versions
 
+pytest_plugins = ["opentrons_shared_data.pytest_benchmarks"]
+
 test_router = routing.APIRouter()
 
 
@@ -103,9 +103,11 @@ async def test_get_instruments_empty(
 # TODO (spp, 2022-01-17): remove xfail once robot server test flow is set up to handle
 #  OT2 vs OT3 tests correclty
 @pytest.mark.ot3_only
+@pytest.mark.parametrize("refresh", [False, True])
 async def test_get_all_attached_instruments(
     decoy: Decoy,
     ot3_hardware_api: OT3API,
+    refresh: bool,
 ) -> None:
     """It should get data of all attached instruments."""
     left_pipette_dict = get_sample_pipette_dict(
@@ -188,9 +190,15 @@ async def test_get_all_attached_instruments(
 
     # We use this convoluted way of testing to verify the important point that
     # cache_instruments is called before fetching attached pipette and gripper data.
-    decoy.when(
-        await ot3_hardware_api.cache_instruments(skip_if_would_block=True)
-    ).then_do(rehearse_instrument_retrievals)
+    # Unless asked to refresh, it should only rescan if something changed.
+    if refresh:
+        decoy.when(
+            await ot3_hardware_api.cache_instruments(skip_if_would_block=True)
+        ).then_do(rehearse_instrument_retrievals)
+    else:
+        decoy.when(await ot3_hardware_api.cache_instruments_if_changed()).then_do(
+            rehearse_instrument_retrievals
+        )
     decoy.when(ot3_hardware_api.get_instrument_offset(mount=OT3Mount.LEFT)).then_return(
         PipetteOffsetSummary(
             offset=Point(1, 2, 3),
@@ -211,7 +219,7 @@ async def test_get_all_attached_instruments(
             reasonability_check_failures=[],
         )
     )
-    result = await get_attached_instruments(hardware=ot3_hardware_api)
+    result = await get_attached_instruments(hardware=ot3_hardware_api, refresh=refresh)
 
     assert result.content.data == [
         Pipette.construct(
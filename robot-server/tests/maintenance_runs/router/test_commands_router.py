@@ -26,12 +26,14 @@ from robot_server.maintenance_runs.maintenance_run_models import (
 )
 from robot_server.maintenance_runs.router.commands_router import (
     create_run_command,
+    create_run_commands,
     get_run_command,
     get_run_commands,
     get_current_run_from_url,
 )
 from robot_server.runs.command_models import (
     RequestModelWithCommandCreate,
+    RequestModelWithCommandCreates,
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
@@ -162,6 +164,58 @@ async def test_create_run_command_blocking_completion(
     assert result.status_code == 201
 
 
+async def test_create_run_commands(
+    decoy: Decoy,
+    mock_maintenance_run_orchestrator_store: MaintenanceRunOrchestratorStore,
+) -> None:
+    """It should add the requested commands as setup commands, in order."""
+    command_request = pe_commands.WaitForResumeCreate(
+        params=pe_commands.WaitForResumeParams(message="Hello"),
+        intent=pe_commands.CommandIntent.PROTOCOL,
+    )
+    commands_once_added = [
+        pe_commands.WaitForResume(
+            id=f"command-id-{n}",
+            key=f"command-key-{n}",
+            createdAt=datetime(year=2021, month=1, day=1),
+            status=pe_commands.CommandStatus.QUEUED,
+            params=pe_commands.WaitForResumeParams(message="Hello"),
+        )
+        for n in range(2)
+    ]
+    setup_request = pe_commands.WaitForResumeCreate(
+        params=pe_commands.WaitForResumeParams(message="Hello"),
+        intent=pe_commands.CommandIntent.SETUP,
+    )
+
+    decoy.when(
+        await mock_maintenance_run_orchestrator_store.add_commands_and_wait_for_interval(
+            requests=[setup_request, setup_request],
+            wait_until_complete=False,
+            timeout=None,
+        )
+    ).then_return(commands_once_added)
+    for command in commands_once_added:
+        decoy.when(
+            mock_maintenance_run_orchestrator_store.get_command(command.id)
+        ).then_return(command)
+
+    result = await create_run_commands(
+        run_id="run-id",
+        request_body=RequestModelWithCommandCreates(
+            data=[command_request, command_request]
+        ),
+        waitUntilComplete=False,
+        run_orchestrator_store=mock_maintenance_run_orchestrator_store,
+        timeout=None,
+        check_estop=True,
+    )
+
+    assert result.content.data == commands_once_added
+    assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=2)
+    assert result.status_code == 201
+
+
 async def test_get_run_commands(
     decoy: Decoy, mock_maintenance_run_data_manager: MaintenanceRunDataManager
 ) -> None:
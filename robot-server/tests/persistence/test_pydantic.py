@@ -0,0 +1,156 @@
+"""Tests for robot_server.persistence.pydantic."""
+import json
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Iterator, List
+
+import pytest
+from pydantic import BaseModel
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_engine.commands import Command
+from opentrons.protocol_engine.types import BooleanParameter, RunTimeParameter
+
+from robot_server.persistence import pydantic as subject
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    AnalysisStatus,
+    CompletedAnalysis,
+)
+
+
+# About 0.5 s here, with either backend.
+_LARGE_ANALYSIS_BUDGET_SECONDS = 2.0
+
+_BACKENDS = [subject.STDLIB_JSON_BACKEND] + (
+    [subject.ORJSON_BACKEND] if subject.ORJSON_BACKEND is not None else []
+)
+
+
+@pytest.fixture(params=_BACKENDS, ids=lambda backend: backend.name)
+def backend(request: pytest.FixtureRequest) -> Iterator[subject.JSONBackend]:
+    """Use each available JSON backend in turn."""
+    previous = subject.get_json_backend()
+    subject.set_json_backend(request.param)
+    yield request.param
+    subject.set_json_backend(previous)
+
+
+def _command(index: int) -> pe_commands.Command:
+    return pe_commands.WaitForResume(
+        id=f"pause-{index}",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message=f"hello {index}"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+
+
+def _analysis(command_count: int) -> CompletedAnalysis:
+    return CompletedAnalysis(
+        id="analysis-id",
+        status=AnalysisStatus.COMPLETED,
+        result=AnalysisResult.OK,
+        pipettes=[],
+        labware=[],
+        modules=[],
+        commands=[_command(i) for i in range(command_count)],
+        errors=[],
+        liquids=[],
+    )
+
+
+def test_round_trip_model(backend: subject.JSONBackend) -> None:
+    """It should serialize a model like Pydantic does and parse it back."""
+    command = _command(1)
+
+    serialized = subject.pydantic_to_json(command)
+
+    assert json.loads(serialized) == json.loads(
+        command.json(by_alias=True, exclude_none=True)
+    )
+    assert subject.json_to_pydantic(pe_commands.WaitForResume, serialized) == command
+    # Union types should go through the union's validation.
+    assert subject.json_to_pydantic(Command, serialized) == command  # type: ignore[arg-type]
+
+
+def test_round_trip_list(backend: subject.JSONBackend) -> None:
+    """It should serialize and parse lists of models."""
+    parameters: List[RunTimeParameter] = [
+        BooleanParameter(
+            displayName="Display Name",
+            variableName="variable_name",
+            value=False,
+            default=True,
+        )
+    ]
+
+    serialized = subject.pydantic_list_to_json(parameters)
+
+    assert subject.json_to_pydantic_list(RunTimeParameter, serialized) == parameters  # type: ignore[arg-type]
+
+
+def test_backends_read_each_others_documents() -> None:
+    """Documents written by one backend should be readable by any other."""
+    analysis = _analysis(command_count=3)
+    previous = subject.get_json_backend()
+    try:
+        for writer in _BACKENDS:
+            subject.set_json_backend(writer)
+            document = subject.pydantic_to_json(analysis)
+            for reader in _BACKENDS:
+                subject.set_json_backend(reader)
+                assert subject.json_to_pydantic(CompletedAnalysis, document) == analysis
+    finally:
+        subject.set_json_backend(previous)
+
+
+def test_default_backend_is_stdlib() -> None:
+    """The stdlib backend should be the default, since orjson isn't a dependency."""
+    assert subject.get_json_backend() is subject.STDLIB_JSON_BACKEND
+
+
+@pytest.mark.parametrize("backend", _BACKENDS, ids=lambda backend: backend.name)
+def test_get_json_backend_by_name(backend: subject.JSONBackend) -> None:
+    """It should look up each available backend by name."""
+    assert subject.get_json_backend_by_name(backend.name) is backend
+
+
+def test_get_json_backend_by_name_unavailable() -> None:
+    """It should raise for backends that don't exist."""
+    with pytest.raises(ValueError, match="not-a-backend"):
+        subject.get_json_backend_by_name("not-a-backend")
+
+
+def test_custom_json_encoders_are_used(backend: subject.JSONBackend) -> None:
+    """It should honor a model's own json_encoders, like `.json()` does."""
+
+    class _Model(BaseModel):
+        value: Decimal
+
+        class Config:
+            json_encoders = {Decimal: str}
+
+    assert json.loads(subject.pydantic_to_json(_Model(value=Decimal("1.10")))) == {
+        "value": "1.10"
+    }
+
+
+@pytest.mark.benchmark
+def test_large_analysis_benchmark(backend: subject.JSONBackend) -> None:
+    """Serialize and parse a large analysis within the time budget."""
+    analysis = _analysis(command_count=5000)
+
+    start = time.perf_counter()
+    document = subject.pydantic_to_json(analysis)
+    serialized_at = time.perf_counter()
+    parsed = subject.json_to_pydantic(CompletedAnalysis, document)
+    parsed_at = time.perf_counter()
+
+    assert parsed == analysis
+    assert parsed_at - start < _LARGE_ANALYSIS_BUDGET_SECONDS, (
+        f"{backend.name}: serialize {(serialized_at - start) * 1000:.0f} ms,"
+        f" parse {(parsed_at - serialized_at) * 1000:.0f} ms"
+    )
@@ -181,6 +181,9 @@ async def test_add_pending(
     with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
         # Unlike get(), get_as_document() should raise if the analysis is pending.
         await subject.get_as_document("analysis-id")
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
+        await subject.get_as_document_chunks("analysis-id")
+    assert await subject.get_as_current_document("analysis-id") is None
 
 
 async def test_returned_in_order_added(
@@ -270,6 +273,7 @@ async def test_update_adds_details_and_completes_analysis(
 
     result = await subject.get("analysis-id")
     result_as_document = await subject.get_as_document("analysis-id")
+    result_as_current_document = await subject.get_as_current_document("analysis-id")
 
     assert result == CompletedAnalysis(
         id="analysis-id",
@@ -285,6 +289,10 @@ async def test_update_adds_details_and_completes_analysis(
         liquids=[],
     )
     assert await subject.get_by_protocol("protocol-id") == [result]
+    assert result_as_current_document == result_as_document
+    assert "".join(await subject.get_as_document_chunks("analysis-id")) == (
+        result_as_document
+    )
     assert json.loads(result_as_document) == {
         "id": "analysis-id",
         "result": "ok",
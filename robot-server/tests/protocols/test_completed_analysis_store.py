@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional, Dict, List
 
 import pytest
+import sqlalchemy
 from sqlalchemy.engine import Engine
 from decoy import Decoy
 
@@ -210,6 +211,84 @@ async def test_get_by_analysis_id_as_document(
     }
 
 
+@pytest.mark.parametrize("chunk_size", [1, 7, 1_000_000])
+async def test_get_by_analysis_id_as_document_chunks(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+    chunk_size: int,
+) -> None:
+    """It should read the same document lazily, in pieces."""
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=_completed_analysis_resource(
+            "analysis-id", "protocol-id"
+        ),
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+
+    chunks = await subject.get_by_id_as_document_chunks(
+        "analysis-id", chunk_size=chunk_size
+    )
+    assert chunks is not None
+    chunk_list = list(chunks)
+
+    assert all(len(chunk) <= chunk_size for chunk in chunk_list)
+    assert "".join(chunk_list) == await subject.get_by_id_as_document("analysis-id")
+    assert await subject.get_by_id_as_document_chunks("not-an-id") is None
+
+
+async def test_get_by_analysis_id_as_document_chunks_consistent(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+    sql_engine: Engine,
+) -> None:
+    """All the pieces should come from the version of the document that was read."""
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=_completed_analysis_resource(
+            "analysis-id", "protocol-id"
+        ),
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+    document = await subject.get_by_id_as_document("analysis-id")
+
+    chunks = await subject.get_by_id_as_document_chunks("analysis-id", chunk_size=7)
+    assert chunks is not None
+    first_chunk = next(chunks)
+    with sql_engine.begin() as transaction:
+        transaction.execute(sqlalchemy.delete(analysis_table))
+
+    assert first_chunk + "".join(chunks) == document
+
+
+async def test_get_by_analysis_id_as_current_document(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    sql_engine: Engine,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should only pass through documents stored by the current analyzer version."""
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=_completed_analysis_resource(
+            "analysis-id", "protocol-id"
+        ),
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+
+    result = await subject.get_by_id_as_current_document("analysis-id")
+    assert result == await subject.get_by_id_as_document("analysis-id")
+    assert await subject.get_by_id_as_current_document("not-an-id") is None
+
+    other_version_subject = CompletedAnalysisStore(sql_engine, memcache, "1")
+    assert (
+        await other_version_subject.get_by_id_as_current_document("analysis-id") is None
+    )
+
+
 async def test_get_ids_by_protocol(
     subject: CompletedAnalysisStore, protocol_store: ProtocolStore
 ) -> None:
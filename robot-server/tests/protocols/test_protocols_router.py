@@ -1,6 +1,7 @@
 """Tests for the /protocols router."""
 
 import io
+import json
 
 import pytest
 from datetime import datetime
@@ -16,6 +17,7 @@ from opentrons.protocol_engine.types import (
     FileInfo,
 )
 from opentrons.protocols.api_support.types import APIVersion
+from opentrons.util import performance_helpers
 
 from opentrons.protocol_reader import (
     FileReaderWriter,
@@ -76,6 +78,7 @@ from robot_server.protocols.router import (
     get_protocol_analyses,
     get_protocol_analysis_by_id,
     get_protocol_analysis_as_document,
+    get_protocol_analysis_profile,
     get_protocol_data_files,
 )
 
@@ -1548,6 +1551,31 @@ async def test_get_protocol_analysis_by_id(
     assert result.content.data == analysis
 
 
+async def test_get_protocol_analysis_by_id_passes_through_document(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should return a stored document without parsing it, when it can."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(await analysis_store.get_as_current_document("analysis-id")).then_return(
+        '{"id": "analysis-id", "status": "completed"}'
+    )
+
+    result = await get_protocol_analysis_by_id(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
+
+    assert result.status_code == 200
+    assert json.loads(result.body) == {
+        "data": {"id": "analysis-id", "status": "completed"}
+    }
+    decoy.verify(await analysis_store.get("analysis-id"), times=0)
+
+
 async def test_get_protocol_analysis_by_id_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
@@ -1596,12 +1624,10 @@ async def test_get_protocol_analysis_as_document(
     protocol_store: ProtocolStore,
     analysis_store: AnalysisStore,
 ) -> None:
-    """It should get a single full analysis by ID."""
-    analysis = "foo"
-
+    """It should stream a single full analysis by ID."""
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_as_document("analysis-id")).then_return(
-        analysis
+    decoy.when(await analysis_store.get_as_document_chunks("analysis-id")).then_return(
+        iter(["fo", "o"])
     )
 
     result = await get_protocol_analysis_as_document(
@@ -1612,7 +1638,12 @@ async def test_get_protocol_analysis_as_document(
     )
 
     assert result.status_code == 200
-    assert result.body.decode(result.charset) == analysis
+    assert result.media_type == "application/json"
+    body = [chunk async for chunk in result.body_iterator]
+    assert (
+        "".join(chunk if isinstance(chunk, str) else chunk.decode() for chunk in body)
+        == "foo"
+    )
 
 
 async def test_get_protocol_analysis_as_document_protocol_not_found(
@@ -1642,7 +1673,7 @@ async def test_get_protocol_analysis_as_document_analysis_not_found(
 ) -> None:
     """It should 404 if the analysis document does not exist."""
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_as_document("analysis-id")).then_raise(
+    decoy.when(await analysis_store.get_as_document_chunks("analysis-id")).then_raise(
         AnalysisNotFoundError("oh no")
     )
 
@@ -1658,6 +1689,68 @@ async def test_get_protocol_analysis_as_document_analysis_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
 
 
+async def test_get_protocol_analysis_profile(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should return an analysis's profile as plain text, or 404 if there isn't one."""
+    profiles = {
+        "analysis-id": "MainThread;analyze (analyzer.py:1) 3\n",
+        "run-id": "MainThread;run (run_controller.py:1) 3\n",
+    }
+    monkeypatch.setattr(performance_helpers, "get_profile", profiles.get)
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(analysis_store.get_summaries_by_protocol("protocol-id")).then_return(
+        [
+            AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED),
+            AnalysisSummary(
+                id="unprofiled-analysis-id", status=AnalysisStatus.COMPLETED
+            ),
+        ]
+    )
+
+    result = await get_protocol_analysis_profile(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
+    assert result.media_type == "text/plain"
+    assert result.body == b"MainThread;analyze (analyzer.py:1) 3\n"
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_profile(
+            protocolId="protocol-id",
+            analysisId="unprofiled-analysis-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "ProfileNotFound"
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_profile(
+            protocolId="protocol-id",
+            analysisId="run-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_profile(
+            protocolId="missing-protocol-id",
+            analysisId="analysis-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "ProtocolNotFound"
+
+
 async def test_create_protocol_analyses_with_same_rtp_values(
     decoy: Decoy,
     protocol_store: ProtocolStore,
@@ -12,6 +12,7 @@ from opentrons.protocol_engine import (
     CommandErrorSlice,
 )
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+from opentrons.util import performance_helpers
 
 from robot_server.data_files.data_files_store import DataFilesStore, DataFileInfo
 
@@ -48,6 +49,7 @@ from robot_server.runs.router.base_router import (
     update_run,
     put_error_recovery_policy,
     get_run_commands_error,
+    get_run_profile,
 )
 
 from robot_server.deck_configuration.store import DeckConfigurationStore
@@ -384,6 +386,39 @@ async def test_get_run_with_missing_id(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_profile(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should return a run's profile as plain text, or 404 if there isn't one."""
+    profiles = {"run-id": "MainThread;run (run.py:1) 3\n"}
+    monkeypatch.setattr(performance_helpers, "get_profile", profiles.get)
+    decoy.when(mock_run_data_manager.get("missing-run-id")).then_raise(
+        RunNotFoundError(run_id="missing-run-id")
+    )
+
+    result = await get_run_profile(
+        runId="run-id", run_data_manager=mock_run_data_manager
+    )
+    assert result.media_type == "text/plain"
+    assert result.body == b"MainThread;run (run.py:1) 3\n"
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_profile(
+            runId="unprofiled-run-id", run_data_manager=mock_run_data_manager
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "ProfileNotFound"
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_profile(
+            runId="missing-run-id", run_data_manager=mock_run_data_manager
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
+
+
 async def test_get_run() -> None:
     """It should wrap the run data in a response."""
     run_data = Run(
@@ -1,8 +1,11 @@
 """Tests for the /runs/.../commands routes."""
+import json
 import pytest
 
 from datetime import datetime
 from decoy import Decoy, matchers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from opentrons.protocol_engine import (
     CommandSlice,
@@ -17,19 +20,31 @@ from robot_server.service.json_api import MultiBodyMeta
 
 from robot_server.runs.command_models import (
     RequestModelWithCommandCreate,
+    RequestModelWithCommandCreates,
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
 )
-from robot_server.runs.run_store import CommandNotFoundError, RunStore
+from robot_server.runs.run_store import (
+    CommandNotFoundError,
+    PreSerializedCommandSlice,
+    RunStore,
+)
 from robot_server.runs.run_orchestrator_store import RunOrchestratorStore
-from robot_server.runs.run_data_manager import RunDataManager
+from robot_server.runs.run_data_manager import (
+    PreSerializedCommandsNotAvailableError,
+    RunDataManager,
+)
+from robot_server.runs.dependencies import get_run_data_manager
 from robot_server.runs.run_models import RunCommandSummary, RunNotFoundError
 from robot_server.runs.router.commands_router import (
     create_run_command,
+    create_run_commands,
     get_run_command,
     get_run_commands,
+    get_run_commands_as_pre_serialized_list,
     get_current_run_from_url,
+    commands_router,
 )
 
 
@@ -282,6 +297,104 @@ async def test_add_command_to_stopped_engine(
     assert exc_info.value.content["errors"][0]["errorCode"] == "4000"
 
 
+async def test_create_run_commands(
+    decoy: Decoy,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should add the requested commands to the ProtocolEngine in order."""
+    home_request = pe_commands.HomeCreate(params=pe_commands.HomeParams())
+    wait_request = pe_commands.WaitForResumeCreate(
+        params=pe_commands.WaitForResumeParams(message="Hello"),
+        intent=pe_commands.CommandIntent.PROTOCOL,
+    )
+
+    home_once_added = pe_commands.Home(
+        id="command-id-1",
+        key="command-key-1",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_commands.CommandStatus.QUEUED,
+        params=pe_commands.HomeParams(),
+    )
+    wait_once_added = pe_commands.WaitForResume(
+        id="command-id-2",
+        key="command-key-2",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_commands.CommandStatus.QUEUED,
+        params=pe_commands.WaitForResumeParams(message="Hello"),
+    )
+
+    decoy.when(
+        await mock_run_orchestrator_store.add_commands_and_wait_for_interval(
+            requests=[
+                pe_commands.HomeCreate(
+                    params=pe_commands.HomeParams(),
+                    intent=pe_commands.CommandIntent.SETUP,
+                ),
+                wait_request,
+            ],
+            failed_command_id=None,
+            wait_until_complete=True,
+            timeout=999,
+        )
+    ).then_return([home_once_added, wait_once_added])
+    decoy.when(mock_run_orchestrator_store.get_command("command-id-1")).then_return(
+        home_once_added
+    )
+    decoy.when(mock_run_orchestrator_store.get_command("command-id-2")).then_return(
+        wait_once_added
+    )
+
+    result = await create_run_commands(
+        run_id="run-id",
+        request_body=RequestModelWithCommandCreates(data=[home_request, wait_request]),
+        waitUntilComplete=True,
+        timeout=999,
+        run_orchestrator_store=mock_run_orchestrator_store,
+        failedCommandId=None,
+        check_estop=True,
+    )
+
+    assert result.content.data == [home_once_added, wait_once_added]
+    assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=2)
+    assert result.status_code == 201
+
+
+async def test_add_conflicting_setup_commands(
+    decoy: Decoy,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should raise an error if the setup commands cannot be added."""
+    command_request = pe_commands.HomeCreate(
+        params=pe_commands.HomeParams(),
+        intent=pe_commands.CommandIntent.SETUP,
+    )
+
+    decoy.when(
+        await mock_run_orchestrator_store.add_commands_and_wait_for_interval(
+            requests=[command_request, command_request],
+            failed_command_id=None,
+            wait_until_complete=False,
+            timeout=None,
+        )
+    ).then_raise(pe_errors.SetupCommandNotAllowedError("oh no"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await create_run_commands(
+            run_id="run-id",
+            request_body=RequestModelWithCommandCreates(
+                data=[command_request, command_request]
+            ),
+            waitUntilComplete=False,
+            timeout=None,
+            run_orchestrator_store=mock_run_orchestrator_store,
+            failedCommandId=None,
+            check_estop=True,
+        )
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.content["errors"][0]["id"] == "SetupCommandNotAllowed"
+
+
 async def test_get_run_commands(
     decoy: Decoy, mock_run_data_manager: RunDataManager
 ) -> None:
@@ -504,3 +617,85 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def test_get_run_commands_as_pre_serialized_list(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should stream a page of pre-serialized commands."""
+    decoy.when(
+        mock_run_data_manager.get_commands_as_preserialized_slice(
+            run_id="run-id", cursor=1, length=2
+        )
+    ).then_return(
+        PreSerializedCommandSlice(
+            commands=iter(['{"id": "command-1"}', '{"id": "command-2"}']),
+            cursor=1,
+            total_length=3,
+        )
+    )
+
+    result = await get_run_commands_as_pre_serialized_list(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=1,
+        pageLength=2,
+    )
+
+    assert result.status_code == 200
+    body = b"".join([chunk async for chunk in result.body_iterator])  # type: ignore[misc]
+    assert json.loads(body) == {
+        "data": ['{"id": "command-1"}', '{"id": "command-2"}'],
+        "meta": {"cursor": 1, "totalLength": 3},
+    }
+
+
+@pytest.mark.parametrize("query", ["cursor=-1", "pageLength=0", "pageLength=-1"])
+def test_get_run_commands_as_pre_serialized_list_validation(
+    mock_run_data_manager: RunDataManager,
+    query: str,
+) -> None:
+    """It should reject a negative cursor or a page length less than 1."""
+    app = FastAPI()
+    app.include_router(commands_router)
+    app.dependency_overrides[get_run_data_manager] = lambda: mock_run_data_manager
+
+    response = TestClient(app).get(f"/runs/run-id/commandsAsPreSerializedList?{query}")
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected_status", "expected_error_id"),
+    [
+        (RunNotFoundError("run-id"), 404, "RunNotFound"),
+        (
+            PreSerializedCommandsNotAvailableError("oh no"),
+            503,
+            "PreSerializedCommandsNotAvailable",
+        ),
+    ],
+)
+async def test_get_run_commands_as_pre_serialized_list_errors(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    exception: Exception,
+    expected_status: int,
+    expected_error_id: str,
+) -> None:
+    """It should raise an error if the commands can't be fetched."""
+    decoy.when(
+        mock_run_data_manager.get_commands_as_preserialized_slice(
+            run_id="run-id", cursor=None, length=None
+        )
+    ).then_raise(exception)
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_as_pre_serialized_list(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+        )
+
+    assert exc_info.value.status_code == expected_status
+    assert exc_info.value.content["errors"][0]["id"] == expected_error_id
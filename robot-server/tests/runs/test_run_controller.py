@@ -184,7 +184,7 @@ async def test_create_play_action_to_start(
     await background_task_captor.value(deck_configuration=[])
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=engine_state_summary,
             commands=protocol_commands,
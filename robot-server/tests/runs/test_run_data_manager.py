@@ -48,6 +48,7 @@ from robot_server.runs.run_store import (
     RunResource,
     CommandNotFoundError,
     BadStateSummary,
+    PreSerializedCommandSlice,
 )
 from robot_server.service.notifications import RunsPublisher
 from robot_server.service.task_runner import TaskRunner
@@ -650,7 +651,7 @@ async def test_update_current(
     )
 
     decoy.when(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=engine_state_summary,
             commands=[run_command],
@@ -710,7 +711,7 @@ async def test_update_current_noop(
 
     decoy.verify(await mock_run_orchestrator_store.clear(), times=0)
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=matchers.Anything(),
             commands=matchers.Anything(),
@@ -810,7 +811,7 @@ async def test_create_archives_existing(
     )
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id_old,
             summary=engine_state_summary,
             commands=[run_command],
@@ -1032,34 +1033,41 @@ def test_get_command_from_db_command_not_found(
         subject.get_command("run-id", "command-id")
 
 
-def test_get_all_commands_as_preserialized_list(
+def test_get_commands_as_preserialized_slice(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
     mock_run_orchestrator_store: RunOrchestratorStore,
 ) -> None:
-    """It should return the pre-serialized commands list."""
+    """It should return a lazily-read slice of pre-serialized commands."""
+    command_slice = PreSerializedCommandSlice(
+        commands=iter(['{"id": command-1}']), cursor=0, total_length=1
+    )
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
     decoy.when(
-        mock_run_store.get_all_commands_as_preserialized_list("run-id")
-    ).then_return(['{"id": command-1}', '{"id": command-2}'])
-    assert subject.get_all_commands_as_preserialized_list("run-id") == [
-        '{"id": command-1}',
-        '{"id": command-2}',
-    ]
+        mock_run_store.get_commands_as_preserialized_slice(
+            run_id="run-id", cursor=None, length=None
+        )
+    ).then_return(command_slice)
 
+    assert (
+        subject.get_commands_as_preserialized_slice("run-id", cursor=None, length=None)
+        is command_slice
+    )
 
-def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
+
+def test_get_commands_as_preserialized_slice_errors_for_active_runs(
     decoy: Decoy,
     subject: RunDataManager,
-    mock_run_store: RunStore,
     mock_run_orchestrator_store: RunOrchestratorStore,
 ) -> None:
-    """It should raise an error when fetching pre-serialized commands list while run is active."""
+    """It should raise an error when fetching pre-serialized commands while run is active."""
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return("current-run-id")
     decoy.when(mock_run_orchestrator_store.get_is_run_terminal()).then_return(False)
     with pytest.raises(PreSerializedCommandsNotAvailableError):
-        subject.get_all_commands_as_preserialized_list("current-run-id")
+        subject.get_commands_as_preserialized_slice(
+            "current-run-id", cursor=None, length=None
+        )
 
 
 async def test_get_current_run_labware_definition(
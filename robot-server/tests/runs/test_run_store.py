@@ -1,17 +1,22 @@
 """Tests for robot_server.runs.run_store."""
+import asyncio
+import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Any, ContextManager, List, Optional, Type
 
 import pytest
 from decoy import Decoy
 from robot_server.data_files.data_files_store import DataFileInfo, DataFilesStore
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from unittest import mock
 
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons_shared_data.errors.codes import ErrorCodes
 
+from robot_server.persistence.database import begin_write
+from robot_server.persistence.pydantic import pydantic_to_json
 from robot_server.protocols.protocol_store import ProtocolNotFoundError
 from robot_server.runs.run_store import (
     CSVParameterRunResource,
@@ -317,6 +322,189 @@ def test_update_state_run_not_found(
         )
 
 
+async def test_update_run_state_async(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It should write the run state from a worker thread and invalidate caches."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    # Prime the cache with the pre-update state.
+    assert isinstance(subject.get_state_summary(run_id="run-id"), BadStateSummary)
+
+    result = await subject.update_run_state_async(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=run_time_parameters,
+    )
+
+    assert result == RunResource(
+        ok=True,
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        actions=[],
+    )
+    assert subject.get_state_summary(run_id="run-id") == state_summary
+    assert (
+        subject.get_commands_slice(run_id="run-id", length=100, cursor=0).commands
+        == protocol_commands
+    )
+
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        await subject.update_run_state_async(
+            run_id="run-not-found",
+            summary=state_summary,
+            commands=protocol_commands,
+            run_time_parameters=[],
+        )
+
+
+async def test_update_run_state_async_does_not_block_event_loop(
+    subject: RunStore,
+    state_summary: StateSummary,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Reads and writes on the event loop should go through while a run is archived."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    commands: List[pe_commands.Command] = [
+        pe_commands.WaitForResume(
+            id=f"pause-{i}",
+            key="command-key",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            params=pe_commands.WaitForResumeParams(message=f"hello {i}"),
+            result=pe_commands.WaitForResumeResult(),
+        )
+        for i in range(10)
+    ]
+    action = RunAction(
+        actionType=RunActionType.PLAY,
+        createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        id="action-id",
+    )
+
+    # Hold up the archive's serialization, in its worker thread, until we're done.
+    serialization_started = threading.Event()
+    event_loop_done = threading.Event()
+
+    def blocking_pydantic_to_json(obj: Any) -> str:
+        serialization_started.set()
+        assert event_loop_done.wait(timeout=10)
+        return pydantic_to_json(obj)
+
+    monkeypatch.setattr(
+        "robot_server.runs.run_store.pydantic_to_json", blocking_pydantic_to_json
+    )
+
+    # A write transaction taken in a worker thread would make writes on the event
+    # loop wait for its lock, so the archive's write should happen on the loop too.
+    write_threads = []
+
+    def recording_begin_write(sql_engine: Engine) -> ContextManager[Connection]:
+        write_threads.append(threading.get_ident())
+        return begin_write(sql_engine)
+
+    monkeypatch.setattr(
+        "robot_server.runs.run_store.begin_write", recording_begin_write
+    )
+
+    write = asyncio.create_task(
+        subject.update_run_state_async(
+            run_id="run-id",
+            summary=state_summary,
+            commands=commands,
+            run_time_parameters=[],
+        )
+    )
+    while not serialization_started.is_set():
+        await asyncio.sleep(0.001)
+
+    try:
+        assert (
+            subject.get_commands_slice(run_id="run-id", length=20, cursor=None).commands
+            == []
+        )
+        subject.insert_action(run_id="run-id", action=action)
+        assert not write.done()
+    finally:
+        event_loop_done.set()
+
+    result = await write
+    assert result.actions == [action]
+    assert set(write_threads) == {threading.get_ident()}
+    assert (
+        subject.get_commands_slice(run_id="run-id", length=20, cursor=None).commands
+        == commands
+    )
+
+
+async def test_concurrent_writers(
+    subject: RunStore,
+    state_summary: StateSummary,
+) -> None:
+    """Concurrent archives and action inserts should all land."""
+    run_ids = ["run-id-1", "run-id-2"]
+    for run_id in run_ids:
+        subject.insert(
+            run_id=run_id,
+            protocol_id=None,
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+    commands: List[pe_commands.Command] = [
+        pe_commands.WaitForResume(
+            id=f"pause-{i}",
+            key="command-key",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            params=pe_commands.WaitForResumeParams(message=f"hello {i}"),
+            result=pe_commands.WaitForResumeResult(),
+        )
+        for i in range(2000)
+    ]
+    action = RunAction(
+        actionType=RunActionType.PLAY,
+        createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        id="action-id",
+    )
+
+    async def insert_action_during_writes() -> None:
+        await asyncio.sleep(0)
+        subject.insert_action(run_id="run-id-1", action=action)
+
+    await asyncio.gather(
+        *(
+            subject.update_run_state_async(
+                run_id=run_id,
+                summary=state_summary,
+                commands=commands,
+                run_time_parameters=[],
+            )
+            for run_id in run_ids
+        ),
+        insert_action_during_writes(),
+    )
+
+    for run_id in run_ids:
+        assert (
+            subject.get_commands_slice(
+                run_id=run_id, length=1, cursor=None
+            ).total_length
+            == 2000
+        )
+    assert subject.get("run-id-1").actions == [action]
+
+
 def test_add_run(subject: RunStore) -> None:
     """It should be able to add a new run to the store."""
     result = subject.insert(
@@ -807,12 +995,12 @@ def test_get_commands_slice_run_not_found(subject: RunStore) -> None:
         subject.get_commands_slice(run_id="not-run-id", cursor=1, length=3)
 
 
-def test_get_all_commands_as_preserialized_list(
+def test_get_commands_as_preserialized_slice_contents(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
     state_summary: StateSummary,
 ) -> None:
-    """It should get all commands stored in DB as a pre-serialized list."""
+    """It should get the commands stored in the DB as pre-serialized JSON."""
     subject.insert(
         run_id="run-id",
         protocol_id=None,
@@ -824,12 +1012,109 @@ def test_get_all_commands_as_preserialized_list(
         commands=protocol_commands,
         run_time_parameters=[],
     )
-    result = subject.get_all_commands_as_preserialized_list(run_id="run-id")
-    assert result == [
-        '{"id": "pause-1", "createdAt": "2021-01-01T00:00:00", "commandType": "waitForResume",'
-        ' "key": "command-key", "status": "succeeded", "params": {"message": "hello world"}, "result": {}}',
-        '{"id": "pause-2", "createdAt": "2022-02-02T00:00:00", "commandType": "waitForResume",'
-        ' "key": "command-key", "status": "succeeded", "params": {"message": "hey world"}, "result": {}}',
-        '{"id": "pause-3", "createdAt": "2023-03-03T00:00:00", "commandType": "waitForResume",'
-        ' "key": "command-key", "status": "succeeded", "params": {"message": "sup world"}, "result": {}}',
+    result = subject.get_commands_as_preserialized_slice(run_id="run-id")
+    # Whitespace depends on the JSON backend, so compare the parsed documents.
+    assert [json.loads(command) for command in result.commands] == [
+        {
+            "id": "pause-1",
+            "createdAt": "2021-01-01T00:00:00",
+            "commandType": "waitForResume",
+            "key": "command-key",
+            "status": "succeeded",
+            "params": {"message": "hello world"},
+            "result": {},
+        },
+        {
+            "id": "pause-2",
+            "createdAt": "2022-02-02T00:00:00",
+            "commandType": "waitForResume",
+            "key": "command-key",
+            "status": "succeeded",
+            "params": {"message": "hey world"},
+            "result": {},
+        },
+        {
+            "id": "pause-3",
+            "createdAt": "2023-03-03T00:00:00",
+            "commandType": "waitForResume",
+            "key": "command-key",
+            "status": "succeeded",
+            "params": {"message": "sup world"},
+            "result": {},
+        },
     ]
+
+
+@pytest.mark.parametrize(
+    ("cursor", "length", "expected_cursor", "expected_ids"),
+    [
+        (None, None, 0, ["pause-1", "pause-2", "pause-3"]),
+        (1, None, 1, ["pause-2", "pause-3"]),
+        (0, 2, 0, ["pause-1", "pause-2"]),
+        (2, 100, 2, ["pause-3"]),
+        (5, 1, 3, []),
+    ],
+)
+def test_get_commands_as_preserialized_slice(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+    cursor: Optional[int],
+    length: Optional[int],
+    expected_cursor: int,
+    expected_ids: List[str],
+) -> None:
+    """It should lazily read a range of commands, in chunks."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    result = subject.get_commands_as_preserialized_slice(
+        run_id="run-id", cursor=cursor, length=length, chunk_size=2
+    )
+
+    assert result.cursor == expected_cursor
+    assert result.total_length == 3
+    assert [json.loads(command)["id"] for command in result.commands] == expected_ids
+
+
+def test_get_commands_as_preserialized_slice_run_not_found(subject: RunStore) -> None:
+    """It should raise RunNotFoundError eagerly, not when the iterator is consumed."""
+    with pytest.raises(RunNotFoundError):
+        subject.get_commands_as_preserialized_slice(run_id="not-run-id")
+
+
+def test_get_commands_as_preserialized_slice_run_deleted(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should raise, not end early, if the run is deleted mid-iteration."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    result = subject.get_commands_as_preserialized_slice(run_id="run-id", chunk_size=2)
+    assert json.loads(next(result.commands))["id"] == "pause-1"
+    assert json.loads(next(result.commands))["id"] == "pause-2"
+
+    subject.remove(run_id="run-id")
+
+    with pytest.raises(RunNotFoundError):
+        next(result.commands)
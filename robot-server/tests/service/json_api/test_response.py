@@ -1,6 +1,7 @@
+import json
 import pytest
 from pydantic import BaseModel
-from typing import Any, Dict, NamedTuple, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
 
 from robot_server.service.json_api.resource_links import ResourceLink
 from robot_server.service.json_api.response import (
@@ -16,6 +17,7 @@ from robot_server.service.json_api.response import (
     NotifyUnsubscribeBody,
     DeprecatedResponseModel,
     DeprecatedMultiResponseModel,
+    StreamingMultiBodyResponse,
 )
 
 
@@ -127,3 +129,43 @@ RESPONSE_SPECS = [
 @pytest.mark.parametrize(ResponseSpec._fields, RESPONSE_SPECS)
 def test_response_to_dict(subject: BaseModel, expected: Dict[str, Any]) -> None:
     assert subject.dict() == expected
+
+
+@pytest.mark.parametrize("item_count", [0, 1, 5])
+async def test_streaming_multi_body_response(item_count: int) -> None:
+    """It should stream a body equivalent to the SimpleMultiBody."""
+    items = [{"id": str(i)} for i in range(item_count)]
+    subject = StreamingMultiBodyResponse(
+        data=(json.dumps(item) for item in items),
+        meta=MultiBodyMeta(cursor=3, totalLength=10),
+        batch_size=2,
+    )
+
+    chunks: List[bytes] = [chunk async for chunk in subject.body_iterator]  # type: ignore[misc]
+
+    assert subject.media_type == "application/json"
+    assert (
+        json.loads(b"".join(chunks))
+        == SimpleMultiBody(
+            data=items, meta=MultiBodyMeta(cursor=3, totalLength=10)
+        ).dict()
+    )
+
+
+async def test_streaming_multi_body_response_error() -> None:
+    """It should propagate errors from the data instead of finishing the body."""
+
+    def items() -> Iterator[str]:
+        yield json.dumps({"id": "0"})
+        raise LookupError("gone")
+
+    subject = StreamingMultiBodyResponse(
+        data=items(), meta=MultiBodyMeta(cursor=0, totalLength=2), batch_size=1
+    )
+
+    chunks: List[object] = []
+    with pytest.raises(LookupError, match="gone"):
+        async for chunk in subject.body_iterator:
+            chunks.append(chunk)
+
+    assert chunks == [b'{"data": [', b'{"id": "0"}']
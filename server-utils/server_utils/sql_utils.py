@@ -43,6 +43,20 @@ def enable_foreign_key_constraints(engine: sqlalchemy.engine.Engine) -> None:
         cursor.close()
 
 
+# An execution option that makes `fix_transactions()` begin a transaction with
+# `BEGIN IMMEDIATE`, which takes the database's write lock up front:
+#
+#     with engine.execution_options(**{BEGIN_IMMEDIATE: True}).begin() as transaction:
+#         ...
+#
+# A transaction that starts with a plain (deferred) `BEGIN` only takes the write lock
+# at its first write. In WAL mode, if another connection committed a write since
+# the transaction started reading, that upgrade fails with SQLITE_BUSY right away,
+# without waiting for the busy timeout. So every transaction that might write should
+# begin immediately, and then concurrent writers just wait their turn.
+BEGIN_IMMEDIATE = "sqlite_begin_immediate"
+
+
 def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     """Make SQLite transactions behave sanely.
 
@@ -51,6 +65,9 @@ def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     These misbehaviors can make transactions not actually behave transactionally. See:
     https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
 
+    Transactions on connections with the `BEGIN_IMMEDIATE` execution option
+    take the write lock when they begin.
+
     This should be called once per SQLAlchemy engine, shortly after creating it,
     before doing anything substantial with it.
 
@@ -73,4 +90,64 @@ def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     @sqlalchemy.event.listens_for(engine, "begin")  # type: ignore[misc]
     def on_begin(conn: sqlalchemy.engine.Connection) -> None:
         # emit our own BEGIN
-        conn.exec_driver_sql("BEGIN")
+        if conn.get_execution_options().get(BEGIN_IMMEDIATE, False):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
+
+def enable_write_ahead_logging(
+    engine: sqlalchemy.engine.Engine, synchronous: str = "NORMAL"
+) -> None:
+    """Put the database in write-ahead-log (WAL) mode.
+
+    In SQLite's default rollback-journal mode, a write transaction locks out every
+    reader for as long as it's running. In WAL mode, readers on other connections
+    keep seeing the last committed snapshot while a write is in progress, so a long
+    write doesn't block short reads. See https://www.sqlite.org/wal.html.
+
+    WAL mode is persistent in the database file, but we set it on every connection
+    so that a fresh database picks it up too.
+
+    This should be called once per SQLAlchemy engine, shortly after creating it,
+    before doing anything substantial with it.
+
+    Params:
+        engine: A SQLAlchemy engine connected to a SQLite database.
+        synchronous: The value for SQLite's `synchronous` pragma.
+            `NORMAL` is safe from corruption in WAL mode, and avoids an fsync
+            on every commit, but the most recent transactions may be rolled back
+            after a power loss. Use `FULL` if that's unacceptable.
+    """
+
+    @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
+    def on_connect(
+        dbapi_connection: Any,
+        connection_record: object,
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL;")
+        cursor.execute(f"PRAGMA synchronous={synchronous};")
+        cursor.close()
+
+
+def set_page_cache_size(engine: sqlalchemy.engine.Engine, size_kib: int) -> None:
+    """Set the size of SQLite's per-connection page cache.
+
+    This should be called once per SQLAlchemy engine, shortly after creating it,
+    before doing anything substantial with it.
+
+    Params:
+        engine: A SQLAlchemy engine connected to a SQLite database.
+        size_kib: The cache size, in kibibytes.
+    """
+
+    @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
+    def on_connect(
+        dbapi_connection: Any,
+        connection_record: object,
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        # Negative values are in KiB instead of pages.
+        cursor.execute(f"PRAGMA cache_size=-{size_kib};")
+        cursor.close()
@@ -115,3 +115,78 @@ def test_fix_transaction_fixes_transactional_ddl(
         c["name"] for c in sqlalchemy.inspect(scratch_engine).get_columns("table")
     ]
     assert column_names == expected_final_column_names
+
+
+def test_enable_write_ahead_logging(scratch_engine: sqlalchemy.engine.Engine) -> None:
+    """It should put connections in WAL mode with the requested sync level."""
+    sql_utils.enable_write_ahead_logging(scratch_engine, synchronous="NORMAL")
+
+    with scratch_engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+
+    assert journal_mode == "wal"
+    # https://www.sqlite.org/pragma.html#pragma_synchronous
+    assert synchronous == 1
+
+
+def test_write_ahead_logging_allows_reads_during_write(tmp_path: Path) -> None:
+    """A reader should see the last committed data while a write is in progress."""
+    engine = sqlalchemy.create_engine(
+        sql_utils.get_connection_url(tmp_path / "test.db")
+    )
+    sql_utils.enable_write_ahead_logging(engine)
+    sql_utils.fix_transactions(engine)
+    metadata = sqlalchemy.MetaData()
+    table = sqlalchemy.Table(
+        "table",
+        metadata,
+        sqlalchemy.Column("int_col", sqlalchemy.Integer, nullable=False),
+    )
+    metadata.create_all(engine)
+    try:
+        with engine.begin() as transaction:
+            transaction.execute(sqlalchemy.insert(table).values(int_col=1))
+
+        with engine.begin() as writer:
+            writer.execute(sqlalchemy.insert(table).values(int_col=2))
+            with engine.begin() as reader:
+                values = reader.execute(sqlalchemy.select(table.c.int_col)).scalars()
+                assert values.all() == [1]
+    finally:
+        engine.dispose()
+
+
+def test_set_page_cache_size(scratch_engine: sqlalchemy.engine.Engine) -> None:
+    """It should set the cache size in KiB."""
+    sql_utils.set_page_cache_size(scratch_engine, size_kib=4096)
+
+    with scratch_engine.connect() as connection:
+        cache_size = connection.exec_driver_sql("PRAGMA cache_size").scalar()
+
+    assert cache_size == -4096
+
+
+def test_fix_transactions_begin_immediate(tmp_path: Path) -> None:
+    """Transactions with the BEGIN_IMMEDIATE option should take the write lock."""
+    engine = sqlalchemy.create_engine(
+        sql_utils.get_connection_url(tmp_path / "test.db"),
+        # Fail right away instead of waiting for the lock.
+        connect_args={"timeout": 0},
+    )
+    sql_utils.enable_write_ahead_logging(engine)
+    sql_utils.fix_transactions(engine)
+    immediate_engine = engine.execution_options(**{sql_utils.BEGIN_IMMEDIATE: True})
+    try:
+        with immediate_engine.begin():
+            # A deferred transaction can still read.
+            with engine.begin() as reader:
+                reader.exec_driver_sql("SELECT 1")
+            # But another immediate one can't start until this one is done.
+            with pytest.raises(sqlalchemy.exc.OperationalError, match="locked"):
+                with immediate_engine.begin():
+                    pass
+        with immediate_engine.begin():
+            pass
+    finally:
+        engine.dispose()
@@ -0,0 +1,43 @@
+"""A pytest plugin for tests that measure timings.
+
+Such tests are flaky on loaded CI machines, so they're marked
+``@pytest.mark.benchmark`` and skipped unless pytest is run with
+``--run-benchmarks``. Register the plugin from a package's root conftest with::
+
+    pytest_plugins = ["opentrons_shared_data.pytest_benchmarks"]
+
+This is a skip hook instead of ``-m "not benchmark"`` in ``addopts`` because
+the Makefiles and CI pass their own ``-m`` expressions, which would replace it.
+"""
+from typing import List
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add --run-benchmarks option to pytest CLI."""
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        help="also run tests marked as benchmarks",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the benchmark marker."""
+    config.addinivalue_line(
+        "markers",
+        "benchmark: Benchmark that measures timings, only run with --run-benchmarks",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip benchmarks unless --run-benchmarks was given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -5,10 +5,9 @@ import time
 from typing import NoReturn
 
 from . import cli, usb_config, usb_monitor, tcp_conn, listener
+from .bridge_buffer import BridgeBuffers
 from .default_config import get_gadget_config, PHY_NAME
 
-from .serial_thread import create_worker_thread
-
 LOG = logging.getLogger(__name__)
 
 
@@ -57,16 +56,14 @@ async def main() -> NoReturn:
 
     monitor.begin()
 
-    thread, queue = create_worker_thread()
-
-    thread.start()
+    buffers = BridgeBuffers()
 
     if monitor.host_connected():
         LOG.debug("USB connected on startup")
         ser = listener.update_ser_handle(config, ser, True, tcp)
 
     while True:
-        ser = listener.listen(monitor, config, ser, tcp, queue)
+        ser = listener.listen(monitor, config, ser, tcp, buffers)
 
 
 if __name__ == "__main__":
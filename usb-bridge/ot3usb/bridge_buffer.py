@@ -0,0 +1,113 @@
+"""Fixed-size buffers for data passing through the bridge."""
+from typing import Callable
+
+# Enough to hold several max-size USB bulk transfers and TCP segments
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+DEFAULT_PACKET_LIMIT = 2048
+
+DEFAULT_PACKET_INTERVAL = 0.01
+
+# Reads data into the buffer it is passed, returning the number of bytes read
+READ_FN = Callable[[memoryview], int]
+
+# Writes data from the buffer it is passed, returning the number of bytes written
+WRITE_FN = Callable[[memoryview], int]
+
+
+class BridgeBuffer:
+    """A preallocated buffer of data read from one end of the bridge.
+
+    Data is read straight into free space at the end of the buffer and
+    written straight out of the start of it, so bytes are never copied
+    through intermediate objects. Everything that arrives before the other
+    end is writable is coalesced into one write. Once the buffer is full,
+    the caller should stop reading from its source until some of it has
+    been written, which pushes back on whoever is sending the data.
+    """
+
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Create an empty buffer that can hold `size` bytes."""
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        """Get the number of bytes waiting to be written."""
+        return self._end - self._start
+
+    def free(self) -> int:
+        """Get the number of bytes that can still be read into the buffer."""
+        return len(self._buf) - len(self)
+
+    def clear(self) -> None:
+        """Drop any data waiting to be written."""
+        self._start = 0
+        self._end = 0
+
+    def read_from(self, read: READ_FN) -> int:
+        """Read as much data as fits into the buffer.
+
+        Args:
+            read: Reads into the free space it is given. Must not be called
+            when the buffer is full.
+
+        Returns the number of bytes read.
+        """
+        if self._end == len(self._buf) and self._start > 0:
+            # Move pending data to the front to make room at the end
+            pending = len(self)
+            self._buf[:pending] = self._view[self._start : self._end]
+            self._start = 0
+            self._end = pending
+        count = read(self._view[self._end :])
+        self._end += count
+        return count
+
+    def write_to(self, write: WRITE_FN, limit: int = 0) -> int:
+        """Write out as much buffered data as possible.
+
+        Args:
+            write: Writes out the data it is given.
+
+            limit: If nonzero, the most bytes to pass to `write` at once.
+
+        Returns the number of bytes written.
+        """
+        end = self._end if limit <= 0 else min(self._end, self._start + limit)
+        count = write(self._view[self._start : end])
+        self._start += count
+        if self._start == self._end:
+            self.clear()
+        return count
+
+
+class BridgeBuffers:
+    """Buffers for each direction of the bridge."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_BUFFER_SIZE,
+        packet_limit: int = DEFAULT_PACKET_LIMIT,
+        packet_interval: float = DEFAULT_PACKET_INTERVAL,
+    ) -> None:
+        """Create empty buffers.
+
+        packet_limit is a maximum size for a single usb packet which is sent no more
+        frequently than every packet_interval seconds, establishing an effective
+        bandwidth limit. This may be required to allow clients to process data in
+        time, since many desktop OS serial drivers do not have very large data
+        buffers.
+        """
+        self.to_serial = BridgeBuffer(size)
+        self.to_tcp = BridgeBuffer(size)
+        self.packet_limit = packet_limit
+        self.packet_interval = packet_interval
+        self.next_serial_write = 0.0
+
+    def clear(self) -> None:
+        """Drop any data waiting to be written, e.g. when a connection drops."""
+        self.to_serial.clear()
+        self.to_tcp.clear()
+        self.next_serial_write = 0.0
@@ -1,14 +1,16 @@
 """Module to poll for input from all sources."""
 
 import logging
+import os
 import select
-from typing import Optional, List, Any
+import time
+from typing import Optional, List, Any, Tuple
 import serial  # type: ignore[import-untyped]
 
 from . import usb_config, usb_monitor, tcp_conn
 
+from .bridge_buffer import BridgeBuffers
 from .default_config import DEFAULT_IP, DEFAULT_PORT
-from .serial_thread import QUEUE_TYPE, QUEUE_MAX_ITEMS
 
 LOG = logging.getLogger(__name__)
 
@@ -60,14 +62,92 @@ def check_monitor(monitor: usb_monitor.USBConnectionMonitor, msg_ready: bool) ->
         monitor.update_state()
 
 
+def _read_serial(ser: serial.Serial, buffer: memoryview) -> int:
+    try:
+        count = os.readv(ser.fileno(), [buffer])
+    except BlockingIOError:
+        return 0
+    if count == 0:
+        # select() said the port was readable, so end-of-file means the host
+        # hung up. Treat it like any other error on a disconnected port.
+        raise OSError("Serial port hung up")
+    return count
+
+
+def _write_serial(ser: serial.Serial, data: memoryview) -> int:
+    try:
+        return os.write(ser.fileno(), data)
+    except BlockingIOError:
+        return 0
+
+
+def _select_args(
+    monitor: usb_monitor.USBConnectionMonitor,
+    ser: Optional[serial.Serial],
+    tcp: tcp_conn.TCPConnection,
+    buffers: BridgeBuffers,
+) -> Tuple[List[Any], List[Any], float]:
+    """Build the read list, write list and timeout for select()."""
+    rlist: List[Any] = [monitor]
+    wlist: List[Any] = []
+    timeout = POLL_TIMEOUT
+    if ser is None:
+        return rlist, wlist, timeout
+    # Only read while there's room for the data, so that a slow reader on one
+    # end pushes back on the writer at the other end
+    if buffers.to_tcp.free():
+        rlist.append(ser)
+    if tcp.connected():
+        if buffers.to_serial.free():
+            rlist.append(tcp)
+        if buffers.to_tcp:
+            wlist.append(tcp)
+    if buffers.to_serial:
+        wait = buffers.next_serial_write - time.monotonic()
+        if wait > 0:
+            timeout = min(timeout, wait)
+        else:
+            wlist.append(ser)
+    return rlist, wlist, timeout
+
+
+def _transfer_serial(
+    ser: serial.Serial, readable: bool, writable: bool, buffers: BridgeBuffers
+) -> None:
+    """Move data between the serial port and the buffers."""
+    if readable:
+        received = buffers.to_tcp.read_from(lambda b: _read_serial(ser, b))
+        LOG.debug(f"Received [{received}] bytes over serial")
+    if writable:
+        buffers.to_serial.write_to(
+            lambda b: _write_serial(ser, b), buffers.packet_limit
+        )
+        if buffers.to_serial:
+            buffers.next_serial_write = time.monotonic() + buffers.packet_interval
+
+
+def _update_connection(
+    config: usb_config.SerialGadget,
+    ser: Optional[serial.Serial],
+    monitor: usb_monitor.USBConnectionMonitor,
+    tcp: tcp_conn.TCPConnection,
+    buffers: BridgeBuffers,
+) -> Optional[serial.Serial]:
+    """Update the serial handle and drop stale data if the host changed."""
+    new_ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
+    if new_ser is not ser:
+        buffers.clear()
+    return new_ser
+
+
 def listen(
     monitor: usb_monitor.USBConnectionMonitor,
     config: usb_config.SerialGadget,
     ser: Optional[serial.Serial],
     tcp: tcp_conn.TCPConnection,
-    worker_queue: QUEUE_TYPE,
+    buffers: BridgeBuffers,
 ) -> Optional[serial.Serial]:
-    """Process any available incoming data.
+    """Process any available incoming data and write out any buffered data.
 
     This function will check for input from any of the input sources to the
     USB bridge:
@@ -75,6 +155,8 @@ def listen(
         - The UDEV message stream (usb_monitor)
         - The TCP connection to the NGINX server, if a connection is open
 
+    Data read from one end is buffered until the other end is writable.
+
     Args:
         monitor: The USB connection monitor
 
@@ -84,34 +166,27 @@ def listen(
 
         tcp: Handle for the socket connection to the internal server
 
-        worker_queue: Handle for queue to the serial worker thread
+        buffers: Data waiting to be written to the serial port and TCP
+        connection
     """
-    rlist: List[Any] = [monitor]
-    if ser is not None:
-        rlist.append(ser)
-        rlist.append(tcp)
-
-    ready = select.select(rlist, [], [], POLL_TIMEOUT)[0]
-    if len(ready) == 0 or monitor in ready:
+    rlist, wlist, timeout = _select_args(monitor, ser, tcp, buffers)
+    ready, writable, _ = select.select(rlist, wlist, [], timeout)
+    idle = len(ready) == 0 and len(writable) == 0 and timeout == POLL_TIMEOUT
+    if idle or monitor in ready:
         # Read a new udev messages
         check_monitor(monitor, monitor in ready)
-        ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
         # ALWAYS exit early if we had a change in udev messages
-        return ser
-    if ser and ser in ready:
-        # Ready serial data
+        return _update_connection(config, ser, monitor, tcp, buffers)
+    if ser and (ser in ready or ser in writable):
         try:
-            data = ser.read_all()
-            LOG.debug(f"Received: {data}")
-            tcp.send(data)
+            _transfer_serial(ser, ser in ready, ser in writable, buffers)
         except OSError:
             LOG.debug("Got an OSError when disconnecting")
             monitor.update_state()
-            ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
+            return _update_connection(config, ser, monitor, tcp, buffers)
     if ser and tcp in ready:
         # Ready TCP data to echo to serial
-        data = tcp.read()
-        worker_queue.put((ser, data))
-        if worker_queue.qsize() >= QUEUE_MAX_ITEMS:
-            LOG.warning("Worker queue appears full")
+        buffers.to_serial.read_from(tcp.read_into)
+    if ser and tcp in writable:
+        buffers.to_tcp.write_to(tcp.send_some)
     return ser
@@ -5,8 +5,6 @@ from typing import Optional, Tuple
 
 LOG = logging.getLogger(__name__)
 
-MAX_BUF = 4096
-
 
 class TCPConnection:
     """Class to connect to the internal NGINX server TCP socket."""
@@ -31,6 +29,8 @@ class TCPConnection:
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._host = (ip, port)
             self._sock.connect(self._host)
+            # The listener only reads or writes once select() says it can
+            self._sock.setblocking(False)
         except Exception as err:
             LOG.error(f"Could not open TCP: {str(err)}")
             self._sock = None
@@ -70,25 +70,41 @@ class TCPConnection:
             return -1
         return self._sock.fileno()
 
-    def read(self) -> bytes:
-        """Read available data over the socket."""
+    def read_into(self, buffer: memoryview) -> int:
+        """Read available data over the socket into a buffer.
+
+        Returns the number of bytes read. This is 0 if there was nothing to
+        read, or if the connection closed and had to be reopened.
+        """
         if not self._sock:
-            return bytes()
-        ret = self._sock.recv(MAX_BUF)
-        if len(ret) == 0:
+            return 0
+        try:
+            count = self._sock.recv_into(buffer)
+        except BlockingIOError:
+            return 0
+        if count == 0:
             # The socket connection died! Just reconnect to the server.
             self._reconnect()
-        LOG.debug(f"Received [{len(ret)}] bytes")
-        return ret
+        LOG.debug(f"Received [{count}] bytes")
+        return count
 
-    def send(self, data: bytes) -> bool:
-        """Send some data over the socket.
+    def send_some(self, data: memoryview) -> int:
+        """Send as much of some data as the socket will take without blocking.
 
         Args:
             data: raw data array to send over the socket.
+
+        Returns the number of bytes sent.
         """
         if not self._sock:
-            return False
-        sent = self._sock.send(data)
+            return 0
+        try:
+            sent = self._sock.send(data)
+        except BlockingIOError:
+            return 0
+        except ConnectionError as err:
+            LOG.debug(f"Could not send: {str(err)}")
+            self._reconnect()
+            return 0
         LOG.debug(f"Sent [{sent}] bytes")
-        return sent == len(data)
+        return sent
@@ -0,0 +1,3 @@
+"""Pytest shared configuration."""
+
+pytest_plugins = ["opentrons_shared_data.pytest_benchmarks"]
@@ -0,0 +1,134 @@
+"""Benchmark of moving data through the bridge.
+
+A pty stands in for the USB gadget serial port and a socketpair stands in for
+the TCP connection to the internal server. Run with
+``pytest --run-benchmarks``.
+"""
+
+import os
+import pty
+import socket
+import threading
+import time
+import tty
+from typing import Callable, Iterator, Tuple
+
+import mock
+import pytest
+import serial  # type: ignore[import-untyped]
+
+from ot3usb import listener, tcp_conn, usb_config, usb_monitor
+from ot3usb.bridge_buffer import BridgeBuffers
+
+UPLOAD_SIZE = 8 * 1024 * 1024
+DOWNLOAD_SIZE = 8 * 1024 * 1024
+CHUNK = 16 * 1024
+
+# A generous floor, so that only a real regression fails on a slow machine.
+# Here the bridge moves about 80 MB/s from USB to TCP and 200 MB/s back.
+MIN_THROUGHPUT_MB_S = 20.0
+
+
+@pytest.fixture
+def ends() -> Iterator[
+    Tuple[int, serial.Serial, socket.socket, tcp_conn.TCPConnection]
+]:
+    """Host side of the serial port, bridge serial handle, server socket, bridge TCP."""
+    host_fd, gadget_fd = pty.openpty()
+    tty.setraw(host_fd)
+    ser = serial.Serial(port=os.ttyname(gadget_fd))
+    ser.write_timeout = 0
+    ser.nonblocking()
+    server, bridge_sock = socket.socketpair()
+    bridge_sock.setblocking(False)
+    tcp = tcp_conn.TCPConnection()
+    tcp._sock = bridge_sock
+    yield host_fd, ser, server, tcp
+    ser.close()
+    os.close(gadget_fd)
+    os.close(host_fd)
+    server.close()
+    bridge_sock.close()
+
+
+def _run_bridge(
+    ser: serial.Serial,
+    tcp: tcp_conn.TCPConnection,
+    buffers: BridgeBuffers,
+    done: threading.Event,
+) -> None:
+    monitor = mock.MagicMock(usb_monitor.USBConnectionMonitor)
+    idle_r, idle_w = os.pipe()
+    monitor.fileno.return_value = idle_r
+    monitor.host_connected.return_value = True
+    config = mock.MagicMock(usb_config.SerialGadget)
+    try:
+        while not done.is_set():
+            listener.listen(monitor, config, ser, tcp, buffers)
+    finally:
+        os.close(idle_r)
+        os.close(idle_w)
+
+
+def _transfer(
+    size: int,
+    write: Callable[[bytes], int],
+    read: Callable[[int], bytes],
+    ser: serial.Serial,
+    tcp: tcp_conn.TCPConnection,
+    buffers: BridgeBuffers,
+) -> float:
+    """Push `size` bytes through the bridge and return the throughput in MB/s."""
+    done = threading.Event()
+    bridge = threading.Thread(target=_run_bridge, args=(ser, tcp, buffers, done))
+    payload = bytes(range(256)) * (CHUNK // 256)
+
+    def _writer() -> None:
+        sent = 0
+        while sent < size:
+            sent += write(payload[: min(CHUNK, size - sent)])
+
+    writer = threading.Thread(target=_writer)
+    start = time.perf_counter()
+    bridge.start()
+    writer.start()
+    received = 0
+    while received < size:
+        received += len(read(CHUNK))
+    elapsed = time.perf_counter() - start
+    done.set()
+    writer.join()
+    bridge.join()
+    return size / elapsed / 1e6
+
+
+@pytest.mark.benchmark
+def test_throughput(
+    ends: Tuple[int, serial.Serial, socket.socket, tcp_conn.TCPConnection]
+) -> None:
+    host_fd, ser, server, tcp = ends
+    # No pacing, so this measures the bridge rather than the packet interval
+    buffers = BridgeBuffers(packet_limit=0, packet_interval=0)
+
+    upload = _transfer(
+        UPLOAD_SIZE,
+        lambda data: os.write(host_fd, data),
+        server.recv,
+        ser,
+        tcp,
+        buffers,
+    )
+    download = _transfer(
+        DOWNLOAD_SIZE,
+        server.send,
+        lambda count: os.read(host_fd, count),
+        ser,
+        tcp,
+        buffers,
+    )
+
+    assert len(buffers.to_tcp) == 0
+    assert len(buffers.to_serial) == 0
+    assert (
+        min(upload, download) > MIN_THROUGHPUT_MB_S
+    ), f"usb -> tcp: {upload:.1f} MB/s, tcp -> usb: {download:.1f} MB/s"
@@ -0,0 +1,74 @@
+"""Tests for the bridge buffers."""
+
+from typing import Callable, List
+
+from ot3usb.bridge_buffer import BridgeBuffer
+
+
+def _reader(data: bytes) -> Callable[[memoryview], int]:
+    def _read(buffer: memoryview) -> int:
+        count = min(len(data), len(buffer))
+        buffer[:count] = data[:count]
+        return count
+
+    return _read
+
+
+def _writer(written: List[bytes], accept: int = 100) -> Callable[[memoryview], int]:
+    def _write(data: memoryview) -> int:
+        written.append(bytes(data[:accept]))
+        return min(accept, len(data))
+
+    return _write
+
+
+def test_read_and_write() -> None:
+    subject = BridgeBuffer(8)
+    written: List[bytes] = []
+    assert len(subject) == 0
+    assert subject.free() == 8
+
+    # Consecutive reads are coalesced into one write
+    assert subject.read_from(_reader(b"abc")) == 3
+    assert subject.read_from(_reader(b"def")) == 3
+    assert len(subject) == 6
+    assert subject.free() == 2
+    assert subject.write_to(_writer(written)) == 6
+    assert written == [b"abcdef"]
+    assert len(subject) == 0
+    assert subject.free() == 8
+
+
+def test_partial_writes_and_limit() -> None:
+    subject = BridgeBuffer(8)
+    written: List[bytes] = []
+    subject.read_from(_reader(b"abcdef"))
+
+    assert subject.write_to(_writer(written), limit=2) == 2
+    assert subject.write_to(_writer(written, accept=1)) == 1
+    assert written == [b"ab", b"c"]
+    assert len(subject) == 3
+
+
+def test_fills_up_and_compacts() -> None:
+    subject = BridgeBuffer(8)
+    written: List[bytes] = []
+
+    # Only as much as fits is read
+    assert subject.read_from(_reader(b"0123456789")) == 8
+    assert subject.free() == 0
+
+    # Freeing space at the front makes room for more at the end
+    subject.write_to(_writer(written), limit=3)
+    assert subject.free() == 3
+    assert subject.read_from(_reader(b"89a")) == 3
+    assert subject.write_to(_writer(written)) == 8
+    assert written == [b"012", b"3456789a"]
+
+
+def test_clear() -> None:
+    subject = BridgeBuffer(8)
+    subject.read_from(_reader(b"abc"))
+    subject.clear()
+    assert len(subject) == 0
+    assert subject.free() == 8
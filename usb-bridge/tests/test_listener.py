@@ -3,12 +3,13 @@
 import pytest
 import mock
 
+import os
 import select
 import serial  # type: ignore[import-untyped]
-from queue import Queue
+from typing import Callable, List
 
 from ot3usb import usb_config, tcp_conn, usb_monitor, listener
-from ot3usb.serial_thread import QUEUE_TYPE
+from ot3usb.bridge_buffer import BridgeBuffers
 
 FAKE_HANDLE = "Handle Placeholder"
 
@@ -30,8 +31,8 @@ def serial_mock() -> mock.MagicMock:
 
 
 @pytest.fixture
-def worker_queue() -> QUEUE_TYPE:
-    return Queue(0)
+def buffers() -> BridgeBuffers:
+    return BridgeBuffers(size=16, packet_limit=2, packet_interval=0)
 
 
 def test_update_ser_handle() -> None:
@@ -82,15 +83,37 @@ SER_DATA = b"abcd"
 TCP_DATA = b"efgh"
 
 
-def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> None:
+def _fill_with(data: bytes) -> mock.MagicMock:
+    def _fill(buffer: memoryview) -> int:
+        buffer[: len(data)] = data
+        return len(data)
+
+    return mock.MagicMock(side_effect=_fill)
+
+
+def _record_into(written: List[bytes]) -> Callable[[memoryview], int]:
+    def _record(data: memoryview) -> int:
+        written.append(bytes(data))
+        return len(data)
+
+    return _record
+
+
+def test_listen(monkeypatch: pytest.MonkeyPatch, buffers: BridgeBuffers) -> None:
     monitor = monitor_mock()
     config = config_mock()
     tcp = tcp_mock()
     ser = serial_mock()
 
-    ser.read_all.return_value = SER_DATA
-    ser.write.return_value = len(TCP_DATA)
-    tcp.read.return_value = TCP_DATA
+    readv_mock = mock.MagicMock(os.readv)
+    readv_mock.side_effect = lambda fd, buffers: _fill_with(SER_DATA)(buffers[0])
+    monkeypatch.setattr("os.readv", readv_mock)
+    serial_written: List[bytes] = []
+    serial_write = _record_into(serial_written)
+    monkeypatch.setattr("os.write", lambda fd, data: serial_write(data))
+    tcp.read_into = _fill_with(TCP_DATA)
+    tcp_sent: List[bytes] = []
+    tcp.send_some.side_effect = _record_into(tcp_sent)
 
     tcp.connected.return_value = False
 
@@ -98,11 +121,11 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
     monkeypatch.setattr("select.select", select_mock)
 
     # FIRST TESTS - NO SERIAL OPEN
-    select_mock.return_value = ([], None, None)
+    select_mock.return_value = ([], [], [])
 
     # No message ready, monitor disconnected
     monitor.host_connected.return_value = False
-    assert listener.listen(monitor, config, None, tcp, worker_queue) is None
+    assert listener.listen(monitor, config, None, tcp, buffers) is None
     monitor.update_state.assert_called_once()
     select_mock.assert_called_with([monitor], [], [], TIMEOUT)
     select_mock.reset_mock()
@@ -110,8 +133,8 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
 
     # Monitor has a message and is connected
     monitor.host_connected.return_value = True
-    select_mock.return_value = ([monitor], None, None)
-    assert listener.listen(monitor, config, None, tcp, worker_queue) is not None
+    select_mock.return_value = ([monitor], [], [])
+    assert listener.listen(monitor, config, None, tcp, buffers) is not None
     # Monitor should be manually updated
     monitor.update_state.assert_not_called()
     select_mock.assert_called_with([monitor], [], [], TIMEOUT)
@@ -121,28 +144,87 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
     # NEXT TESTS - SERIAL IS OPEN
 
     # Nothing ready to read
-    select_mock.return_value = ([], None, None)
+    select_mock.return_value = ([], [], [])
     tcp.connected.return_value = True
     monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp, worker_queue) == ser
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
     select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
     select_mock.reset_mock()
     monitor.reset_mock()
 
     # Serial and TCP ready to read
-    select_mock.return_value = ([ser, tcp], None, None)
-    tcp.connected.return_value = True
-    monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp, worker_queue) == ser
+    select_mock.return_value = ([ser, tcp], [], [])
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
     select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
-    ser.read_all.assert_called_once()
-    tcp.send.assert_called_with(SER_DATA)
-    tcp.read.assert_called_once()
-    assert not worker_queue.empty()
-    assert worker_queue.get() == (ser, TCP_DATA)
+    readv_mock.assert_called_once()
+    tcp.read_into.assert_called_once()
+    assert len(buffers.to_tcp) == len(SER_DATA)
+    assert len(buffers.to_serial) == len(TCP_DATA)
+    select_mock.reset_mock()
+
+    # Both ends writable: TCP gets everything, serial one packet at a time
+    select_mock.return_value = ([], [ser, tcp], [])
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    select_mock.assert_called_with([monitor, ser, tcp], [tcp, ser], [], TIMEOUT)
+    assert tcp_sent == [SER_DATA]
+    assert serial_written == [TCP_DATA[:2]]
+    select_mock.return_value = ([], [ser], [])
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    select_mock.assert_called_with([monitor, ser, tcp], [ser], [], TIMEOUT)
+    assert tcp_sent == [SER_DATA]
+    assert serial_written == [TCP_DATA[:2], TCP_DATA[2:]]
+    assert len(buffers.to_serial) == 0
+    select_mock.reset_mock()
+
+    # Full buffers stop reading from the other end
+    select_mock.return_value = ([], [], [])
+    buffers.to_serial.read_from(_fill_with(b"x" * 16))
+    buffers.to_tcp.read_from(_fill_with(b"y" * 16))
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    select_mock.assert_called_with([monitor], [tcp, ser], [], TIMEOUT)
+    select_mock.reset_mock()
 
-    ser.reset_mock()
+    # Serial writes are spaced out by the packet interval
+    buffers.packet_interval = TIMEOUT / 2
+    select_mock.return_value = ([], [ser], [])
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    assert select_mock.call_args[0][1] == [tcp]
+    assert 0 < select_mock.call_args[0][3] <= TIMEOUT / 2
     select_mock.reset_mock()
+
+    # Data is dropped when the host disconnects
+    monitor.host_connected.return_value = False
+    select_mock.return_value = ([monitor], [], [])
+    assert listener.listen(monitor, config, ser, tcp, buffers) is None
+    assert len(buffers.to_serial) == 0
+    assert len(buffers.to_tcp) == 0
+
+
+def test_listen_serial_hangup(
+    monkeypatch: pytest.MonkeyPatch, buffers: BridgeBuffers
+) -> None:
+    """A readable serial port that reads nothing has been hung up."""
+    monitor = monitor_mock()
+    config = config_mock()
+    tcp = tcp_mock()
+    ser = serial_mock()
+    tcp.connected.return_value = True
+
+    monkeypatch.setattr("os.readv", lambda fd, buffers: 0)
+    select_mock = mock.MagicMock(select.select)
+    monkeypatch.setattr("select.select", select_mock)
+    select_mock.return_value = ([ser], [], [])
+
+    # Still connected according to the monitor: keep the port
+    monitor.host_connected.return_value = True
+    assert listener.listen(monitor, config, ser, tcp, buffers) == ser
+    monitor.update_state.assert_called_once()
+    tcp.disconnect.assert_not_called()
     monitor.reset_mock()
 
-    # Check for handling when the serial line disconnecs
+    # The monitor agrees that the host is gone: drop the port and the TCP connection
+    monitor.host_connected.return_value = False
+    assert listener.listen(monitor, config, ser, tcp, buffers) is None
+    monitor.update_state.assert_called_once()
+    tcp.disconnect.assert_called_once()
@@ -53,7 +53,7 @@ def test_connect(
     monkeypatch.setattr("socket.socket", mock.MagicMock(socket.socket))
 
     # When disconnected, should not be able to read
-    assert subject.read() == b""
+    assert subject.read_into(memoryview(bytearray(4))) == 0
 
     # Reconnection should not work now
     subject._reconnect()
@@ -79,43 +79,66 @@ def test_connect(
     assert not subject.connect(IP, PORT)
 
 
-def test_read(
+def test_read_into(
     subject_connected: TCPConnection,
     socket_driver: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     subject = subject_connected
-    socket_driver.recv.return_value = RECV_RET
+    buffer = memoryview(bytearray(16))
+
+    def _recv_into(buf: memoryview) -> int:
+        buf[: len(RECV_RET)] = RECV_RET
+        return len(RECV_RET)
+
+    socket_driver.recv_into.side_effect = _recv_into
     # Set up a patch on the reconnect function
     reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
     monkeypatch.setattr(subject, "_reconnect", reconnect_mock)
 
-    # Make sure that reading returns the data
-    data = subject.read()
-    socket_driver.recv.assert_called_once()
-    assert data == RECV_RET
+    # Make sure that reading fills the buffer
+    assert subject.read_into(buffer) == len(RECV_RET)
+    socket_driver.recv_into.assert_called_once_with(buffer)
+    assert bytes(buffer[: len(RECV_RET)]) == RECV_RET
+
+    # Nothing to read yet
+    socket_driver.recv_into.side_effect = BlockingIOError()
+    assert subject.read_into(buffer) == 0
+    reconnect_mock.assert_not_called()
 
     # Check error case
-    socket_driver.reset_mock()
-    socket_driver.recv.return_value = b""
-    data = subject.read()
-    assert data == b""
+    socket_driver.recv_into.side_effect = None
+    socket_driver.recv_into.return_value = 0
+    assert subject.read_into(buffer) == 0
     reconnect_mock.assert_called_once()
 
 
-def test_send(subject_connected: TCPConnection, socket_driver: mock.Mock) -> None:
+def test_send_some(
+    subject_connected: TCPConnection,
+    socket_driver: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     subject = subject_connected
-    socket_driver.send.return_value = len(SEND_DATA)
-
-    assert subject.send(SEND_DATA)
+    data = memoryview(SEND_DATA)
+    reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
+    monkeypatch.setattr(subject, "_reconnect", reconnect_mock)
 
     socket_driver.send.return_value = len(SEND_DATA) - 1
-    assert not subject.send(SEND_DATA)
+    assert subject.send_some(data) == len(SEND_DATA) - 1
+    socket_driver.send.assert_called_once_with(data)
+
+    socket_driver.send.side_effect = BlockingIOError()
+    assert subject.send_some(data) == 0
+    reconnect_mock.assert_not_called()
+
+    socket_driver.send.side_effect = BrokenPipeError()
+    assert subject.send_some(data) == 0
+    reconnect_mock.assert_called_once()
 
 
 def test_send_fail(
     subject_disconnected: TCPConnection, socket_driver: mock.Mock
 ) -> None:
-    assert not subject_disconnected.send(SEND_DATA)
+    assert subject_disconnected.send_some(memoryview(SEND_DATA)) == 0
 
     socket_driver.send.assert_not_called()